@@ -12,6 +12,10 @@ class SubscriptionNotFound(Exception):
     """Raised when a subscription is not found."""
 
 
+class SubscriptionConflict(Exception):
+    """Raised when an active subscription to the fund already exists."""
+
+
 class InsufficientBalance(Exception):
     """Raised when a user has insufficient balance for an operation."""
 
@@ -24,5 +28,17 @@ class OptimisticLockError(Exception):
     """Raised when an optimistic locking conflict occurs."""
 
 
+class StaleBalance(OptimisticLockError):
+    """Raised when a balance changed after it was read."""
+
+
 class IdempotencyConflict(Exception):
     """Raised when an idempotent operation conflicts with existing data."""
+
+
+class InvalidCursor(Exception):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+class InvalidTimeRange(Exception):
+    """Raised when a time range is too wide to read."""
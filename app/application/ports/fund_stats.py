@@ -0,0 +1,14 @@
+from typing import Protocol
+from app.domain.models.fund_stats import FundStats
+
+
+class FundStatsPort(Protocol):
+
+    def get(self, fund_id: str) -> FundStats:
+        """Get a fund's assets under management and active subscribers."""
+
+
+class AsyncFundStatsPort(Protocol):
+
+    async def get(self, fund_id: str) -> FundStats:
+        """Get a fund's assets under management and active subscribers."""
@@ -6,9 +6,45 @@ class FundPort(Protocol):
     def get_by_id(self, fund_id: str) -> Fund:
         """Get a fund by its ID."""
 
+    def get_many(self, fund_ids: list[str]) -> list[Fund]:
+        """Get several funds by ID, in input order, skipping missing ones."""
+
     def list_all(
                 self,
                 limit: int = 50,
                 last_key: str | None = None
                 ) -> Tuple[list[Fund], str | None]:
-        """List all funds."""
+        """List all funds, resuming after the ``last_key`` cursor."""
+
+    def search(
+                self,
+                category: str,
+                max_min_amount: float | None = None,
+                limit: int = 50,
+                cursor: str | None = None
+                ) -> Tuple[list[Fund], str | None]:
+        """Funds of a category, by minimum amount, up to ``max_min_amount``."""
+
+
+class AsyncFundPort(Protocol):
+    async def get_by_id(self, fund_id: str) -> Fund:
+        """Get a fund by its ID."""
+
+    async def get_many(self, fund_ids: list[str]) -> list[Fund]:
+        """Get several funds by ID, in input order, skipping missing ones."""
+
+    async def list_all(
+                self,
+                limit: int = 50,
+                last_key: str | None = None
+                ) -> Tuple[list[Fund], str | None]:
+        """List all funds, resuming after the ``last_key`` cursor."""
+
+    async def search(
+                self,
+                category: str,
+                max_min_amount: float | None = None,
+                limit: int = 50,
+                cursor: str | None = None
+                ) -> Tuple[list[Fund], str | None]:
+        """Funds of a category, by minimum amount, up to ``max_min_amount``."""
@@ -0,0 +1,51 @@
+from typing import Any, Protocol
+from app.domain.models.idempotency import IdempotencyRecord
+
+
+class IdempotencyPort(Protocol):
+    """
+    Stored responses of requests sent with an Idempotency-Key, so a retry
+    replays the first response instead of running the operation again.
+    """
+
+    def begin(self, key: str, fingerprint: str) -> IdempotencyRecord:
+        """Claim ``key`` for a request, or return its completed record.
+
+        An in-progress record is the caller's claim: it should run the
+        operation and then complete or release the claim. Raises
+        IdempotencyConflict when the key was used with another request
+        or that request is still running.
+        """
+
+    def complete(
+            self,
+            claim: IdempotencyRecord,
+            status_code: int,
+            body: Any
+            ) -> None:
+        """Store the response of the request holding ``claim``."""
+
+    def release(self, claim: IdempotencyRecord) -> None:
+        """Forget ``claim``'s key after a failure, so a retry runs again."""
+
+
+class AsyncIdempotencyPort(Protocol):
+    """Async counterpart of IdempotencyPort."""
+
+    async def begin(
+            self,
+            key: str,
+            fingerprint: str
+            ) -> IdempotencyRecord:
+        """Claim ``key`` for a request, or return its completed record."""
+
+    async def complete(
+            self,
+            claim: IdempotencyRecord,
+            status_code: int,
+            body: Any
+            ) -> None:
+        """Store the response of the request holding ``claim``."""
+
+    async def release(self, claim: IdempotencyRecord) -> None:
+        """Forget ``claim``'s key after a failure, so a retry runs again."""
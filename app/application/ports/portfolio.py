@@ -0,0 +1,14 @@
+from typing import Protocol
+from app.domain.models.portfolio import Portfolio
+
+
+class PortfolioPort(Protocol):
+
+    def get(self, user_id: str) -> Portfolio:
+        """Get a user's portfolio summary (empty if they never invested)."""
+
+
+class AsyncPortfolioPort(Protocol):
+
+    async def get(self, user_id: str) -> Portfolio:
+        """Get a user's portfolio summary (empty if they never invested)."""
@@ -1,4 +1,5 @@
-from typing import Protocol, Optional, Iterable, Any
+from typing import Protocol, Optional, Iterable, Any, Tuple
+from app.domain.models.partial import PartialRecord
 from app.domain.models.subscription import Subscription
 
 
@@ -7,8 +8,17 @@ class SubscriptionPort(Protocol):
     def _add(self, subscription: Subscription) -> Subscription:
         """Add a subscription from seed for testing."""
 
-    def get(self, user_id: str, fund_id: str) -> Optional[Subscription]:
-        """Get a subscription by user ID and fund ID."""
+    def get(
+            self,
+            user_id: str,
+            fund_id: str,
+            fields: Iterable[str] | None = None
+            ) -> Optional[Subscription | PartialRecord]:
+        """Get a subscription by user ID and fund ID.
+
+        With ``fields`` only those attributes need to be read: the
+        subscription may be a partial record with just those fields.
+        """
 
     def update(self, user_id: str, fund_id: str, **params: Any) -> Subscription:
         """Update a subscription."""
@@ -16,9 +26,22 @@ class SubscriptionPort(Protocol):
     def list_by_user(
             self,
             user_id: str,
-            status: str | None = None
-            ) -> Iterable[Subscription]:
-        """List subscriptions by user ID, filtered by status."""
+            status: str | None = None,
+            fields: Iterable[str] | None = None
+            ) -> Iterable[Subscription | PartialRecord]:
+        """List subscriptions by user ID, filtered by status.
+
+        With ``fields`` they may be partial records with just those fields.
+        """
+
+    def list_by_fund(
+            self,
+            fund_id: str,
+            status: str = "active",
+            limit: int = 50,
+            cursor: str | None = None
+            ) -> Tuple[list[Subscription], str | None]:
+        """One page of a fund's subscriptions in a status, and the cursor."""
 
     def save(self, subscription: Subscription) -> Subscription:
         """Save a subscription."""
@@ -36,3 +59,49 @@ class SubscriptionPort(Protocol):
 
     def unsubscribe(self, user_id: str, fund_id: str) -> Subscription:
         """Unsubscribe a user from a fund (change status to cancelled)."""
+
+
+class AsyncSubscriptionPort(Protocol):
+
+    async def get(
+            self,
+            user_id: str,
+            fund_id: str,
+            fields: Iterable[str] | None = None
+            ) -> Optional[Subscription | PartialRecord]:
+        """Get a subscription by user ID and fund ID.
+
+        With ``fields`` only those attributes need to be read: the
+        subscription may be a partial record with just those fields.
+        """
+
+    async def update(
+            self,
+            user_id: str,
+            fund_id: str,
+            **params: Any
+            ) -> Subscription:
+        """Update a subscription."""
+
+    async def list_by_user(
+            self,
+            user_id: str,
+            status: str | None = None,
+            fields: Iterable[str] | None = None
+            ) -> list[Subscription | PartialRecord]:
+        """List subscriptions by user ID, filtered by status.
+
+        With ``fields`` they may be partial records with just those fields.
+        """
+
+    async def list_by_fund(
+            self,
+            fund_id: str,
+            status: str = "active",
+            limit: int = 50,
+            cursor: str | None = None
+            ) -> Tuple[list[Subscription], str | None]:
+        """One page of a fund's subscriptions in a status, and the cursor."""
+
+    async def save(self, subscription: Subscription) -> Subscription:
+        """Save a subscription."""
@@ -1,29 +1,171 @@
-from typing import Protocol, Iterable
+from typing import Protocol, Iterable, Tuple
 from datetime import datetime
-from app.domain.models.transaction import Transaction
+from app.domain.models.transaction import Transaction, TransactionRow
 
 
 class TransactionPort(Protocol):
+    """
+    Transaction history access.
+
+    The iterable methods fetch pages lazily while the caller consumes them:
+    ``limit`` caps the total number of transactions (``None`` for no cap)
+    and ``page_size`` the items read per DynamoDB request. The ``*_page``
+    methods return one page and an opaque cursor to resume after it, or
+    ``None`` when there is nothing left. A user's transactions can be
+    bounded by ``from_time`` and ``to_time``, both included.
+    """
+
     def get_all(
             self,
-            limit: int = 50,
-            since: datetime | None = None
+            limit: int | None = 50,
+            since: datetime | None = None,
+            cursor: str | None = None,
+            page_size: int | None = None
             ) -> Iterable[Transaction]:
         """Get all transactions, optionally filtered by a starting date."""
 
+    def get_all_page(
+            self,
+            limit: int = 50,
+            since: datetime | None = None,
+            cursor: str | None = None,
+            page_size: int | None = None
+            ) -> Tuple[list[Transaction], str | None]:
+        """Get one page of transactions and the cursor to the next one."""
+
+    def get_all_rows_page(
+            self,
+            limit: int = 50,
+            since: datetime | None = None,
+            cursor: str | None = None,
+            page_size: int | None = None
+            ) -> Tuple[list[TransactionRow], str | None]:
+        """Like ``get_all_page``, as unvalidated rows for responses."""
+
+    def get_all_parallel(
+            self,
+            total_segments: int = 8,
+            since: datetime | None = None,
+            ordered: bool = False,
+            max_workers: int | None = None,
+            max_buffered_pages: int | None = None
+            ) -> Iterable[Transaction]:
+        """Get all transactions reading table segments concurrently.
+
+        Meant for full exports; ``ordered`` returns them by timestamp,
+        streamed from the time index, and needs ``since``
+        (``InvalidTimeRange`` otherwise).
+        """
+
     def get_by_fund(
             self,
             fund_id: str,
-            limit: int = 50
+            limit: int | None = 50,
+            cursor: str | None = None,
+            page_size: int | None = None
             ) -> Iterable[Transaction]:
         """Get all transactions for a specific fund."""
 
+    def get_by_fund_page(
+            self,
+            fund_id: str,
+            limit: int = 50,
+            cursor: str | None = None,
+            page_size: int | None = None
+            ) -> Tuple[list[Transaction], str | None]:
+        """Get one page of a fund's transactions and the next cursor."""
+
     def get_by_user(
             self,
             user_id: str,
-            limit: int = 50
+            limit: int | None = 50,
+            cursor: str | None = None,
+            page_size: int | None = None,
+            from_time: datetime | None = None,
+            to_time: datetime | None = None
             ) -> Iterable[Transaction]:
         """Get all transactions for a specific user."""
 
+    def get_by_user_page(
+            self,
+            user_id: str,
+            limit: int = 50,
+            cursor: str | None = None,
+            page_size: int | None = None,
+            from_time: datetime | None = None,
+            to_time: datetime | None = None
+            ) -> Tuple[list[Transaction], str | None]:
+        """Get one page of a user's transactions and the next cursor."""
+
+    def get_by_user_rows_page(
+            self,
+            user_id: str,
+            limit: int = 50,
+            cursor: str | None = None,
+            page_size: int | None = None,
+            from_time: datetime | None = None,
+            to_time: datetime | None = None
+            ) -> Tuple[list[TransactionRow], str | None]:
+        """Like ``get_by_user_page``, as unvalidated rows for responses."""
+
     def save(self, transaction: Transaction) -> Transaction:
         """Save a transaction."""
+
+
+class AsyncTransactionPort(Protocol):
+    """
+    Async transaction history access; returns whole pages, since a lazy
+    iterable would block the event loop while it is consumed.
+    """
+
+    async def get_all_page(
+            self,
+            limit: int = 50,
+            since: datetime | None = None,
+            cursor: str | None = None,
+            page_size: int | None = None
+            ) -> Tuple[list[Transaction], str | None]:
+        """Get one page of transactions and the cursor to the next one."""
+
+    async def get_all_rows_page(
+            self,
+            limit: int = 50,
+            since: datetime | None = None,
+            cursor: str | None = None,
+            page_size: int | None = None
+            ) -> Tuple[list[TransactionRow], str | None]:
+        """Like ``get_all_page``, as unvalidated rows for responses."""
+
+    async def get_by_fund_page(
+            self,
+            fund_id: str,
+            limit: int = 50,
+            cursor: str | None = None,
+            page_size: int | None = None
+            ) -> Tuple[list[Transaction], str | None]:
+        """Get one page of a fund's transactions and the next cursor."""
+
+    async def get_by_user_page(
+            self,
+            user_id: str,
+            limit: int = 50,
+            cursor: str | None = None,
+            page_size: int | None = None,
+            from_time: datetime | None = None,
+            to_time: datetime | None = None
+            ) -> Tuple[list[Transaction], str | None]:
+        """Get one page of a user's transactions and the next cursor."""
+
+    async def get_by_user_rows_page(
+            self,
+            user_id: str,
+            limit: int = 50,
+            cursor: str | None = None,
+            page_size: int | None = None,
+            from_time: datetime | None = None,
+            to_time: datetime | None = None
+            ) -> Tuple[list[TransactionRow], str | None]:
+        """Like ``get_by_user_page``, as unvalidated rows for responses."""
+
+    async def save(self, transaction: Transaction) -> Transaction:
+        """Save a transaction."""
@@ -0,0 +1,84 @@
+from typing import Protocol
+from app.domain.models.idempotency import IdempotencyRecord
+from app.domain.models.subscription import Subscription
+from app.domain.models.transaction import Transaction
+
+
+class UnitOfWorkPort(Protocol):
+    """
+    Atomic writes spanning the user balance, a subscription, its
+    transaction log entry and the user's portfolio summary: either all of
+    them are stored or none is.
+    """
+
+    def subscribe(
+            self,
+            subscription: Subscription,
+            transaction: Transaction,
+            claim: IdempotencyRecord | None = None
+            ) -> Subscription:
+        """Debit the balance, open the subscription and log the transaction.
+
+        With ``claim``, the Idempotency-Key claimed for the request, the
+        response is stored in the same transaction: a retry replays it even
+        if the process dies right after the write, and IdempotencyConflict
+        is raised if another request took the key over meanwhile.
+
+        Raises InsufficientBalance when the balance does not cover the
+        amount, UserNotFound when the user does not exist,
+        SubscriptionConflict when the subscription is already active,
+        StaleBalance when the stored balance is not the transaction's
+        ``prev_balance`` and OptimisticLockError when a concurrent write
+        touched the same items.
+        """
+
+    def subscribe_many(
+            self,
+            entries: list[tuple[Subscription, Transaction]]
+            ) -> list[Subscription | Exception]:
+        """Subscribe many users, at most one entry per user.
+
+        Returns, in input order, the stored subscription or the error
+        ``subscribe`` would have raised for each entry.
+        """
+
+    def cancel(
+            self,
+            subscription: Subscription,
+            transaction: Transaction,
+            claim: IdempotencyRecord | None = None
+            ) -> Subscription:
+        """Refund the amount, cancel the subscription and log the transaction.
+
+        ``claim`` is stored with the write as in ``subscribe``. Raises
+        SubscriptionNotFound when the subscription is no longer
+        active, StaleBalance when the balance is not the transaction's
+        ``prev_balance`` and OptimisticLockError when the subscription
+        changed since it was read.
+        """
+
+
+class AsyncUnitOfWorkPort(Protocol):
+    """Async counterpart of UnitOfWorkPort."""
+
+    async def subscribe(
+            self,
+            subscription: Subscription,
+            transaction: Transaction,
+            claim: IdempotencyRecord | None = None
+            ) -> Subscription:
+        """Debit the balance, open the subscription and log the transaction."""
+
+    async def subscribe_many(
+            self,
+            entries: list[tuple[Subscription, Transaction]]
+            ) -> list[Subscription | Exception]:
+        """Subscribe many users, at most one entry per user."""
+
+    async def cancel(
+            self,
+            subscription: Subscription,
+            transaction: Transaction,
+            claim: IdempotencyRecord | None = None
+            ) -> Subscription:
+        """Refund the amount, cancel the subscription and log the transaction."""
@@ -1,11 +1,57 @@
-from typing import Protocol, Any
+from typing import Protocol, Any, Iterable
+from app.domain.models.partial import PartialRecord
 from app.domain.models.user import User
 
 
 class UserPort(Protocol):
 
-    def get_by_id(self, user_id: str) -> User:
-        """Get a user by their ID."""
+    def get_by_id(
+            self,
+            user_id: str,
+            fields: Iterable[str] | None = None
+            ) -> User | PartialRecord:
+        """Get a user by their ID.
+
+        With ``fields`` only those attributes need to be read: the user
+        may be a partial record with just those fields.
+        """
+
+    def get_many(
+            self,
+            user_ids: list[str],
+            fields: Iterable[str] | None = None
+            ) -> list[User | PartialRecord]:
+        """Get several users by ID, in input order, skipping missing ones.
+
+        With ``fields`` they may be partial records, always with user_id.
+        """
 
     def update(self, user_id: str, **params: Any) -> User:
         """Update a user."""
+
+
+class AsyncUserPort(Protocol):
+
+    async def get_by_id(
+            self,
+            user_id: str,
+            fields: Iterable[str] | None = None
+            ) -> User | PartialRecord:
+        """Get a user by their ID.
+
+        With ``fields`` only those attributes need to be read: the user
+        may be a partial record with just those fields.
+        """
+
+    async def get_many(
+            self,
+            user_ids: list[str],
+            fields: Iterable[str] | None = None
+            ) -> list[User | PartialRecord]:
+        """Get several users by ID, in input order, skipping missing ones.
+
+        With ``fields`` they may be partial records, always with user_id.
+        """
+
+    async def update(self, user_id: str, **params: Any) -> User:
+        """Update a user."""
@@ -0,0 +1,11 @@
+from datetime import datetime, timezone
+
+
+def utc_now() -> datetime:
+    """
+    The current time as stored: naive UTC.
+
+    Transaction keys (ULIDs), day buckets and the since/from/to filters all
+    read naive timestamps as UTC, so local time must never be stored.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic import BaseModel
 
 
@@ -6,3 +7,8 @@ class Fund(BaseModel):
     name: str
     min_amount: float
     category: str
+
+
+class FundPage(BaseModel):
+    items: list[Fund]
+    next_cursor: Optional[str] = None
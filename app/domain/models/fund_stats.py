@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class FundStats(BaseModel):
+    fund_id: str
+    aum: int = 0
+    active_subscribers: int = 0
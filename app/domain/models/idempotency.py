@@ -0,0 +1,18 @@
+from typing import Any, Optional
+from enum import Enum
+from pydantic import BaseModel
+
+
+class IdempotencyStatus(str, Enum):
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+
+
+class IdempotencyRecord(BaseModel):
+    key: str
+    fingerprint: str
+    status: IdempotencyStatus
+    status_code: Optional[int] = None
+    body: Optional[Any] = None
+    # Set on the record of the request that claimed the key
+    claim_id: Optional[str] = None
@@ -0,0 +1,44 @@
+from functools import lru_cache
+from typing import Iterable, Type
+
+from pydantic import BaseModel, create_model
+
+
+class PartialRecord(BaseModel):
+    """
+    A record read with only some of its fields (see ``partial_model``).
+
+    Reading any other attribute raises AttributeError, so caches must not
+    keep one where the full record is expected.
+    """
+
+
+@lru_cache(maxsize=None)
+def _partial_model(
+        model: Type[BaseModel],
+        fields: frozenset
+        ) -> Type[BaseModel]:
+    unknown = fields - model.model_fields.keys()
+    if unknown:
+        raise TypeError(
+            f"{model.__name__} has no fields {', '.join(sorted(unknown))}"
+        )
+    if fields == model.model_fields.keys():
+        return model
+    return create_model(
+        f'Partial{model.__name__}',
+        __base__=PartialRecord,
+        **{
+            name: (info.annotation, info)
+            for name, info in model.model_fields.items()
+            if name in fields
+        }
+    )
+
+
+def partial_model(
+        model: Type[BaseModel],
+        fields: Iterable[str]
+        ) -> Type[BaseModel]:
+    """``model`` with only ``fields``, validated alike; itself for all."""
+    return _partial_model(model, frozenset(fields))
@@ -0,0 +1,10 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class Portfolio(BaseModel):
+    user_id: str
+    fund_ids: list[str] = []
+    amounts: dict[str, int] = {}
+    total_invested: int = 0
+    updated_at: Optional[str] = None
@@ -1,5 +1,14 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class SubscribeRequest(BaseModel):
     amount: int
+
+
+class BulkSubscribeItem(BaseModel):
+    user_id: str
+    amount: int
+
+
+class BulkSubscribeRequest(BaseModel):
+    items: list[BulkSubscribeItem] = Field(min_length=1, max_length=1000)
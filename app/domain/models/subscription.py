@@ -1,7 +1,7 @@
 from typing import Optional
 from enum import Enum
-from pydantic import BaseModel
-from datetime import datetime
+from pydantic import BaseModel, Field
+from app.domain.models.clock import utc_now
 
 
 class Status(str, Enum):
@@ -14,5 +14,31 @@ class Subscription(BaseModel):
     fund_id: str
     amount: int
     status: Status
-    created_at: Optional[str] = datetime.now().isoformat()
+    created_at: Optional[str] = Field(
+        default_factory=lambda: utc_now().isoformat()
+    )
     cancelled_at: Optional[str] = None
+
+
+class SubscriptionPage(BaseModel):
+    items: list[Subscription]
+    next_cursor: Optional[str] = None
+
+
+class BulkItemStatus(str, Enum):
+    SUBSCRIBED = "subscribed"
+    FAILED = "failed"
+
+
+class BulkSubscriptionResult(BaseModel):
+    user_id: str
+    status: BulkItemStatus
+    subscription: Optional[Subscription] = None
+    error: Optional[str] = None
+
+
+class BulkSubscriptionReport(BaseModel):
+    fund_id: str
+    succeeded: int
+    failed: int
+    results: list[BulkSubscriptionResult]
@@ -1,3 +1,5 @@
+from dataclasses import dataclass, field
+from typing import Optional
 from enum import Enum
 from pydantic import BaseModel
 
@@ -15,3 +17,31 @@ class Transaction(BaseModel):
     timestamp: str
     prev_balance: int
     new_balance: int
+
+
+class TransactionPage(BaseModel):
+    items: list[Transaction]
+    next_cursor: Optional[str] = None
+
+
+@dataclass(slots=True)
+class TransactionRow:
+    """
+    Read-only view of a stored transaction for history responses.
+
+    Unlike ``Transaction`` it is not validated, so only build it from
+    items the application wrote. Serializes to the same JSON.
+    """
+    user_id: str
+    fund_id: str
+    amount: int
+    transaction_type: str
+    timestamp: str
+    prev_balance: int
+    new_balance: int
+
+
+@dataclass(slots=True)
+class TransactionRowPage:
+    items: list[TransactionRow] = field(default_factory=list)
+    next_cursor: Optional[str] = None
@@ -0,0 +1,382 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Iterable, Optional, Tuple
+from app.application.ports.fund_stats import (
+    AsyncFundStatsPort,
+    FundStatsPort
+)
+from app.application.ports.funds import AsyncFundPort, FundPort
+from app.application.ports.idempotency import (
+    AsyncIdempotencyPort,
+    IdempotencyPort
+)
+from app.application.ports.portfolio import AsyncPortfolioPort, PortfolioPort
+from app.application.ports.subscriptions import (
+    AsyncSubscriptionPort,
+    SubscriptionPort
+)
+from app.application.ports.transactions import (
+    AsyncTransactionPort,
+    TransactionPort
+)
+from app.application.ports.unit_of_work import (
+    AsyncUnitOfWorkPort,
+    UnitOfWorkPort
+)
+from app.application.ports.users import AsyncUserPort, UserPort
+from app.domain.models.fund import Fund
+from app.domain.models.fund_stats import FundStats
+from app.domain.models.idempotency import IdempotencyRecord
+from app.domain.models.partial import PartialRecord
+from app.domain.models.portfolio import Portfolio
+from app.domain.models.subscription import Subscription
+from app.domain.models.transaction import Transaction, TransactionRow
+from app.domain.models.user import User
+from app.infrastructure.adapters.offload import run_blocking
+
+
+# boto3 has no asyncio API: these adapters run the synchronous adapters
+# on a bounded thread pool, so a slow DynamoDB call only holds a worker
+# thread instead of the event loop shared by every in-flight request.
+
+
+class AsyncFundAdapter(AsyncFundPort):
+    def __init__(self, funds_port: FundPort, executor: ThreadPoolExecutor):
+        self._funds_port = funds_port
+        self._executor = executor
+
+    async def get_by_id(self, fund_id: str) -> Fund:
+        """Get a fund by its ID."""
+        return await run_blocking(
+            self._executor, self._funds_port.get_by_id, fund_id
+        )
+
+    async def get_many(self, fund_ids: list[str]) -> list[Fund]:
+        """Get several funds by ID, in input order, skipping missing ones."""
+        return await run_blocking(
+            self._executor, self._funds_port.get_many, fund_ids
+        )
+
+    async def list_all(
+        self,
+        limit: int = 50,
+        last_key: str | None = None
+    ) -> Tuple[list[Fund], str | None]:
+        """List all funds, resuming after the ``last_key`` cursor."""
+        return await run_blocking(
+            self._executor, self._funds_port.list_all,
+            limit=limit, last_key=last_key
+        )
+
+    async def search(
+        self,
+        category: str,
+        max_min_amount: float | None = None,
+        limit: int = 50,
+        cursor: str | None = None
+    ) -> Tuple[list[Fund], str | None]:
+        """Funds of a category, by minimum amount, up to ``max_min_amount``."""
+        return await run_blocking(
+            self._executor, self._funds_port.search,
+            category, max_min_amount, limit=limit, cursor=cursor
+        )
+
+
+class AsyncFundStatsAdapter(AsyncFundStatsPort):
+    def __init__(
+        self,
+        fund_stats_port: FundStatsPort,
+        executor: ThreadPoolExecutor
+    ):
+        self._fund_stats_port = fund_stats_port
+        self._executor = executor
+
+    async def get(self, fund_id: str) -> FundStats:
+        """Get a fund's assets under management and active subscribers."""
+        return await run_blocking(
+            self._executor, self._fund_stats_port.get, fund_id
+        )
+
+
+class AsyncIdempotencyAdapter(AsyncIdempotencyPort):
+    def __init__(
+        self,
+        idempotency_port: IdempotencyPort,
+        executor: ThreadPoolExecutor
+    ):
+        self._idempotency_port = idempotency_port
+        self._executor = executor
+
+    async def begin(
+        self,
+        key: str,
+        fingerprint: str
+    ) -> IdempotencyRecord:
+        """Claim ``key`` for a request, or return its completed record."""
+        return await run_blocking(
+            self._executor, self._idempotency_port.begin, key, fingerprint
+        )
+
+    async def complete(
+        self,
+        claim: IdempotencyRecord,
+        status_code: int,
+        body: Any
+    ) -> None:
+        """Store the response of the request holding ``claim``."""
+        await run_blocking(
+            self._executor, self._idempotency_port.complete,
+            claim, status_code, body
+        )
+
+    async def release(self, claim: IdempotencyRecord) -> None:
+        """Forget ``claim``'s key after a failure, so a retry runs again."""
+        await run_blocking(
+            self._executor, self._idempotency_port.release, claim
+        )
+
+
+class AsyncPortfolioAdapter(AsyncPortfolioPort):
+    def __init__(
+        self,
+        portfolio_port: PortfolioPort,
+        executor: ThreadPoolExecutor
+    ):
+        self._portfolio_port = portfolio_port
+        self._executor = executor
+
+    async def get(self, user_id: str) -> Portfolio:
+        """Get a user's portfolio summary (empty if they never invested)."""
+        return await run_blocking(
+            self._executor, self._portfolio_port.get, user_id
+        )
+
+
+class AsyncUserAdapter(AsyncUserPort):
+    def __init__(self, user_port: UserPort, executor: ThreadPoolExecutor):
+        self._user_port = user_port
+        self._executor = executor
+
+    async def get_by_id(
+        self,
+        user_id: str,
+        fields: Iterable[str] | None = None
+    ) -> User | PartialRecord:
+        """Get a user by their ID."""
+        return await run_blocking(
+            self._executor, self._user_port.get_by_id, user_id, fields
+        )
+
+    async def get_many(
+        self,
+        user_ids: list[str],
+        fields: Iterable[str] | None = None
+    ) -> list[User | PartialRecord]:
+        """Get several users by ID, in input order, skipping missing ones."""
+        return await run_blocking(
+            self._executor, self._user_port.get_many, user_ids, fields
+        )
+
+    async def update(self, user_id: str, **params: Any) -> User:
+        """Update a user."""
+        return await run_blocking(
+            self._executor, self._user_port.update, user_id, **params
+        )
+
+
+class AsyncSubscriptionAdapter(AsyncSubscriptionPort):
+    def __init__(
+        self,
+        subscription_port: SubscriptionPort,
+        executor: ThreadPoolExecutor
+    ):
+        self._subscription_port = subscription_port
+        self._executor = executor
+
+    async def get(
+        self,
+        user_id: str,
+        fund_id: str,
+        fields: Iterable[str] | None = None
+    ) -> Optional[Subscription | PartialRecord]:
+        """Get a subscription by user ID and fund ID."""
+        return await run_blocking(
+            self._executor, self._subscription_port.get,
+            user_id, fund_id, fields
+        )
+
+    async def update(
+        self,
+        user_id: str,
+        fund_id: str,
+        **params: Any
+    ) -> Subscription:
+        """Update a subscription."""
+        return await run_blocking(
+            self._executor, self._subscription_port.update,
+            user_id, fund_id, **params
+        )
+
+    async def list_by_user(
+        self,
+        user_id: str,
+        status: str | None = None,
+        fields: Iterable[str] | None = None
+    ) -> list[Subscription | PartialRecord]:
+        """List subscriptions by user ID, filtered by status."""
+        def read_all() -> list[Subscription]:
+            # Consume the lazy pages inside the worker thread
+            return list(self._subscription_port.list_by_user(
+                user_id, status, fields
+            ))
+
+        return await run_blocking(self._executor, read_all)
+
+    async def list_by_fund(
+        self,
+        fund_id: str,
+        status: str = "active",
+        limit: int = 50,
+        cursor: str | None = None
+    ) -> Tuple[list[Subscription], str | None]:
+        """One page of a fund's subscriptions in a status, and the cursor."""
+        return await run_blocking(
+            self._executor, self._subscription_port.list_by_fund,
+            fund_id, status, limit=limit, cursor=cursor
+        )
+
+    async def save(self, subscription: Subscription) -> Subscription:
+        """Save a subscription."""
+        return await run_blocking(
+            self._executor, self._subscription_port.save, subscription
+        )
+
+
+class AsyncTransactionAdapter(AsyncTransactionPort):
+    def __init__(
+        self,
+        transaction_port: TransactionPort,
+        executor: ThreadPoolExecutor
+    ):
+        self._transaction_port = transaction_port
+        self._executor = executor
+
+    async def get_all_page(
+        self,
+        limit: int = 50,
+        since: datetime | None = None,
+        cursor: str | None = None,
+        page_size: int | None = None
+    ) -> Tuple[list[Transaction], str | None]:
+        """Get one page of transactions and the cursor to the next one."""
+        return await run_blocking(
+            self._executor, self._transaction_port.get_all_page,
+            limit=limit, since=since, cursor=cursor, page_size=page_size
+        )
+
+    async def get_all_rows_page(
+        self,
+        limit: int = 50,
+        since: datetime | None = None,
+        cursor: str | None = None,
+        page_size: int | None = None
+    ) -> Tuple[list[TransactionRow], str | None]:
+        """Like ``get_all_page``, as unvalidated rows for responses."""
+        return await run_blocking(
+            self._executor, self._transaction_port.get_all_rows_page,
+            limit=limit, since=since, cursor=cursor, page_size=page_size
+        )
+
+    async def get_by_fund_page(
+        self,
+        fund_id: str,
+        limit: int = 50,
+        cursor: str | None = None,
+        page_size: int | None = None
+    ) -> Tuple[list[Transaction], str | None]:
+        """Get one page of a fund's transactions and the next cursor."""
+        return await run_blocking(
+            self._executor, self._transaction_port.get_by_fund_page,
+            fund_id, limit=limit, cursor=cursor, page_size=page_size
+        )
+
+    async def get_by_user_page(
+        self,
+        user_id: str,
+        limit: int = 50,
+        cursor: str | None = None,
+        page_size: int | None = None,
+        from_time: datetime | None = None,
+        to_time: datetime | None = None
+    ) -> Tuple[list[Transaction], str | None]:
+        """Get one page of a user's transactions and the next cursor."""
+        return await run_blocking(
+            self._executor, self._transaction_port.get_by_user_page,
+            user_id, limit=limit, cursor=cursor, page_size=page_size,
+            from_time=from_time, to_time=to_time
+        )
+
+    async def get_by_user_rows_page(
+        self,
+        user_id: str,
+        limit: int = 50,
+        cursor: str | None = None,
+        page_size: int | None = None,
+        from_time: datetime | None = None,
+        to_time: datetime | None = None
+    ) -> Tuple[list[TransactionRow], str | None]:
+        """Like ``get_by_user_page``, as unvalidated rows for responses."""
+        return await run_blocking(
+            self._executor, self._transaction_port.get_by_user_rows_page,
+            user_id, limit=limit, cursor=cursor, page_size=page_size,
+            from_time=from_time, to_time=to_time
+        )
+
+    async def save(self, transaction: Transaction) -> Transaction:
+        """Save a transaction."""
+        return await run_blocking(
+            self._executor, self._transaction_port.save, transaction
+        )
+
+
+class AsyncUnitOfWorkAdapter(AsyncUnitOfWorkPort):
+    def __init__(
+        self,
+        unit_of_work: UnitOfWorkPort,
+        executor: ThreadPoolExecutor
+    ):
+        self._unit_of_work = unit_of_work
+        self._executor = executor
+
+    async def subscribe(
+        self,
+        subscription: Subscription,
+        transaction: Transaction,
+        claim: IdempotencyRecord | None = None
+    ) -> Subscription:
+        """Debit the balance, open the subscription and log the transaction."""
+        return await run_blocking(
+            self._executor, self._unit_of_work.subscribe,
+            subscription, transaction, claim
+        )
+
+    async def subscribe_many(
+        self,
+        entries: list[tuple[Subscription, Transaction]]
+    ) -> list[Subscription | Exception]:
+        """Subscribe many users, at most one entry per user."""
+        return await run_blocking(
+            self._executor, self._unit_of_work.subscribe_many, entries
+        )
+
+    async def cancel(
+        self,
+        subscription: Subscription,
+        transaction: Transaction,
+        claim: IdempotencyRecord | None = None
+    ) -> Subscription:
+        """Refund the amount, cancel the subscription and log the transaction."""
+        return await run_blocking(
+            self._executor, self._unit_of_work.cancel,
+            subscription, transaction, claim
+        )
@@ -0,0 +1,95 @@
+import contextvars
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Sequence, TypeVar
+
+
+T = TypeVar('T')
+
+# DynamoDB limits per request
+BATCH_GET_LIMIT = 100
+TRANSACT_LIMIT = 100
+
+MAX_ATTEMPTS = 8
+
+
+def chunked(values: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """Split ``values`` into consecutive slices of at most ``size``."""
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def backoff_delay(attempt: int, base: float = 0.05, cap: float = 2.0) -> float:
+    """Exponential backoff with full jitter for the given retry attempt."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def batch_get_items(
+    dynamodb: Any,
+    table_name: str,
+    keys: List[Dict[str, Any]],
+    max_attempts: int = MAX_ATTEMPTS,
+    max_workers: int | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+    projection: Dict[str, Any] | None = None
+) -> List[Dict[str, Any]]:
+    """Read ``keys`` with BatchGetItem, in chunks of up to 100 keys.
+
+    Chunks are read concurrently (up to ``max_workers`` at a time) and
+    keys returned as UnprocessedKeys are retried with backoff. Items come
+    back in no particular order and missing keys are simply absent.
+    ``projection`` (see ``projection.projection``) limits the attributes.
+    """
+    chunks = list(chunked(keys, BATCH_GET_LIMIT))
+
+    def read(chunk: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return _batch_get_chunk(
+            dynamodb, table_name, chunk, max_attempts, sleep, projection
+        )
+
+    if len(chunks) <= 1:
+        return [item for chunk in chunks for item in read(chunk)]
+
+    workers = min(len(chunks), max_workers or int(
+        os.getenv('DYNAMODB_BATCH_GET_CONCURRENCY', '8')
+    ))
+    # Each chunk runs in its own copy of the caller's context, as inline
+    # calls do (request metrics are kept in a context variable)
+    contexts = [contextvars.copy_context() for _ in chunks]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return [
+            item
+            for items in executor.map(
+                lambda context, chunk: context.run(read, chunk),
+                contexts,
+                chunks
+            )
+            for item in items
+        ]
+
+
+def _batch_get_chunk(
+    dynamodb: Any,
+    table_name: str,
+    keys: Sequence[Dict[str, Any]],
+    max_attempts: int,
+    sleep: Callable[[float], None],
+    projection: Dict[str, Any] | None = None
+) -> List[Dict[str, Any]]:
+    items: List[Dict[str, Any]] = []
+    # UnprocessedKeys carries the projection along with the keys
+    request = {table_name: {'Keys': list(keys), **(projection or {})}}
+    for attempt in range(max_attempts):
+        response = dynamodb.batch_get_item(RequestItems=request)
+        items.extend(response.get('Responses', {}).get(table_name, []))
+        request = response.get('UnprocessedKeys') or {}
+        if not request:
+            return items
+        sleep(backoff_delay(attempt))
+
+    raise Exception(
+        "Error reading items: unprocessed keys left after "
+        f"{max_attempts} attempts"
+    )
@@ -0,0 +1,174 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Tuple
+from app.application.ports.funds import FundPort
+from app.domain.models.fund import Fund
+
+
+# Marks a cached "fund does not exist" answer.
+_NOT_FOUND = object()
+
+
+class CachedFundAdapter(FundPort):
+    """
+    FundPort decorator keeping funds in process memory.
+
+    Meant to be created once per process so the cache survives warm Lambda
+    invocations. Entries expire after ``ttl`` seconds (``negative_ttl`` for
+    funds that do not exist) and the least recently used ones are evicted
+    beyond ``max_size``. Concurrent misses for the same fund wait for a
+    single fetch instead of all reaching DynamoDB.
+    """
+
+    def __init__(
+            self,
+            funds_port: FundPort,
+            ttl: float = 300.0,
+            max_size: int = 256,
+            negative_ttl: float | None = None,
+            clock: Callable[[], float] = time.monotonic
+            ) -> None:
+        self._funds_port = funds_port
+        self._ttl = ttl
+        self._negative_ttl = ttl if negative_ttl is None else negative_ttl
+        self._max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[str, Tuple[float, object]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading: Dict[str, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_by_id(self, fund_id: str) -> Fund:
+        """Get a fund by its ID, from the cache when possible."""
+        found, value = self._lookup(fund_id)
+        if not found:
+            with self._lock:
+                loading = self._loading.setdefault(fund_id, threading.Lock())
+
+            with loading:
+                # Another thread may have loaded it while we waited.
+                found, value = self._lookup(fund_id)
+                if not found:
+                    try:
+                        value = self._load(fund_id)
+                    finally:
+                        with self._lock:
+                            self._loading.pop(fund_id, None)
+
+        if value is _NOT_FOUND:
+            raise ValueError(f"Fund with ID {fund_id} not found")
+        return value
+
+    def get_many(self, fund_ids: list[str]) -> list[Fund]:
+        """Get several funds, reading only the uncached ones in one batch."""
+        values: Dict[str, object] = {}
+        missing = []
+        for fund_id in dict.fromkeys(fund_ids):
+            found, value = self._lookup(fund_id)
+            if found:
+                values[fund_id] = value
+            else:
+                missing.append(fund_id)
+
+        if missing:
+            with self._lock:
+                self.misses += len(missing)
+            loaded = {
+                fund.fund_id: fund
+                for fund in self._funds_port.get_many(missing)
+            }
+            for fund_id in missing:
+                values[fund_id] = loaded.get(fund_id, _NOT_FOUND)
+                self._store(fund_id, values[fund_id])
+
+        return [
+            values[fund_id]
+            for fund_id in dict.fromkeys(fund_ids)
+            if values[fund_id] is not _NOT_FOUND
+        ]
+
+    def list_all(
+            self,
+            limit: int = 50,
+            last_key: str | None = None
+            ) -> Tuple[list[Fund], str | None]:
+        """List all funds (not cached)."""
+        return self._funds_port.list_all(limit=limit, last_key=last_key)
+
+    def search(
+            self,
+            category: str,
+            max_min_amount: float | None = None,
+            limit: int = 50,
+            cursor: str | None = None
+            ) -> Tuple[list[Fund], str | None]:
+        """Search the catalog (not cached), caching each fund found."""
+        funds, next_cursor = self._funds_port.search(
+            category, max_min_amount, limit=limit, cursor=cursor
+        )
+        for fund in funds:
+            self._store(fund.fund_id, fund)
+        return funds, next_cursor
+
+    def warm(self, page_size: int = 100) -> int:
+        """Load the whole catalog into the cache, returning the funds read."""
+        loaded = 0
+        last_key = None
+        while True:
+            funds, last_key = self._funds_port.list_all(
+                limit=page_size, last_key=last_key
+            )
+            for fund in funds:
+                self._store(fund.fund_id, fund)
+            loaded += len(funds)
+            if last_key is None:
+                return loaded
+
+    def invalidate(self, fund_id: str | None = None) -> None:
+        """Drop one fund from the cache, or all of them."""
+        with self._lock:
+            if fund_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(fund_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters, e.g. to estimate the read units saved."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries)
+            }
+
+    def _lookup(self, fund_id: str) -> Tuple[bool, object]:
+        with self._lock:
+            entry = self._entries.get(fund_id)
+            if entry is None or entry[0] <= self._clock():
+                return False, None
+            self._entries.move_to_end(fund_id)
+            self.hits += 1
+            return True, entry[1]
+
+    def _load(self, fund_id: str) -> object:
+        with self._lock:
+            self.misses += 1
+        try:
+            value = self._funds_port.get_by_id(fund_id)
+        except ValueError:
+            value = _NOT_FOUND
+        self._store(fund_id, value)
+        return value
+
+    def _store(self, fund_id: str, value: object) -> None:
+        ttl = self._negative_ttl if value is _NOT_FOUND else self._ttl
+        with self._lock:
+            self._entries[fund_id] = (self._clock() + ttl, value)
+            self._entries.move_to_end(fund_id)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
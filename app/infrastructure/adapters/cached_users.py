@@ -0,0 +1,217 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Tuple
+from app.application.ports.unit_of_work import UnitOfWorkPort
+from app.application.ports.users import UserPort
+from app.domain.models.idempotency import IdempotencyRecord
+from app.domain.models.partial import PartialRecord
+from app.domain.models.subscription import Subscription
+from app.domain.models.transaction import Transaction
+from app.domain.models.user import User
+
+
+class CachedUserAdapter(UserPort):
+    """
+    UserPort decorator keeping user profiles in process memory briefly.
+
+    Profiles change with every subscription, so entries only live ``ttl``
+    seconds and are dropped by ``invalidate`` whenever this process writes
+    the user. The balance is never trusted for correctness: the writes
+    check it themselves (``balance >= :amount``), so a stale entry cannot
+    cause an overdraft.
+
+    Each user carries a version that ``invalidate`` and ``update`` bump.
+    A read records the version it started at and is only stored if no
+    write happened meanwhile, so a slow read cannot put back a profile
+    that a concurrent write already replaced. Versions come from one
+    process-wide counter, so the table of them can be reset without
+    reusing an old value.
+    """
+
+    def __init__(
+            self,
+            user_port: UserPort,
+            ttl: float = 5.0,
+            max_size: int = 1024,
+            clock: Callable[[], float] = time.monotonic
+            ) -> None:
+        self._user_port = user_port
+        self._ttl = ttl
+        self._max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[str, Tuple[float, int, User]] = (
+            OrderedDict()
+        )
+        self._versions: Dict[str, int] = {}
+        self._counter = 0
+        # Version of every user absent from ``_versions``
+        self._floor = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_by_id(
+            self,
+            user_id: str,
+            fields: Iterable[str] | None = None
+            ) -> User | PartialRecord:
+        """Get a user by their ID, from the cache when possible.
+
+        A cached profile also answers partial reads; partial users read
+        from the table are not cached.
+        """
+        user = self._lookup(user_id)
+        if user is not None:
+            return user
+
+        version = self._version(user_id)
+        with self._lock:
+            self.misses += 1
+        user = self._user_port.get_by_id(user_id, fields)
+        self._store(user, version)
+        return user
+
+    def get_many(
+            self,
+            user_ids: list[str],
+            fields: Iterable[str] | None = None
+            ) -> list[User | PartialRecord]:
+        """Get several users, reading only the uncached ones in one batch."""
+        users: Dict[str, User] = {}
+        missing = []
+        for user_id in dict.fromkeys(user_ids):
+            user = self._lookup(user_id)
+            if user is not None:
+                users[user_id] = user
+            else:
+                missing.append(user_id)
+
+        if missing:
+            versions = {user_id: self._version(user_id) for user_id in missing}
+            with self._lock:
+                self.misses += len(missing)
+            for user in self._user_port.get_many(missing, fields):
+                users[user.user_id] = user
+                self._store(user, versions[user.user_id])
+
+        return [
+            users[user_id]
+            for user_id in dict.fromkeys(user_ids)
+            if user_id in users
+        ]
+
+    def update(self, user_id: str, **params: Any) -> User:
+        """Update a user and cache the profile the write returned."""
+        version = self.invalidate(user_id)
+        user = self._user_port.update(user_id, **params)
+        self._store(user, version)
+        return user
+
+    def invalidate(self, user_id: str | None = None) -> int:
+        """Drop one user from the cache (or all), returning its new version."""
+        with self._lock:
+            self._counter += 1
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+                self._versions[user_id] = self._counter
+            if user_id is None or len(self._versions) > self._max_size:
+                # Reads started before now hold an older version and
+                # will not be stored
+                self._versions.clear()
+                self._floor = self._counter
+            return self._counter
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters, e.g. to estimate the read units saved."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries)
+            }
+
+    def _version(self, user_id: str) -> int:
+        with self._lock:
+            return self._versions.get(user_id, self._floor)
+
+    def _lookup(self, user_id: str) -> User | None:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] <= self._clock():
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[2]
+
+    def _store(self, user: User, version: int) -> None:
+        if isinstance(user, PartialRecord):
+            return
+        with self._lock:
+            if self._versions.get(user.user_id, self._floor) != version:
+                # Written since this read started: the profile is stale
+                return
+            self._entries[user.user_id] = (
+                self._clock() + self._ttl, version, user
+            )
+            self._entries.move_to_end(user.user_id)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+
+class UserCacheUnitOfWork(UnitOfWorkPort):
+    """
+    UnitOfWorkPort decorator dropping the cached profile of every user
+    whose balance a transaction may have changed, committed or not.
+    """
+
+    def __init__(
+            self,
+            unit_of_work: UnitOfWorkPort,
+            users: CachedUserAdapter
+            ) -> None:
+        self.wrapped = unit_of_work
+        self._users = users
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.wrapped, name)
+
+    def subscribe(
+            self,
+            subscription: Subscription,
+            transaction: Transaction,
+            claim: IdempotencyRecord | None = None
+            ) -> Subscription:
+        """Commit a subscription, then forget the user's profile."""
+        try:
+            return self.wrapped.subscribe(subscription, transaction, claim)
+        finally:
+            self._users.invalidate(subscription.user_id)
+
+    def subscribe_many(
+            self,
+            entries: list[tuple[Subscription, Transaction]]
+            ) -> list[Subscription | Exception]:
+        """Commit many subscriptions, then forget the users' profiles."""
+        try:
+            return self.wrapped.subscribe_many(entries)
+        finally:
+            for subscription, _ in entries:
+                self._users.invalidate(subscription.user_id)
+
+    def cancel(
+            self,
+            subscription: Subscription,
+            transaction: Transaction,
+            claim: IdempotencyRecord | None = None
+            ) -> Subscription:
+        """Commit a cancellation, then forget the user's profile."""
+        try:
+            return self.wrapped.cancel(subscription, transaction, claim)
+        finally:
+            self._users.invalidate(subscription.user_id)
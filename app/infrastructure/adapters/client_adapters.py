@@ -0,0 +1,70 @@
+from app.infrastructure.adapters.funds import FundAdapter
+from app.infrastructure.adapters.subscription import SubscriptionAdapter
+from app.infrastructure.adapters.transactions import TransactionAdapter
+from app.infrastructure.adapters.users import UserAdapter
+from app.infrastructure.adapters.wire import (
+    WireTable,
+    wire_to_fund,
+    wire_to_row,
+    wire_to_subscription,
+    wire_to_transaction,
+    wire_to_user
+)
+from app.infrastructure.dynamodb import get_dynamodb_client
+
+
+# The same adapters, reading through the low-level client: items arrive in
+# the wire format and each record's decoder builds the domain object from
+# it directly, skipping the resource layer's Decimal conversion (see
+# ``wire``). Writes still go through the resource. Pages and cursors are
+# the same as the resource adapters'.
+
+
+def _wire_table(dynamodb_client, table_name: str) -> WireTable:
+    return WireTable(dynamodb_client or get_dynamodb_client(), table_name)
+
+
+class ClientUserAdapter(UserAdapter):
+    _to_user = staticmethod(wire_to_user)
+    _wire = True
+
+    def __init__(self, dynamodb_resource=None, dynamodb_client=None):
+        super().__init__(dynamodb_resource)
+        self._reads = self._batch_reads = _wire_table(
+            dynamodb_client, self.table_name
+        )
+
+
+class ClientFundAdapter(FundAdapter):
+    _to_fund = staticmethod(wire_to_fund)
+    _wire = True
+
+    def __init__(self, dynamodb_resource=None, dynamodb_client=None):
+        super().__init__(dynamodb_resource)
+        self._reads = self._batch_reads = _wire_table(
+            dynamodb_client, self.table_name
+        )
+
+
+class ClientSubscriptionAdapter(SubscriptionAdapter):
+    _to_subscription = staticmethod(wire_to_subscription)
+    _wire = True
+
+    def __init__(self, dynamodb_resource=None, dynamodb_client=None):
+        super().__init__(dynamodb_resource)
+        self._reads = _wire_table(
+            dynamodb_client, self.subscriptions_table.name
+        )
+
+
+class ClientTransactionAdapter(TransactionAdapter):
+    _to_transaction = staticmethod(wire_to_transaction)
+    _to_row = staticmethod(wire_to_row)
+    _wire = True
+
+    def __init__(self, dynamodb_resource=None, dynamodb_client=None):
+        super().__init__(dynamodb_resource)
+        # WireTable takes the rendered requests of parallel_scan too
+        self._reads = self._scan_client = _wire_table(
+            dynamodb_client, self.transactions_table.name
+        )
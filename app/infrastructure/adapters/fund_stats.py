@@ -0,0 +1,85 @@
+import os
+import zlib
+from botocore.exceptions import ClientError
+from app.application.ports.fund_stats import FundStatsPort
+from app.domain.models.fund_stats import FundStats
+from app.infrastructure.adapters.batch import batch_get_items
+from app.infrastructure.dynamodb import get_dynamodb_resource
+from typing import Any, Dict, List
+
+
+STATS_SK = 'STATS'
+
+
+def stats_shards() -> int:
+    """Number of counter shards per fund (only ever increase it)."""
+    return max(1, int(os.getenv('FUND_STATS_SHARDS', '10')))
+
+
+def shard_for(user_id: str, shards: int) -> int:
+    """Counter shard written by a user's subscriptions."""
+    return zlib.crc32(user_id.encode()) % shards
+
+
+def stats_key(fund_id: str, shard: int) -> Dict[str, str]:
+    # Each shard has its own partition key: shards sharing one PK would
+    # share its partition and its write throughput.
+    return {'PK': f'FUND#{fund_id}#STATS#{shard}', 'SK': STATS_SK}
+
+
+def stats_action(
+        table_name: str,
+        fund_id: str,
+        shard: int,
+        amount: int,
+        subscribers: int
+        ) -> Dict[str, Any]:
+    """TransactWriteItems action adding to one counter shard of a fund."""
+    return {'Update': {
+        'TableName': table_name,
+        'Key': stats_key(fund_id, shard),
+        'UpdateExpression': (
+            'SET fund_id = :fund_id '
+            'ADD aum :amount, active_subscribers :subscribers'
+        ),
+        'ExpressionAttributeValues': {
+            ':fund_id': fund_id,
+            ':amount': amount,
+            ':subscribers': subscribers
+        }
+    }}
+
+
+def sum_shards(fund_id: str, items: List[Dict[str, Any]]) -> FundStats:
+    """Add up the counter shards of a fund."""
+    return FundStats(
+        fund_id=fund_id,
+        aum=sum(int(item.get('aum', 0)) for item in items),
+        active_subscribers=sum(
+            int(item.get('active_subscribers', 0)) for item in items
+        )
+    )
+
+
+class FundStatsAdapter(FundStatsPort):
+    def __init__(self, dynamodb_resource=None, shards: int | None = None):
+        if dynamodb_resource is None:
+            # En Lambda, usar IAM Role automático (recurso compartido)
+            self.dynamodb = get_dynamodb_resource()
+        else:
+            self.dynamodb = dynamodb_resource
+
+        self.table_name = os.getenv('APPCHALLENGE_TABLE_NAME', 'AppChallenge')
+        self.shards = shards or stats_shards()
+
+    def get(self, fund_id: str) -> FundStats:
+        """Get a fund's assets under management and active subscribers."""
+        keys = [stats_key(fund_id, shard) for shard in range(self.shards)]
+        try:
+            items = batch_get_items(self.dynamodb, self.table_name, keys)
+            return sum_shards(fund_id, items)
+
+        except ClientError as e:
+            raise Exception(
+                f"Error retrieving fund stats: {e.response['Error']['Message']}"
+            )
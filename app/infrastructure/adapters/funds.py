@@ -1,28 +1,56 @@
-import boto3
 import os
+from decimal import Decimal
 from botocore.exceptions import ClientError
+from boto3.dynamodb.conditions import Attr, Key
 from app.domain.models.fund import Fund
 from app.application.ports.funds import FundPort
+from app.infrastructure.adapters.batch import batch_get_items
+from app.infrastructure.adapters.pagination import read_page
+from app.infrastructure.dynamodb import get_dynamodb_resource
 from typing import List, Tuple, Dict, Any
 
 
+TABLE_KEY = ('PK', 'SK')
+
+# Fund profiles by category, cheapest first: category-index is
+# (category, min_amount). Only fund profiles carry both attributes.
+CATEGORY_INDEX = 'category-index'
+CATEGORY_INDEX_KEY = ('category', 'min_amount', 'PK', 'SK')
+
+
+def item_to_fund(item: Dict[str, Any]) -> Fund:
+    """Build a Fund from its PROFILE item."""
+    return Fund(
+        fund_id=item.get('fund_id'),
+        name=item.get('name'),
+        min_amount=float(item.get('min_amount', 0)),
+        category=item.get('category')
+    )
+
+
 class FundAdapter(FundPort):
+    # Reads decode items with this; ClientFundAdapter reads the wire format
+    _to_fund = staticmethod(item_to_fund)
+    _wire = False
+
     def __init__(self, dynamodb_resource=None):
         if dynamodb_resource is None:
-            # En Lambda, usar IAM Role automático
-            self.dynamodb = boto3.resource(
-                'dynamodb',
-                region_name=os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
-            )
+            # En Lambda, usar IAM Role automático (recurso compartido)
+            self.dynamodb = get_dynamodb_resource()
         else:
             self.dynamodb = dynamodb_resource
 
-        self.funds_table = self.dynamodb.Table(os.getenv('APPCHALLENGE_TABLE_NAME', 'AppChallenge'))
+        self.table_name = os.getenv('APPCHALLENGE_TABLE_NAME', 'AppChallenge')
+        self.funds_table = self.dynamodb.Table(self.table_name)
+        # Where reads go: get_item/query/scan on the table, batch_get_item
+        # on the source
+        self._reads = self.funds_table
+        self._batch_reads = self.dynamodb
 
     def get_by_id(self, fund_id: str) -> Fund:
         """Get a fund by its ID."""
         try:
-            response = self.funds_table.get_item(
+            response = self._reads.get_item(
                 Key={
                     'PK': f'FUND#{fund_id}',
                     'SK': 'PROFILE'
@@ -32,49 +60,86 @@ class FundAdapter(FundPort):
             if 'Item' not in response:
                 raise ValueError(f"Fund with ID {fund_id} not found")
 
-            item = response['Item']
-            return Fund(
-                fund_id=item.get('fund_id'),
-                name=item.get('name'),
-                min_amount=float(item.get('min_amount', 0)),
-                category=item.get('category')
-            )
+            return self._to_fund(response['Item'])
         except ClientError as e:
             raise Exception(
                 f"Error retrieving fund: {e.response['Error']['Message']}"
             )
 
+    def get_many(self, fund_ids: List[str]) -> List[Fund]:
+        """Get several funds at once, skipping the ones that don't exist."""
+        # BatchGetItem rejects duplicate keys
+        unique = list(dict.fromkeys(fund_ids))
+        keys = [{'PK': f'FUND#{fund_id}', 'SK': 'PROFILE'} for fund_id in unique]
+        try:
+            items = batch_get_items(self._batch_reads, self.table_name, keys)
+        except ClientError as e:
+            raise Exception(
+                f"Error retrieving funds: {e.response['Error']['Message']}"
+            )
+
+        # BatchGetItem returns items in any order: restore the input order
+        funds = (self._to_fund(item) for item in items)
+        found = {fund.fund_id: fund for fund in funds}
+        return [found[fund_id] for fund_id in unique if fund_id in found]
+
     def list_all(
         self,
         limit: int = 50,
         last_key: str | None = None
     ) -> Tuple[List[Fund], str | None]:
-        """List all funds."""
+        """List all funds, resuming after the ``last_key`` cursor."""
         try:
-            scan_kwargs: Dict[str, Any] = {'Limit': limit}
-
-            if last_key:
-                scan_kwargs['ExclusiveStartKey'] = {'fund_id': last_key}
-
-            response = self.funds_table.scan(**scan_kwargs)
-
-            funds = []
-            for item in response.get('Items', []):
-                fund = Fund(
-                    fund_id=item['fund_id'],
-                    name=item['name'],
-                    min_amount=float(item['min_amount']),
-                    category=item['category']
+            scan_kwargs: Dict[str, Any] = {
+                'FilterExpression': (
+                    Attr('PK').begins_with('FUND#') & Attr('SK').eq('PROFILE')
                 )
-                funds.append(fund)
+            }
 
-            next_key = None
-            if 'LastEvaluatedKey' in response:
-                next_key = response['LastEvaluatedKey']['fund_id']
+            items, next_key = read_page(
+                self._reads.scan,
+                scan_kwargs,
+                TABLE_KEY,
+                limit,
+                cursor=last_key,
+                wire=self._wire
+            )
 
+            funds = [self._to_fund(item) for item in items]
             return (funds, next_key)
 
         except ClientError as e:
             raise Exception(
                 f"Error listing funds: {e.response['Error']['Message']}"
             )
+
+    def search(
+        self,
+        category: str,
+        max_min_amount: float | None = None,
+        limit: int = 50,
+        cursor: str | None = None
+    ) -> Tuple[List[Fund], str | None]:
+        """Funds of a category, by minimum amount, up to ``max_min_amount``."""
+        condition = Key('category').eq(category)
+        if max_min_amount is not None:
+            condition &= Key('min_amount').lte(Decimal(str(max_min_amount)))
+        try:
+            items, next_cursor = read_page(
+                self._reads.query,
+                {
+                    'IndexName': CATEGORY_INDEX,
+                    'KeyConditionExpression': condition
+                },
+                CATEGORY_INDEX_KEY,
+                limit,
+                cursor,
+                limit,
+                wire=self._wire
+            )
+            return [self._to_fund(item) for item in items], next_cursor
+
+        except ClientError as e:
+            raise Exception(
+                f"Error searching funds: {e.response['Error']['Message']}"
+            )
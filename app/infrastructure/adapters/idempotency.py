@@ -0,0 +1,241 @@
+import json
+import os
+import time
+import uuid
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.exceptions import ClientError
+from app.application.ports.errors import IdempotencyConflict
+from app.application.ports.idempotency import IdempotencyPort
+from app.domain.models.idempotency import IdempotencyRecord, IdempotencyStatus
+from app.infrastructure.dynamodb import get_dynamodb_resource
+from typing import Any, Callable, Dict
+
+
+IDEMPOTENCY_SK = 'IDEMPOTENCY'
+
+_deserializer = TypeDeserializer()
+
+
+def idempotency_key(key: str) -> Dict[str, str]:
+    return {'PK': f'IDEMPOTENCY#{key}', 'SK': IDEMPOTENCY_SK}
+
+
+def item_to_record(key: str, item: Dict[str, Any]) -> IdempotencyRecord:
+    return IdempotencyRecord(
+        key=key,
+        fingerprint=item['fingerprint'],
+        status=IdempotencyStatus(item['status']),
+        status_code=item.get('status_code'),
+        body=json.loads(item['response']) if 'response' in item else None,
+        claim_id=item.get('claim_id')
+    )
+
+
+def _completion(
+        claim: IdempotencyRecord,
+        status_code: int,
+        body: Any
+        ) -> Dict[str, Any]:
+    """Update storing the response of ``claim``, while it still holds."""
+    return {
+        'UpdateExpression': (
+            'SET #status = :completed, status_code = :status_code, '
+            'response = :response REMOVE locked_until'
+        ),
+        # Once the lock expired another request may have taken the key
+        'ConditionExpression': (
+            '#status = :in_progress AND claim_id = :claim_id'
+        ),
+        'ExpressionAttributeNames': {'#status': 'status'},
+        'ExpressionAttributeValues': {
+            ':completed': IdempotencyStatus.COMPLETED.value,
+            ':in_progress': IdempotencyStatus.IN_PROGRESS.value,
+            ':claim_id': claim.claim_id,
+            ':status_code': status_code,
+            # Stored as JSON text: DynamoDB numbers come back as Decimal
+            # and would not replay byte for byte
+            ':response': json.dumps(body, separators=(',', ':'))
+        }
+    }
+
+
+def completion_action(
+        table_name: str,
+        claim: IdempotencyRecord,
+        status_code: int,
+        body: Any
+        ) -> Dict[str, Any]:
+    """TransactWriteItems action completing ``claim`` with a response.
+
+    Written in the same transaction as the operation, a retry replays the
+    response even if the process dies right after the write.
+    """
+    return {'Update': {
+        'TableName': table_name,
+        'Key': idempotency_key(claim.key),
+        **_completion(claim, status_code, body)
+    }}
+
+
+def mark_completed(
+        claim: IdempotencyRecord,
+        status_code: int,
+        body: Any
+        ) -> None:
+    """Record on ``claim`` that its response is stored."""
+    claim.status = IdempotencyStatus.COMPLETED
+    claim.status_code = status_code
+    claim.body = body
+
+
+class IdempotencyAdapter(IdempotencyPort):
+    """
+    Idempotency records in the application table.
+
+    Records expire through the table's TTL (``expires_at``) after ``ttl``
+    seconds. A claim that was never completed, e.g. because the process
+    died, can be taken over after ``lock_timeout`` seconds.
+    """
+
+    def __init__(
+            self,
+            dynamodb_resource=None,
+            ttl: int | None = None,
+            lock_timeout: int | None = None,
+            clock: Callable[[], float] = time.time
+            ) -> None:
+        if dynamodb_resource is None:
+            # En Lambda, usar IAM Role automático (recurso compartido)
+            self.dynamodb = get_dynamodb_resource()
+        else:
+            self.dynamodb = dynamodb_resource
+
+        self.idempotency_table = self.dynamodb.Table(os.getenv('APPCHALLENGE_TABLE_NAME', 'AppChallenge'))
+        self.ttl = ttl or int(os.getenv('IDEMPOTENCY_TTL_SECONDS', '86400'))
+        self.lock_timeout = lock_timeout or int(
+            os.getenv('IDEMPOTENCY_LOCK_SECONDS', '30')
+        )
+        self._clock = clock
+
+    def begin(self, key: str, fingerprint: str) -> IdempotencyRecord:
+        """Claim ``key`` for a request, or return its completed record."""
+        now = int(self._clock())
+        claim = IdempotencyRecord(
+            key=key,
+            fingerprint=fingerprint,
+            status=IdempotencyStatus.IN_PROGRESS,
+            claim_id=uuid.uuid4().hex
+        )
+        try:
+            self.idempotency_table.put_item(
+                Item={
+                    **idempotency_key(key),
+                    'fingerprint': fingerprint,
+                    'status': IdempotencyStatus.IN_PROGRESS.value,
+                    'claim_id': claim.claim_id,
+                    'locked_until': now + self.lock_timeout,
+                    'expires_at': now + self.ttl
+                },
+                # TTL deletes lazily: expired records count as absent
+                ConditionExpression=(
+                    'attribute_not_exists(PK) OR expires_at < :now OR '
+                    '(#status = :in_progress AND locked_until < :now)'
+                ),
+                ExpressionAttributeNames={'#status': 'status'},
+                ExpressionAttributeValues={
+                    ':now': now,
+                    ':in_progress': IdempotencyStatus.IN_PROGRESS.value
+                },
+                # A replay gets the stored record back without a second read
+                ReturnValuesOnConditionCheckFailure='ALL_OLD'
+            )
+            return claim
+
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise Exception(
+                    "Error claiming idempotency key: "
+                    f"{e.response['Error']['Message']}"
+                )
+            old = e.response.get('Item')
+
+        if old is not None:
+            record = item_to_record(key, {
+                name: _deserializer.deserialize(value)
+                for name, value in old.items()
+            })
+        else:
+            record = self._get(key)
+        if record is None:
+            # Released between our put and get: let the caller retry
+            raise IdempotencyConflict(
+                "A request with this Idempotency-Key is still in progress"
+            )
+        if record.fingerprint != fingerprint:
+            raise IdempotencyConflict(
+                "Idempotency-Key was already used with a different request"
+            )
+        if record.status != IdempotencyStatus.COMPLETED:
+            raise IdempotencyConflict(
+                "A request with this Idempotency-Key is still in progress"
+            )
+        return record
+
+    def complete(
+            self,
+            claim: IdempotencyRecord,
+            status_code: int,
+            body: Any
+            ) -> None:
+        """Store the response of the request holding ``claim``."""
+        try:
+            self.idempotency_table.update_item(
+                Key=idempotency_key(claim.key),
+                **_completion(claim, status_code, body)
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise Exception(
+                    "Error storing idempotent response: "
+                    f"{e.response['Error']['Message']}"
+                )
+            # The key was taken over: the response of that request wins
+            return
+        mark_completed(claim, status_code, body)
+
+    def release(self, claim: IdempotencyRecord) -> None:
+        """Forget ``claim``'s key after a failure, so a retry runs again."""
+        try:
+            self.idempotency_table.delete_item(
+                Key=idempotency_key(claim.key),
+                ConditionExpression=(
+                    '#status = :in_progress AND claim_id = :claim_id'
+                ),
+                ExpressionAttributeNames={'#status': 'status'},
+                ExpressionAttributeValues={
+                    ':in_progress': IdempotencyStatus.IN_PROGRESS.value,
+                    ':claim_id': claim.claim_id
+                }
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise Exception(
+                    "Error releasing idempotency key: "
+                    f"{e.response['Error']['Message']}"
+                )
+
+    def _get(self, key: str) -> IdempotencyRecord | None:
+        try:
+            response = self.idempotency_table.get_item(
+                Key=idempotency_key(key), ConsistentRead=True
+            )
+        except ClientError as e:
+            raise Exception(
+                "Error reading idempotency key: "
+                f"{e.response['Error']['Message']}"
+            )
+
+        item = response.get('Item')
+        if item is None:
+            return None
+        return item_to_record(key, item)
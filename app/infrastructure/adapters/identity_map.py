@@ -0,0 +1,457 @@
+"""
+Request-scoped identity map in front of the user, subscription and fund
+ports and the unit of work.
+
+Inside ``request_scope()`` every key is read from DynamoDB at most once:
+later reads of the same user, subscription or fund, including the
+``None`` / not-found answers, come from the map. Writes keep it current
+without another read: ``update`` stores the ``ALL_NEW`` item it gets
+back, and a committed unit of work stores the subscription it wrote. The
+balance it changed is updated atomically on the server, so that user is
+dropped and read again if needed.
+
+The map lives in a context variable; the thread pools running boto3
+calls copy the caller's context, so every call of a request shares it.
+Outside a scope (jobs, scripts) the decorators just delegate.
+"""
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List
+from typing import Optional, Tuple
+
+from app.application.ports.funds import FundPort
+from app.application.ports.subscriptions import SubscriptionPort
+from app.application.ports.unit_of_work import UnitOfWorkPort
+from app.application.ports.users import UserPort
+from app.domain.models.fund import Fund
+from app.domain.models.idempotency import IdempotencyRecord
+from app.domain.models.partial import PartialRecord
+from app.domain.models.subscription import Subscription
+from app.domain.models.transaction import Transaction
+from app.domain.models.user import User
+
+
+# Marks a cached "does not exist" answer.
+_NOT_FOUND = object()
+
+_scope: ContextVar['IdentityMap | None'] = ContextVar(
+    'identity_map', default=None
+)
+
+
+class IdentityMap:
+    """Entities read or written during one request, by key."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[Hashable, object] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+
+    def lookup(self, key: Hashable) -> Tuple[bool, object]:
+        with self._lock:
+            if key not in self._entries:
+                return False, None
+            self.hits += 1
+            return True, self._entries[key]
+
+    def store(self, key: Hashable, value: object) -> None:
+        with self._lock:
+            self._entries[key] = value
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+def current_identity_map() -> IdentityMap | None:
+    """The identity map of the current request, if any."""
+    return _scope.get()
+
+
+@contextmanager
+def request_scope() -> Iterator[IdentityMap]:
+    """Share one identity map among the calls made inside the block."""
+    identity_map = IdentityMap()
+    token = _scope.set(identity_map)
+    try:
+        yield identity_map
+    finally:
+        _scope.reset(token)
+
+
+async def identity_map_middleware(request: Any, call_next: Callable) -> Any:
+    """HTTP middleware opening a request scope around each request."""
+    with request_scope():
+        return await call_next(request)
+
+
+def _user_key(user_id: str) -> Hashable:
+    return ('user', user_id)
+
+
+def _subscription_key(user_id: str, fund_id: str) -> Hashable:
+    return ('subscription', user_id, fund_id)
+
+
+def _fund_key(fund_id: str) -> Hashable:
+    return ('fund', fund_id)
+
+
+class _Decorator:
+    """Forwards anything it does not override to the decorated port.
+
+    Subclasses must still override every method of their port: the
+    Protocol's stubs would otherwise be found before ``__getattr__``.
+    """
+
+    def __init__(self, port: Any) -> None:
+        self.wrapped = port
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.wrapped, name)
+
+
+def _read_through(
+        key: Hashable,
+        load: Callable[[], Any],
+        missing: Callable[[], Any]
+) -> Any:
+    """Return the mapped value for ``key``, loading it on the first read.
+
+    ``load`` raising ValueError means "not found": that answer is kept
+    too, and ``missing`` rebuilds the result for later reads. Partial
+    records are returned but not kept: a later full read must not get one.
+    """
+    identity_map = _scope.get()
+    if identity_map is None:
+        return load()
+
+    found, value = identity_map.lookup(key)
+    if not found:
+        try:
+            value = load()
+        except ValueError:
+            identity_map.store(key, _NOT_FOUND)
+            raise
+        if isinstance(value, PartialRecord):
+            return value
+        identity_map.store(key, _NOT_FOUND if value is None else value)
+    if value is _NOT_FOUND:
+        return missing()
+    return value
+
+
+def _store(key: Hashable, value: Any) -> None:
+    identity_map = _scope.get()
+    if identity_map is not None and not isinstance(value, PartialRecord):
+        identity_map.store(key, value)
+
+
+def _discard(*keys: Hashable) -> None:
+    identity_map = _scope.get()
+    if identity_map is not None:
+        for key in keys:
+            identity_map.discard(key)
+
+
+def _read_many(
+        ids: List[str],
+        key: Callable[[str], Hashable],
+        load: Callable[[List[str]], List[Any]],
+        id_of: Callable[[Any], str]
+) -> List[Any]:
+    """``get_many`` reading only the ids the map does not know yet."""
+    identity_map = _scope.get()
+    if identity_map is None:
+        return load(ids)
+
+    values: Dict[str, object] = {}
+    missing = []
+    for item_id in dict.fromkeys(ids):
+        found, value = identity_map.lookup(key(item_id))
+        if found:
+            values[item_id] = value
+        else:
+            missing.append(item_id)
+
+    if missing:
+        loaded = {id_of(value): value for value in load(missing)}
+        for item_id in missing:
+            value = loaded.get(item_id, _NOT_FOUND)
+            if not isinstance(value, PartialRecord):
+                identity_map.store(key(item_id), value)
+            values[item_id] = value
+
+    return [
+        values[item_id] for item_id in dict.fromkeys(ids)
+        if values[item_id] is not _NOT_FOUND
+    ]
+
+
+class IdentityMapUserAdapter(_Decorator, UserPort):
+    def __init__(self, user_port: UserPort) -> None:
+        super().__init__(user_port)
+
+    def _missing(self, user_id: str) -> User:
+        raise ValueError(f"User with ID {user_id} not found")
+
+    def get_by_id(
+            self,
+            user_id: str,
+            fields: Iterable[str] | None = None
+            ) -> User | PartialRecord:
+        """Get a user by their ID, once per request."""
+        return _read_through(
+            _user_key(user_id),
+            lambda: self.wrapped.get_by_id(user_id, fields),
+            lambda: self._missing(user_id)
+        )
+
+    def get_many(
+            self,
+            user_ids: List[str],
+            fields: Iterable[str] | None = None
+            ) -> List[User | PartialRecord]:
+        """Get several users, reading only those not seen in the request."""
+        return _read_many(
+            user_ids, _user_key,
+            lambda missing: self.wrapped.get_many(missing, fields),
+            lambda user: user.user_id
+        )
+
+    def update(self, user_id: str, **params: Any) -> User:
+        """Update a user and keep the stored result."""
+        try:
+            user = self.wrapped.update(user_id, **params)
+        except Exception:
+            _discard(_user_key(user_id))
+            raise
+        _store(_user_key(user_id), user)
+        return user
+
+
+class IdentityMapSubscriptionAdapter(_Decorator, SubscriptionPort):
+    def __init__(self, subscription_port: SubscriptionPort) -> None:
+        super().__init__(subscription_port)
+
+    def _add(self, subscription: Subscription) -> Subscription:
+        """Add a subscription from seed for testing."""
+        return self.save(subscription)
+
+    def get(
+            self,
+            user_id: str,
+            fund_id: str,
+            fields: Iterable[str] | None = None
+            ) -> Optional[Subscription | PartialRecord]:
+        """Get a subscription, once per request."""
+        return _read_through(
+            _subscription_key(user_id, fund_id),
+            lambda: self.wrapped.get(user_id, fund_id, fields),
+            lambda: None
+        )
+
+    def list_by_user(
+            self,
+            user_id: str,
+            status: str | None = None,
+            fields: Iterable[str] | None = None
+            ) -> Iterable[Subscription | PartialRecord]:
+        """List a user's subscriptions, remembering each one listed."""
+        for subscription in self.wrapped.list_by_user(user_id, status, fields):
+            _store(
+                _subscription_key(user_id, subscription.fund_id),
+                subscription
+            )
+            yield subscription
+
+    def list_by_fund(
+            self,
+            fund_id: str,
+            status: str = "active",
+            limit: int = 50,
+            cursor: str | None = None
+            ) -> Tuple[List[Subscription], str | None]:
+        """List a fund's subscriptions, remembering each one listed."""
+        subscriptions, next_cursor = self.wrapped.list_by_fund(
+            fund_id, status, limit=limit, cursor=cursor
+        )
+        for subscription in subscriptions:
+            _store(
+                _subscription_key(subscription.user_id, fund_id),
+                subscription
+            )
+        return subscriptions, next_cursor
+
+    def update(
+            self,
+            user_id: str,
+            fund_id: str,
+            **params: Any
+            ) -> Subscription:
+        """Update a subscription and keep the stored result."""
+        return self._write(
+            user_id, fund_id,
+            lambda: self.wrapped.update(user_id, fund_id, **params)
+        )
+
+    def save(self, subscription: Subscription) -> Subscription:
+        """Save a subscription."""
+        return self._write(
+            subscription.user_id, subscription.fund_id,
+            lambda: self.wrapped.save(subscription)
+        )
+
+    def cancel(self, user_id: str, fund_id: str) -> Subscription:
+        """Cancel a subscription."""
+        return self._write(
+            user_id, fund_id, lambda: self.wrapped.cancel(user_id, fund_id)
+        )
+
+    def subscribe(
+            self,
+            user_id: str,
+            fund_id: str,
+            amount: int
+            ) -> Subscription:
+        """Subscribe a user to a fund."""
+        return self._write(
+            user_id, fund_id,
+            lambda: self.wrapped.subscribe(user_id, fund_id, amount)
+        )
+
+    def unsubscribe(self, user_id: str, fund_id: str) -> Subscription:
+        """Unsubscribe a user from a fund."""
+        return self._write(
+            user_id, fund_id,
+            lambda: self.wrapped.unsubscribe(user_id, fund_id)
+        )
+
+    def _write(
+            self,
+            user_id: str,
+            fund_id: str,
+            write: Callable[[], Subscription]
+            ) -> Subscription:
+        key = _subscription_key(user_id, fund_id)
+        try:
+            subscription = write()
+        except Exception:
+            # The stored state is unknown: read it again next time
+            _discard(key)
+            raise
+        _store(key, subscription)
+        return subscription
+
+
+class IdentityMapFundAdapter(_Decorator, FundPort):
+    def __init__(self, funds_port: FundPort) -> None:
+        super().__init__(funds_port)
+
+    def _missing(self, fund_id: str) -> Fund:
+        raise ValueError(f"Fund with ID {fund_id} not found")
+
+    def get_by_id(self, fund_id: str) -> Fund:
+        """Get a fund by its ID, once per request."""
+        return _read_through(
+            _fund_key(fund_id),
+            lambda: self.wrapped.get_by_id(fund_id),
+            lambda: self._missing(fund_id)
+        )
+
+    def get_many(self, fund_ids: List[str]) -> List[Fund]:
+        """Get several funds, reading only those not seen in the request."""
+        return _read_many(
+            fund_ids, _fund_key, self.wrapped.get_many,
+            lambda fund: fund.fund_id
+        )
+
+    def list_all(
+            self,
+            limit: int = 50,
+            last_key: str | None = None
+            ) -> Tuple[List[Fund], str | None]:
+        """List all funds, remembering each one listed."""
+        funds, next_key = self.wrapped.list_all(limit=limit, last_key=last_key)
+        for fund in funds:
+            _store(_fund_key(fund.fund_id), fund)
+        return funds, next_key
+
+    def search(
+            self,
+            category: str,
+            max_min_amount: float | None = None,
+            limit: int = 50,
+            cursor: str | None = None
+            ) -> Tuple[List[Fund], str | None]:
+        """Search the catalog, remembering each fund found."""
+        funds, next_cursor = self.wrapped.search(
+            category, max_min_amount, limit=limit, cursor=cursor
+        )
+        for fund in funds:
+            _store(_fund_key(fund.fund_id), fund)
+        return funds, next_cursor
+
+
+class IdentityMapUnitOfWork(_Decorator, UnitOfWorkPort):
+    def __init__(self, unit_of_work: UnitOfWorkPort) -> None:
+        super().__init__(unit_of_work)
+
+    def subscribe(
+            self,
+            subscription: Subscription,
+            transaction: Transaction,
+            claim: IdempotencyRecord | None = None
+            ) -> Subscription:
+        """Commit a subscription and keep what was written."""
+        try:
+            stored = self.wrapped.subscribe(subscription, transaction, claim)
+        finally:
+            self._forget(subscription)
+        _store(
+            _subscription_key(stored.user_id, stored.fund_id), stored
+        )
+        return stored
+
+    def subscribe_many(
+            self,
+            entries: list[tuple[Subscription, Transaction]]
+            ) -> list[Subscription | Exception]:
+        """Commit many subscriptions and keep the ones written."""
+        try:
+            outcomes = self.wrapped.subscribe_many(entries)
+        finally:
+            for subscription, _ in entries:
+                self._forget(subscription)
+        for outcome in outcomes:
+            if isinstance(outcome, Subscription):
+                _store(
+                    _subscription_key(outcome.user_id, outcome.fund_id),
+                    outcome
+                )
+        return outcomes
+
+    def cancel(
+            self,
+            subscription: Subscription,
+            transaction: Transaction,
+            claim: IdempotencyRecord | None = None
+            ) -> Subscription:
+        """Commit a cancellation and keep what was written."""
+        try:
+            stored = self.wrapped.cancel(subscription, transaction, claim)
+        finally:
+            self._forget(subscription)
+        _store(
+            _subscription_key(stored.user_id, stored.fund_id), stored
+        )
+        return stored
+
+    def _forget(self, subscription: Subscription) -> None:
+        # The balance changes on the server (balance - :amount), so the
+        # mapped user is stale after any attempt
+        _discard(
+            _user_key(subscription.user_id),
+            _subscription_key(subscription.user_id, subscription.fund_id)
+        )
@@ -0,0 +1,94 @@
+"""
+Time-sortable unique ids (ULIDs) for item keys.
+
+A ULID is 26 Crockford base32 characters: a 48-bit millisecond timestamp
+and 80 random bits, so ids sort by time as plain strings and a range of
+times is a range of keys. Ids a process makes in the same millisecond
+increment the random part of the previous one instead of drawing a new
+one, so they stay unique and ordered across its threads. Other processes
+(and Lambda instances) draw their own random parts: two ids only collide
+in the same millisecond with the same 80 bits, and the writes using them
+are conditional anyway.
+"""
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+
+ENCODING = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+ULID_LENGTH = 26
+TIME_LENGTH = 10
+RANDOM_LENGTH = 16
+
+_MAX_RANDOM = (1 << 80) - 1
+_VALID = frozenset(ENCODING)
+
+
+def encode(value: int, length: int) -> str:
+    """``value`` in Crockford base32, left-padded to ``length`` characters."""
+    chars = []
+    for _ in range(length):
+        value, digit = divmod(value, 32)
+        chars.append(ENCODING[digit])
+    return ''.join(reversed(chars))
+
+
+def epoch_ms(moment: datetime) -> int:
+    """Milliseconds since the epoch; naive datetimes are taken as UTC."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp() * 1000)
+
+
+def ulid_floor(moment: datetime) -> str:
+    """The smallest ULID of ``moment``'s millisecond."""
+    return encode(epoch_ms(moment), TIME_LENGTH) + '0' * RANDOM_LENGTH
+
+
+def ulid_ceiling(moment: datetime) -> str:
+    """The largest ULID of ``moment``'s millisecond."""
+    return encode(epoch_ms(moment), TIME_LENGTH) + 'Z' * RANDOM_LENGTH
+
+
+def is_ulid(value: str) -> bool:
+    return len(value) == ULID_LENGTH and _VALID.issuperset(value)
+
+
+class UlidGenerator:
+    """Makes ULIDs, monotonic within each millisecond."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Start over, e.g. in a forked child."""
+        # A new lock: another thread may have held it during the fork
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_random = 0
+
+    def new(self, timestamp_ms: int | None = None) -> str:
+        """A new ULID for ``timestamp_ms`` (now by default)."""
+        if timestamp_ms is None:
+            timestamp_ms = time.time_ns() // 1_000_000
+        with self._lock:
+            if (timestamp_ms == self._last_ms and
+                    self._last_random < _MAX_RANDOM):
+                random = self._last_random + 1
+            else:
+                random = int.from_bytes(os.urandom(10), 'big')
+            self._last_ms = timestamp_ms
+            self._last_random = random
+        return (encode(timestamp_ms, TIME_LENGTH) +
+                encode(random, RANDOM_LENGTH))
+
+
+_generator = UlidGenerator()
+# A forked child would otherwise continue the parent's sequence
+os.register_at_fork(after_in_child=_generator.reset)
+
+
+def new_ulid(timestamp_ms: int | None = None) -> str:
+    """A new ULID from the process-wide generator."""
+    return _generator.new(timestamp_ms)
@@ -0,0 +1,38 @@
+import asyncio
+import contextvars
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+
+T = TypeVar('T')
+
+
+def create_executor(max_workers: int | None = None) -> ThreadPoolExecutor:
+    """Thread pool running blocking boto3 calls for the async adapters."""
+    # As many threads as pooled HTTP connections: more would only queue
+    # on the connection pool.
+    workers = max_workers or int(
+        os.getenv('DYNAMODB_OFFLOAD_WORKERS')
+        or os.getenv('DYNAMODB_MAX_POOL_CONNECTIONS', '50')
+    )
+    return ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix='dynamodb-offload'
+    )
+
+
+async def run_blocking(
+    executor: ThreadPoolExecutor,
+    function: Callable[..., T],
+    *args: Any,
+    **kwargs: Any
+) -> T:
+    """Run ``function`` on ``executor`` without blocking the event loop.
+
+    The caller's context variables are visible inside the thread, as they
+    would be if the call ran inline.
+    """
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, function, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(executor, call)
@@ -0,0 +1,122 @@
+import base64
+import binascii
+import json
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from app.application.ports.errors import InvalidCursor
+
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+def encode_cursor(key: Dict[str, Any] | None) -> str | None:
+    """Encode a DynamoDB key as an opaque, URL-safe cursor."""
+    if not key:
+        return None
+    return encode_typed_cursor(
+        {name: _serializer.serialize(value) for name, value in key.items()}
+    )
+
+
+def encode_typed_cursor(typed: Dict[str, Any]) -> str:
+    """Like ``encode_cursor``, for a key already in the wire format."""
+    payload = json.dumps(typed, separators=(',', ':'), sort_keys=True)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(
+    cursor: str | None,
+    key_attributes: Tuple[str, ...] | None = None
+) -> Dict[str, Any] | None:
+    """Decode a cursor produced by ``encode_cursor`` back into a key.
+
+    With ``key_attributes``, a cursor whose key has other attributes (one
+    from a listing on another index or the table) is refused too: as an
+    ExclusiveStartKey DynamoDB would reject it with a ValidationException.
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        typed = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        key = {
+            name: _deserializer.deserialize(value)
+            for name, value in typed.items()
+        }
+    except (binascii.Error, ValueError, TypeError, AttributeError) as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor}") from e
+
+    if key_attributes is not None and set(key) != set(key_attributes):
+        raise InvalidCursor("Cursor does not match this listing")
+    return key
+
+
+def iterate_items(
+    operation: Callable[..., Dict[str, Any]],
+    request: Dict[str, Any],
+    page_size: int | None = None,
+    start_key: Dict[str, Any] | None = None
+) -> Iterator[Dict[str, Any]]:
+    """Yield the items of a Query/Scan, following LastEvaluatedKey lazily.
+
+    A new page is only requested once the caller has consumed the items
+    of the previous one, so stopping early never reads ahead.
+    """
+    request = dict(request)
+    if page_size:
+        request['Limit'] = page_size
+    if start_key:
+        request['ExclusiveStartKey'] = start_key
+
+    while True:
+        response = operation(**request)
+        yield from response.get('Items', [])
+
+        if 'LastEvaluatedKey' not in response:
+            return
+        request['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def take_page(
+    items: Iterator[Dict[str, Any]],
+    key_attributes: Tuple[str, ...],
+    limit: int,
+    wire: bool = False
+) -> Tuple[List[Dict[str, Any]], str | None]:
+    """Take up to ``limit`` items and the cursor to resume after them.
+
+    The cursor is ``None`` once the items are exhausted. ``wire`` items
+    (see ``wire.WireTable``) give the same cursor as deserialized ones.
+    """
+    page = list(islice(items, limit))
+
+    next_cursor = None
+    if page and len(page) == limit:
+        last = page[-1]
+        key = {name: last[name] for name in key_attributes}
+        next_cursor = encode_typed_cursor(key) if wire else encode_cursor(key)
+    return page, next_cursor
+
+
+def read_page(
+    operation: Callable[..., Dict[str, Any]],
+    request: Dict[str, Any],
+    key_attributes: Tuple[str, ...],
+    limit: int,
+    cursor: str | None = None,
+    page_size: int | None = None,
+    wire: bool = False
+) -> Tuple[List[Dict[str, Any]], str | None]:
+    """Read up to ``limit`` items of a Query/Scan starting at ``cursor``."""
+    return take_page(
+        iterate_items(
+            operation, request, page_size,
+            decode_cursor(cursor, key_attributes)
+        ),
+        key_attributes,
+        limit,
+        wire
+    )
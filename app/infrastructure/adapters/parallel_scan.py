@@ -0,0 +1,121 @@
+import contextvars
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator
+
+from boto3.dynamodb.conditions import ConditionBase, ConditionExpressionBuilder
+
+
+_PAGE = 'page'
+_DONE = 'done'
+_ERROR = 'error'
+
+
+def _render_filter(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Render a FilterExpression condition object into its string form.
+
+    The resource layer renders condition objects with one builder shared by
+    every thread using the client, which is not thread-safe, so workers
+    must only receive already rendered expressions.
+    """
+    condition = request.get('FilterExpression')
+    if not isinstance(condition, ConditionBase):
+        return request
+
+    expression = ConditionExpressionBuilder().build_expression(condition)
+    return dict(
+        request,
+        FilterExpression=expression.condition_expression,
+        ExpressionAttributeNames={
+            **request.get('ExpressionAttributeNames', {}),
+            **expression.attribute_name_placeholders
+        },
+        ExpressionAttributeValues={
+            **request.get('ExpressionAttributeValues', {}),
+            **expression.attribute_value_placeholders
+        }
+    )
+
+
+def parallel_scan(
+    client: Any,
+    request: Dict[str, Any],
+    total_segments: int,
+    max_workers: int | None = None,
+    max_buffered_pages: int | None = None,
+    page_size: int | None = None
+) -> Iterator[Dict[str, Any]]:
+    """Yield the items of a Scan split into ``total_segments`` segments.
+
+    Segments are read concurrently by a bounded thread pool sharing one
+    boto3 client: clients are thread-safe, resources and tables are not.
+    Passing the resource's ``meta.client`` keeps the resource-layer
+    conveniences (condition objects in, Python values out).
+
+    Pages flow through a bounded queue: once ``max_buffered_pages`` pages
+    wait to be consumed the workers block, so memory stays bounded by
+    ``max_buffered_pages + max_workers`` pages whatever the table size.
+    Items come out in arrival order.
+    """
+    if total_segments < 1:
+        raise ValueError("total_segments must be at least 1")
+
+    request = _render_filter(request)
+    workers = min(total_segments, max_workers or total_segments)
+    pages: queue.Queue = queue.Queue(maxsize=max_buffered_pages or workers * 2)
+    stop = threading.Event()
+
+    def offer(message: tuple) -> bool:
+        while not stop.is_set():
+            try:
+                pages.put(message, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def scan_segment(segment: int) -> None:
+        segment_request = dict(
+            request, Segment=segment, TotalSegments=total_segments
+        )
+        if page_size:
+            segment_request['Limit'] = page_size
+        try:
+            while not stop.is_set():
+                response = client.scan(**segment_request)
+                if not offer((_PAGE, response.get('Items', []))):
+                    return
+                if 'LastEvaluatedKey' not in response:
+                    break
+                segment_request['ExclusiveStartKey'] = (
+                    response['LastEvaluatedKey']
+                )
+            offer((_DONE, None))
+        except Exception as e:
+            offer((_ERROR, e))
+
+    executor = ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix='dynamodb-scan'
+    )
+    try:
+        for segment in range(total_segments):
+            # Segments see the caller's context variables, as inline calls
+            executor.submit(
+                contextvars.copy_context().run, scan_segment, segment
+            )
+
+        finished = 0
+        while finished < total_segments:
+            kind, payload = pages.get()
+            if kind == _ERROR:
+                raise payload
+            if kind == _DONE:
+                finished += 1
+                continue
+            yield from payload
+    finally:
+        # Also reached when the consumer stops early: release the workers
+        # blocked on a full queue and drop segments not started yet.
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,151 @@
+import os
+from botocore.exceptions import ClientError
+from app.application.ports.portfolio import PortfolioPort
+from app.domain.models.portfolio import Portfolio
+from app.domain.models.subscription import Subscription, Status
+from app.infrastructure.dynamodb import get_dynamodb_resource
+from typing import Any, Dict, Iterable
+
+
+# The summary lives next to the profile: USER#<id> / PORTFOLIO.
+PORTFOLIO_SK = 'PORTFOLIO'
+
+# Amounts are top-level attributes ("amount#<fund_id>"): a nested map
+# can't be created and written in the same update expression.
+AMOUNT_PREFIX = 'amount#'
+
+
+def portfolio_key(user_id: str) -> Dict[str, str]:
+    return {'PK': f'USER#{user_id}', 'SK': PORTFOLIO_SK}
+
+
+def item_to_portfolio(user_id: str, item: Dict[str, Any] | None) -> Portfolio:
+    """Build a Portfolio from its summary item, empty when there is none."""
+    if not item:
+        return Portfolio(user_id=user_id)
+
+    amounts = {
+        name[len(AMOUNT_PREFIX):]: int(value)
+        for name, value in item.items()
+        if name.startswith(AMOUNT_PREFIX)
+    }
+    return Portfolio(
+        user_id=user_id,
+        fund_ids=sorted(amounts),
+        amounts=amounts,
+        total_invested=int(item.get('total_invested', 0)),
+        updated_at=item.get('updated_at')
+    )
+
+
+def portfolio_to_item(portfolio: Portfolio, version: int) -> Dict[str, Any]:
+    """Build the summary item for a Portfolio."""
+    item = {
+        **portfolio_key(portfolio.user_id),
+        'user_id': portfolio.user_id,
+        'total_invested': portfolio.total_invested,
+        'version': version,
+        'updated_at': portfolio.updated_at
+    }
+    if portfolio.amounts:
+        item['fund_ids'] = set(portfolio.amounts)
+    for fund_id, amount in portfolio.amounts.items():
+        item[f'{AMOUNT_PREFIX}{fund_id}'] = amount
+    return item
+
+
+def portfolio_from_subscriptions(
+        user_id: str,
+        subscriptions: Iterable[Subscription],
+        updated_at: str | None = None
+        ) -> Portfolio:
+    """Recompute a portfolio from the user's subscriptions."""
+    amounts = {
+        s.fund_id: s.amount
+        for s in subscriptions
+        if s.status == Status.ACTIVE
+    }
+    return Portfolio(
+        user_id=user_id,
+        fund_ids=sorted(amounts),
+        amounts=amounts,
+        total_invested=sum(amounts.values()),
+        updated_at=updated_at
+    )
+
+
+def open_position_action(
+        table_name: str,
+        subscription: Subscription,
+        timestamp: str
+        ) -> Dict[str, Any]:
+    """TransactWriteItems action adding a subscription to the summary."""
+    return {'Update': {
+        'TableName': table_name,
+        'Key': portfolio_key(subscription.user_id),
+        'UpdateExpression': (
+            'SET user_id = :user_id, #amount = :amount, '
+            'updated_at = :timestamp '
+            'ADD fund_ids :fund, total_invested :amount, version :one'
+        ),
+        'ExpressionAttributeNames': {
+            '#amount': f'{AMOUNT_PREFIX}{subscription.fund_id}'
+        },
+        'ExpressionAttributeValues': {
+            ':user_id': subscription.user_id,
+            ':amount': subscription.amount,
+            ':fund': {subscription.fund_id},
+            ':timestamp': timestamp,
+            ':one': 1
+        }
+    }}
+
+
+def close_position_action(
+        table_name: str,
+        subscription: Subscription,
+        timestamp: str
+        ) -> Dict[str, Any]:
+    """TransactWriteItems action removing a subscription from the summary."""
+    return {'Update': {
+        'TableName': table_name,
+        'Key': portfolio_key(subscription.user_id),
+        'UpdateExpression': (
+            'SET updated_at = :timestamp REMOVE #amount '
+            'DELETE fund_ids :fund '
+            'ADD total_invested :refund, version :one'
+        ),
+        'ExpressionAttributeNames': {
+            '#amount': f'{AMOUNT_PREFIX}{subscription.fund_id}'
+        },
+        'ExpressionAttributeValues': {
+            ':fund': {subscription.fund_id},
+            ':refund': -subscription.amount,
+            ':timestamp': timestamp,
+            ':one': 1
+        }
+    }}
+
+
+class PortfolioAdapter(PortfolioPort):
+    def __init__(self, dynamodb_resource=None):
+        if dynamodb_resource is None:
+            # En Lambda, usar IAM Role automático (recurso compartido)
+            self.dynamodb = get_dynamodb_resource()
+        else:
+            self.dynamodb = dynamodb_resource
+
+        self.portfolio_table = self.dynamodb.Table(os.getenv('APPCHALLENGE_TABLE_NAME', 'AppChallenge'))
+
+    def get(self, user_id: str) -> Portfolio:
+        """Get a user's portfolio summary (empty if they never invested)."""
+        try:
+            response = self.portfolio_table.get_item(
+                Key=portfolio_key(user_id)
+            )
+            return item_to_portfolio(user_id, response.get('Item'))
+
+        except ClientError as e:
+            raise Exception(
+                f"Error retrieving portfolio: {e.response['Error']['Message']}"
+            )
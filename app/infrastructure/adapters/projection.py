@@ -0,0 +1,52 @@
+"""
+Reads of only some attributes of a record.
+
+Ports that take ``fields`` read just those attributes (a
+``ProjectionExpression``) and return a partial record (see
+``app.domain.models.partial``): a model with only those fields, validated
+like the full one. Asking for every field of the model returns the model
+itself.
+
+DynamoDB still charges the read units of the whole item; what shrinks is
+the response and the work to deserialize it.
+"""
+from typing import Any, Dict, Iterable, Type
+
+from pydantic import BaseModel
+
+from app.domain.models.partial import partial_model
+from app.infrastructure.adapters.wire import deserialize_item
+
+
+def projection(
+        fields: Iterable[str],
+        key_attributes: Iterable[str] = ()
+        ) -> Dict[str, Any]:
+    """ProjectionExpression reading ``fields`` and ``key_attributes``.
+
+    Every name goes through a placeholder, since ``name``, ``status`` and
+    ``timestamp`` are reserved words.
+    """
+    names = list(dict.fromkeys([*fields, *key_attributes]))
+    placeholders = {f'#f{index}': name for index, name in enumerate(names)}
+    return {
+        'ProjectionExpression': ', '.join(placeholders),
+        'ExpressionAttributeNames': placeholders
+    }
+
+
+def partial_record(
+        model: Type[BaseModel],
+        fields: Iterable[str],
+        item: Dict[str, Any],
+        wire: bool = False
+        ) -> BaseModel:
+    """Build the partial ``model`` of a projected item.
+
+    ``wire`` items (see ``wire.WireTable``) are deserialized first.
+    """
+    fields = frozenset(fields)
+    record = partial_model(model, fields)
+    if wire:
+        item = deserialize_item(item)
+    return record(**{name: item.get(name) for name in fields})
@@ -1,25 +1,103 @@
-import boto3
 import os
-from datetime import datetime
 from botocore.exceptions import ClientError
-from boto3.dynamodb.conditions import Attr
+from boto3.dynamodb.conditions import Attr, Key
+from app.application.ports.errors import InvalidCursor
 from app.application.ports.subscriptions import SubscriptionPort
+from app.domain.models.clock import utc_now
+from app.domain.models.partial import PartialRecord
 from app.domain.models.subscription import Subscription, Status
-from typing import Optional, Iterable, Any
+from app.infrastructure.adapters.fund_stats import shard_for
+from app.infrastructure.adapters.pagination import (
+    decode_cursor,
+    iterate_items,
+    take_page
+)
+from app.infrastructure.adapters.projection import partial_record, projection
+from app.infrastructure.dynamodb import get_dynamodb_resource
+from typing import Optional, Iterable, Iterator, Any, Dict, List, Tuple
+
+
+# A fund's subscribers by status: fund_status-index is (fund_status,
+# user_id) and only subscriptions carry fund_status.
+SUBSCRIBER_INDEX = 'fund_status-index'
+SUBSCRIBER_INDEX_KEY = ('fund_status', 'user_id', 'PK', 'SK')
+
+
+def subscriber_shards() -> int:
+    """Partitions per fund and status in fund_status-index.
+
+    Raise it for funds with so many subscribers that one index partition
+    can't take their writes; existing items are moved with
+    ``backfill_subscriber_index``.
+    """
+    return max(1, int(os.getenv('SUBSCRIBER_INDEX_SHARDS', '1')))
+
+
+def subscriber_key(
+        fund_id: str,
+        status: str,
+        user_id: str,
+        shards: int
+        ) -> str:
+    """fund_status value of a user's subscription to a fund."""
+    return f"{fund_id}#{status}#{shard_for(user_id, shards)}"
+
+
+def subscription_to_item(
+        subscription: Subscription,
+        shards: int | None = None
+        ) -> Dict[str, Any]:
+    """Build the DynamoDB item for a Subscription."""
+    item = {
+        'PK': f'USER#{subscription.user_id}',
+        'SK': f'SUB#{subscription.fund_id}',
+        'user_id': subscription.user_id,
+        'fund_id': subscription.fund_id,
+        'amount': subscription.amount,
+        'status': subscription.status.value,
+        'fund_status': subscriber_key(
+            subscription.fund_id,
+            subscription.status.value,
+            subscription.user_id,
+            shards or subscriber_shards()
+        ),
+        'created_at': subscription.created_at
+    }
+
+    if subscription.cancelled_at:
+        item['cancelled_at'] = subscription.cancelled_at
+    return item
+
+
+def item_to_subscription(item: Dict[str, Any]) -> Subscription:
+    """Build a Subscription from a DynamoDB item."""
+    return Subscription(
+        user_id=item.get('user_id'),
+        fund_id=item.get('fund_id'),
+        amount=int(item.get('amount', 0)),
+        status=Status(item.get('status')),
+        created_at=item.get('created_at'),
+        cancelled_at=item.get('cancelled_at')
+    )
 
 
 class SubscriptionAdapter(SubscriptionPort):
+    # Reads decode items with this; ClientSubscriptionAdapter reads the
+    # wire format
+    _to_subscription = staticmethod(item_to_subscription)
+    _wire = False
+
     def __init__(self, dynamodb_resource=None):
         if dynamodb_resource is None:
-            # En Lambda, usar IAM Role automático
-            self.dynamodb = boto3.resource(
-                'dynamodb',
-                region_name=os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
-            )
+            # En Lambda, usar IAM Role automático (recurso compartido)
+            self.dynamodb = get_dynamodb_resource()
         else:
             self.dynamodb = dynamodb_resource
 
         self.subscriptions_table = self.dynamodb.Table(os.getenv('APPCHALLENGE_TABLE_NAME', 'AppChallenge'))
+        self.shards = subscriber_shards()
+        # Where get_item and query go
+        self._reads = self.subscriptions_table
 
     def subscribe(
         self,
@@ -34,7 +112,7 @@ class SubscriptionAdapter(SubscriptionPort):
                 fund_id=fund_id,
                 amount=amount,
                 status=Status.ACTIVE,
-                created_at=datetime.now().isoformat()
+                created_at=utc_now().isoformat()
             )
 
             return self.save(subscription)
@@ -54,25 +132,21 @@ class SubscriptionAdapter(SubscriptionPort):
                     'SK': f'SUB#{fund_id}'
                 },
                 UpdateExpression=(
-                    'SET #status = :cancelled, cancelled_at = :timestamp'
+                    'SET #status = :cancelled, cancelled_at = :timestamp, '
+                    'fund_status = :fund_status'
                 ),
                 ExpressionAttributeNames={'#status': 'status'},
                 ExpressionAttributeValues={
                     ':cancelled': Status.CANCELLED.value,
-                    ':timestamp': datetime.now().isoformat()
+                    ':timestamp': utc_now().isoformat(),
+                    ':fund_status': subscriber_key(
+                        fund_id, Status.CANCELLED.value, user_id, self.shards
+                    )
                 },
                 ReturnValues='ALL_NEW'
             )
 
-            item = response['Attributes']
-            return Subscription(
-                user_id=item['user_id'],
-                fund_id=item['fund_id'],
-                amount=int(item['amount']),
-                status=Status(item['status']),
-                created_at=item.get('created_at'),
-                cancelled_at=item.get('cancelled_at')
-            )
+            return item_to_subscription(response['Attributes'])
 
         except ClientError as e:
             if e.response['Error']['Code'] == 'ResourceNotFoundException':
@@ -86,34 +160,33 @@ class SubscriptionAdapter(SubscriptionPort):
         """Add a subscription from seed for testing."""
         return self.save(subscription)
 
-    def get(self, user_id: str, fund_id: str) -> Optional[Subscription]:
-        """Get a subscription by user ID and fund ID."""
+    def get(
+            self,
+            user_id: str,
+            fund_id: str,
+            fields: Iterable[str] | None = None
+            ) -> Optional[Subscription | PartialRecord]:
+        """Get a subscription by user and fund, only ``fields`` when given."""
+        request: Dict[str, Any] = {
+            'Key': {
+                'PK': f'USER#{user_id}',
+                'SK': f'SUB#{fund_id}'
+            }
+        }
+        if fields is not None:
+            request.update(projection(fields))
         try:
-            response = self.subscriptions_table.get_item(
-                Key={
-                    'PK': f'USER#{user_id}',
-                    'SK': f'SUB#{fund_id}'
-                }
-            )
+            response = self._reads.get_item(**request)
 
             if 'Item' not in response:
                 return None
 
-            item = response['Item']
-            return Subscription(
-                user_id=item.get('user_id'),
-                fund_id=item.get('fund_id'),
-                amount=int(item.get('amount', 0)),
-                status=Status(item.get('status')),
-                created_at=item.get('created_at'),
-                cancelled_at=item.get('cancelled_at')
-            )
+            return self._decode(response['Item'], fields)
 
         except ClientError as e:
             raise Exception(
-                f"Error retrieving subscription: {
-                    e.response['Error']['Message']
-                }"
+                "Error retrieving subscription: "
+                f"{e.response['Error']['Message']}"
             )
 
     def update(
@@ -127,6 +200,13 @@ class SubscriptionAdapter(SubscriptionPort):
             if not params:
                 raise ValueError("No fields to update")
 
+            if 'status' in params:
+                # Move the item to the new status in fund_status-index
+                status = Status(params['status']).value
+                params = {**params, 'fund_status': subscriber_key(
+                    fund_id, status, user_id, self.shards
+                )}
+
             # Build update expression dynamically
             update_expression = "SET "
             expression_values = {}
@@ -156,48 +236,50 @@ class SubscriptionAdapter(SubscriptionPort):
             )
 
             item = response['Attributes']
-            return Subscription(
-                user_id=item.get('user_id'),
-                fund_id=item.get('fund_id'),
-                amount=int(item.get('amount', 0)),
-                status=Status(item.get('status')),
-                created_at=item.get('created_at'),
-                cancelled_at=item.get('cancelled_at')
-            )
+            return item_to_subscription(item)
 
         except ClientError as e:
             raise Exception(
-                f"Error updating subscription: {
-                    e.response['Error']['Message']
-                }"
+                "Error updating subscription: "
+                f"{e.response['Error']['Message']}"
             )
 
     def list_by_user(
         self,
         user_id: str,
-        status: str | None = None
-    ) -> Iterable[Subscription]:
-        """List subscriptions by user ID, filtered by status."""
-        try:
-            scan_kwargs = {
-                'FilterExpression': Attr('PK').eq(f'USER#{user_id}') & Attr('SK').begins_with('SUB#')
-            }
+        status: str | None = None,
+        fields: Iterable[str] | None = None
+    ) -> Iterable[Subscription | PartialRecord]:
+        """List subscriptions by user ID, filtered by status.
 
-            if status:
-                scan_kwargs['FilterExpression'] = (
-                    scan_kwargs['FilterExpression'] & Attr('status').eq(status)
-                )
+        With ``fields`` only those are read; the status filter works on
+        the whole item either way.
+        """
+        query_kwargs: Dict[str, Any] = {
+            'KeyConditionExpression': (
+                Key('PK').eq(f'USER#{user_id}') &
+                Key('SK').begins_with('SUB#')
+            )
+        }
+
+        if status:
+            query_kwargs['FilterExpression'] = Attr('status').eq(status)
+        if fields is not None:
+            query_kwargs.update(projection(fields))
+
+        try:
+            # Follow LastEvaluatedKey lazily: a page is only requested
+            # once the caller has consumed the previous one.
+            while True:
+                response = self._reads.query(**query_kwargs)
 
-            response = self.subscriptions_table.scan(**scan_kwargs)
+                for item in response.get('Items', []):
+                    yield self._decode(item, fields)
 
-            for item in response.get('Items', []):
-                yield Subscription(
-                    user_id=item.get('user_id'),
-                    fund_id=item.get('fund_id'),
-                    amount=int(item.get('amount', 0)),
-                    status=Status(item.get('status')),
-                    created_at=item.get('created_at'),
-                    cancelled_at=item.get('cancelled_at')
+                if 'LastEvaluatedKey' not in response:
+                    break
+                query_kwargs['ExclusiveStartKey'] = (
+                    response['LastEvaluatedKey']
                 )
 
         except ClientError as e:
@@ -205,23 +287,76 @@ class SubscriptionAdapter(SubscriptionPort):
                 f"Error listing subscriptions by user: {e.response['Error']['Message']}"
             )
 
-    def save(self, subscription: Subscription) -> Subscription:
-        """Save a subscription."""
+    def _decode(
+            self,
+            item: Dict[str, Any],
+            fields: Iterable[str] | None
+            ) -> Subscription | PartialRecord:
+        if fields is None:
+            return self._to_subscription(item)
+        return partial_record(Subscription, fields, item, self._wire)
+
+    def list_by_fund(
+        self,
+        fund_id: str,
+        status: str = Status.ACTIVE.value,
+        limit: int = 50,
+        cursor: str | None = None
+    ) -> Tuple[List[Subscription], str | None]:
+        """One page of a fund's subscriptions in a status, and the cursor."""
         try:
-            item = {
-                'PK': f'USER#{subscription.user_id}',
-                'SK': f'SUB#{subscription.fund_id}',
-                'user_id': subscription.user_id,
-                'fund_id': subscription.fund_id,
-                'amount': subscription.amount,
-                'status': subscription.status.value,
-                'created_at': subscription.created_at
-            }
+            items, next_cursor = take_page(
+                self._fund_items(
+                    fund_id, Status(status).value, limit,
+                    decode_cursor(cursor, SUBSCRIBER_INDEX_KEY)
+                ),
+                SUBSCRIBER_INDEX_KEY,
+                limit,
+                wire=self._wire
+            )
+            return [
+                self._to_subscription(item) for item in items
+            ], next_cursor
+
+        except ClientError as e:
+            raise Exception(
+                "Error listing subscriptions by fund: "
+                f"{e.response['Error']['Message']}"
+            )
 
-            if subscription.cancelled_at:
-                item['cancelled_at'] = subscription.cancelled_at
+    def _fund_items(
+        self,
+        fund_id: str,
+        status: str,
+        page_size: int,
+        start_key: Dict[str, Any] | None
+    ) -> Iterator[Dict[str, Any]]:
+        """Query the index shard by shard, resuming at the cursor's shard."""
+        keys = [f"{fund_id}#{status}#{shard}" for shard in range(self.shards)]
+        if start_key:
+            if start_key.get('fund_status') not in keys:
+                # From another fund, status or shard count
+                raise InvalidCursor("Cursor does not match this listing")
+            keys = keys[keys.index(start_key['fund_status']):]
 
-            self.subscriptions_table.put_item(Item=item)
+        for key in keys:
+            yield from iterate_items(
+                self._reads.query,
+                {
+                    'IndexName': SUBSCRIBER_INDEX,
+                    'KeyConditionExpression': Key('fund_status').eq(key)
+                },
+                page_size,
+                start_key if start_key and key == start_key['fund_status']
+                else None
+            )
+
+    def save(self, subscription: Subscription) -> Subscription:
+        """Save a subscription."""
+        try:
+            self.subscriptions_table.put_item(
+                Item=subscription_to_item(subscription, self.shards)
+            )
             return subscription
 
         except ClientError as e:
@@ -1,58 +1,250 @@
-import boto3
 import os
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from itertools import islice
 from botocore.exceptions import ClientError
 from boto3.dynamodb.conditions import Attr, Key
+from app.application.ports.errors import InvalidTimeRange
 from app.application.ports.transactions import TransactionPort
-from app.domain.models.transaction import Transaction, TransactionType
-from typing import Iterable, Dict, Any
+from app.domain.models.clock import utc_now
+from app.domain.models.transaction import (
+    Transaction,
+    TransactionRow,
+    TransactionType
+)
+from app.infrastructure.adapters.ids import (
+    epoch_ms,
+    new_ulid,
+    ulid_ceiling,
+    ulid_floor
+)
+from app.infrastructure.adapters.pagination import (
+    decode_cursor,
+    iterate_items,
+    read_page,
+    take_page
+)
+from app.infrastructure.adapters.parallel_scan import parallel_scan
+from app.infrastructure.dynamodb import get_dynamodb_resource
+from typing import Iterable, Iterator, Dict, Any, List, Tuple
+
+
+TABLE_KEY = ('PK', 'SK')
+# A fund's transactions in time order: fund_id-index is (fund_id,
+# timestamp), so fund profiles, subscriptions and counters stay out.
+FUND_INDEX = 'fund_id-index'
+FUND_INDEX_KEY = ('fund_id', 'timestamp', 'PK', 'SK')
+
+# Transactions are also indexed by day so date-range reads query only the
+# buckets they need: tx_time-index is (tx_bucket, timestamp).
+TIME_INDEX = 'tx_time-index'
+TIME_INDEX_KEY = ('tx_bucket', 'timestamp', 'PK', 'SK')
+
+# A colliding ULID is drawn again this many times before giving up
+SAVE_ATTEMPTS = 3
+
+
+def _all_key(since: datetime | None) -> Tuple[str, ...]:
+    """Key of the items listed by ``get_all``: index or table order."""
+    return TIME_INDEX_KEY if since else TABLE_KEY
+
+
+def time_bucket(timestamp: str) -> str:
+    """Day bucket (TXB#YYYY-MM-DD) of an ISO-8601 timestamp."""
+    return f"TXB#{timestamp[:10]}"
+
+
+def as_utc(moment: datetime) -> datetime:
+    """``moment`` as naive UTC, like the stored timestamps."""
+    if moment.tzinfo is None:
+        return moment
+    return moment.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def time_buckets(since: datetime, until: datetime) -> Iterator[str]:
+    """Day buckets from ``since`` to ``until``, both included."""
+    day = since.date()
+    while day <= until.date():
+        yield time_bucket(day.isoformat())
+        day += timedelta(days=1)
+
+
+def transaction_to_item(transaction: Transaction) -> Dict[str, Any]:
+    """Build the DynamoDB item for a Transaction, under a new ULID key."""
+    # The ULID carries the transaction's time, so SK order is time order
+    # and a time range is an SK range (see ``user_sk_condition``)
+    transaction_id = new_ulid(
+        epoch_ms(datetime.fromisoformat(transaction.timestamp))
+    )
+
+    return {
+        'PK': f'USER#{transaction.user_id}',
+        'SK': f'TX#{transaction_id}',
+        'transaction_id': transaction_id,
+        'user_id': transaction.user_id,
+        'fund_id': transaction.fund_id,
+        'amount': transaction.amount,
+        'transaction_type': transaction.transaction_type.value,
+        'timestamp': transaction.timestamp,
+        'tx_bucket': time_bucket(transaction.timestamp),
+        'prev_balance': transaction.prev_balance,
+        'new_balance': transaction.new_balance
+    }
+
+
+def user_sk_condition(
+    from_time: datetime | None = None,
+    to_time: datetime | None = None
+):
+    """Key condition on SK for a user's transactions between two times."""
+    if from_time is None and to_time is None:
+        return Key('SK').begins_with('TX#')
+    return Key('SK').between(
+        'TX#' + (ulid_floor(from_time) if from_time else '0'),
+        'TX#' + (ulid_ceiling(to_time) if to_time else '~')
+    )
+
+
+def item_to_transaction(item: Dict[str, Any]) -> Transaction:
+    """Build a Transaction from a DynamoDB item."""
+    return Transaction(
+        user_id=item.get('user_id'),
+        fund_id=item.get('fund_id'),
+        amount=int(item.get('amount', 0)),
+        transaction_type=TransactionType(item.get('transaction_type')),
+        timestamp=item.get('timestamp'),
+        prev_balance=int(item.get('prev_balance', 0)),
+        new_balance=int(item.get('new_balance', 0))
+    )
+
+
+def item_to_row(item: Dict[str, Any]) -> TransactionRow:
+    """Build a TransactionRow from a DynamoDB item, without validation."""
+    return TransactionRow(
+        item['user_id'],
+        item['fund_id'],
+        int(item['amount']),
+        item['transaction_type'],
+        item['timestamp'],
+        int(item['prev_balance']),
+        int(item['new_balance'])
+    )
 
 
 class TransactionAdapter(TransactionPort):
+    # Reads decode items with these; ClientTransactionAdapter reads the
+    # wire format
+    _to_transaction = staticmethod(item_to_transaction)
+    _to_row = staticmethod(item_to_row)
+    _wire = False
+
     def __init__(self, dynamodb_resource=None):
         if dynamodb_resource is None:
-            # En Lambda, usar IAM Role automático
-            self.dynamodb = boto3.resource(
-                'dynamodb',
-                region_name=os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
-            )
+            # En Lambda, usar IAM Role automático (recurso compartido)
+            self.dynamodb = get_dynamodb_resource()
         else:
             self.dynamodb = dynamodb_resource
 
         self.transactions_table = self.dynamodb.Table(os.getenv('APPCHALLENGE_TABLE_NAME', 'AppChallenge'))
+        # Where query and scan go; parallel scans share the client
+        self._reads = self.transactions_table
+        self._scan_client = self.dynamodb.meta.client
 
     def get_all(
         self,
-        limit: int = 50,
-        since: datetime | None = None
+        limit: int | None = 50,
+        since: datetime | None = None,
+        cursor: str | None = None,
+        page_size: int | None = None
     ) -> Iterable[Transaction]:
         """Get all transactions, optionally filtered by a starting date."""
         try:
-            scan_kwargs: Dict[str, Any] = {
-                'Limit': limit,
-                'FilterExpression': Attr('SK').begins_with('TX#')
-            }
-
-            if since:
-                scan_kwargs['FilterExpression'] = (
-                    scan_kwargs['FilterExpression'] &
-                    Attr('timestamp').gte(since.isoformat())
-                )
+            items = self._all_items(
+                since, page_size, decode_cursor(cursor, _all_key(since))
+            )
+            for item in islice(items, limit):
+                yield self._to_transaction(item)
 
-            response = self.transactions_table.scan(**scan_kwargs)
-
-            for item in response.get('Items', []):
-                yield Transaction(
-                    user_id=item.get('user_id'),
-                    fund_id=item.get('fund_id'),
-                    amount=int(item.get('amount', 0)),
-                    transaction_type=TransactionType(
-                        item.get('transaction_type')
-                    ),
-                    timestamp=item.get('timestamp'),
-                    prev_balance=int(item.get('prev_balance', 0)),
-                    new_balance=int(item.get('new_balance', 0))
-                )
+        except ClientError as e:
+            raise Exception(
+                "Error retrieving all transactions: "
+                f"{e.response['Error']['Message']}"
+            )
+
+    def get_all_page(
+        self,
+        limit: int = 50,
+        since: datetime | None = None,
+        cursor: str | None = None,
+        page_size: int | None = None
+    ) -> Tuple[List[Transaction], str | None]:
+        """Get one page of transactions and the cursor to the next one."""
+        items, next_cursor = self._all_page(limit, since, cursor, page_size)
+        return [self._to_transaction(item) for item in items], next_cursor
+
+    def get_all_rows_page(
+        self,
+        limit: int = 50,
+        since: datetime | None = None,
+        cursor: str | None = None,
+        page_size: int | None = None
+    ) -> Tuple[List[TransactionRow], str | None]:
+        """Like ``get_all_page``, as unvalidated rows."""
+        items, next_cursor = self._all_page(limit, since, cursor, page_size)
+        return [self._to_row(item) for item in items], next_cursor
+
+    def get_all_parallel(
+        self,
+        total_segments: int = 8,
+        since: datetime | None = None,
+        ordered: bool = False,
+        max_workers: int | None = None,
+        max_buffered_pages: int | None = None
+    ) -> Iterable[Transaction]:
+        """Get all transactions with a parallel segmented scan.
+
+        Scan order follows partition hashes, not time: ``ordered`` reads
+        the time index instead, one day bucket after another, so it needs
+        ``since`` and ignores the scan settings.
+        """
+        if ordered:
+            if since is None:
+                raise InvalidTimeRange("An ordered export needs 'since'")
+            return self._ordered_export(since)
+        return self._parallel_export(
+            total_segments, since, max_workers, max_buffered_pages
+        )
+
+    def _parallel_export(
+        self,
+        total_segments: int,
+        since: datetime | None,
+        max_workers: int | None,
+        max_buffered_pages: int | None
+    ) -> Iterator[Transaction]:
+        try:
+            items = parallel_scan(
+                self._scan_client,
+                {
+                    'TableName': self.transactions_table.name,
+                    **self._all_request(since)
+                },
+                total_segments,
+                max_workers=max_workers,
+                max_buffered_pages=max_buffered_pages
+            )
+            for item in items:
+                yield self._to_transaction(item)
+
+        except ClientError as e:
+            raise Exception(
+                "Error scanning all transactions: "
+                f"{e.response['Error']['Message']}"
+            )
+
+    def _ordered_export(self, since: datetime) -> Iterator[Transaction]:
+        try:
+            for item in self._since_items(since, None, None):
+                yield self._to_transaction(item)
 
         except ClientError as e:
             raise Exception(
@@ -63,29 +255,46 @@ class TransactionAdapter(TransactionPort):
     def get_by_fund(
         self,
         fund_id: str,
-        limit: int = 50
+        limit: int | None = 50,
+        cursor: str | None = None,
+        page_size: int | None = None
     ) -> Iterable[Transaction]:
         """Get all transactions for a specific fund."""
         try:
-            response = self.transactions_table.query(
-                IndexName='fund_id-index',
-                KeyConditionExpression=Key('fund_id').eq(fund_id),
-                FilterExpression=Attr('SK').begins_with('TX#'),
-                Limit=limit
-            )
-
-            for item in response.get('Items', []):
-                yield Transaction(
-                    user_id=item.get('user_id'),
-                    fund_id=item.get('fund_id'),
-                    amount=int(item.get('amount', 0)),
-                    transaction_type=TransactionType(
-                        item.get('transaction_type')
-                    ),
-                    timestamp=item.get('timestamp'),
-                    prev_balance=int(item.get('prev_balance', 0)),
-                    new_balance=int(item.get('new_balance', 0))
-                )
+            items = iterate_items(
+                self._reads.query,
+                self._fund_request(fund_id),
+                page_size or limit,
+                decode_cursor(cursor, FUND_INDEX_KEY)
+            )
+            for item in islice(items, limit):
+                yield self._to_transaction(item)
+
+        except ClientError as e:
+            raise Exception(
+                f"Error retrieving transactions by fund: "
+                f"{e.response['Error']['Message']}"
+            )
+
+    def get_by_fund_page(
+        self,
+        fund_id: str,
+        limit: int = 50,
+        cursor: str | None = None,
+        page_size: int | None = None
+    ) -> Tuple[List[Transaction], str | None]:
+        """Get one page of a fund's transactions and the next cursor."""
+        try:
+            items, next_cursor = read_page(
+                self._reads.query,
+                self._fund_request(fund_id),
+                FUND_INDEX_KEY,
+                limit,
+                cursor,
+                page_size or limit,
+                wire=self._wire
+            )
+            return [self._to_transaction(item) for item in items], next_cursor
 
         except ClientError as e:
             raise Exception(
@@ -96,30 +305,22 @@ class TransactionAdapter(TransactionPort):
     def get_by_user(
         self,
         user_id: str,
-        limit: int = 50
+        limit: int | None = 50,
+        cursor: str | None = None,
+        page_size: int | None = None,
+        from_time: datetime | None = None,
+        to_time: datetime | None = None
     ) -> Iterable[Transaction]:
-        """Get all transactions for a specific user."""
+        """Get all transactions for a specific user, optionally in a range."""
         try:
-            response = self.transactions_table.query(
-                KeyConditionExpression=(
-                    Key('PK').eq(f'USER#{user_id}') &
-                    Key('SK').begins_with('TX#')
-                ),
-                Limit=limit
-            )
-
-            for item in response.get('Items', []):
-                yield Transaction(
-                    user_id=item.get('user_id'),
-                    fund_id=item.get('fund_id'),
-                    amount=int(item.get('amount', 0)),
-                    transaction_type=TransactionType(
-                        item.get('transaction_type')
-                    ),
-                    timestamp=item.get('timestamp'),
-                    prev_balance=int(item.get('prev_balance', 0)),
-                    new_balance=int(item.get('new_balance', 0))
-                )
+            items = iterate_items(
+                self._reads.query,
+                self._user_request(user_id, from_time, to_time),
+                page_size or limit,
+                decode_cursor(cursor, TABLE_KEY)
+            )
+            for item in islice(items, limit):
+                yield self._to_transaction(item)
 
         except ClientError as e:
             raise Exception(
@@ -127,29 +328,176 @@ class TransactionAdapter(TransactionPort):
                 f"{e.response['Error']['Message']}"
             )
 
-    def save(self, transaction: Transaction) -> Transaction:
-        """Save a transaction."""
+    def get_by_user_page(
+        self,
+        user_id: str,
+        limit: int = 50,
+        cursor: str | None = None,
+        page_size: int | None = None,
+        from_time: datetime | None = None,
+        to_time: datetime | None = None
+    ) -> Tuple[List[Transaction], str | None]:
+        """Get one page of a user's transactions and the next cursor."""
+        items, next_cursor = self._user_page(
+            user_id, limit, cursor, page_size, from_time, to_time
+        )
+        return [self._to_transaction(item) for item in items], next_cursor
+
+    def get_by_user_rows_page(
+        self,
+        user_id: str,
+        limit: int = 50,
+        cursor: str | None = None,
+        page_size: int | None = None,
+        from_time: datetime | None = None,
+        to_time: datetime | None = None
+    ) -> Tuple[List[TransactionRow], str | None]:
+        """Like ``get_by_user_page``, as unvalidated rows."""
+        items, next_cursor = self._user_page(
+            user_id, limit, cursor, page_size, from_time, to_time
+        )
+        return [self._to_row(item) for item in items], next_cursor
+
+    def _all_page(
+        self,
+        limit: int,
+        since: datetime | None,
+        cursor: str | None,
+        page_size: int | None
+    ) -> Tuple[List[Dict[str, Any]], str | None]:
+        try:
+            return take_page(
+                self._all_items(
+                    since, page_size, decode_cursor(cursor, _all_key(since))
+                ),
+                _all_key(since),
+                limit,
+                wire=self._wire
+            )
+
+        except ClientError as e:
+            raise Exception(
+                "Error retrieving all transactions: "
+                f"{e.response['Error']['Message']}"
+            )
+
+    def _user_page(
+        self,
+        user_id: str,
+        limit: int,
+        cursor: str | None,
+        page_size: int | None,
+        from_time: datetime | None = None,
+        to_time: datetime | None = None
+    ) -> Tuple[List[Dict[str, Any]], str | None]:
         try:
-            # Generate unique transaction ID
-            timestamp_clean = transaction.timestamp.replace(':', '').replace('-', '').replace('.', '')[:15]
-            transaction_id = f"T{timestamp_clean}"
-            
-            self.transactions_table.put_item(
-                Item={
-                    'PK': f'USER#{transaction.user_id}',
-                    'SK': f'TX#{timestamp_clean}#{transaction_id}',
-                    'user_id': transaction.user_id,
-                    'fund_id': transaction.fund_id,
-                    'amount': transaction.amount,
-                    'transaction_type': transaction.transaction_type.value,
-                    'timestamp': transaction.timestamp,
-                    'prev_balance': transaction.prev_balance,
-                    'new_balance': transaction.new_balance
-                }
-            )
-            return transaction
+            return read_page(
+                self._reads.query,
+                self._user_request(user_id, from_time, to_time),
+                TABLE_KEY,
+                limit,
+                cursor,
+                page_size or limit,
+                wire=self._wire
+            )
 
         except ClientError as e:
             raise Exception(
-                f"Error saving transaction: {e.response['Error']['Message']}"
+                "Error retrieving transactions by user: "
+                f"{e.response['Error']['Message']}"
+            )
+
+    def _all_items(
+        self,
+        since: datetime | None,
+        page_size: int | None,
+        start_key: Dict[str, Any] | None
+    ) -> Iterator[Dict[str, Any]]:
+        if since is None:
+            return iterate_items(
+                self._reads.scan,
+                self._all_request(None),
+                page_size,
+                start_key
+            )
+        return self._since_items(since, page_size, start_key)
+
+    def _since_items(
+        self,
+        since: datetime,
+        page_size: int | None,
+        start_key: Dict[str, Any] | None
+    ) -> Iterator[Dict[str, Any]]:
+        """Query the time index bucket by bucket, in timestamp order."""
+        first_bucket = start_key['tx_bucket'] if start_key else None
+
+        # Buckets and timestamps are UTC days: an offset must not pick
+        # the wrong first day
+        since = as_utc(since)
+        until = max(utc_now(), since)
+        for bucket in time_buckets(since, until):
+            if first_bucket and bucket < first_bucket:
+                continue
+            yield from iterate_items(
+                self._reads.query,
+                {
+                    'IndexName': TIME_INDEX,
+                    'KeyConditionExpression': (
+                        Key('tx_bucket').eq(bucket) &
+                        Key('timestamp').gte(since.isoformat())
+                    )
+                },
+                page_size,
+                start_key if bucket == first_bucket else None
+            )
+
+    def _all_request(self, since: datetime | None) -> Dict[str, Any]:
+        filter_expression = Attr('SK').begins_with('TX#')
+        if since:
+            filter_expression = (
+                filter_expression &
+                Attr('timestamp').gte(as_utc(since).isoformat())
+            )
+        return {'FilterExpression': filter_expression}
+
+    def _fund_request(self, fund_id: str) -> Dict[str, Any]:
+        return {
+            'IndexName': FUND_INDEX,
+            'KeyConditionExpression': Key('fund_id').eq(fund_id),
+            'FilterExpression': Attr('SK').begins_with('TX#')
+        }
+
+    def _user_request(
+        self,
+        user_id: str,
+        from_time: datetime | None = None,
+        to_time: datetime | None = None
+    ) -> Dict[str, Any]:
+        return {
+            'KeyConditionExpression': (
+                Key('PK').eq(f'USER#{user_id}') &
+                user_sk_condition(from_time, to_time)
             )
+        }
+
+    def save(self, transaction: Transaction) -> Transaction:
+        """Save a transaction under a new key, never overwriting one."""
+        for _ in range(SAVE_ATTEMPTS):
+            try:
+                self.transactions_table.put_item(
+                    Item=transaction_to_item(transaction),
+                    ConditionExpression=Attr('SK').not_exists()
+                )
+                return transaction
+
+            except ClientError as e:
+                code = e.response['Error']['Code']
+                if code != 'ConditionalCheckFailedException':
+                    raise Exception(
+                        "Error saving transaction: "
+                        f"{e.response['Error']['Message']}"
+                    )
+        raise Exception(
+            "Error saving transaction: no free transaction id after "
+            f"{SAVE_ATTEMPTS} attempts"
+        )
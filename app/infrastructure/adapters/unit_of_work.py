@@ -0,0 +1,466 @@
+import os
+import time
+from botocore.exceptions import ClientError
+from boto3.dynamodb.types import TypeDeserializer
+from app.application.ports.errors import (
+    IdempotencyConflict,
+    InsufficientBalance,
+    OptimisticLockError,
+    StaleBalance,
+    SubscriptionConflict,
+    SubscriptionNotFound,
+    UserNotFound
+)
+from app.application.ports.unit_of_work import UnitOfWorkPort
+from app.domain.models.clock import utc_now
+from app.domain.models.idempotency import IdempotencyRecord
+from app.domain.models.subscription import Subscription, Status
+from app.domain.models.transaction import Transaction
+from app.infrastructure.adapters.batch import (
+    MAX_ATTEMPTS,
+    TRANSACT_LIMIT,
+    backoff_delay,
+    chunked
+)
+from app.infrastructure.adapters.fund_stats import (
+    shard_for,
+    stats_action,
+    stats_shards
+)
+from app.infrastructure.adapters.idempotency import (
+    completion_action,
+    mark_completed
+)
+from app.infrastructure.adapters.portfolio import (
+    close_position_action,
+    open_position_action
+)
+from app.infrastructure.adapters.subscription import (
+    subscriber_key,
+    subscriber_shards,
+    subscription_to_item
+)
+from app.infrastructure.adapters.transactions import transaction_to_item
+from app.infrastructure.dynamodb import get_dynamodb_resource
+from typing import Any, Dict, List, Tuple
+
+
+# Actions written for each subscribe: balance, subscription, transaction
+# and portfolio summary, plus a fund counter update shared by the chunk
+SUBSCRIBE_ACTIONS = 4
+
+_THROTTLING = {
+    'ThrottlingException',
+    'ProvisionedThroughputExceededException',
+    'RequestLimitExceeded'
+}
+_RETRYABLE_REASONS = {
+    'TransactionConflict',
+    'ThrottlingError',
+    'ProvisionedThroughputExceeded'
+}
+
+
+_deserializer = TypeDeserializer()
+
+
+def _cancellation_reasons(error: ClientError) -> List[Dict[str, Any]]:
+    """Per-action reasons of a cancelled transaction, in request order."""
+    return error.response.get('CancellationReasons', [])
+
+
+def _failed(reason: Dict[str, Any]) -> bool:
+    return reason.get('Code') == 'ConditionalCheckFailed'
+
+
+def _old_item(reason: Dict[str, Any]) -> Dict[str, Any] | None:
+    """Item returned by ReturnValuesOnConditionCheckFailure, if any."""
+    # Cancellation reasons are not deserialized by the resource layer.
+    if 'Item' not in reason:
+        return None
+    return {
+        name: _deserializer.deserialize(value)
+        for name, value in reason['Item'].items()
+    }
+
+
+def _claim_lost() -> IdempotencyConflict:
+    # The Idempotency-Key lock expired and another request took the key
+    return IdempotencyConflict(
+        "A request with this Idempotency-Key is still in progress"
+    )
+
+
+def _balance_changed() -> StaleBalance:
+    # The transaction logs the balance it was built from: it must still
+    # be the stored one
+    return StaleBalance("Balance changed since it was read, retry the request")
+
+
+def _transaction_id_taken() -> OptimisticLockError:
+    # Another writer drew the same transaction id: a retry draws a new one
+    return OptimisticLockError(
+        "Transaction id already taken, retry the request"
+    )
+
+
+class UnitOfWorkAdapter(UnitOfWorkPort):
+    def __init__(self, dynamodb_resource=None, shards: int | None = None):
+        if dynamodb_resource is None:
+            # En Lambda, usar IAM Role automático (recurso compartido)
+            self.dynamodb = get_dynamodb_resource()
+        else:
+            self.dynamodb = dynamodb_resource
+
+        self.table_name = os.getenv('APPCHALLENGE_TABLE_NAME', 'AppChallenge')
+        # Resource clients keep Python values in and out of the request.
+        self.client = self.dynamodb.meta.client
+        self.shards = shards or stats_shards()
+        self.subscriber_shards = subscriber_shards()
+
+    def subscribe(
+            self,
+            subscription: Subscription,
+            transaction: Transaction,
+            claim: IdempotencyRecord | None = None
+            ) -> Subscription:
+        """Debit the balance, open the subscription and log the transaction."""
+        actions = [
+            *self._subscribe_actions(subscription, transaction),
+            *self._stats_actions([subscription]),
+            *self._claim_actions(claim, subscription)
+        ]
+        try:
+            self.client.transact_write_items(TransactItems=actions)
+            self._claim_completed(claim, subscription)
+            return subscription
+
+        except ClientError as e:
+            reasons = self._cancelled(e, "Error subscribing to fund: ")
+            if claim is not None and _failed(reasons[-1]):
+                raise _claim_lost()
+            error = self._subscribe_error(subscription, reasons)
+            if error is not None:
+                raise error
+            if _failed(reasons[2]):
+                raise _transaction_id_taken()
+            raise
+
+    def subscribe_many(
+            self,
+            entries: List[Tuple[Subscription, Transaction]],
+            max_attempts: int = MAX_ATTEMPTS
+            ) -> List[Subscription | Exception]:
+        """Subscribe many users, one transaction per chunk of entries.
+
+        Each entry is committed atomically with the others in its chunk;
+        entries whose conditions fail are reported and the rest of the
+        chunk is retried without them. Results follow the input order.
+        """
+        results: List[Subscription | Exception | None] = [None] * len(entries)
+        # Worst case every entry is for a different fund: one counter each
+        per_chunk = TRANSACT_LIMIT // (SUBSCRIBE_ACTIONS + 1)
+        for chunk in chunked(range(len(entries)), per_chunk):
+            self._subscribe_chunk(entries, list(chunk), results, max_attempts)
+        return results
+
+    def _subscribe_chunk(
+            self,
+            entries: List[Tuple[Subscription, Transaction]],
+            pending: List[int],
+            results: List[Any],
+            max_attempts: int
+            ) -> None:
+        attempt = 0
+        while pending:
+            actions = [
+                action
+                for index in pending
+                for action in self._subscribe_actions(*entries[index])
+            ]
+            # Counter actions go last so reasons still line up per entry
+            actions += self._stats_actions(
+                [entries[index][0] for index in pending]
+            )
+            try:
+                self.client.transact_write_items(TransactItems=actions)
+            except ClientError as e:
+                code = e.response['Error']['Code']
+                reasons = _cancellation_reasons(e)
+
+                if any(_failed(reason) for reason in reasons):
+                    # Drop the entries that can't succeed, retry the rest;
+                    # a taken transaction id gets a new one on the retry,
+                    # until the attempts run out
+                    exhausted = attempt + 1 >= max_attempts
+                    remaining = []
+                    for position, index in enumerate(pending):
+                        offset = position * SUBSCRIBE_ACTIONS
+                        entry = reasons[offset:offset + SUBSCRIBE_ACTIONS]
+                        error = self._subscribe_error(entries[index][0], entry)
+                        if error is None and exhausted and _failed(entry[2]):
+                            error = _transaction_id_taken()
+                        if error is None:
+                            remaining.append(index)
+                        else:
+                            results[index] = error
+
+                    if len(remaining) == len(pending):
+                        # Nothing dropped: only ids were taken this time
+                        attempt += 1
+                        if exhausted:
+                            for index in pending:
+                                results[index] = _transaction_id_taken()
+                            return
+                    pending = remaining
+                    continue
+
+                retryable = code in _THROTTLING or any(
+                    r.get('Code') in _RETRYABLE_REASONS for r in reasons
+                )
+                attempt += 1
+                if retryable and attempt < max_attempts:
+                    time.sleep(backoff_delay(attempt))
+                    continue
+
+                error = (
+                    OptimisticLockError(
+                        "Concurrent transaction on the same items, "
+                        "retry the request"
+                    )
+                    if retryable else
+                    Exception(
+                        "Error subscribing to fund: "
+                        f"{e.response['Error']['Message']}"
+                    )
+                )
+                for index in pending:
+                    results[index] = error
+                return
+
+            for index in pending:
+                results[index] = entries[index][0]
+            return
+
+    def _subscribe_actions(
+            self,
+            subscription: Subscription,
+            transaction: Transaction
+            ) -> List[Dict[str, Any]]:
+        """Balance debit, subscription, transaction log and summary writes."""
+        return [
+            {'Update': {
+                'TableName': self.table_name,
+                'Key': {
+                    'PK': f'USER#{subscription.user_id}',
+                    'SK': 'PROFILE'
+                },
+                'UpdateExpression': 'SET balance = balance - :amount',
+                # The logged prev_balance must be the one debited
+                'ConditionExpression': (
+                    'attribute_exists(PK) AND balance >= :amount '
+                    'AND balance = :prev_balance'
+                ),
+                'ExpressionAttributeValues': {
+                    ':amount': subscription.amount,
+                    ':prev_balance': transaction.prev_balance
+                },
+                'ReturnValuesOnConditionCheckFailure': 'ALL_OLD'
+            }},
+            {'Put': {
+                'TableName': self.table_name,
+                'Item': subscription_to_item(
+                    subscription, self.subscriber_shards
+                ),
+                'ConditionExpression': (
+                    'attribute_not_exists(PK) OR #status <> :active'
+                ),
+                'ExpressionAttributeNames': {'#status': 'status'},
+                'ExpressionAttributeValues': {
+                    ':active': Status.ACTIVE.value
+                }
+            }},
+            {'Put': {
+                'TableName': self.table_name,
+                'Item': transaction_to_item(transaction),
+                # Never overwrite a logged transaction with the same id
+                'ConditionExpression': 'attribute_not_exists(PK)'
+            }},
+            open_position_action(
+                self.table_name, subscription, transaction.timestamp
+            )
+        ]
+
+    def _stats_actions(
+            self,
+            subscriptions: List[Subscription],
+            sign: int = 1
+            ) -> List[Dict[str, Any]]:
+        """One fund counter update per fund, adding up ``subscriptions``."""
+        # A transaction can't touch the same item twice: merge per fund
+        funds: Dict[str, List[Subscription]] = {}
+        for subscription in subscriptions:
+            funds.setdefault(subscription.fund_id, []).append(subscription)
+
+        return [
+            stats_action(
+                self.table_name,
+                fund_id,
+                shard_for(group[0].user_id, self.shards),
+                sign * sum(s.amount for s in group),
+                sign * len(group)
+            )
+            for fund_id, group in funds.items()
+        ]
+
+    def _claim_actions(
+            self,
+            claim: IdempotencyRecord | None,
+            result: Subscription
+            ) -> List[Dict[str, Any]]:
+        """Completion of ``claim`` with ``result``, the route's response."""
+        if claim is None:
+            return []
+        return [completion_action(
+            self.table_name, claim, 200, result.model_dump(mode='json')
+        )]
+
+    @staticmethod
+    def _claim_completed(
+            claim: IdempotencyRecord | None,
+            result: Subscription
+            ) -> None:
+        if claim is not None:
+            mark_completed(claim, 200, result.model_dump(mode='json'))
+
+    @staticmethod
+    def _subscribe_error(
+            subscription: Subscription,
+            reasons: List[Dict[str, Any]]
+            ) -> Exception | None:
+        """Error for the failed conditions of a subscribe, if any failed."""
+        balance, current = reasons[0], reasons[1]
+        if _failed(balance):
+            user = _old_item(balance)
+            if user is None:
+                return UserNotFound(
+                    f"User with ID {subscription.user_id} not found"
+                )
+            if user['balance'] >= subscription.amount:
+                return _balance_changed()
+            return InsufficientBalance(
+                "Insufficient balance to subscribe to fund "
+                f"{subscription.fund_id}"
+            )
+        if _failed(current):
+            return SubscriptionConflict("Active subscription already exists")
+        return None
+
+    def cancel(
+            self,
+            subscription: Subscription,
+            transaction: Transaction,
+            claim: IdempotencyRecord | None = None
+            ) -> Subscription:
+        """Refund the amount, cancel the subscription and log the transaction."""
+        cancelled = subscription.model_copy(update={
+            'status': Status.CANCELLED,
+            'cancelled_at': utc_now().isoformat()
+        })
+        actions = [
+            {'Update': {
+                'TableName': self.table_name,
+                'Key': {
+                    'PK': f'USER#{subscription.user_id}',
+                    'SK': 'PROFILE'
+                },
+                'UpdateExpression': 'SET balance = balance + :amount',
+                'ConditionExpression': (
+                    'attribute_exists(PK) AND balance = :prev_balance'
+                ),
+                'ExpressionAttributeValues': {
+                    ':amount': subscription.amount,
+                    ':prev_balance': transaction.prev_balance
+                },
+                'ReturnValuesOnConditionCheckFailure': 'ALL_OLD'
+            }},
+            {'Update': {
+                'TableName': self.table_name,
+                'Key': {
+                    'PK': f'USER#{subscription.user_id}',
+                    'SK': f'SUB#{subscription.fund_id}'
+                },
+                'UpdateExpression': (
+                    'SET #status = :cancelled, cancelled_at = :timestamp, '
+                    'fund_status = :fund_status'
+                ),
+                # The refund is the amount read by the caller: refuse to
+                # cancel if the subscription changed in the meantime.
+                'ConditionExpression': '#status = :active AND amount = :amount',
+                'ExpressionAttributeNames': {'#status': 'status'},
+                'ExpressionAttributeValues': {
+                    ':active': Status.ACTIVE.value,
+                    ':cancelled': Status.CANCELLED.value,
+                    ':timestamp': cancelled.cancelled_at,
+                    ':amount': subscription.amount,
+                    ':fund_status': subscriber_key(
+                        subscription.fund_id, Status.CANCELLED.value,
+                        subscription.user_id, self.subscriber_shards
+                    )
+                },
+                'ReturnValuesOnConditionCheckFailure': 'ALL_OLD'
+            }},
+            {'Put': {
+                'TableName': self.table_name,
+                'Item': transaction_to_item(transaction),
+                # Never overwrite a logged transaction with the same id
+                'ConditionExpression': 'attribute_not_exists(PK)'
+            }},
+            close_position_action(
+                self.table_name, subscription, cancelled.cancelled_at
+            ),
+            *self._stats_actions([subscription], sign=-1),
+            *self._claim_actions(claim, cancelled)
+        ]
+
+        try:
+            self.client.transact_write_items(TransactItems=actions)
+            self._claim_completed(claim, cancelled)
+            return cancelled
+
+        except ClientError as e:
+            reasons = self._cancelled(e, "Error cancelling subscription: ")
+            if claim is not None and _failed(reasons[-1]):
+                raise _claim_lost()
+            user, current = reasons[0], reasons[1]
+            if _failed(user):
+                if _old_item(user) is not None:
+                    raise _balance_changed()
+                raise UserNotFound(
+                    f"User with ID {subscription.user_id} not found"
+                )
+            if _failed(current):
+                item = _old_item(current)
+                if item and item.get('status') == Status.ACTIVE.value:
+                    raise OptimisticLockError(
+                        "Subscription changed while cancelling it"
+                    )
+                raise SubscriptionNotFound("Active subscription not found")
+            if _failed(reasons[2]):
+                raise _transaction_id_taken()
+            raise
+
+    @staticmethod
+    def _cancelled(error: ClientError, message: str) -> List[Dict[str, Any]]:
+        """Cancellation reasons of ``error``, raising anything else."""
+        if error.response['Error']['Code'] != 'TransactionCanceledException':
+            raise Exception(f"{message}{error.response['Error']['Message']}")
+
+        reasons = _cancellation_reasons(error)
+        if any(r.get('Code') == 'TransactionConflict' for r in reasons):
+            raise OptimisticLockError(
+                "Concurrent transaction on the same items, retry the request"
+            )
+        if len(reasons) < 2:
+            raise Exception(f"{message}{error.response['Error']['Message']}")
+        return reasons
@@ -1,52 +1,110 @@
-import boto3
 import os
 from botocore.exceptions import ClientError
 from app.application.ports.users import UserPort
+from app.domain.models.partial import PartialRecord
 from app.domain.models.user import User, NotifyChannel
-from typing import Any
+from app.infrastructure.adapters.batch import batch_get_items
+from app.infrastructure.adapters.projection import partial_record, projection
+from app.infrastructure.dynamodb import get_dynamodb_resource
+from typing import Any, Dict, Iterable, List
+
+
+def item_to_user(item: dict) -> User:
+    """Build a User from its PROFILE item."""
+    return User(
+        user_id=item.get('user_id'),
+        name=item.get('name'),
+        email=item.get('email'),
+        phone=item.get('phone'),
+        balance=int(item.get('balance', 0)),
+        notify_channel=NotifyChannel(item.get('notify_channel'))
+    )
 
 
 class UserAdapter(UserPort):
+    # Reads decode items with this; ClientUserAdapter reads the wire format
+    _to_user = staticmethod(item_to_user)
+    _wire = False
+
     def __init__(self, dynamodb_resource=None):
         if dynamodb_resource is None:
-            # En Lambda, usar IAM Role automático
-            self.dynamodb = boto3.resource(
-                'dynamodb',
-                region_name=os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
-            )
+            # En Lambda, usar IAM Role automático (recurso compartido)
+            self.dynamodb = get_dynamodb_resource()
         else:
             self.dynamodb = dynamodb_resource
 
-        self.users_table = self.dynamodb.Table(os.getenv('APPCHALLENGE_TABLE_NAME', 'AppChallenge'))
+        self.table_name = os.getenv('APPCHALLENGE_TABLE_NAME', 'AppChallenge')
+        self.users_table = self.dynamodb.Table(self.table_name)
+        # Where reads go: get_item on the table, batch_get_item on the source
+        self._reads = self.users_table
+        self._batch_reads = self.dynamodb
 
-    def get_by_id(self, user_id: str) -> User:
-        """Get a user by their ID."""
+    def get_by_id(
+            self,
+            user_id: str,
+            fields: Iterable[str] | None = None
+            ) -> User | PartialRecord:
+        """Get a user by their ID, only ``fields`` when given."""
+        request: Dict[str, Any] = {
+            'Key': {
+                'PK': f'USER#{user_id}',
+                'SK': 'PROFILE'
+            }
+        }
+        if fields is not None:
+            request.update(projection(fields))
         try:
-            response = self.users_table.get_item(
-                Key={
-                    'PK': f'USER#{user_id}',
-                    'SK': 'PROFILE'
-                }
-            )
+            response = self._reads.get_item(**request)
 
             if 'Item' not in response:
                 raise ValueError(f"User with ID {user_id} not found")
 
-            item = response['Item']
-            return User(
-                user_id=item.get('user_id'),
-                name=item.get('name'),
-                email=item.get('email'),
-                phone=item.get('phone'),
-                balance=int(item.get('balance', 0)),
-                notify_channel=NotifyChannel(item.get('notify_channel'))
-            )
+            return self._decode(response['Item'], fields)
 
         except ClientError as e:
             raise Exception(
                 f"Error retrieving user: {e.response['Error']['Message']}"
             )
 
+    def get_many(
+            self,
+            user_ids: List[str],
+            fields: Iterable[str] | None = None
+            ) -> List[User | PartialRecord]:
+        """Get several users at once, skipping the ones that don't exist.
+
+        With ``fields`` only those are read, plus user_id.
+        """
+        # BatchGetItem rejects duplicate keys
+        unique = list(dict.fromkeys(user_ids))
+        keys = [{'PK': f'USER#{user_id}', 'SK': 'PROFILE'} for user_id in unique]
+        if fields is not None:
+            # Results are matched to the input by user_id
+            fields = {*fields, 'user_id'}
+        try:
+            items = batch_get_items(
+                self._batch_reads, self.table_name, keys,
+                projection=projection(fields) if fields is not None else None
+            )
+        except ClientError as e:
+            raise Exception(
+                f"Error retrieving users: {e.response['Error']['Message']}"
+            )
+
+        # BatchGetItem returns items in any order: restore the input order
+        users = (self._decode(item, fields) for item in items)
+        found = {user.user_id: user for user in users}
+        return [found[user_id] for user_id in unique if user_id in found]
+
+    def _decode(
+            self,
+            item: Dict[str, Any],
+            fields: Iterable[str] | None
+            ) -> User | PartialRecord:
+        if fields is None:
+            return self._to_user(item)
+        return partial_record(User, fields, item, self._wire)
+
     def update(self, user_id: str, **params: Any) -> User:
         """Update a user."""
         try:
@@ -78,14 +136,7 @@ class UserAdapter(UserPort):
             )
 
             item = response['Attributes']
-            return User(
-                user_id=item.get('user_id'),
-                name=item.get('name'),
-                email=item.get('email'),
-                phone=item.get('phone'),
-                balance=int(item.get('balance', 0)),
-                notify_channel=NotifyChannel(item.get('notify_channel'))
-            )
+            return item_to_user(item)
 
         except ClientError as e:
             raise Exception(
@@ -0,0 +1,233 @@
+"""
+DynamoDB reads decoded from the wire format, without the resource layer.
+
+With the resource API, botocore first walks each response against the
+service model, then the resource layer runs every attribute through
+``TypeDeserializer`` (numbers become ``Decimal``), and the adapters
+convert the fields once more. Here:
+
+* ``raw_reads`` makes a low-level client hand read responses over as the
+  JSON body itself, so botocore doesn't walk the items;
+* ``WireTable`` takes the same arguments as a resource ``Table`` for reads
+  (condition objects, Python values) and returns items in the wire format
+  (``{'amount': {'N': '75000'}}``);
+* the ``wire_to_*`` decoders know each record's attributes and types and
+  build the domain object from the typed values in one pass.
+
+Keys (``LastEvaluatedKey``, ``UnprocessedKeys``) come back as Python
+values, so cursors and retries work as with the resource layer.
+"""
+import json
+from decimal import Decimal
+from typing import Any, Dict
+
+from boto3.dynamodb.conditions import ConditionBase, ConditionExpressionBuilder
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+from app.domain.models.fund import Fund
+from app.domain.models.subscription import Subscription
+from app.domain.models.transaction import Transaction, TransactionRow
+from app.domain.models.user import User
+
+
+Item = Dict[str, Dict[str, Any]]
+
+RAW_OPERATIONS = ('GetItem', 'BatchGetItem', 'Query', 'Scan')
+
+_RAW = '_dynamodb_raw_reads'
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+def raw_reads(client: Any) -> Any:
+    """Make ``client`` return read responses as their parsed JSON body.
+
+    Only for a client that is not behind a resource: the resource layer
+    expects botocore's parsed shapes. Errors are parsed as usual.
+    """
+    if getattr(client, _RAW, False):
+        return client
+    for operation in RAW_OPERATIONS:
+        client.meta.events.register(
+            f'before-parse.dynamodb.{operation}', _raw_body
+        )
+    setattr(client, _RAW, True)
+    return client
+
+
+def _raw_body(
+        response_dict: Dict[str, Any],
+        customized_response_dict: Dict[str, Any],
+        **kwargs: Any
+        ) -> None:
+    body = response_dict.get('body')
+    if response_dict['status_code'] >= 300 or not body:
+        return
+    customized_response_dict.update(json.loads(body))
+    # Leave botocore nothing to walk: the body above is the response
+    response_dict['body'] = b'{}'
+
+
+def serialize_item(item: Dict[str, Any]) -> Item:
+    return {name: _serializer.serialize(value) for name, value in item.items()}
+
+
+def deserialize_item(item: Item) -> Dict[str, Any]:
+    return {name: _deserializer.deserialize(value) for name, value in item.items()}
+
+
+class WireTable:
+    """Reads of one table through a raw client: Python in, wire items out.
+
+    ``client`` is switched to ``raw_reads``, so don't share it with a
+    resource.
+    """
+
+    def __init__(self, client: Any, table_name: str) -> None:
+        self.client = raw_reads(client)
+        self.name = table_name
+
+    def get_item(self, **kwargs: Any) -> Dict[str, Any]:
+        request = self._request(kwargs)
+        return self.client.get_item(**request)
+
+    def query(self, **kwargs: Any) -> Dict[str, Any]:
+        return self._page(self.client.query(**self._request(kwargs)))
+
+    def scan(self, **kwargs: Any) -> Dict[str, Any]:
+        return self._page(self.client.scan(**self._request(kwargs)))
+
+    def batch_get_item(
+            self,
+            RequestItems: Dict[str, Dict[str, Any]]
+            ) -> Dict[str, Any]:
+        """BatchGetItem with Python keys, as ``batch_get_items`` sends them."""
+        response = self.client.batch_get_item(RequestItems={
+            table: dict(request, Keys=[serialize_item(k) for k in request['Keys']])
+            for table, request in RequestItems.items()
+        })
+        unprocessed = response.get('UnprocessedKeys')
+        if unprocessed:
+            response['UnprocessedKeys'] = {
+                table: dict(
+                    request,
+                    Keys=[deserialize_item(k) for k in request['Keys']]
+                )
+                for table, request in unprocessed.items()
+            }
+        return response
+
+    def _request(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """The low-level request for resource-style arguments."""
+        request = dict(kwargs, TableName=self.name)
+        names = dict(request.pop('ExpressionAttributeNames', {}))
+        values = dict(request.pop('ExpressionAttributeValues', {}))
+
+        # One builder per request: placeholders must not repeat within it,
+        # and builders are not thread-safe
+        builder = ConditionExpressionBuilder()
+        for parameter, is_key_condition in (
+            ('KeyConditionExpression', True),
+            ('FilterExpression', False),
+            ('ConditionExpression', False)
+        ):
+            condition = request.get(parameter)
+            if isinstance(condition, ConditionBase):
+                expression = builder.build_expression(
+                    condition, is_key_condition=is_key_condition
+                )
+                request[parameter] = expression.condition_expression
+                names.update(expression.attribute_name_placeholders)
+                values.update(expression.attribute_value_placeholders)
+
+        if names:
+            request['ExpressionAttributeNames'] = names
+        if values:
+            request['ExpressionAttributeValues'] = serialize_item(values)
+        for key in ('Key', 'ExclusiveStartKey'):
+            if key in request:
+                request[key] = serialize_item(request[key])
+        return request
+
+    @staticmethod
+    def _page(response: Dict[str, Any]) -> Dict[str, Any]:
+        if 'LastEvaluatedKey' in response:
+            response['LastEvaluatedKey'] = deserialize_item(
+                response['LastEvaluatedKey']
+            )
+        return response
+
+
+# -- decoders ------------------------------------------------------------
+#
+# Each reads the attributes its record is written with; a missing
+# required attribute is a KeyError, as in ``item_to_row``.
+
+def _int(value: Dict[str, str]) -> int:
+    number = value['N']
+    try:
+        return int(number)
+    except ValueError:
+        # Written as a decimal: truncate, as int(Decimal) does
+        return int(Decimal(number))
+
+
+def _optional_str(item: Item, name: str) -> str | None:
+    value = item.get(name)
+    return None if value is None else value.get('S')
+
+
+def wire_to_user(item: Item) -> User:
+    return User(
+        user_id=item['user_id']['S'],
+        name=item['name']['S'],
+        email=item['email']['S'],
+        phone=_optional_str(item, 'phone'),
+        balance=_int(item['balance']),
+        notify_channel=item['notify_channel']['S']
+    )
+
+
+def wire_to_fund(item: Item) -> Fund:
+    return Fund(
+        fund_id=item['fund_id']['S'],
+        name=item['name']['S'],
+        min_amount=float(item['min_amount']['N']),
+        category=item['category']['S']
+    )
+
+
+def wire_to_subscription(item: Item) -> Subscription:
+    return Subscription(
+        user_id=item['user_id']['S'],
+        fund_id=item['fund_id']['S'],
+        amount=_int(item['amount']),
+        status=item['status']['S'],
+        created_at=_optional_str(item, 'created_at'),
+        cancelled_at=_optional_str(item, 'cancelled_at')
+    )
+
+
+def wire_to_transaction(item: Item) -> Transaction:
+    return Transaction(
+        user_id=item['user_id']['S'],
+        fund_id=item['fund_id']['S'],
+        amount=_int(item['amount']),
+        transaction_type=item['transaction_type']['S'],
+        timestamp=item['timestamp']['S'],
+        prev_balance=_int(item['prev_balance']),
+        new_balance=_int(item['new_balance'])
+    )
+
+
+def wire_to_row(item: Item) -> TransactionRow:
+    return TransactionRow(
+        item['user_id']['S'],
+        item['fund_id']['S'],
+        _int(item['amount']),
+        item['transaction_type']['S'],
+        item['timestamp']['S'],
+        _int(item['prev_balance']),
+        _int(item['new_balance'])
+    )
@@ -0,0 +1,235 @@
+import os
+from functools import lru_cache
+
+# Ports (Interfaces)
+from app.application.ports.fund_stats import FundStatsPort
+from app.application.ports.funds import FundPort
+from app.application.ports.idempotency import IdempotencyPort
+from app.application.ports.portfolio import PortfolioPort
+from app.application.ports.subscriptions import SubscriptionPort
+from app.application.ports.transactions import TransactionPort
+from app.application.ports.users import UserPort
+from app.application.ports.unit_of_work import UnitOfWorkPort
+
+# Adapters (Implementations)
+from app.infrastructure.adapters.async_adapters import (
+    AsyncFundAdapter,
+    AsyncFundStatsAdapter,
+    AsyncIdempotencyAdapter,
+    AsyncPortfolioAdapter,
+    AsyncSubscriptionAdapter,
+    AsyncTransactionAdapter,
+    AsyncUnitOfWorkAdapter,
+    AsyncUserAdapter
+)
+from app.infrastructure.adapters.cached_funds import CachedFundAdapter
+from app.infrastructure.adapters.client_adapters import (
+    ClientFundAdapter,
+    ClientSubscriptionAdapter,
+    ClientTransactionAdapter,
+    ClientUserAdapter
+)
+from app.infrastructure.adapters.cached_users import (
+    CachedUserAdapter,
+    UserCacheUnitOfWork
+)
+from app.infrastructure.adapters.fund_stats import FundStatsAdapter
+from app.infrastructure.adapters.funds import FundAdapter
+from app.infrastructure.adapters.idempotency import IdempotencyAdapter
+from app.infrastructure.adapters.identity_map import (
+    IdentityMapFundAdapter,
+    IdentityMapSubscriptionAdapter,
+    IdentityMapUnitOfWork,
+    IdentityMapUserAdapter
+)
+from app.infrastructure.adapters.offload import create_executor
+from app.infrastructure.adapters.portfolio import PortfolioAdapter
+from app.infrastructure.adapters.subscription import SubscriptionAdapter
+from app.infrastructure.adapters.transactions import TransactionAdapter
+from app.infrastructure.adapters.users import UserAdapter
+from app.infrastructure.adapters.unit_of_work import UnitOfWorkAdapter
+from app.infrastructure.dynamodb import (
+    get_dynamodb_client,
+    get_dynamodb_resource
+)
+from app.infrastructure.instrumentation import instrument
+
+# Use Cases
+from app.use_cases.funds import AsyncFundUseCase
+from app.use_cases.idempotency import AsyncIdempotencyUseCase
+from app.use_cases.portfolio import AsyncPortfolioUseCase
+from app.use_cases.subscriptions import (
+    AsyncSubscriptionUseCase,
+    SubscriptionUseCase
+)
+from app.use_cases.transactions import (
+    AsyncTransactionUseCase,
+    TransactionUseCase
+)
+
+
+class Container:
+    """
+    Application-scoped adapters and use cases.
+
+    Everything is built once and shares a single DynamoDB resource (and so
+    one client and connection pool); adapters and use cases keep no
+    per-request state, so requests can reuse them safely.
+
+    The async use cases run the same adapters on ``executor``, a bounded
+    thread pool, so blocking boto3 calls stay off the event loop.
+
+    User, subscription and fund reads go through a request-scoped identity
+    map (see ``identity_map``); it only caches inside ``request_scope()``.
+
+    With DYNAMODB_BACKEND=client, user, fund, subscription and transaction
+    reads use the low-level client and the wire codec (see
+    ``client_adapters``) instead of the resource layer.
+    """
+
+    def __init__(
+            self,
+            dynamodb_resource=None,
+            executor=None,
+            dynamodb_client=None
+            ) -> None:
+        self.dynamodb = dynamodb_resource or get_dynamodb_resource()
+        instrument(self.dynamodb.meta.client)
+        self.dynamodb_client = self._dynamodb_client(dynamodb_client)
+        self.executor = executor or create_executor()
+
+        self.fund_port: FundPort = IdentityMapFundAdapter(self._fund_port())
+        self.subscription_port: SubscriptionPort = (
+            IdentityMapSubscriptionAdapter(
+                self._adapter(SubscriptionAdapter, ClientSubscriptionAdapter)
+            )
+        )
+        self.transaction_port: TransactionPort = (
+            self._adapter(TransactionAdapter, ClientTransactionAdapter)
+        )
+        self.user_port: UserPort = (
+            IdentityMapUserAdapter(self._user_adapter())
+        )
+        # Profiles read by the routes; None when the cache is off
+        self.user_cache = self._user_cache()
+        self.user_profile_port: UserPort = IdentityMapUserAdapter(
+            self.user_cache or self._user_adapter()
+        )
+        unit_of_work: UnitOfWorkPort = UnitOfWorkAdapter(self.dynamodb)
+        if self.user_cache is not None:
+            unit_of_work = UserCacheUnitOfWork(unit_of_work, self.user_cache)
+        self.unit_of_work: UnitOfWorkPort = (
+            IdentityMapUnitOfWork(unit_of_work)
+        )
+        self.portfolio_port: PortfolioPort = PortfolioAdapter(self.dynamodb)
+        self.fund_stats_port: FundStatsPort = FundStatsAdapter(self.dynamodb)
+        self.idempotency_port: IdempotencyPort = (
+            IdempotencyAdapter(self.dynamodb)
+        )
+
+        self.subscription_use_case = SubscriptionUseCase(
+            funds_port=self.fund_port,
+            subscription_port=self.subscription_port,
+            transaction_port=self.transaction_port,
+            user_port=self.user_port,
+            unit_of_work=self.unit_of_work
+        )
+        max_since_days = int(os.getenv('TRANSACTIONS_MAX_SINCE_DAYS', '366'))
+        self.transaction_use_case = TransactionUseCase(
+            transaction_port=self.transaction_port,
+            max_since_days=max_since_days
+        )
+
+        self.async_subscription_use_case = AsyncSubscriptionUseCase(
+            funds_port=AsyncFundAdapter(self.fund_port, self.executor),
+            subscription_port=AsyncSubscriptionAdapter(
+                self.subscription_port, self.executor
+            ),
+            user_port=AsyncUserAdapter(self.user_port, self.executor),
+            unit_of_work=AsyncUnitOfWorkAdapter(
+                self.unit_of_work, self.executor
+            )
+        )
+        self.async_user_profile_port = AsyncUserAdapter(
+            self.user_profile_port, self.executor
+        )
+        self.async_transaction_use_case = AsyncTransactionUseCase(
+            transaction_port=AsyncTransactionAdapter(
+                self.transaction_port, self.executor
+            ),
+            max_since_days=max_since_days
+        )
+        self.async_portfolio_use_case = AsyncPortfolioUseCase(
+            portfolio_port=AsyncPortfolioAdapter(
+                self.portfolio_port, self.executor
+            )
+        )
+        self.async_idempotency_use_case = AsyncIdempotencyUseCase(
+            idempotency_port=AsyncIdempotencyAdapter(
+                self.idempotency_port, self.executor
+            )
+        )
+        self.async_fund_use_case = AsyncFundUseCase(
+            funds_port=AsyncFundAdapter(self.fund_port, self.executor),
+            fund_stats_port=AsyncFundStatsAdapter(
+                self.fund_stats_port, self.executor
+            )
+        )
+
+    def _dynamodb_client(self, dynamodb_client):
+        """The client for wire-format reads, or None for the resource."""
+        backend = os.getenv('DYNAMODB_BACKEND', 'resource')
+        if backend == 'resource':
+            return None
+        if backend != 'client':
+            raise ValueError(f"Unknown DYNAMODB_BACKEND: {backend}")
+        client = dynamodb_client or get_dynamodb_client()
+        instrument(client)
+        return client
+
+    def _adapter(self, resource_adapter, client_adapter):
+        """One of the record adapters, for the configured backend."""
+        if self.dynamodb_client is None:
+            return resource_adapter(self.dynamodb)
+        return client_adapter(self.dynamodb, self.dynamodb_client)
+
+    def _user_adapter(self) -> UserPort:
+        return self._adapter(UserAdapter, ClientUserAdapter)
+
+    def _fund_port(self) -> FundPort:
+        """Fund adapter behind the in-process catalog cache."""
+        funds = self._adapter(FundAdapter, ClientFundAdapter)
+        # FUND_CACHE_TTL_SECONDS=0 turns the cache off
+        ttl = float(os.getenv('FUND_CACHE_TTL_SECONDS', '300'))
+        if ttl <= 0:
+            return funds
+
+        cache = CachedFundAdapter(
+            funds,
+            ttl=ttl,
+            max_size=int(os.getenv('FUND_CACHE_MAX_SIZE', '256')),
+            negative_ttl=float(
+                os.getenv('FUND_CACHE_NEGATIVE_TTL_SECONDS', '30')
+            )
+        )
+        if os.getenv('FUND_CACHE_WARM', 'false').lower() == 'true':
+            cache.warm()
+        return cache
+
+    def _user_cache(self) -> CachedUserAdapter | None:
+        """Short-lived profile cache for the routes, unless disabled."""
+        # USER_CACHE_TTL_SECONDS=0 turns the cache off
+        ttl = float(os.getenv('USER_CACHE_TTL_SECONDS', '5'))
+        if ttl <= 0:
+            return None
+        return CachedUserAdapter(
+            self._user_adapter(),
+            ttl=ttl,
+            max_size=int(os.getenv('USER_CACHE_MAX_SIZE', '1024'))
+        )
+
+
+@lru_cache()
+def get_container() -> Container:
+    """Create the process-wide container, kept across warm invocations."""
+    return Container()
@@ -1,84 +1,119 @@
-from fastapi import Depends
-import os
-import boto3
-from functools import lru_cache
-
 # Ports (Interfaces)
+from app.application.ports.fund_stats import FundStatsPort
 from app.application.ports.funds import FundPort
+from app.application.ports.idempotency import IdempotencyPort
+from app.application.ports.portfolio import PortfolioPort
 from app.application.ports.subscriptions import SubscriptionPort
 from app.application.ports.transactions import TransactionPort
-from app.application.ports.users import UserPort
-
-# Adapters (Implementations)
-from app.infrastructure.adapters.funds import FundAdapter
-from app.infrastructure.adapters.subscription import SubscriptionAdapter
-from app.infrastructure.adapters.transactions import TransactionAdapter
-from app.infrastructure.adapters.users import UserAdapter
+from app.application.ports.users import AsyncUserPort, UserPort
+from app.application.ports.unit_of_work import UnitOfWorkPort
 
 # Use Cases
-from app.use_cases.subscriptions import SubscriptionUseCase
-from app.use_cases.transactions import TransactionUseCase
+from app.use_cases.funds import AsyncFundUseCase
+from app.use_cases.idempotency import AsyncIdempotencyUseCase
+from app.use_cases.portfolio import AsyncPortfolioUseCase
+from app.use_cases.subscriptions import (
+    AsyncSubscriptionUseCase,
+    SubscriptionUseCase
+)
+from app.use_cases.transactions import (
+    AsyncTransactionUseCase,
+    TransactionUseCase
+)
+
+
+# Adapters and use cases are built once per process by the container;
+# these factories only hand them to FastAPI (and are what tests override).
+# The container (and boto3 with it) is imported on first use, keeping it
+# out of the import of the app.
+
+
+def get_container():
+    """Return the process-wide container, importing it on first use."""
+    from app.infrastructure import container
+
+    return container.get_container()
 
 
-@lru_cache()
-def get_dynamodb_resource():
-    """Create and cache DynamoDB resource connection."""
-    # En Lambda, usar el IAM Role automático en lugar de credenciales hardcodeadas
-    return boto3.resource(
-        'dynamodb',
-        region_name=os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
-    )
+def get_fund_repository() -> FundPort:
+    """Factory for Fund repository - cached DynamoDB implementation."""
+    return get_container().fund_port
 
 
-def get_fund_repository(
-    dynamodb=Depends(get_dynamodb_resource)
-) -> FundPort:
-    """Factory for Fund repository - DynamoDB implementation."""
-    return FundAdapter(dynamodb)
+def get_fund_stats_repository() -> FundStatsPort:
+    """Factory for the fund counters - sharded DynamoDB items."""
+    return get_container().fund_stats_port
 
 
-def get_subscription_repository(
-    dynamodb=Depends(get_dynamodb_resource)
-) -> SubscriptionPort:
+def get_subscription_repository() -> SubscriptionPort:
     """Factory for Subscription repository - DynamoDB implementation."""
-    return SubscriptionAdapter(dynamodb)
+    return get_container().subscription_port
 
 
-def get_transaction_repository(
-    dynamodb=Depends(get_dynamodb_resource)
-) -> TransactionPort:
+def get_transaction_repository() -> TransactionPort:
     """Factory for Transaction repository - DynamoDB implementation."""
-    return TransactionAdapter(dynamodb)
+    return get_container().transaction_port
 
 
-def get_user_repository(
-    dynamodb=Depends(get_dynamodb_resource)
-) -> UserPort:
+def get_user_repository() -> UserPort:
     """Factory for User repository - DynamoDB implementation."""
-    return UserAdapter(dynamodb)
+    return get_container().user_port
+
+
+def get_async_user_profiles() -> AsyncUserPort:
+    """Factory for the user profiles read by the routes - cached briefly."""
+    return get_container().async_user_profile_port
+
+
+def get_portfolio_repository() -> PortfolioPort:
+    """Factory for Portfolio repository - DynamoDB summary item."""
+    return get_container().portfolio_port
+
+
+def get_idempotency_repository() -> IdempotencyPort:
+    """Factory for the idempotency records - DynamoDB conditional puts."""
+    return get_container().idempotency_port
+
+
+def get_unit_of_work() -> UnitOfWorkPort:
+    """Factory for the unit of work - DynamoDB TransactWriteItems."""
+    return get_container().unit_of_work
 
 # ============================================
 # USE CASE FACTORIES
 # ============================================
 
 
-def get_subscription_use_case(
-    fund_port: FundPort = Depends(get_fund_repository),
-    subscription_port: SubscriptionPort = Depends(get_subscription_repository),
-    transaction_port: TransactionPort = Depends(get_transaction_repository),
-    user_port: UserPort = Depends(get_user_repository)
-) -> SubscriptionUseCase:
+def get_subscription_use_case() -> SubscriptionUseCase:
     """Factory for Subscription use case with all dependencies injected."""
-    return SubscriptionUseCase(
-        funds_port=fund_port,
-        subscription_port=subscription_port,
-        transaction_port=transaction_port,
-        user_port=user_port
-    )
+    return get_container().subscription_use_case
 
 
-def get_transaction_use_case(
-    transaction_port: TransactionPort = Depends(get_transaction_repository)
-) -> TransactionUseCase:
+def get_transaction_use_case() -> TransactionUseCase:
     """Factory for Transaction use case with all dependencies injected."""
-    return TransactionUseCase(transaction_port=transaction_port)
+    return get_container().transaction_use_case
+
+
+def get_async_subscription_use_case() -> AsyncSubscriptionUseCase:
+    """Factory for the async Subscription use case (thread-pool offload)."""
+    return get_container().async_subscription_use_case
+
+
+def get_async_transaction_use_case() -> AsyncTransactionUseCase:
+    """Factory for the async Transaction use case (thread-pool offload)."""
+    return get_container().async_transaction_use_case
+
+
+def get_async_portfolio_use_case() -> AsyncPortfolioUseCase:
+    """Factory for the async Portfolio use case (thread-pool offload)."""
+    return get_container().async_portfolio_use_case
+
+
+def get_async_fund_use_case() -> AsyncFundUseCase:
+    """Factory for the async Fund use case (thread-pool offload)."""
+    return get_container().async_fund_use_case
+
+
+def get_async_idempotency_use_case() -> AsyncIdempotencyUseCase:
+    """Factory for the async Idempotency use case (thread-pool offload)."""
+    return get_container().async_idempotency_use_case
@@ -0,0 +1,48 @@
+import os
+from functools import lru_cache
+
+import boto3
+from botocore.config import Config
+
+from app.infrastructure.adapters.wire import raw_reads
+from app.infrastructure.instrumentation import instrument
+
+
+def dynamodb_config() -> Config:
+    """Botocore client settings for DynamoDB, tunable through env vars."""
+    return Config(
+        region_name=os.getenv('AWS_DEFAULT_REGION', 'us-east-1'),
+        # One pool shared by every adapter, sized for concurrent requests
+        max_pool_connections=int(
+            os.getenv('DYNAMODB_MAX_POOL_CONNECTIONS', '50')
+        ),
+        # Keep idle connections open between warm invocations
+        tcp_keepalive=True,
+        connect_timeout=float(os.getenv('DYNAMODB_CONNECT_TIMEOUT', '1')),
+        read_timeout=float(os.getenv('DYNAMODB_READ_TIMEOUT', '5')),
+        retries={
+            'mode': 'adaptive',
+            'max_attempts': int(os.getenv('DYNAMODB_MAX_ATTEMPTS', '3'))
+        }
+    )
+
+
+@lru_cache()
+def get_dynamodb_resource():
+    """Create and cache the process-wide DynamoDB resource."""
+    # En Lambda, usar el IAM Role automático en lugar de credenciales hardcodeadas
+    resource = boto3.resource('dynamodb', config=dynamodb_config())
+    instrument(resource.meta.client)
+    return resource
+
+
+@lru_cache()
+def get_dynamodb_client():
+    """Create and cache the low-level client for wire-format reads.
+
+    Separate from the resource's client: ``raw_reads`` changes what its
+    read calls return, which the resource layer could not parse.
+    """
+    client = boto3.client('dynamodb', config=dynamodb_config())
+    instrument(client)
+    return raw_reads(client)
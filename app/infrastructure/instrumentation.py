@@ -0,0 +1,223 @@
+"""
+DynamoDB cost and latency per request.
+
+``instrument`` hooks botocore events on the shared client. While a
+collector is active in the current context, every call asks for
+``ReturnConsumedCapacity=TOTAL`` and records its wall time, capacity units
+and returned items; outside a request the hooks do nothing.
+``collect`` opens a collector for one request; the thread pools that run
+boto3 calls copy the caller's context, so their calls land in it too.
+
+Only the standard library is imported here, so the web layer can use it
+without loading boto3 at cold start.
+"""
+import json
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List
+
+
+READ_OPERATIONS = frozenset({
+    'GetItem', 'BatchGetItem', 'Query', 'Scan', 'TransactGetItems'
+})
+WRITE_OPERATIONS = frozenset({
+    'PutItem', 'UpdateItem', 'DeleteItem', 'BatchWriteItem',
+    'TransactWriteItems'
+})
+
+_STARTED = 'instrumentation_started'
+_INDEX = 'instrumentation_index'
+_INSTRUMENTED = '_dynamodb_instrumented'
+
+_current: ContextVar['RequestMetrics | None'] = ContextVar(
+    'dynamodb_request_metrics', default=None
+)
+
+
+@dataclass
+class OperationMetrics:
+    calls: int = 0
+    read_units: float = 0.0
+    write_units: float = 0.0
+    items: int = 0
+    elapsed_ms: float = 0.0
+
+
+class RequestMetrics:
+    """DynamoDB calls made while serving one request, by operation."""
+
+    def __init__(self) -> None:
+        self.operations: Dict[str, OperationMetrics] = defaultdict(
+            OperationMetrics
+        )
+        self._lock = threading.Lock()
+
+    def record(
+            self,
+            operation: str,
+            elapsed_ms: float,
+            read_units: float = 0.0,
+            write_units: float = 0.0,
+            items: int = 0
+    ) -> None:
+        # Calls from parallel scans and batch reads arrive on worker threads
+        with self._lock:
+            metrics = self.operations[operation]
+            metrics.calls += 1
+            metrics.read_units += read_units
+            metrics.write_units += write_units
+            metrics.items += items
+            metrics.elapsed_ms += elapsed_ms
+
+    def total(self) -> OperationMetrics:
+        total = OperationMetrics()
+        with self._lock:
+            for metrics in self.operations.values():
+                total.calls += metrics.calls
+                total.read_units += metrics.read_units
+                total.write_units += metrics.write_units
+                total.items += metrics.items
+                total.elapsed_ms += metrics.elapsed_ms
+        return total
+
+    def server_timing(self) -> str:
+        """``Server-Timing`` header value: the total, then each operation."""
+        total = self.total()
+        entries = [_timing_entry('ddb', total)]
+        with self._lock:
+            for operation, metrics in sorted(self.operations.items()):
+                name = 'ddb-' + operation.replace(':', '.')
+                entries.append(_timing_entry(name, metrics))
+        return ', '.join(entries)
+
+    def emf(
+            self,
+            namespace: str,
+            route: str,
+            status_code: int,
+            elapsed_ms: float
+    ) -> Dict[str, Any]:
+        """CloudWatch Embedded Metric Format document for the request."""
+        total = self.total()
+        with self._lock:
+            operations = {
+                operation: vars(metrics).copy()
+                for operation, metrics in self.operations.items()
+            }
+        return {
+            '_aws': {
+                'Timestamp': int(time.time() * 1000),
+                'CloudWatchMetrics': [{
+                    'Namespace': namespace,
+                    'Dimensions': [['Route']],
+                    'Metrics': [
+                        {'Name': 'DynamoDBCalls', 'Unit': 'Count'},
+                        {'Name': 'DynamoDBReadUnits', 'Unit': 'Count'},
+                        {'Name': 'DynamoDBWriteUnits', 'Unit': 'Count'},
+                        {'Name': 'DynamoDBTime', 'Unit': 'Milliseconds'},
+                        {'Name': 'RequestTime', 'Unit': 'Milliseconds'},
+                    ]
+                }]
+            },
+            'Route': route,
+            'StatusCode': status_code,
+            'DynamoDBCalls': total.calls,
+            'DynamoDBReadUnits': total.read_units,
+            'DynamoDBWriteUnits': total.write_units,
+            'DynamoDBTime': round(total.elapsed_ms, 3),
+            'RequestTime': round(elapsed_ms, 3),
+            'DynamoDBOperations': operations,
+        }
+
+    def emf_json(self, *args: Any, **kwargs: Any) -> str:
+        return json.dumps(self.emf(*args, **kwargs), separators=(',', ':'))
+
+
+def _timing_entry(name: str, metrics: OperationMetrics) -> str:
+    description = (
+        f"{metrics.calls} calls, {metrics.read_units:g} RCU, "
+        f"{metrics.write_units:g} WCU, {metrics.items} items"
+    )
+    return f'{name};dur={metrics.elapsed_ms:.1f};desc="{description}"'
+
+
+def current() -> RequestMetrics | None:
+    """The collector of the current request, if any."""
+    return _current.get()
+
+
+@contextmanager
+def collect() -> Iterator[RequestMetrics]:
+    """Record the DynamoDB calls made inside the block."""
+    metrics = RequestMetrics()
+    token = _current.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _current.reset(token)
+
+
+def instrument(client: Any) -> Any:
+    """Register the metric hooks on a DynamoDB client, once."""
+    if getattr(client, _INSTRUMENTED, False):
+        return client
+    events = client.meta.events
+    events.register('before-parameter-build.dynamodb', _before_call)
+    events.register('after-call.dynamodb', _after_call)
+    setattr(client, _INSTRUMENTED, True)
+    return client
+
+
+def _before_call(params: Dict[str, Any], model: Any, context: Dict[str, Any],
+                 **kwargs: Any) -> None:
+    if _current.get() is None:
+        return
+    if 'ReturnConsumedCapacity' in model.input_shape.members:
+        params.setdefault('ReturnConsumedCapacity', 'TOTAL')
+    context[_INDEX] = params.get('IndexName')
+    context[_STARTED] = time.perf_counter()
+
+
+def _after_call(parsed: Dict[str, Any], model: Any, context: Dict[str, Any],
+                **kwargs: Any) -> None:
+    metrics = _current.get()
+    started = context.get(_STARTED)
+    if metrics is None or started is None:
+        return
+
+    operation = model.name
+    units = _capacity_units(parsed.get('ConsumedCapacity'))
+    index_name = context.get(_INDEX)
+    metrics.record(
+        f'{operation}:{index_name}' if index_name else operation,
+        (time.perf_counter() - started) * 1000,
+        read_units=units if operation in READ_OPERATIONS else 0.0,
+        write_units=units if operation in WRITE_OPERATIONS else 0.0,
+        items=_returned_items(parsed)
+    )
+
+
+def _capacity_units(consumed: Any) -> float:
+    if not consumed:
+        return 0.0
+    entries: List[Dict[str, Any]] = (
+        consumed if isinstance(consumed, list) else [consumed]
+    )
+    return float(sum(entry.get('CapacityUnits', 0) for entry in entries))
+
+
+def _returned_items(parsed: Dict[str, Any]) -> int:
+    if 'Count' in parsed:
+        return parsed['Count']
+    if 'Item' in parsed:
+        return 1
+    if 'Responses' in parsed:
+        responses = parsed['Responses']
+        if isinstance(responses, dict):
+            return sum(len(items) for items in responses.values())
+        return len(responses)
+    return 0
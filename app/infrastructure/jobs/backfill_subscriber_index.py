@@ -0,0 +1,90 @@
+"""
+Set ``fund_status`` on subscriptions, so fund_status-index lists them.
+
+Subscriptions written before the index have no ``fund_status`` and are
+invisible to ``SubscriptionAdapter.list_by_fund``. The value also holds
+the shard, so run this again after changing SUBSCRIBER_INDEX_SHARDS: it
+rewrites every subscription whose value doesn't match the setting.
+
+    SUBSCRIBER_INDEX_SHARDS=1 \\
+        python -m app.infrastructure.jobs.backfill_subscriber_index --segments 8
+"""
+import argparse
+import os
+
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
+
+from app.infrastructure.adapters.parallel_scan import parallel_scan
+from app.infrastructure.adapters.subscription import (
+    subscriber_key,
+    subscriber_shards
+)
+from app.infrastructure.dynamodb import get_dynamodb_resource
+
+
+def backfill_subscriber_index(
+    dynamodb_resource,
+    table_name: str,
+    total_segments: int = 4,
+    shards: int | None = None,
+    dry_run: bool = False
+) -> int:
+    """Fix fund_status on every SUB# item; return how many needed it."""
+    shards = shards or subscriber_shards()
+    table = dynamodb_resource.Table(table_name)
+    items = parallel_scan(
+        dynamodb_resource.meta.client,
+        {
+            'TableName': table_name,
+            'FilterExpression': Attr('SK').begins_with('SUB#'),
+            'ProjectionExpression': (
+                'PK, SK, user_id, fund_id, #status, fund_status'
+            ),
+            'ExpressionAttributeNames': {'#status': 'status'}
+        },
+        total_segments
+    )
+
+    updated = 0
+    for item in items:
+        expected = subscriber_key(
+            item['fund_id'], item['status'], item['user_id'], shards
+        )
+        if item.get('fund_status') == expected:
+            continue
+        updated += 1
+        if dry_run:
+            continue
+        try:
+            table.update_item(
+                Key={'PK': item['PK'], 'SK': item['SK']},
+                UpdateExpression='SET fund_status = :fund_status',
+                # A subscribe or cancel since the scan wrote its own value
+                ConditionExpression=Attr('status').eq(item['status']),
+                ExpressionAttributeValues={':fund_status': expected}
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+    return updated
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--segments', type=int, default=4)
+    parser.add_argument('--dry-run', action='store_true')
+    args = parser.parse_args()
+
+    count = backfill_subscriber_index(
+        get_dynamodb_resource(),
+        os.getenv('APPCHALLENGE_TABLE_NAME', 'AppChallenge'),
+        total_segments=args.segments,
+        dry_run=args.dry_run
+    )
+    action = 'would be updated' if args.dry_run else 'updated'
+    print(f"{count} subscriptions {action}")
+
+
+if __name__ == '__main__':
+    main()
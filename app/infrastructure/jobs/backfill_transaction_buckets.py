@@ -0,0 +1,82 @@
+"""
+Backfill ``tx_bucket`` on transactions written before tx_time-index existed.
+
+Items without the attribute are invisible to the time index, so date-range
+reads (``TransactionAdapter.get_all(since=...)``) would skip them.
+
+    python -m app.infrastructure.jobs.backfill_transaction_buckets --segments 8
+"""
+import argparse
+import os
+
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
+
+from app.infrastructure.adapters.parallel_scan import parallel_scan
+from app.infrastructure.adapters.transactions import time_bucket
+from app.infrastructure.dynamodb import get_dynamodb_resource
+
+
+def backfill_transaction_buckets(
+    dynamodb_resource,
+    table_name: str,
+    total_segments: int = 4,
+    dry_run: bool = False
+) -> int:
+    """Set tx_bucket on every TX# item missing it; return how many needed it."""
+    table = dynamodb_resource.Table(table_name)
+    items = parallel_scan(
+        dynamodb_resource.meta.client,
+        {
+            'TableName': table_name,
+            'FilterExpression': (
+                Attr('SK').begins_with('TX#') &
+                Attr('tx_bucket').not_exists()
+            ),
+            'ProjectionExpression': 'PK, SK, #timestamp',
+            'ExpressionAttributeNames': {'#timestamp': 'timestamp'}
+        },
+        total_segments
+    )
+
+    updated = 0
+    for item in items:
+        if not item.get('timestamp'):
+            continue
+        updated += 1
+        if dry_run:
+            continue
+        try:
+            table.update_item(
+                Key={'PK': item['PK'], 'SK': item['SK']},
+                UpdateExpression='SET tx_bucket = :bucket',
+                ConditionExpression=Attr('PK').exists(),
+                ExpressionAttributeValues={
+                    ':bucket': time_bucket(item['timestamp'])
+                }
+            )
+        except ClientError as e:
+            # Deleted since it was scanned: nothing left to index.
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+    return updated
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--segments', type=int, default=4)
+    parser.add_argument('--dry-run', action='store_true')
+    args = parser.parse_args()
+
+    count = backfill_transaction_buckets(
+        get_dynamodb_resource(),
+        os.getenv('APPCHALLENGE_TABLE_NAME', 'AppChallenge'),
+        total_segments=args.segments,
+        dry_run=args.dry_run
+    )
+    action = 'would be updated' if args.dry_run else 'updated'
+    print(f"{count} transactions {action}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+"""
+Check the sharded fund counters against the subscriptions they summarize.
+
+Recomputes each fund's AUM and active subscribers from the active ``SUB#``
+items and compares them with the sum of its ``STATS`` shards. With
+``--repair`` the difference is added to shard 0: an ``ADD`` commutes with
+the writes that keep running, so none of them is lost.
+
+A scan is not a snapshot: a subscription written while it runs can be
+seen without its counter update, or the other way round. Before repairing,
+the drifted funds are scanned again and only a difference seen by both
+scans is written; transient drift is left alone.
+
+    python -m app.infrastructure.jobs.check_fund_stats --segments 8
+    python -m app.infrastructure.jobs.check_fund_stats --repair
+"""
+import argparse
+import os
+from collections import defaultdict
+from typing import Any, Dict, List, Set, Tuple
+
+from boto3.dynamodb.conditions import Attr
+
+from app.domain.models.fund_stats import FundStats
+from app.domain.models.subscription import Status
+from app.infrastructure.adapters.fund_stats import (
+    STATS_SK,
+    stats_key,
+    sum_shards
+)
+from app.infrastructure.adapters.parallel_scan import parallel_scan
+from app.infrastructure.dynamodb import get_dynamodb_resource
+
+
+def check_fund_stats(
+    dynamodb_resource,
+    table_name: str,
+    total_segments: int = 4,
+    repair: bool = False
+) -> Dict[str, Tuple[FundStats, FundStats]]:
+    """Return ``{fund_id: (expected, stored)}`` for every drifted fund.
+
+    With ``repair`` only the drift confirmed by a second scan is returned,
+    and that is what gets written.
+    """
+    drift = _scan_drift(dynamodb_resource, table_name, total_segments)
+    if not repair or not drift:
+        return drift
+
+    again = _scan_drift(
+        dynamodb_resource, table_name, total_segments, set(drift)
+    )
+    drift = {
+        fund_id: again[fund_id] for fund_id in drift
+        if fund_id in again
+        and _delta(*again[fund_id]) == _delta(*drift[fund_id])
+    }
+
+    table = dynamodb_resource.Table(table_name)
+    for fund_id, (wanted, stored) in drift.items():
+        aum, subscribers = _delta(wanted, stored)
+        table.update_item(
+            Key=stats_key(fund_id, 0),
+            UpdateExpression=(
+                'SET fund_id = :fund_id '
+                'ADD aum :aum, active_subscribers :subscribers'
+            ),
+            ExpressionAttributeValues={
+                ':fund_id': fund_id,
+                ':aum': aum,
+                ':subscribers': subscribers
+            }
+        )
+    return drift
+
+
+def _scan_drift(
+    dynamodb_resource,
+    table_name: str,
+    total_segments: int,
+    fund_ids: Set[str] | None = None
+) -> Dict[str, Tuple[FundStats, FundStats]]:
+    """Scan the table once and compare the counters of ``fund_ids`` (all)."""
+    items = parallel_scan(
+        dynamodb_resource.meta.client,
+        {
+            'TableName': table_name,
+            'FilterExpression': (
+                (Attr('SK').begins_with('SUB#') &
+                 Attr('status').eq(Status.ACTIVE.value)) |
+                Attr('SK').eq(STATS_SK)
+            )
+        },
+        total_segments
+    )
+
+    expected: Dict[str, FundStats] = {}
+    shards: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for item in items:
+        if fund_ids is not None and item['fund_id'] not in fund_ids:
+            continue
+        if item['SK'] == STATS_SK:
+            shards[item['fund_id']].append(item)
+            continue
+        stats = expected.setdefault(
+            item['fund_id'], FundStats(fund_id=item['fund_id'])
+        )
+        stats.aum += int(item['amount'])
+        stats.active_subscribers += 1
+
+    drift = {}
+    for fund_id in expected.keys() | shards.keys():
+        wanted = expected.get(fund_id, FundStats(fund_id=fund_id))
+        stored = sum_shards(fund_id, shards.get(fund_id, []))
+        if wanted != stored:
+            drift[fund_id] = (wanted, stored)
+    return drift
+
+
+def _delta(wanted: FundStats, stored: FundStats) -> Tuple[int, int]:
+    """What shard 0 must add for the counters to match."""
+    return (
+        wanted.aum - stored.aum,
+        wanted.active_subscribers - stored.active_subscribers
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--segments', type=int, default=4)
+    parser.add_argument('--repair', action='store_true')
+    args = parser.parse_args()
+
+    drift = check_fund_stats(
+        get_dynamodb_resource(),
+        os.getenv('APPCHALLENGE_TABLE_NAME', 'AppChallenge'),
+        total_segments=args.segments,
+        repair=args.repair
+    )
+    for fund_id, (wanted, stored) in sorted(drift.items()):
+        print(f"{fund_id}: aum {stored.aum} -> {wanted.aum}, "
+              f"subscribers {stored.active_subscribers} -> "
+              f"{wanted.active_subscribers}")
+    action = 'repaired' if args.repair else 'drifted'
+    print(f"{len(drift)} funds {action}")
+
+
+if __name__ == '__main__':
+    main()
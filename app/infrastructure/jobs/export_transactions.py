@@ -0,0 +1,59 @@
+"""
+Dump the whole transaction history as NDJSON, for audits.
+
+Reads the table with a parallel segmented scan, so transactions come out
+in no particular order; ``--ordered`` reads tx_time-index one day after
+another instead and needs ``--since``. ``GET /transactions/export`` pages
+through the history in order; this job is for full dumps, where the
+segments read concurrently are what keeps a large table fast.
+
+    python -m app.infrastructure.jobs.export_transactions --segments 8
+"""
+import argparse
+import sys
+from datetime import datetime
+from typing import TextIO
+
+from app.infrastructure.adapters.transactions import TransactionAdapter
+from app.use_cases.transactions import TransactionUseCase
+
+
+def export_transactions(
+    use_case: TransactionUseCase,
+    out: TextIO,
+    total_segments: int = 8,
+    since: datetime | None = None,
+    ordered: bool = False
+) -> int:
+    """Write one JSON document per transaction to ``out``; return how many."""
+    exported = 0
+    for transaction in use_case.export_all_transactions(
+        total_segments=total_segments,
+        since=since,
+        ordered=ordered
+    ):
+        out.write(transaction.model_dump_json())
+        out.write('\n')
+        exported += 1
+    return exported
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--segments', type=int, default=8)
+    parser.add_argument('--since', type=datetime.fromisoformat)
+    parser.add_argument('--ordered', action='store_true')
+    args = parser.parse_args()
+
+    count = export_transactions(
+        TransactionUseCase(TransactionAdapter()),
+        sys.stdout,
+        total_segments=args.segments,
+        since=args.since,
+        ordered=args.ordered
+    )
+    print(f"{count} transactions exported", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+"""
+Recompute the ``USER#<id> / PORTFOLIO`` summaries from the ``SUB#`` items.
+
+Subscribe and cancel keep the summary up to date in the same transaction;
+this job creates it for subscriptions written before it existed and
+repairs any drift. Summaries that already match are left untouched.
+
+    python -m app.infrastructure.jobs.rebuild_portfolios --segments 8
+    python -m app.infrastructure.jobs.rebuild_portfolios --user u001
+"""
+import argparse
+import os
+from collections import defaultdict
+from typing import Any, Dict, List
+
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
+
+from app.application.ports.errors import OptimisticLockError
+from app.domain.models.clock import utc_now
+from app.domain.models.portfolio import Portfolio
+from app.domain.models.subscription import Subscription
+from app.infrastructure.adapters.pagination import iterate_items
+from app.infrastructure.adapters.parallel_scan import parallel_scan
+from app.infrastructure.adapters.portfolio import (
+    PORTFOLIO_SK,
+    item_to_portfolio,
+    portfolio_from_subscriptions,
+    portfolio_key,
+    portfolio_to_item
+)
+from app.infrastructure.adapters.subscription import item_to_subscription
+from app.infrastructure.dynamodb import get_dynamodb_resource
+
+
+def _stale(portfolio: Portfolio, current: Dict[str, Any] | None) -> bool:
+    if current is None:
+        return bool(portfolio.amounts)
+    stored = item_to_portfolio(portfolio.user_id, current)
+    return (stored.amounts != portfolio.amounts or
+            stored.total_invested != portfolio.total_invested)
+
+
+def _replace(table, portfolio: Portfolio, current: Dict[str, Any] | None) -> bool:
+    """Write ``portfolio`` unless the summary changed since ``current``."""
+    if current is None:
+        version, condition = 1, Attr('PK').not_exists()
+    else:
+        version = int(current.get('version', 0)) + 1
+        condition = Attr('version').eq(current.get('version', 0))
+    try:
+        table.put_item(
+            Item=portfolio_to_item(portfolio, version),
+            ConditionExpression=condition
+        )
+        return True
+    except ClientError as e:
+        # A subscribe or cancel got there first: recompute from scratch.
+        if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+            raise
+        return False
+
+
+def rebuild_portfolio(
+    dynamodb_resource,
+    table_name: str,
+    user_id: str,
+    max_attempts: int = 3
+) -> Portfolio:
+    """Recompute one user's summary with consistent reads."""
+    table = dynamodb_resource.Table(table_name)
+    for _ in range(max_attempts):
+        current = table.get_item(
+            Key=portfolio_key(user_id), ConsistentRead=True
+        ).get('Item')
+        subscriptions: List[Subscription] = [
+            item_to_subscription(item)
+            for item in iterate_items(table.query, {
+                'KeyConditionExpression': (
+                    Key('PK').eq(f'USER#{user_id}') &
+                    Key('SK').begins_with('SUB#')
+                ),
+                'ConsistentRead': True
+            })
+        ]
+        portfolio = portfolio_from_subscriptions(
+            user_id, subscriptions, utc_now().isoformat()
+        )
+        if not _stale(portfolio, current) or _replace(table, portfolio, current):
+            return portfolio
+
+    raise OptimisticLockError(
+        f"Portfolio of user {user_id} kept changing while rebuilding it"
+    )
+
+
+def rebuild_portfolios(
+    dynamodb_resource,
+    table_name: str,
+    total_segments: int = 4,
+    dry_run: bool = False
+) -> int:
+    """Rebuild every stale summary; return how many needed it."""
+    table = dynamodb_resource.Table(table_name)
+    items = parallel_scan(
+        dynamodb_resource.meta.client,
+        {
+            'TableName': table_name,
+            'FilterExpression': (
+                Attr('SK').begins_with('SUB#') | Attr('SK').eq(PORTFOLIO_SK)
+            )
+        },
+        total_segments
+    )
+
+    subscriptions: Dict[str, List[Subscription]] = defaultdict(list)
+    summaries: Dict[str, Dict[str, Any]] = {}
+    for item in items:
+        user_id = item['PK'][len('USER#'):]
+        if item['SK'] == PORTFOLIO_SK:
+            summaries[user_id] = item
+        else:
+            subscriptions[user_id].append(item_to_subscription(item))
+
+    rebuilt = 0
+    now = utc_now().isoformat()
+    for user_id in subscriptions.keys() | summaries.keys():
+        current = summaries.get(user_id)
+        portfolio = portfolio_from_subscriptions(
+            user_id, subscriptions.get(user_id, []), now
+        )
+        if not _stale(portfolio, current):
+            continue
+        rebuilt += 1
+        if dry_run:
+            continue
+        if not _replace(table, portfolio, current):
+            # The scan saw an older summary: retry this user alone
+            rebuild_portfolio(dynamodb_resource, table_name, user_id)
+    return rebuilt
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--segments', type=int, default=4)
+    parser.add_argument('--user', help='rebuild a single user')
+    parser.add_argument('--dry-run', action='store_true')
+    args = parser.parse_args()
+
+    table_name = os.getenv('APPCHALLENGE_TABLE_NAME', 'AppChallenge')
+    if args.user:
+        portfolio = rebuild_portfolio(
+            get_dynamodb_resource(), table_name, args.user
+        )
+        print(portfolio.model_dump_json())
+        return
+
+    count = rebuild_portfolios(
+        get_dynamodb_resource(),
+        table_name,
+        total_segments=args.segments,
+        dry_run=args.dry_run
+    )
+    action = 'would be rebuilt' if args.dry_run else 'rebuilt'
+    print(f"{count} portfolios {action}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Move transactions written before ULID keys to ``TX#<ULID>`` sort keys.
+
+Older items are keyed ``TX#<timestamp>``. They sort after every ULID key, so
+``from``/``to`` reads (``TransactionAdapter.get_by_user`` with a time range)
+would skip them, and two of them in the same second were one item. Each
+one is copied under a ULID of its timestamp and the old key deleted, both
+in one transaction, so a rerun only moves what is left.
+
+    python -m app.infrastructure.jobs.rekey_transactions --segments 8
+"""
+import argparse
+import os
+from datetime import datetime
+
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
+
+from app.infrastructure.adapters.ids import epoch_ms, is_ulid, new_ulid
+from app.infrastructure.adapters.parallel_scan import parallel_scan
+from app.infrastructure.dynamodb import get_dynamodb_resource
+
+
+def rekey_transactions(
+    dynamodb_resource,
+    table_name: str,
+    total_segments: int = 4,
+    dry_run: bool = False
+) -> int:
+    """Rekey every TX# item without a ULID; return how many needed it."""
+    client = dynamodb_resource.meta.client
+    items = parallel_scan(
+        client,
+        {
+            'TableName': table_name,
+            'FilterExpression': Attr('SK').begins_with('TX#')
+        },
+        total_segments
+    )
+
+    moved = 0
+    for item in items:
+        if is_ulid(item['SK'][3:]) or not item.get('timestamp'):
+            continue
+        moved += 1
+        if dry_run:
+            continue
+        transaction_id = new_ulid(
+            epoch_ms(datetime.fromisoformat(item['timestamp']))
+        )
+        try:
+            client.transact_write_items(TransactItems=[
+                {'Put': {
+                    'TableName': table_name,
+                    'Item': {**item, 'SK': f'TX#{transaction_id}',
+                             'transaction_id': transaction_id},
+                    'ConditionExpression': 'attribute_not_exists(PK)'
+                }},
+                {'Delete': {
+                    'TableName': table_name,
+                    'Key': {'PK': item['PK'], 'SK': item['SK']},
+                    'ConditionExpression': 'attribute_exists(PK)'
+                }}
+            ])
+        except ClientError as e:
+            # Moved or deleted since it was scanned: nothing left to do.
+            if e.response['Error']['Code'] != 'TransactionCanceledException':
+                raise
+    return moved
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--segments', type=int, default=4)
+    parser.add_argument('--dry-run', action='store_true')
+    args = parser.parse_args()
+
+    count = rekey_transactions(
+        get_dynamodb_resource(),
+        os.getenv('APPCHALLENGE_TABLE_NAME', 'AppChallenge'),
+        total_segments=args.segments,
+        dry_run=args.dry_run
+    )
+    action = 'would be rekeyed' if args.dry_run else 'rekeyed'
+    print(f"{count} transactions {action}")
+
+
+if __name__ == '__main__':
+    main()
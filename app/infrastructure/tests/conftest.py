@@ -0,0 +1,26 @@
+"""
+Configuración común para tests de adapters contra la tabla en memoria.
+"""
+import pytest
+
+from app.infrastructure.tests.memory_dynamodb import MemoryDynamoDB
+
+
+@pytest.fixture
+def memory_dynamodb():
+    """Endpoint DynamoDB en memoria con la tabla AppChallenge creada."""
+    dynamodb = MemoryDynamoDB()
+    dynamodb.create_table('AppChallenge')
+    return dynamodb
+
+
+@pytest.fixture
+def table(memory_dynamodb):
+    """Tabla AppChallenge en memoria para sembrar y verificar datos."""
+    return memory_dynamodb.tables['AppChallenge']
+
+
+@pytest.fixture
+def dynamodb_resource(memory_dynamodb):
+    """Recurso boto3 cuyas llamadas se resuelven contra la tabla en memoria."""
+    return memory_dynamodb.resource()
@@ -0,0 +1,985 @@
+"""
+In-memory stand-in for the AppChallenge DynamoDB table.
+
+``MemoryDynamoDB`` plugs into a real boto3 client through botocore's
+``before-send`` event: the adapters keep running the same request
+serialization, condition builders, type (de)serialization and error
+parsing they use against AWS, but every call is answered in-process.
+
+Query and Scan follow the service rules the adapters depend on:
+``Limit`` counts evaluated items (before any filter), pages are cut at
+1 MB, ``LastEvaluatedKey`` drives pagination and read units are charged
+for every evaluated item, not only for the returned ones.
+"""
+import io
+import json
+import math
+import threading
+import time
+import zlib
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from decimal import Decimal
+from typing import Any, Iterator
+
+import boto3
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore import UNSIGNED
+from botocore.awsrequest import AWSResponse
+from botocore.config import Config
+
+from app.infrastructure.tests.memory_expressions import (
+    ExpressionError,
+    apply_update,
+    evaluate,
+    parse_condition,
+    parse_projection,
+    parse_update,
+    project,
+)
+
+
+PAGE_SIZE_LIMIT = 1024 * 1024
+READ_UNIT_SIZE = 4096
+WRITE_UNIT_SIZE = 1024
+
+# Global secondary indexes declared for AppChallenge in template.yaml.
+APP_CHALLENGE_INDEXES = {
+    'tx_time-index': ('tx_bucket', 'timestamp'),
+    'category-index': ('category', 'min_amount'),
+    'fund_status-index': ('fund_status', 'user_id'),
+    'fund_id-index': ('fund_id', 'timestamp'),
+}
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+class DynamoDBError(Exception):
+    """Service error returned to the boto3 client as an HTTP 400."""
+
+    def __init__(self, code: str, message: str, **extra: Any) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.extra = extra
+
+
+class _RawResponse(io.BytesIO):
+    def stream(self, **kwargs: Any) -> Iterator[bytes]:
+        yield self.getvalue()
+
+
+def item_size(item: dict) -> int:
+    """Approximate DynamoDB item size in bytes."""
+    return sum(len(name.encode()) + _value_size(v) for name, v in item.items())
+
+
+def _value_size(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value.encode())
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if value is None or isinstance(value, bool):
+        return 1
+    if isinstance(value, (int, Decimal)):
+        return len(str(value).lstrip('-').replace('.', '')) // 2 + 1
+    if isinstance(value, dict):
+        return 3 + sum(
+            len(k.encode()) + _value_size(v) for k, v in value.items()
+        )
+    return 3 + sum(_value_size(v) for v in value)
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, int):
+        return Decimal(value)
+    if isinstance(value, float):
+        return Decimal(str(value))
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_normalize(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return {_normalize(v) for v in value}
+    return value
+
+
+def _serialize(item: dict) -> dict:
+    return {name: _serializer.serialize(v) for name, v in item.items()}
+
+
+def _deserialize(item: dict) -> dict:
+    return {name: _deserializer.deserialize(v) for name, v in item.items()}
+
+
+def _scan_position(hash_value: Any) -> tuple:
+    return (zlib.crc32(str(hash_value).encode()), hash_value)
+
+
+class _Partition:
+    """Items sharing a hash key, kept addressable in sort-key order."""
+
+    __slots__ = ('items', '_keys')
+
+    def __init__(self) -> None:
+        self.items: dict[tuple, dict] = {}
+        self._keys: list[tuple] | None = None
+
+    def put(self, key: tuple, item: dict) -> None:
+        if key not in self.items and self._keys is not None:
+            insort(self._keys, key)
+        self.items[key] = item
+
+    def remove(self, key: tuple) -> None:
+        if self.items.pop(key, None) is not None and self._keys is not None:
+            del self._keys[bisect_left(self._keys, key)]
+
+    def keys(self) -> list[tuple]:
+        if self._keys is None:
+            self._keys = sorted(self.items)
+        return self._keys
+
+
+class _Source:
+    """A key space that Query and Scan can walk: the table or a GSI."""
+
+    def __init__(self, hash_key: str, range_key: str) -> None:
+        self.hash_key = hash_key
+        self.range_key = range_key
+        self.partitions: dict[Any, _Partition] = {}
+        self._order: list[tuple] | None = None
+
+    def sort_key(self, item: dict) -> tuple:
+        raise NotImplementedError
+
+    def last_key(self, item: dict) -> dict:
+        raise NotImplementedError
+
+    def start_key(self, key: dict) -> tuple:
+        raise NotImplementedError
+
+    def add(self, item: dict) -> None:
+        if self.hash_key not in item or self.range_key not in item:
+            return
+        hash_value = item[self.hash_key]
+        partition = self.partitions.get(hash_value)
+        if partition is None:
+            partition = self.partitions[hash_value] = _Partition()
+            self._order = None
+        partition.put(self.sort_key(item), item)
+
+    def discard(self, item: dict) -> None:
+        if self.hash_key not in item or self.range_key not in item:
+            return
+        hash_value = item[self.hash_key]
+        partition = self.partitions.get(hash_value)
+        if partition is None:
+            return
+        partition.remove(self.sort_key(item))
+        if not partition.items:
+            del self.partitions[hash_value]
+            self._order = None
+
+    def scan_order(self) -> list[tuple]:
+        if self._order is None:
+            self._order = sorted(_scan_position(h) for h in self.partitions)
+        return self._order
+
+
+class _TableSource(_Source):
+    def sort_key(self, item: dict) -> tuple:
+        return (item[self.range_key],)
+
+    def last_key(self, item: dict) -> dict:
+        return {
+            self.hash_key: item[self.hash_key],
+            self.range_key: item[self.range_key],
+        }
+
+    def start_key(self, key: dict) -> tuple:
+        return (key[self.range_key],)
+
+
+class _IndexSource(_Source):
+    def __init__(self, table: '_TableSource', hash_key: str, range_key: str):
+        super().__init__(hash_key, range_key)
+        self.table = table
+
+    def sort_key(self, item: dict) -> tuple:
+        return (
+            item[self.range_key],
+            item[self.table.hash_key],
+            item[self.table.range_key],
+        )
+
+    def last_key(self, item: dict) -> dict:
+        key = self.table.last_key(item)
+        key[self.hash_key] = item[self.hash_key]
+        key[self.range_key] = item[self.range_key]
+        return key
+
+    def start_key(self, key: dict) -> tuple:
+        return (
+            key[self.range_key],
+            key[self.table.hash_key],
+            key[self.table.range_key],
+        )
+
+
+class MemoryTable:
+    """One single-table-design table with optional global secondary indexes."""
+
+    def __init__(
+            self,
+            name: str,
+            hash_key: str = 'PK',
+            range_key: str = 'SK',
+            indexes: dict[str, tuple[str, str]] | None = None
+            ) -> None:
+        self.name = name
+        self.source = _TableSource(hash_key, range_key)
+        self.indexes = {
+            index_name: _IndexSource(self.source, index_hash, index_range)
+            for index_name, (index_hash, index_range) in (indexes or {}).items()
+        }
+        self.read_units = 0.0
+        self.write_units = 0.0
+        self._encoded: dict[tuple, tuple[dict, int]] = {}
+
+    @property
+    def hash_key(self) -> str:
+        return self.source.hash_key
+
+    @property
+    def range_key(self) -> str:
+        return self.source.range_key
+
+    def __len__(self) -> int:
+        return sum(len(p.items) for p in self.source.partitions.values())
+
+    def __iter__(self) -> Iterator[dict]:
+        for partition in self.source.partitions.values():
+            yield from partition.items.values()
+
+    def reset_metrics(self) -> None:
+        self.read_units = 0.0
+        self.write_units = 0.0
+
+    # -- direct access (seeding and assertions) --------------------------
+
+    def get(self, key: dict) -> dict | None:
+        partition = self.source.partitions.get(key[self.hash_key])
+        if partition is None:
+            return None
+        return partition.items.get((key[self.range_key],))
+
+    def put(self, item: dict) -> None:
+        """Store an item without going through boto3 (no capacity charged)."""
+        self.store(_normalize(item))
+
+    def load(self, items: Any) -> None:
+        for item in items:
+            self.put(item)
+
+    def key_of(self, item: dict) -> dict:
+        return self.source.last_key(item)
+
+    def encoded(self, item: dict) -> tuple[dict, int]:
+        """Wire form and size of a stored item, computed once per write."""
+        key = (item[self.hash_key], item[self.range_key])
+        cached = self._encoded.get(key)
+        if cached is None:
+            cached = self._encoded[key] = (_serialize(item), item_size(item))
+        return cached
+
+    def store(self, item: dict) -> dict | None:
+        for attribute in (self.hash_key, self.range_key):
+            if not isinstance(item.get(attribute), (str, Decimal, bytes)):
+                raise DynamoDBError(
+                    'ValidationException',
+                    'One or more parameter values were invalid: Missing the '
+                    f'key {attribute} in the item'
+                )
+        previous = self.get(item)
+        if previous is not None:
+            self.discard(previous)
+        self.source.add(item)
+        for index in self.indexes.values():
+            index.add(item)
+        return previous
+
+    def discard(self, item: dict) -> None:
+        self._encoded.pop((item[self.hash_key], item[self.range_key]), None)
+        self.source.discard(item)
+        for index in self.indexes.values():
+            index.discard(item)
+
+    # -- capacity ----------------------------------------------------------
+
+    def charge_read(self, size: int, consistent: bool = False) -> float:
+        units = max(1, math.ceil(size / READ_UNIT_SIZE)) * (
+            1.0 if consistent else 0.5
+        )
+        self.read_units += units
+        return units
+
+    def charge_write(self, size: int) -> float:
+        units = float(max(1, math.ceil(size / WRITE_UNIT_SIZE)))
+        self.write_units += units
+        return units
+
+
+class MemoryDynamoDB:
+    """In-process DynamoDB endpoint for boto3 clients and resources."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.tables: dict[str, MemoryTable] = {}
+        self.operations: Counter = Counter()
+        # Fault injection: the next N batch calls leave half of their keys
+        # unprocessed, as DynamoDB does when throttled or over size limits.
+        self.unprocessed_batches = 0
+        self._lock = threading.RLock()
+
+    def create_table(
+            self,
+            name: str = 'AppChallenge',
+            hash_key: str = 'PK',
+            range_key: str = 'SK',
+            indexes: dict[str, tuple[str, str]] | None = APP_CHALLENGE_INDEXES
+            ) -> MemoryTable:
+        table = MemoryTable(name, hash_key, range_key, indexes)
+        self.tables[name] = table
+        return table
+
+    def reset_metrics(self) -> None:
+        self.operations.clear()
+        for table in self.tables.values():
+            table.reset_metrics()
+
+    # -- boto3 wiring ------------------------------------------------------
+
+    def session(self) -> boto3.session.Session:
+        return boto3.session.Session(
+            aws_access_key_id='memory',
+            aws_secret_access_key='memory',
+            region_name='us-east-1'
+        )
+
+    def client_config(self) -> Config:
+        return Config(
+            signature_version=UNSIGNED,
+            retries={'total_max_attempts': 1}
+        )
+
+    def client(self):
+        client = self.session().client('dynamodb', config=self.client_config())
+        self.attach(client)
+        return client
+
+    def resource(self):
+        resource = self.session().resource(
+            'dynamodb', config=self.client_config()
+        )
+        self.attach(resource.meta.client)
+        return resource
+
+    def attach(self, client) -> None:
+        """Route every call made by ``client`` to this stand-in."""
+        client.meta.events.register('before-send.dynamodb', self._handle)
+
+    def _handle(self, request, **kwargs: Any) -> AWSResponse:
+        target = request.headers['X-Amz-Target']
+        if isinstance(target, bytes):
+            target = target.decode()
+        operation = target.rsplit('.', 1)[-1]
+        params = json.loads(request.body or b'{}')
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        try:
+            handler = getattr(self, f'_op_{operation}', None)
+            if handler is None:
+                raise DynamoDBError(
+                    'UnknownOperationException',
+                    f'Operation {operation} is not supported'
+                )
+            with self._lock:
+                self.operations[operation] += 1
+                result = handler(params)
+            status, body = 200, result
+        except DynamoDBError as error:
+            status = 400
+            body = {
+                '__type': f'com.amazonaws.dynamodb.v20120810#{error.code}',
+                'message': error.message,
+                **error.extra,
+            }
+        except ExpressionError as error:
+            status = 400
+            body = {
+                '__type': 'com.amazon.coral.validate#ValidationException',
+                'message': f'Invalid expression: {error}',
+            }
+
+        return AWSResponse(
+            request.url,
+            status,
+            {'Content-Type': 'application/x-amz-json-1.0'},
+            _RawResponse(json.dumps(body).encode())
+        )
+
+    # -- request helpers ---------------------------------------------------
+
+    def _table(self, params: dict) -> MemoryTable:
+        name = params.get('TableName')
+        if name not in self.tables:
+            raise DynamoDBError(
+                'ResourceNotFoundException',
+                'Requested resource not found'
+            )
+        return self.tables[name]
+
+    @staticmethod
+    def _values(params: dict) -> dict:
+        return _deserialize(params.get('ExpressionAttributeValues', {}))
+
+    def _condition(self, params: dict, key: str) -> tuple | None:
+        if not params.get(key):
+            return None
+        return parse_condition(
+            params[key],
+            params.get('ExpressionAttributeNames'),
+            self._values(params)
+        )
+
+    def _projection(self, params: dict) -> list[tuple] | None:
+        if not params.get('ProjectionExpression'):
+            return None
+        return parse_projection(
+            params['ProjectionExpression'],
+            params.get('ExpressionAttributeNames')
+        )
+
+    @staticmethod
+    def _capacity(params: dict, table: MemoryTable, units: float) -> dict:
+        mode = params.get('ReturnConsumedCapacity', 'NONE')
+        if mode == 'NONE':
+            return {}
+        capacity: dict[str, Any] = {
+            'TableName': table.name,
+            'CapacityUnits': units,
+        }
+        if mode == 'INDEXES':
+            if 'IndexName' in params:
+                capacity['GlobalSecondaryIndexes'] = {
+                    params['IndexName']: {'CapacityUnits': units}
+                }
+            else:
+                capacity['Table'] = {'CapacityUnits': units}
+        return {'ConsumedCapacity': capacity}
+
+    def _check(
+            self,
+            condition: tuple | None,
+            item: dict | None,
+            params: dict | None = None
+    ) -> None:
+        if condition is not None and not evaluate(condition, item or {}):
+            extra = {}
+            if (item and params and
+                    params.get('ReturnValuesOnConditionCheckFailure')
+                    == 'ALL_OLD'):
+                extra['Item'] = _serialize(item)
+            raise DynamoDBError(
+                'ConditionalCheckFailedException',
+                'The conditional request failed',
+                **extra
+            )
+
+    @staticmethod
+    def _key(table: MemoryTable, params: dict) -> dict:
+        key = _deserialize(params.get('Key', {}))
+        if set(key) != {table.hash_key, table.range_key}:
+            raise DynamoDBError(
+                'ValidationException',
+                'The provided key element does not match the schema'
+            )
+        return key
+
+    def _updated(self, key: dict, existing: dict | None, params: dict) -> dict:
+        actions = parse_update(
+            params.get('UpdateExpression', ''),
+            params.get('ExpressionAttributeNames'),
+            self._values(params)
+        )
+        for action in actions:
+            if action[1][0] in key:
+                raise DynamoDBError(
+                    'ValidationException',
+                    'Cannot update attribute '
+                    f'{action[1][0]}. This attribute is part of the key'
+                )
+        return apply_update(existing or dict(key), actions)
+
+    # -- single-item operations -------------------------------------------
+
+    def _op_GetItem(self, params: dict) -> dict:
+        table = self._table(params)
+        item = table.get(self._key(table, params))
+        units = table.charge_read(
+            item_size(item) if item else 0,
+            params.get('ConsistentRead', False)
+        )
+        result = self._capacity(params, table, units)
+        if item is not None:
+            projection = self._projection(params)
+            result['Item'] = _serialize(
+                project(item, projection) if projection else item
+            )
+        return result
+
+    def _op_PutItem(self, params: dict) -> dict:
+        table = self._table(params)
+        item = _deserialize(params['Item'])
+        existing = table.get(item)
+        self._check(
+            self._condition(params, 'ConditionExpression'), existing, params
+        )
+        table.store(item)
+        result = self._capacity(
+            params, table, table.charge_write(item_size(item))
+        )
+        if params.get('ReturnValues') == 'ALL_OLD' and existing:
+            result['Attributes'] = _serialize(existing)
+        return result
+
+    def _op_UpdateItem(self, params: dict) -> dict:
+        table = self._table(params)
+        key = self._key(table, params)
+        existing = table.get(key)
+        self._check(
+            self._condition(params, 'ConditionExpression'), existing, params
+        )
+        updated = self._updated(key, existing, params)
+        table.store(updated)
+
+        result = self._capacity(
+            params, table, table.charge_write(item_size(updated))
+        )
+        return_values = params.get('ReturnValues', 'NONE')
+        if return_values in ('ALL_NEW', 'UPDATED_NEW'):
+            result['Attributes'] = _serialize(updated)
+        elif return_values in ('ALL_OLD', 'UPDATED_OLD') and existing:
+            result['Attributes'] = _serialize(existing)
+        return result
+
+    def _op_DeleteItem(self, params: dict) -> dict:
+        table = self._table(params)
+        existing = table.get(self._key(table, params))
+        self._check(
+            self._condition(params, 'ConditionExpression'), existing, params
+        )
+        if existing is not None:
+            table.discard(existing)
+        result = self._capacity(
+            params,
+            table,
+            table.charge_write(item_size(existing) if existing else 0)
+        )
+        if params.get('ReturnValues') == 'ALL_OLD' and existing:
+            result['Attributes'] = _serialize(existing)
+        return result
+
+    # -- batch operations --------------------------------------------------
+
+    def _take_unprocessed(self) -> bool:
+        if self.unprocessed_batches <= 0:
+            return False
+        self.unprocessed_batches -= 1
+        return True
+
+    def _op_BatchGetItem(self, params: dict) -> dict:
+        request_items = params.get('RequestItems', {})
+        total = sum(len(r.get('Keys', [])) for r in request_items.values())
+        if not 1 <= total <= 100:
+            raise DynamoDBError(
+                'ValidationException',
+                'Too many items requested for the BatchGetItem call'
+            )
+        throttled = self._take_unprocessed()
+
+        responses: dict[str, list] = {}
+        unprocessed: dict[str, dict] = {}
+        capacity = []
+        for table_name, request in request_items.items():
+            table = self._table({'TableName': table_name})
+            keys = request['Keys']
+            identities = {json.dumps(k, sort_keys=True) for k in keys}
+            if len(identities) != len(keys):
+                raise DynamoDBError(
+                    'ValidationException',
+                    'Provided list of item keys contains duplicates'
+                )
+            if throttled:
+                keys, rest = keys[:len(keys) // 2], keys[len(keys) // 2:]
+                if rest:
+                    unprocessed[table_name] = dict(request, Keys=rest)
+
+            projection = self._projection(request)
+            found = []
+            units = 0.0
+            for key in keys:
+                item = table.get(self._key(table, {'Key': key}))
+                units += table.charge_read(
+                    item_size(item) if item else 0,
+                    request.get('ConsistentRead', False)
+                )
+                if item is not None:
+                    found.append(_serialize(
+                        project(item, projection) if projection else item
+                    ))
+            responses[table_name] = found
+            capacity.append({'TableName': table_name, 'CapacityUnits': units})
+
+        result: dict[str, Any] = {
+            'Responses': responses,
+            'UnprocessedKeys': unprocessed,
+        }
+        if params.get('ReturnConsumedCapacity', 'NONE') != 'NONE':
+            result['ConsumedCapacity'] = capacity
+        return result
+
+    # -- transactions ------------------------------------------------------
+
+    def _op_TransactWriteItems(self, params: dict) -> dict:
+        """All-or-nothing writes: every condition is checked before any write.
+
+        A failed condition cancels the whole transaction and is reported in
+        ``CancellationReasons``, one entry per action in request order.
+        Transactional writes consume twice the units of plain writes.
+        """
+        actions = params.get('TransactItems', [])
+        if not 1 <= len(actions) <= 100:
+            raise DynamoDBError(
+                'ValidationException',
+                'Member must have length less than or equal to 100 and '
+                'greater than or equal to 1'
+            )
+
+        planned, reasons, seen = [], [], set()
+        for action in actions:
+            (kind, body), = action.items()
+            table = self._table(body)
+            if kind == 'Put':
+                item = _deserialize(body['Item'])
+                key = table.key_of(item)
+            else:
+                key = self._key(table, body)
+                item = None
+            identity = (table.name, key[table.hash_key], key[table.range_key])
+            if identity in seen:
+                raise DynamoDBError(
+                    'ValidationException',
+                    'Transaction request cannot include multiple operations '
+                    'on one item'
+                )
+            seen.add(identity)
+
+            existing = table.get(key)
+            condition = self._condition(body, 'ConditionExpression')
+            if condition is not None and not evaluate(condition, existing or {}):
+                reason = {
+                    'Code': 'ConditionalCheckFailed',
+                    'Message': 'The conditional request failed',
+                }
+                if (body.get('ReturnValuesOnConditionCheckFailure') == 'ALL_OLD'
+                        and existing):
+                    reason['Item'] = _serialize(existing)
+                reasons.append(reason)
+            else:
+                reasons.append({'Code': 'None'})
+                if kind == 'Update':
+                    item = self._updated(key, existing, body)
+            planned.append((kind, table, item, existing))
+
+        if any(reason['Code'] != 'None' for reason in reasons):
+            codes = ', '.join(reason['Code'] for reason in reasons)
+            raise DynamoDBError(
+                'TransactionCanceledException',
+                'Transaction cancelled, please refer cancellation reasons '
+                f'for specific reasons [{codes}]',
+                CancellationReasons=reasons
+            )
+
+        units: dict[str, float] = Counter()
+        for kind, table, item, existing in planned:
+            if kind in ('Put', 'Update'):
+                table.store(item)
+                size = item_size(item)
+            elif kind == 'Delete':
+                if existing is not None:
+                    table.discard(existing)
+                size = item_size(existing) if existing else 0
+            else:
+                continue
+            charged = table.charge_write(size)
+            table.write_units += charged
+            units[table.name] += 2 * charged
+
+        if params.get('ReturnConsumedCapacity', 'NONE') == 'NONE':
+            return {}
+        return {'ConsumedCapacity': [
+            {'TableName': name, 'CapacityUnits': total}
+            for name, total in units.items()
+        ]}
+
+    # -- Query and Scan ----------------------------------------------------
+
+    def _source(self, table: MemoryTable, params: dict) -> _Source:
+        index_name = params.get('IndexName')
+        if index_name is None:
+            return table.source
+        if index_name not in table.indexes:
+            raise DynamoDBError(
+                'ValidationException',
+                'The table does not have the specified index: '
+                f'{index_name}'
+            )
+        if params.get('ConsistentRead'):
+            raise DynamoDBError(
+                'ValidationException',
+                'Consistent reads are not supported on global secondary '
+                'indexes'
+            )
+        return table.indexes[index_name]
+
+    def _op_Query(self, params: dict) -> dict:
+        table = self._table(params)
+        source = self._source(table, params)
+        key_condition = self._condition(params, 'KeyConditionExpression')
+        if key_condition is None:
+            raise DynamoDBError(
+                'ValidationException',
+                'Either the KeyConditions or KeyConditionExpression '
+                'parameter must be specified in the request.'
+            )
+        hash_value, range_condition = _split_key_condition(
+            key_condition, source
+        )
+        entries = _query_entries(
+            source,
+            hash_value,
+            range_condition,
+            forward=params.get('ScanIndexForward', True),
+            start=_deserialize(params.get('ExclusiveStartKey', {}))
+        )
+        return self._read_page(table, source, entries, params)
+
+    def _op_Scan(self, params: dict) -> dict:
+        table = self._table(params)
+        source = self._source(table, params)
+        total_segments = params.get('TotalSegments')
+        segment = params.get('Segment')
+        if (total_segments is None) != (segment is None):
+            raise DynamoDBError(
+                'ValidationException',
+                'Segment and TotalSegments must be provided together'
+            )
+        entries = _scan_entries(
+            source,
+            start=_deserialize(params.get('ExclusiveStartKey', {})),
+            segment=segment,
+            total_segments=total_segments
+        )
+        return self._read_page(table, source, entries, params)
+
+    def _read_page(
+            self,
+            table: MemoryTable,
+            source: _Source,
+            entries: Iterator[dict],
+            params: dict
+            ) -> dict:
+        limit = params.get('Limit')
+        item_filter = self._condition(params, 'FilterExpression')
+        projection = self._projection(params)
+
+        scanned = 0
+        size = 0
+        matched: list[dict] = []
+        last_evaluated = None
+        for item in entries:
+            scanned += 1
+            size += table.encoded(item)[1]
+            if item_filter is None or evaluate(item_filter, item):
+                matched.append(item)
+            if (limit and scanned >= limit) or size >= PAGE_SIZE_LIMIT:
+                last_evaluated = item
+                break
+
+        units = table.charge_read(size, params.get('ConsistentRead', False))
+        result: dict[str, Any] = {
+            'Count': len(matched),
+            'ScannedCount': scanned,
+            **self._capacity(params, table, units),
+        }
+        if params.get('Select') != 'COUNT':
+            result['Items'] = [
+                _serialize(project(item, projection)) if projection
+                else table.encoded(item)[0]
+                for item in matched
+            ]
+        if last_evaluated is not None:
+            result['LastEvaluatedKey'] = _serialize(
+                source.last_key(last_evaluated)
+            )
+        return result
+
+
+def _split_key_condition(node: tuple, source: _Source) -> tuple:
+    """Split a key condition into the hash key value and the range clause."""
+    clauses = []
+    pending = [node]
+    while pending:
+        current = pending.pop()
+        if current[0] == 'and':
+            pending.extend((current[2], current[1]))
+        else:
+            clauses.append(current)
+
+    hash_value = None
+    range_condition = None
+    for clause in clauses:
+        if (
+            clause[0] == 'compare' and clause[1] == '='
+            and clause[2] == ('path', (source.hash_key,))
+            and clause[3][0] == 'value'
+        ):
+            hash_value = clause[3][1]
+        elif _key_clause_path(clause) == (source.range_key,):
+            range_condition = clause
+        else:
+            raise DynamoDBError(
+                'ValidationException',
+                'Query key condition not supported'
+            )
+    if hash_value is None:
+        raise DynamoDBError(
+            'ValidationException',
+            'Query condition missed key schema element: '
+            f'{source.hash_key}'
+        )
+    return hash_value, range_condition
+
+
+def _key_clause_path(clause: tuple) -> tuple | None:
+    if clause[0] == 'function' and clause[1] == 'begins_with':
+        return clause[2]
+    if clause[0] == 'between':
+        operand = clause[1]
+    elif clause[0] == 'compare':
+        operand = clause[2]
+    else:
+        return None
+    return operand[1] if operand[0] == 'path' else None
+
+
+def _range_bounds(keys: list[tuple], clause: tuple | None) -> tuple[int, int]:
+    """Index bounds of the sort keys matching a key-condition range clause."""
+    if clause is None:
+        return 0, len(keys)
+
+    def first(key_tuple: tuple) -> Any:
+        return key_tuple[0]
+
+    if clause[0] == 'between':
+        low, high = clause[2][1], clause[3][1]
+        return (
+            bisect_left(keys, low, key=first),
+            bisect_right(keys, high, key=first),
+        )
+    if clause[0] == 'function':
+        prefix = clause[3][1]
+        if not prefix:
+            return 0, len(keys)
+        successor = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return (
+            bisect_left(keys, prefix, key=first),
+            bisect_left(keys, successor, key=first),
+        )
+
+    operator, value = clause[1], clause[3][1]
+    if operator == '=':
+        return (
+            bisect_left(keys, value, key=first),
+            bisect_right(keys, value, key=first),
+        )
+    if operator == '<':
+        return 0, bisect_left(keys, value, key=first)
+    if operator == '<=':
+        return 0, bisect_right(keys, value, key=first)
+    if operator == '>':
+        return bisect_right(keys, value, key=first), len(keys)
+    if operator == '>=':
+        return bisect_left(keys, value, key=first), len(keys)
+    raise DynamoDBError(
+        'ValidationException',
+        f'Unsupported operator in key condition: {operator}'
+    )
+
+
+def _query_entries(
+        source: _Source,
+        hash_value: Any,
+        range_condition: tuple | None,
+        forward: bool,
+        start: dict
+        ) -> Iterator[dict]:
+    partition = source.partitions.get(hash_value)
+    if partition is None:
+        return
+    keys = partition.keys()
+    low, high = _range_bounds(keys, range_condition)
+    if start:
+        start_key = source.start_key(start)
+        if forward:
+            low = max(low, bisect_right(keys, start_key))
+        else:
+            high = min(high, bisect_left(keys, start_key))
+    positions = range(low, high) if forward else range(high - 1, low - 1, -1)
+    for position in positions:
+        yield partition.items[keys[position]]
+
+
+def _scan_entries(
+        source: _Source,
+        start: dict,
+        segment: int | None,
+        total_segments: int | None
+        ) -> Iterator[dict]:
+    order = source.scan_order()
+    position = 0
+    start_key = None
+    if start:
+        position = bisect_left(order, _scan_position(start[source.hash_key]))
+        start_key = source.start_key(start)
+
+    for crc, hash_value in order[position:]:
+        if total_segments and crc % total_segments != segment:
+            continue
+        partition = source.partitions.get(hash_value)
+        if partition is None:
+            continue
+        keys = partition.keys()
+        first = 0
+        if start_key is not None:
+            if hash_value == start[source.hash_key]:
+                first = bisect_right(keys, start_key)
+            start_key = None
+        for key in keys[first:]:
+            yield partition.items[key]
@@ -0,0 +1,494 @@
+"""
+Parser and evaluator for DynamoDB expressions used by the in-memory table.
+
+Supports the subset of the expression grammar the adapters rely on:
+condition/filter/key-condition expressions, update expressions
+(SET/REMOVE/ADD/DELETE) and projection expressions.
+"""
+import copy
+import re
+from decimal import Decimal
+from typing import Any, Callable
+
+
+MISSING = object()
+
+_TOKEN = re.compile(
+    r"\s*(?:(<>|<=|>=|=|<|>|\(|\)|,|\[|\]|\.|\+|-)|([#:]?[A-Za-z0-9_]+))"
+)
+_UPDATE_CLAUSES = {'SET', 'REMOVE', 'ADD', 'DELETE'}
+
+
+class ExpressionError(ValueError):
+    """Raised when an expression cannot be parsed or evaluated."""
+
+
+def tokenize(expression: str) -> list[str]:
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        if not match or match.end() == position:
+            raise ExpressionError(
+                f"Invalid expression near: {expression[position:]!r}"
+            )
+        tokens.append(match.group(1) or match.group(2))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    def __init__(
+            self,
+            expression: str,
+            names: dict[str, str] | None,
+            values: dict[str, Any] | None
+            ) -> None:
+        self.tokens = tokenize(expression)
+        self.position = 0
+        self.names = names or {}
+        self.values = values or {}
+
+    # -- token helpers ---------------------------------------------------
+
+    def peek(self, offset: int = 0) -> str | None:
+        index = self.position + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def take(self, expected: str | None = None) -> str:
+        token = self.peek()
+        if token is None:
+            raise ExpressionError("Unexpected end of expression")
+        if expected is not None and token.upper() != expected:
+            raise ExpressionError(f"Expected {expected!r}, got {token!r}")
+        self.position += 1
+        return token
+
+    def at_keyword(self, keyword: str) -> bool:
+        token = self.peek()
+        return token is not None and token.upper() == keyword
+
+    def done(self) -> bool:
+        return self.position >= len(self.tokens)
+
+    # -- paths and operands ----------------------------------------------
+
+    def path(self) -> tuple:
+        elements: list[Any] = [self.name(self.take())]
+        while self.peek() in ('.', '['):
+            if self.take() == '.':
+                elements.append(self.name(self.take()))
+            else:
+                elements.append(int(self.take()))
+                self.take(']')
+        return tuple(elements)
+
+    def name(self, token: str) -> str:
+        if token.startswith('#'):
+            if token not in self.names:
+                raise ExpressionError(f"Undefined attribute name {token}")
+            return self.names[token]
+        if token.startswith(':') or token in ('(', ')', ','):
+            raise ExpressionError(f"Expected attribute name, got {token!r}")
+        return token
+
+    def value(self, token: str) -> Any:
+        if token not in self.values:
+            raise ExpressionError(f"Undefined attribute value {token}")
+        return self.values[token]
+
+    def operand(self) -> tuple:
+        token = self.peek()
+        if token is None:
+            raise ExpressionError("Unexpected end of expression")
+        if token.startswith(':'):
+            self.take()
+            return ('value', self.value(token))
+        if token.lower() == 'size' and self.peek(1) == '(':
+            self.take()
+            self.take('(')
+            path = self.path()
+            self.take(')')
+            return ('size', path)
+        return ('path', self.path())
+
+    # -- conditions ------------------------------------------------------
+
+    def condition(self) -> tuple:
+        node = self.conjunction()
+        while self.at_keyword('OR'):
+            self.take()
+            node = ('or', node, self.conjunction())
+        return node
+
+    def conjunction(self) -> tuple:
+        node = self.negation()
+        while self.at_keyword('AND'):
+            self.take()
+            node = ('and', node, self.negation())
+        return node
+
+    def negation(self) -> tuple:
+        if self.at_keyword('NOT'):
+            self.take()
+            return ('not', self.negation())
+        return self.primary()
+
+    def primary(self) -> tuple:
+        token = self.peek()
+        if token == '(':
+            self.take()
+            node = self.condition()
+            self.take(')')
+            return node
+
+        function = (token or '').lower()
+        if self.peek(1) == '(' and function in (
+                'attribute_exists', 'attribute_not_exists',
+                'begins_with', 'contains', 'attribute_type'):
+            self.take()
+            self.take('(')
+            path = self.path()
+            argument = None
+            if function not in ('attribute_exists', 'attribute_not_exists'):
+                self.take(',')
+                argument = self.operand()
+            self.take(')')
+            return ('function', function, path, argument)
+
+        left = self.operand()
+        if self.at_keyword('BETWEEN'):
+            self.take()
+            low = self.operand()
+            self.take('AND')
+            return ('between', left, low, self.operand())
+        if self.at_keyword('IN'):
+            self.take()
+            self.take('(')
+            options = [self.operand()]
+            while self.peek() == ',':
+                self.take()
+                options.append(self.operand())
+            self.take(')')
+            return ('in', left, options)
+
+        comparator = self.take()
+        if comparator not in ('=', '<>', '<', '<=', '>', '>='):
+            raise ExpressionError(f"Unknown comparator {comparator!r}")
+        return ('compare', comparator, left, self.operand())
+
+    # -- updates ---------------------------------------------------------
+
+    def update(self) -> list[tuple]:
+        actions = []
+        while not self.done():
+            clause = self.take().upper()
+            if clause not in _UPDATE_CLAUSES:
+                raise ExpressionError(f"Unknown update clause {clause!r}")
+            while True:
+                actions.append(self.update_action(clause))
+                if self.peek() != ',':
+                    break
+                self.take()
+        return actions
+
+    def update_action(self, clause: str) -> tuple:
+        path = self.path()
+        if clause == 'REMOVE':
+            return ('remove', path, None)
+        if clause in ('ADD', 'DELETE'):
+            return (clause.lower(), path, self.operand())
+        self.take('=')
+        value = self.set_operand()
+        if self.peek() in ('+', '-'):
+            operator = self.take()
+            value = ('arithmetic', operator, value, self.set_operand())
+        return ('set', path, value)
+
+    def set_operand(self) -> tuple:
+        function = (self.peek() or '').lower()
+        if self.peek(1) == '(' and function in ('if_not_exists', 'list_append'):
+            self.take()
+            self.take('(')
+            first = (
+                ('path', self.path()) if function == 'if_not_exists'
+                else self.set_operand()
+            )
+            self.take(',')
+            second = self.set_operand()
+            self.take(')')
+            return (function, first, second)
+        return self.operand()
+
+    # -- projections -----------------------------------------------------
+
+    def projection(self) -> list[tuple]:
+        paths = [self.path()]
+        while self.peek() == ',':
+            self.take()
+            paths.append(self.path())
+        return paths
+
+
+def _finish(parser: _Parser, result: Any) -> Any:
+    if not parser.done():
+        raise ExpressionError(f"Unexpected token {parser.peek()!r}")
+    return result
+
+
+def parse_condition(
+        expression: str,
+        names: dict[str, str] | None = None,
+        values: dict[str, Any] | None = None
+        ) -> tuple:
+    parser = _Parser(expression, names, values)
+    return _finish(parser, parser.condition())
+
+
+def parse_update(
+        expression: str,
+        names: dict[str, str] | None = None,
+        values: dict[str, Any] | None = None
+        ) -> list[tuple]:
+    parser = _Parser(expression, names, values)
+    return _finish(parser, parser.update())
+
+
+def parse_projection(
+        expression: str,
+        names: dict[str, str] | None = None
+        ) -> list[tuple]:
+    parser = _Parser(expression, names, None)
+    return _finish(parser, parser.projection())
+
+
+# -- evaluation --------------------------------------------------------------
+
+
+def resolve(item: dict, path: tuple) -> Any:
+    current: Any = item
+    for element in path:
+        if isinstance(element, int):
+            if not isinstance(current, list) or element >= len(current):
+                return MISSING
+        elif not isinstance(current, dict) or element not in current:
+            return MISSING
+        current = current[element]
+    return current
+
+
+def operand_value(item: dict, operand: tuple) -> Any:
+    kind = operand[0]
+    if kind == 'value':
+        return operand[1]
+    if kind == 'path':
+        return resolve(item, operand[1])
+    value = resolve(item, operand[1])
+    if value is MISSING:
+        return MISSING
+    if isinstance(value, (str, bytes, list, dict, set, frozenset)):
+        return Decimal(len(value))
+    raise ExpressionError("size() used on an unsupported type")
+
+
+def _comparable(left: Any, right: Any) -> bool:
+    if left is MISSING or right is MISSING:
+        return False
+    if isinstance(left, (int, Decimal)) and isinstance(right, (int, Decimal)):
+        return not isinstance(left, bool) and not isinstance(right, bool)
+    return type(left) is type(right)
+
+
+_COMPARATORS: dict[str, Callable[[Any, Any], bool]] = {
+    '=': lambda a, b: a == b,
+    '<>': lambda a, b: a != b,
+    '<': lambda a, b: a < b,
+    '<=': lambda a, b: a <= b,
+    '>': lambda a, b: a > b,
+    '>=': lambda a, b: a >= b,
+}
+
+_TYPE_CODES = {
+    'S': str, 'N': (int, Decimal), 'B': bytes, 'BOOL': bool,
+    'M': dict, 'L': list, 'NULL': type(None),
+}
+
+
+def evaluate(node: tuple, item: dict) -> bool:
+    kind = node[0]
+    if kind == 'and':
+        return evaluate(node[1], item) and evaluate(node[2], item)
+    if kind == 'or':
+        return evaluate(node[1], item) or evaluate(node[2], item)
+    if kind == 'not':
+        return not evaluate(node[1], item)
+    if kind == 'compare':
+        left = operand_value(item, node[2])
+        right = operand_value(item, node[3])
+        if node[1] == '<>' and (left is MISSING) != (right is MISSING):
+            return True
+        if not _comparable(left, right):
+            return False
+        return _COMPARATORS[node[1]](left, right)
+    if kind == 'between':
+        value = operand_value(item, node[1])
+        low = operand_value(item, node[2])
+        high = operand_value(item, node[3])
+        return (
+            _comparable(value, low) and _comparable(value, high)
+            and low <= value <= high
+        )
+    if kind == 'in':
+        value = operand_value(item, node[1])
+        return any(
+            _comparable(value, option) and value == option
+            for option in (operand_value(item, o) for o in node[2])
+        )
+    if kind == 'function':
+        return _evaluate_function(node[1], node[2], node[3], item)
+    raise ExpressionError(f"Unknown condition node {kind!r}")
+
+
+def _evaluate_function(
+        function: str,
+        path: tuple,
+        argument: tuple | None,
+        item: dict
+        ) -> bool:
+    value = resolve(item, path)
+    if function == 'attribute_exists':
+        return value is not MISSING
+    if function == 'attribute_not_exists':
+        return value is MISSING
+
+    expected = operand_value(item, argument)
+    if value is MISSING or expected is MISSING:
+        return False
+    if function == 'begins_with':
+        return (
+            isinstance(value, (str, bytes)) and type(value) is type(expected)
+            and value.startswith(expected)
+        )
+    if function == 'contains':
+        if isinstance(value, (str, bytes)):
+            return type(value) is type(expected) and expected in value
+        if isinstance(value, (set, frozenset, list)):
+            return expected in value
+        return False
+    if function == 'attribute_type':
+        python_type = _TYPE_CODES.get(expected)
+        if expected in ('SS', 'NS', 'BS'):
+            return isinstance(value, (set, frozenset))
+        return python_type is not None and isinstance(value, python_type)
+    raise ExpressionError(f"Unknown function {function!r}")
+
+
+def _update_value(item: dict, operand: tuple) -> Any:
+    kind = operand[0]
+    if kind == 'arithmetic':
+        left = _update_value(item, operand[2])
+        right = _update_value(item, operand[3])
+        if not isinstance(left, Decimal) or not isinstance(right, Decimal):
+            raise ExpressionError(
+                "An operand in the update expression has an incorrect "
+                "data type"
+            )
+        return left + right if operand[1] == '+' else left - right
+    if kind == 'if_not_exists':
+        current = resolve(item, operand[1][1])
+        return _update_value(item, operand[2]) if current is MISSING else current
+    if kind == 'list_append':
+        first = _update_value(item, operand[1])
+        second = _update_value(item, operand[2])
+        if not isinstance(first, list) or not isinstance(second, list):
+            raise ExpressionError("list_append requires two lists")
+        return first + second
+    value = operand_value(item, operand)
+    if value is MISSING:
+        raise ExpressionError(
+            "The provided expression refers to an attribute that does not "
+            "exist in the item"
+        )
+    return value
+
+
+def _assign(item: dict, path: tuple, value: Any) -> None:
+    parent = resolve(item, path[:-1]) if len(path) > 1 else item
+    if parent is MISSING:
+        raise ExpressionError(
+            "The document path provided in the update expression is invalid "
+            "for update"
+        )
+    if isinstance(path[-1], int):
+        if path[-1] >= len(parent):
+            parent.append(value)
+        else:
+            parent[path[-1]] = value
+    else:
+        parent[path[-1]] = value
+
+
+def _remove(item: dict, path: tuple) -> None:
+    parent = resolve(item, path[:-1]) if len(path) > 1 else item
+    if parent is MISSING:
+        return
+    if isinstance(path[-1], int):
+        if path[-1] < len(parent):
+            del parent[path[-1]]
+    else:
+        parent.pop(path[-1], None)
+
+
+def apply_update(item: dict, actions: list[tuple]) -> dict:
+    """Return a new item with the parsed update actions applied."""
+    updated = copy.deepcopy(item)
+    # SET operands are evaluated against the item before the update.
+    resolved = [
+        (action, _update_value(item, action[2]) if action[0] == 'set'
+         else None)
+        for action in actions
+    ]
+    for (kind, path, operand), value in resolved:
+        if kind == 'set':
+            _assign(updated, path, value)
+        elif kind == 'remove':
+            _remove(updated, path)
+        elif kind == 'add':
+            change = operand_value(item, operand)
+            current = resolve(updated, path)
+            if current is MISSING:
+                _assign(updated, path, change)
+            elif isinstance(current, Decimal) and isinstance(change, Decimal):
+                _assign(updated, path, current + change)
+            elif isinstance(current, (set, frozenset)):
+                _assign(updated, path, set(current) | set(change))
+            else:
+                raise ExpressionError(
+                    "An operand in the update expression has an incorrect "
+                    "data type"
+                )
+        elif kind == 'delete':
+            change = operand_value(item, operand)
+            current = resolve(updated, path)
+            if isinstance(current, (set, frozenset)):
+                remaining = set(current) - set(change)
+                if remaining:
+                    _assign(updated, path, remaining)
+                else:
+                    _remove(updated, path)
+    return updated
+
+
+def project(item: dict, paths: list[tuple]) -> dict:
+    """Return a copy of the item holding only the projected paths."""
+    projected: dict = {}
+    for path in paths:
+        value = resolve(item, path)
+        if value is MISSING:
+            continue
+        target = projected
+        for element in path[:-1]:
+            target = target.setdefault(element, {})
+        target[path[-1]] = value
+    return projected
@@ -0,0 +1,105 @@
+import asyncio
+import contextvars
+import time
+
+from app.domain.models.subscription import Status
+from app.domain.models.user import User, NotifyChannel
+from app.infrastructure.adapters.offload import create_executor, run_blocking
+from app.infrastructure.container import Container
+
+
+request_id = contextvars.ContextVar('request_id', default=None)
+
+
+class TestRunBlocking:
+    """
+    Tests de la ejecución de llamadas bloqueantes fuera del event loop.
+    """
+
+    def test_event_loop_keeps_running_during_blocking_call(self):
+        """
+        Mientras una llamada bloqueante espera, el loop sigue atendiendo
+        otras tareas.
+        """
+        # Arrange
+        executor = create_executor(max_workers=2)
+        ticks = []
+
+        async def heartbeat():
+            for _ in range(5):
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        async def scenario():
+            await asyncio.gather(
+                run_blocking(executor, time.sleep, 0.1),
+                heartbeat()
+            )
+
+        # Act
+        asyncio.run(scenario())
+        executor.shutdown()
+
+        # Assert
+        assert len(ticks) == 5
+        assert ticks[-1] - ticks[0] < 0.1
+
+    def test_context_variables_reach_the_worker_thread(self):
+        """
+        Las variables de contexto del request son visibles en el hilo.
+        """
+        # Arrange
+        executor = create_executor(max_workers=1)
+
+        async def scenario():
+            request_id.set("req-1")
+            return await run_blocking(executor, request_id.get)
+
+        # Act
+        seen = asyncio.run(scenario())
+        executor.shutdown()
+
+        # Assert
+        assert seen == "req-1"
+
+
+class TestAsyncUseCasesOnMemoryTable:
+    """
+    Tests de los casos de uso async contra la tabla en memoria.
+    """
+
+    def test_subscribe_and_cancel(self, table, dynamodb_resource):
+        """
+        Suscribir y cancelar con los adapters async deja el saldo intacto.
+        """
+        # Arrange
+        table.put({'PK': 'FUND#f001', 'SK': 'PROFILE', 'fund_id': 'f001',
+                   'name': 'Fondo', 'min_amount': 50000, 'category': 'FPV'})
+        table.put({'PK': 'USER#u001', 'SK': 'PROFILE', 'user_id': 'u001',
+                   'balance': 500000})
+        container = Container(dynamodb_resource)
+        use_case = container.async_subscription_use_case
+        user = User(user_id="u001", name="Test User",
+                    email="test@example.com", balance=500000,
+                    notify_channel=NotifyChannel.EMAIL, phone="0")
+
+        async def scenario():
+            opened = await use_case.subscribe(
+                fund_id="f001", user=user, amount=100000
+            )
+            cancelled = await use_case.cancel_subscription(
+                fund_id="f001", user=user.model_copy(update={
+                    'balance': 400000
+                })
+            )
+            return opened, cancelled
+
+        # Act
+        opened, cancelled = asyncio.run(scenario())
+        container.executor.shutdown()
+
+        # Assert
+        assert opened.status == Status.ACTIVE
+        assert cancelled.status == Status.CANCELLED
+        profile = table.get({'PK': 'USER#u001', 'SK': 'PROFILE'})
+        assert profile['balance'] == 500000
@@ -0,0 +1,88 @@
+import time
+
+from app.infrastructure.adapters.batch import batch_get_items
+from app.infrastructure.adapters.funds import FundAdapter
+
+
+def _seed_fund(table, fund_id):
+    table.put({'PK': f'FUND#{fund_id}', 'SK': 'PROFILE',
+               'fund_id': fund_id, 'name': f'Fondo {fund_id}',
+               'min_amount': 50000, 'category': 'FPV'})
+
+
+class TestBatchGetItems:
+    """
+    Tests de la lectura por lotes con BatchGetItem.
+    """
+
+    def test_chunks_are_read_concurrently(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        Los bloques de 100 claves se piden en paralelo: el tiempo total
+        es cercano al de una sola llamada.
+        """
+        # Arrange
+        for index in range(400):
+            _seed_fund(table, f"f{index:03d}")
+        keys = [{'PK': f'FUND#f{index:03d}', 'SK': 'PROFILE'}
+                for index in range(400)]
+        memory_dynamodb.latency = 0.1
+
+        # Act
+        started = time.perf_counter()
+        items = batch_get_items(dynamodb_resource, 'AppChallenge', keys,
+                                max_workers=4)
+        elapsed = time.perf_counter() - started
+
+        # Assert
+        assert len(items) == 400
+        assert memory_dynamodb.operations == {'BatchGetItem': 4}
+        assert elapsed < 0.3
+
+    def test_unprocessed_keys_are_retried_with_backoff(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        Las claves sin procesar se reintentan esperando entre intentos.
+        """
+        # Arrange
+        for index in range(10):
+            _seed_fund(table, f"f{index:03d}")
+        keys = [{'PK': f'FUND#f{index:03d}', 'SK': 'PROFILE'}
+                for index in range(10)]
+        memory_dynamodb.unprocessed_batches = 3
+        delays = []
+
+        # Act
+        items = batch_get_items(dynamodb_resource, 'AppChallenge', keys,
+                                sleep=delays.append)
+
+        # Assert
+        assert len(items) == 10
+        assert len(delays) == 3
+        assert memory_dynamodb.operations == {'BatchGetItem': 4}
+
+
+class TestFundAdapterGetMany:
+    """
+    Tests de la lectura de varios fondos a la vez.
+    """
+
+    def test_keeps_input_order_and_skips_missing(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        Los fondos vuelven en el orden pedido, sin duplicados ni ausentes.
+        """
+        # Arrange
+        for fund_id in ("f001", "f002", "f003"):
+            _seed_fund(table, fund_id)
+        adapter = FundAdapter(dynamodb_resource)
+
+        # Act
+        funds = adapter.get_many(["f003", "f404", "f001", "f003", "f002"])
+
+        # Assert
+        assert [f.fund_id for f in funds] == ["f003", "f001", "f002"]
+        assert memory_dynamodb.operations == {'BatchGetItem': 1}
@@ -0,0 +1,219 @@
+import asyncio
+
+from app.application.ports.errors import (
+    InsufficientBalance,
+    OptimisticLockError,
+    UserNotFound
+)
+from app.domain.models.requests import BulkSubscribeItem
+from app.domain.models.subscription import BulkItemStatus, Subscription, Status
+from app.domain.models.transaction import Transaction, TransactionType
+from app.infrastructure.adapters import transactions
+from app.infrastructure.adapters.unit_of_work import UnitOfWorkAdapter
+from app.infrastructure.adapters.users import UserAdapter
+from app.infrastructure.container import Container
+
+
+def _seed_user(table, user_id, balance=500000):
+    table.put({'PK': f'USER#{user_id}', 'SK': 'PROFILE',
+               'user_id': user_id, 'name': 'Test User',
+               'email': f'{user_id}@example.com', 'phone': '0',
+               'balance': balance, 'notify_channel': 'email'})
+
+
+def _seed_fund(table):
+    table.put({'PK': 'FUND#f001', 'SK': 'PROFILE', 'fund_id': 'f001',
+               'name': 'Fondo', 'min_amount': 50000, 'category': 'FPV'})
+
+
+def _entry(user_id, amount=100000):
+    subscription = Subscription(user_id=user_id, fund_id="f001",
+                                amount=amount, status=Status.ACTIVE,
+                                created_at="2025-08-22T10:00:00")
+    transaction = Transaction(user_id=user_id, fund_id="f001", amount=amount,
+                              transaction_type=TransactionType.OPEN,
+                              timestamp="2025-08-22T10:00:00.000001",
+                              prev_balance=500000,
+                              new_balance=500000 - amount)
+    return subscription, transaction
+
+
+class TestUserAdapterGetMany:
+    """
+    Tests de la lectura de usuarios por lotes con BatchGetItem.
+    """
+
+    def test_returns_users_in_input_order_skipping_missing(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        Los usuarios vuelven en el orden pedido y los inexistentes se
+        omiten, en una sola llamada por cada 100 claves.
+        """
+        # Arrange
+        for index in range(150):
+            _seed_user(table, f"u{index:03d}")
+        user_ids = [f"u{index:03d}" for index in reversed(range(150))]
+        user_ids.insert(10, "missing")
+        adapter = UserAdapter(dynamodb_resource)
+
+        # Act
+        users = adapter.get_many(user_ids)
+
+        # Assert
+        assert [u.user_id for u in users] == [
+            f"u{index:03d}" for index in reversed(range(150))
+        ]
+        assert memory_dynamodb.operations == {'BatchGetItem': 2}
+
+    def test_retries_unprocessed_keys(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        Las claves que DynamoDB deja sin procesar se vuelven a pedir.
+        """
+        # Arrange
+        for index in range(8):
+            _seed_user(table, f"u{index:03d}")
+        memory_dynamodb.unprocessed_batches = 2
+        adapter = UserAdapter(dynamodb_resource)
+
+        # Act
+        users = adapter.get_many([f"u{index:03d}" for index in range(8)])
+
+        # Assert
+        assert len(users) == 8
+        assert memory_dynamodb.operations == {'BatchGetItem': 3}
+
+
+class TestUnitOfWorkSubscribeMany:
+    """
+    Tests de la suscripción masiva con transacciones por bloques.
+    """
+
+    def test_chunks_entries_into_transactions(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        Cada transacción lleva como máximo 20 suscripciones: 4 acciones
+        por usuario más un contador por fondo.
+        """
+        # Arrange
+        entries = []
+        for index in range(70):
+            _seed_user(table, f"u{index:03d}")
+            entries.append(_entry(f"u{index:03d}"))
+        unit_of_work = UnitOfWorkAdapter(dynamodb_resource)
+
+        # Act
+        results = unit_of_work.subscribe_many(entries)
+
+        # Assert
+        assert all(isinstance(r, Subscription) for r in results)
+        assert memory_dynamodb.operations == {'TransactWriteItems': 4}
+        assert table.get({'PK': 'USER#u069', 'SK': 'PROFILE'})['balance'] == (
+            400000
+        )
+
+    def test_failed_entries_do_not_block_the_rest_of_the_chunk(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        Las entradas que fallan se reportan y el resto del bloque se
+        reintenta sin ellas.
+        """
+        # Arrange
+        _seed_user(table, "u001")
+        _seed_user(table, "u002", balance=1000)
+        _seed_user(table, "u004")
+        entries = [_entry("u001"), _entry("u002"), _entry("u003"),
+                   _entry("u004")]
+        unit_of_work = UnitOfWorkAdapter(dynamodb_resource)
+
+        # Act
+        results = unit_of_work.subscribe_many(entries)
+
+        # Assert
+        assert isinstance(results[0], Subscription)
+        assert isinstance(results[1], InsufficientBalance)
+        assert isinstance(results[2], UserNotFound)
+        assert isinstance(results[3], Subscription)
+        assert table.get({'PK': 'USER#u002', 'SK': 'PROFILE'})['balance'] == (
+            1000
+        )
+        assert table.get({'PK': 'USER#u004', 'SK': 'SUB#f001'}) is not None
+
+    def test_taken_transaction_ids_are_retried_a_bounded_number_of_times(
+        self, monkeypatch, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        Un id de transacción que siempre está tomado cuenta contra
+        max_attempts: esa entrada falla y el resto del bloque se escribe.
+        """
+        # Arrange
+        _seed_user(table, "u001")
+        _seed_user(table, "u002")
+        table.put({'PK': 'USER#u001', 'SK': 'TX#01K3B0000000000000000000AA'})
+        monkeypatch.setattr(transactions, 'new_ulid',
+                            lambda _: '01K3B0000000000000000000AA')
+        unit_of_work = UnitOfWorkAdapter(dynamodb_resource)
+
+        # Act
+        results = unit_of_work.subscribe_many(
+            [_entry("u001"), _entry("u002")], max_attempts=3
+        )
+
+        # Assert
+        assert isinstance(results[0], OptimisticLockError)
+        assert isinstance(results[1], Subscription)
+        assert memory_dynamodb.operations == {'TransactWriteItems': 4}
+        assert table.get({'PK': 'USER#u001', 'SK': 'PROFILE'})['balance'] == (
+            500000
+        )
+
+
+class TestSubscribeManyUseCase:
+    """
+    Tests del caso de uso de suscripción masiva contra la tabla en memoria.
+    """
+
+    def test_reports_each_item(self, memory_dynamodb, table,
+                               dynamodb_resource):
+        """
+        El reporte indica el resultado de cada usuario en el orden pedido.
+        """
+        # Arrange
+        _seed_fund(table)
+        _seed_user(table, "u001")
+        _seed_user(table, "u002", balance=1000)
+        container = Container(dynamodb_resource)
+        items = [
+            BulkSubscribeItem(user_id="u001", amount=100000),
+            BulkSubscribeItem(user_id="u002", amount=100000),
+            BulkSubscribeItem(user_id="u003", amount=100000),
+            BulkSubscribeItem(user_id="u001", amount=100000),
+            BulkSubscribeItem(user_id="u004", amount=10),
+        ]
+
+        # Act
+        report = asyncio.run(
+            container.async_subscription_use_case.subscribe_many(
+                fund_id="f001", items=items
+            )
+        )
+        container.executor.shutdown()
+
+        # Assert
+        assert report.succeeded == 1
+        assert report.failed == 4
+        assert [r.status for r in report.results] == [
+            BulkItemStatus.SUBSCRIBED,
+            BulkItemStatus.FAILED,
+            BulkItemStatus.FAILED,
+            BulkItemStatus.FAILED,
+            BulkItemStatus.FAILED,
+        ]
+        assert report.results[1].error == (
+            "No hay suficiente saldo para vincularse al fondo $Fondo"
+        )
+        assert report.results[3].error == "Duplicate user in request"
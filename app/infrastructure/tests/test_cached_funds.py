@@ -0,0 +1,239 @@
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from app.domain.models.fund import Fund
+from app.infrastructure.adapters.cached_funds import CachedFundAdapter
+from app.infrastructure.adapters.funds import FundAdapter
+
+
+def _seed_fund(table, fund_id, min_amount=75000):
+    table.put({'PK': f'FUND#{fund_id}', 'SK': 'PROFILE',
+               'fund_id': fund_id, 'name': f'Fondo {fund_id}',
+               'min_amount': min_amount, 'category': 'FPV'})
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCachedFundAdapter:
+    """
+    Tests del caché en memoria del catálogo de fondos.
+    """
+
+    def test_repeated_lookups_read_dynamodb_once(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        Consultar el mismo fondo varias veces hace un solo GetItem.
+        """
+        # Arrange
+        _seed_fund(table, "f001")
+        funds = CachedFundAdapter(FundAdapter(dynamodb_resource))
+
+        # Act
+        results = [funds.get_by_id("f001") for _ in range(5)]
+
+        # Assert
+        assert all(fund.name == "Fondo f001" for fund in results)
+        assert memory_dynamodb.operations == {'GetItem': 1}
+        assert funds.stats() == {
+            'hits': 4, 'misses': 1, 'evictions': 0, 'size': 1
+        }
+
+    def test_entries_expire_after_ttl(self):
+        """
+        Pasado el TTL el fondo se vuelve a leer.
+        """
+        # Arrange
+        clock = FakeClock()
+        inner = Mock()
+        inner.get_by_id.return_value = Fund(
+            fund_id="f001", name="Fondo", min_amount=1000, category="FPV"
+        )
+        funds = CachedFundAdapter(inner, ttl=60, clock=clock)
+
+        # Act
+        funds.get_by_id("f001")
+        clock.now = 59
+        funds.get_by_id("f001")
+        clock.now = 61
+        funds.get_by_id("f001")
+
+        # Assert
+        assert inner.get_by_id.call_count == 2
+
+    def test_missing_fund_is_cached(self, memory_dynamodb, dynamodb_resource):
+        """
+        Un fondo inexistente también se cachea (caché negativo).
+        """
+        # Arrange
+        funds = CachedFundAdapter(FundAdapter(dynamodb_resource))
+
+        # Act & Assert
+        for _ in range(3):
+            with pytest.raises(ValueError, match="not found"):
+                funds.get_by_id("f999")
+
+        assert memory_dynamodb.operations == {'GetItem': 1}
+
+    def test_least_recently_used_is_evicted(self):
+        """
+        Al superar max_size se descarta el fondo usado hace más tiempo.
+        """
+        # Arrange
+        inner = Mock()
+        inner.get_by_id.side_effect = lambda fund_id: Fund(
+            fund_id=fund_id, name="Fondo", min_amount=1000, category="FPV"
+        )
+        funds = CachedFundAdapter(inner, max_size=2)
+
+        # Act
+        funds.get_by_id("f001")
+        funds.get_by_id("f002")
+        funds.get_by_id("f001")
+        funds.get_by_id("f003")
+        funds.get_by_id("f001")
+        funds.get_by_id("f002")
+
+        # Assert
+        fetched = [call.args[0] for call in inner.get_by_id.call_args_list]
+        assert fetched == ["f001", "f002", "f003", "f002"]
+        assert funds.evictions == 2
+
+    def test_concurrent_misses_fetch_once(self):
+        """
+        Varias consultas simultáneas del mismo fondo hacen una sola lectura.
+        """
+        # Arrange
+        inner = Mock()
+
+        def slow_get(fund_id):
+            time.sleep(0.05)
+            return Fund(fund_id=fund_id, name="Fondo", min_amount=1000,
+                        category="FPV")
+
+        inner.get_by_id.side_effect = slow_get
+        funds = CachedFundAdapter(inner)
+        start = threading.Barrier(8)
+        results = []
+
+        def lookup():
+            start.wait()
+            results.append(funds.get_by_id("f001"))
+
+        # Act
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert len(results) == 8
+        assert inner.get_by_id.call_count == 1
+
+    def test_warm_loads_the_whole_catalog(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        warm() carga todos los fondos, así las consultas no leen DynamoDB.
+        """
+        # Arrange
+        for index in range(12):
+            _seed_fund(table, f"f{index:03d}")
+        table.put({'PK': 'USER#u001', 'SK': 'PROFILE', 'user_id': 'u001'})
+        funds = CachedFundAdapter(FundAdapter(dynamodb_resource))
+
+        # Act
+        loaded = funds.warm(page_size=5)
+        memory_dynamodb.reset_metrics()
+        names = {funds.get_by_id(f"f{index:03d}").name for index in range(12)}
+
+        # Assert
+        assert loaded == 12
+        assert len(names) == 12
+        assert memory_dynamodb.operations == {}
+
+
+class TestFundAdapterListAll:
+    """
+    Tests de list_all contra la tabla en memoria.
+    """
+
+    def test_pages_through_funds_only(self, table, dynamodb_resource):
+        """
+        list_all devuelve solo fondos y el cursor recorre todas las páginas.
+        """
+        # Arrange
+        for index in range(7):
+            _seed_fund(table, f"f{index:03d}")
+            table.put({'PK': f'USER#u{index:03d}', 'SK': 'PROFILE',
+                       'user_id': f'u{index:03d}'})
+        adapter = FundAdapter(dynamodb_resource)
+
+        # Act
+        seen, last_key = [], None
+        while True:
+            funds, last_key = adapter.list_all(limit=3, last_key=last_key)
+            seen.extend(fund.fund_id for fund in funds)
+            if last_key is None:
+                break
+
+        # Assert
+        assert sorted(seen) == [f"f{index:03d}" for index in range(7)]
+
+    def test_searched_funds_are_cached(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        Los fondos de una búsqueda quedan en caché para get_by_id.
+        """
+        # Arrange
+        for index in range(3):
+            _seed_fund(table, f"f{index:03d}")
+        cache = CachedFundAdapter(FundAdapter(dynamodb_resource))
+
+        # Act
+        funds, _ = cache.search("FPV")
+        found = [cache.get_by_id(fund.fund_id) for fund in funds]
+
+        # Assert
+        assert len(found) == 3
+        assert memory_dynamodb.operations == {'Query': 1}
+
+
+class TestCachedFundAdapterGetMany:
+    """
+    Tests de la lectura por lotes a través del caché.
+    """
+
+    def test_reads_only_uncached_funds(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        Los fondos ya cacheados no se vuelven a pedir y los inexistentes
+        quedan cacheados como ausentes.
+        """
+        # Arrange
+        for fund_id in ("f001", "f002", "f003"):
+            _seed_fund(table, fund_id)
+        funds = CachedFundAdapter(FundAdapter(dynamodb_resource))
+        funds.get_by_id("f001")
+        memory_dynamodb.reset_metrics()
+
+        # Act
+        first = funds.get_many(["f003", "f001", "f404", "f002"])
+        second = funds.get_many(["f002", "f404"])
+
+        # Assert
+        assert [f.fund_id for f in first] == ["f003", "f001", "f002"]
+        assert [f.fund_id for f in second] == ["f002"]
+        assert memory_dynamodb.operations == {'BatchGetItem': 1}
@@ -0,0 +1,180 @@
+from unittest.mock import Mock
+
+from app.domain.models.subscription import Subscription, Status
+from app.domain.models.transaction import Transaction, TransactionType
+from app.domain.models.user import User
+from app.infrastructure.adapters.cached_users import (
+    CachedUserAdapter,
+    UserCacheUnitOfWork
+)
+from app.infrastructure.adapters.unit_of_work import UnitOfWorkAdapter
+from app.infrastructure.adapters.users import UserAdapter
+
+
+def _seed_user(table, user_id="u001", balance=500000):
+    table.put({'PK': f'USER#{user_id}', 'SK': 'PROFILE',
+               'user_id': user_id, 'name': 'Test User',
+               'email': f'{user_id}@example.com', 'phone': '0',
+               'balance': balance, 'notify_channel': 'email'})
+
+
+def _user(user_id="u001", balance=500000):
+    return User(user_id=user_id, name="Test User",
+                email=f"{user_id}@example.com", phone="0",
+                balance=balance, notify_channel="email")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCachedUserAdapter:
+    """
+    Tests del caché corto de perfiles de usuario.
+    """
+
+    def test_repeated_lookups_read_dynamodb_once(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        Consultar el mismo usuario varias veces hace un solo GetItem.
+        """
+        # Arrange
+        _seed_user(table)
+        users = CachedUserAdapter(UserAdapter(dynamodb_resource))
+
+        # Act
+        results = [users.get_by_id("u001") for _ in range(5)]
+
+        # Assert
+        assert all(user.balance == 500000 for user in results)
+        assert memory_dynamodb.operations == {'GetItem': 1}
+        assert users.stats() == {
+            'hits': 4, 'misses': 1, 'evictions': 0, 'size': 1
+        }
+
+    def test_entries_expire_after_ttl(self):
+        """
+        Pasado el TTL el perfil se vuelve a leer.
+        """
+        # Arrange
+        clock = FakeClock()
+        inner = Mock()
+        inner.get_by_id.return_value = _user()
+        users = CachedUserAdapter(inner, ttl=5, clock=clock)
+
+        # Act
+        users.get_by_id("u001")
+        clock.now = 4
+        users.get_by_id("u001")
+        clock.now = 6
+        users.get_by_id("u001")
+
+        # Assert
+        assert inner.get_by_id.call_count == 2
+
+    def test_read_overtaken_by_a_write_is_not_cached(self):
+        """
+        Una lectura que empezó antes de una escritura no deja en el caché
+        el perfil viejo.
+        """
+        # Arrange
+        inner = Mock()
+        users = CachedUserAdapter(inner)
+
+        def read_while_written(user_id, fields=None):
+            users.invalidate(user_id)
+            return _user(balance=500000)
+
+        inner.get_by_id.side_effect = read_while_written
+
+        # Act
+        users.get_by_id("u001")
+        inner.get_by_id.side_effect = None
+        inner.get_by_id.return_value = _user(balance=400000)
+        user = users.get_by_id("u001")
+
+        # Assert
+        assert user.balance == 400000
+        assert inner.get_by_id.call_count == 2
+
+    def test_update_caches_the_returned_profile(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        update guarda el perfil ALL_NEW, sin volver a leerlo.
+        """
+        # Arrange
+        _seed_user(table)
+        users = CachedUserAdapter(UserAdapter(dynamodb_resource))
+        users.get_by_id("u001")
+
+        # Act
+        users.update("u001", balance=123)
+        user = users.get_by_id("u001")
+
+        # Assert
+        assert user.balance == 123
+        assert memory_dynamodb.operations == {'GetItem': 1, 'UpdateItem': 1}
+
+    def test_get_many_reads_only_uncached_users(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        Los usuarios ya cacheados no se vuelven a pedir.
+        """
+        # Arrange
+        for user_id in ("u001", "u002"):
+            _seed_user(table, user_id)
+        users = CachedUserAdapter(UserAdapter(dynamodb_resource))
+        users.get_by_id("u001")
+        memory_dynamodb.reset_metrics()
+
+        # Act
+        found = users.get_many(["u002", "u404", "u001"])
+
+        # Assert
+        assert [u.user_id for u in found] == ["u002", "u001"]
+        assert memory_dynamodb.operations == {'BatchGetItem': 1}
+
+
+class TestUserCacheUnitOfWork:
+    """
+    Tests de la invalidación del caché al escribir el saldo.
+    """
+
+    def test_commit_drops_the_cached_profile(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        Después de suscribir, el siguiente perfil trae el saldo nuevo.
+        """
+        # Arrange
+        _seed_user(table)
+        users = CachedUserAdapter(UserAdapter(dynamodb_resource))
+        unit_of_work = UserCacheUnitOfWork(
+            UnitOfWorkAdapter(dynamodb_resource), users
+        )
+        users.get_by_id("u001")
+        subscription = Subscription(user_id="u001", fund_id="f001",
+                                    amount=100000, status=Status.ACTIVE,
+                                    created_at="2025-08-22T10:00:00")
+        transaction = Transaction(user_id="u001", fund_id="f001",
+                                  amount=100000,
+                                  transaction_type=TransactionType.OPEN,
+                                  timestamp="2025-08-22T10:00:00.000001",
+                                  prev_balance=500000, new_balance=400000)
+
+        # Act
+        unit_of_work.subscribe(subscription, transaction)
+        user = users.get_by_id("u001")
+
+        # Assert
+        assert user.balance == 400000
+        assert memory_dynamodb.operations == {
+            'GetItem': 2, 'TransactWriteItems': 1
+        }
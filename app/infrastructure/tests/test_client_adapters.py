@@ -0,0 +1,243 @@
+from datetime import datetime
+
+import pytest
+
+from app.domain.models.subscription import Status, Subscription
+from app.domain.models.transaction import Transaction
+from app.infrastructure.adapters.client_adapters import (
+    ClientFundAdapter,
+    ClientSubscriptionAdapter,
+    ClientTransactionAdapter,
+    ClientUserAdapter
+)
+from app.infrastructure.adapters.funds import FundAdapter
+from app.infrastructure.adapters.projection import projection
+from app.infrastructure.adapters.subscription import SubscriptionAdapter
+from app.infrastructure.adapters.transactions import TransactionAdapter
+from app.infrastructure.adapters.users import UserAdapter
+from app.infrastructure.adapters.wire import WireTable, wire_to_user
+from app.infrastructure.instrumentation import collect, instrument
+
+
+def _transaction(index, user_id="u001", fund_id="f001"):
+    return Transaction(
+        user_id=user_id,
+        fund_id=fund_id,
+        amount=75000,
+        transaction_type="open",
+        timestamp=f"2025-08-22T10:{index // 60:02d}:{index % 60:02d}",
+        prev_balance=500000,
+        new_balance=425000
+    )
+
+
+def _seed_user(table, user_id, **extra):
+    table.put({'PK': f'USER#{user_id}', 'SK': 'PROFILE', 'user_id': user_id,
+               'name': 'Ana', 'email': 'ana@example.com', 'balance': 500000,
+               'notify_channel': 'email', **extra})
+
+
+@pytest.fixture
+def dynamodb_client(memory_dynamodb):
+    """Cliente de bajo nivel aparte del recurso, como en producción."""
+    return memory_dynamodb.client()
+
+
+class TestWireTable:
+    """
+    Tests de las lecturas en formato wire con el cliente de bajo nivel.
+    """
+
+    def test_returns_wire_items_and_python_keys(
+            self, table, dynamodb_client
+            ):
+        """
+        Los items llegan tipados ({'N': ...}) y LastEvaluatedKey como
+        valores Python, para reutilizarlo como ExclusiveStartKey.
+        """
+        # Arrange
+        for index in range(3):
+            _seed_user(table, f"u{index:03d}")
+        reads = WireTable(dynamodb_client, 'AppChallenge')
+
+        # Act
+        first = reads.scan(Limit=2)
+        rest = reads.scan(ExclusiveStartKey=first['LastEvaluatedKey'])
+
+        # Assert
+        assert first['Items'][0]['balance'] == {'N': '500000'}
+        last = first['Items'][-1]
+        assert first['LastEvaluatedKey'] == {
+            'PK': last['PK']['S'], 'SK': 'PROFILE'
+        }
+        assert len(rest['Items']) == 1
+
+    def test_keeps_consumed_capacity_for_instrumentation(
+            self, table, dynamodb_client
+            ):
+        """
+        Saltarse el parser de botocore no oculta el consumo a las métricas.
+        """
+        # Arrange
+        _seed_user(table, "u001")
+        reads = WireTable(instrument(dynamodb_client), 'AppChallenge')
+
+        # Act
+        with collect() as metrics:
+            response = reads.get_item(Key={'PK': 'USER#u001', 'SK': 'PROFILE'})
+
+        # Assert
+        assert wire_to_user(response['Item']).balance == 500000
+        assert metrics.operations['GetItem'].read_units == 0.5
+
+    def test_projection_limits_the_returned_attributes(
+            self, table, dynamodb_client
+            ):
+        """
+        Con ProjectionExpression la respuesta trae solo esos atributos.
+        """
+        # Arrange
+        _seed_user(table, "u001")
+        reads = WireTable(dynamodb_client, 'AppChallenge')
+
+        # Act
+        response = reads.get_item(
+            Key={'PK': 'USER#u001', 'SK': 'PROFILE'},
+            **projection(['balance', 'name'])
+        )
+
+        # Assert
+        assert response['Item'] == {
+            'balance': {'N': '500000'}, 'name': {'S': 'Ana'}
+        }
+
+
+class TestClientAdapters:
+    """
+    Los adapters con cliente de bajo nivel devuelven lo mismo que los de
+    recurso, con los mismos cursores.
+    """
+
+    def test_transaction_pages_and_cursors_match(
+            self, dynamodb_resource, dynamodb_client
+            ):
+        """
+        Páginas, filas y cursores coinciden, y un cursor de un backend
+        sirve en el otro.
+        """
+        # Arrange
+        resource = TransactionAdapter(dynamodb_resource)
+        client = ClientTransactionAdapter(dynamodb_resource, dynamodb_client)
+        for index in range(25):
+            resource.save(_transaction(index))
+            resource.save(_transaction(index, "u002", "f002"))
+
+        # Act
+        page, cursor = client.get_by_user_page("u001", limit=10)
+        expected = resource.get_by_user_page("u001", limit=10)
+        next_page = client.get_by_user_page("u001", limit=10, cursor=cursor)
+        rows, _ = client.get_by_user_rows_page("u001", limit=10)
+
+        # Assert
+        assert (page, cursor) == expected
+        assert next_page == resource.get_by_user_page(
+            "u001", limit=10, cursor=cursor
+        )
+        assert rows == resource.get_by_user_rows_page("u001", limit=10)[0]
+        assert client.get_by_fund_page("f002", limit=7) == (
+            resource.get_by_fund_page("f002", limit=7)
+        )
+        since = datetime(2025, 8, 22)
+        assert client.get_all_page(limit=7, since=since) == (
+            resource.get_all_page(limit=7, since=since)
+        )
+
+    def test_parallel_scan_decodes_wire_items(
+            self, dynamodb_resource, dynamodb_client
+            ):
+        """
+        El scan paralelo también pasa por el cliente de bajo nivel.
+        """
+        # Arrange
+        resource = TransactionAdapter(dynamodb_resource)
+        for index in range(30):
+            resource.save(_transaction(index))
+        client = ClientTransactionAdapter(dynamodb_resource, dynamodb_client)
+
+        # Act
+        transactions = list(client.get_all_parallel(4))
+        since = datetime(2025, 8, 22)
+        ordered = list(client.get_all_parallel(since=since, ordered=True))
+
+        # Assert
+        key = lambda t: t.timestamp  # noqa: E731
+        assert sorted(transactions, key=key) == sorted(
+            resource.get_all_parallel(4), key=key
+        )
+        assert ordered == list(
+            resource.get_all_parallel(since=since, ordered=True)
+        )
+
+    def test_subscription_reads_match(self, dynamodb_resource, dynamodb_client):
+        """
+        get, list_by_user y list_by_fund devuelven las mismas suscripciones.
+        """
+        # Arrange
+        resource = SubscriptionAdapter(dynamodb_resource)
+        client = ClientSubscriptionAdapter(dynamodb_resource, dynamodb_client)
+        for index in range(5):
+            resource.save(Subscription(
+                user_id=f"u{index:03d}", fund_id="f001", amount=75000,
+                status=Status.ACTIVE, created_at="2025-08-22T10:00:00"
+            ))
+        client.cancel("u001", "f001")
+
+        # Act
+        cancelled = client.get("u001", "f001")
+        page = client.list_by_fund("f001", limit=2)
+
+        # Assert
+        assert cancelled == resource.get("u001", "f001")
+        assert cancelled.cancelled_at is not None
+        assert client.get("u001", "f999") is None
+        assert list(client.list_by_user("u000")) == (
+            list(resource.list_by_user("u000"))
+        )
+        assert page == resource.list_by_fund("f001", limit=2)
+
+    def test_user_and_fund_reads_match(
+            self, table, dynamodb_resource, dynamodb_client
+            ):
+        """
+        Perfiles por ID y por lote, incluido el teléfono opcional.
+        """
+        # Arrange
+        _seed_user(table, "u001", phone="+573001234567")
+        _seed_user(table, "u002")
+        for index, category in enumerate(("FPV", "FIC", "FPV")):
+            table.put({'PK': f'FUND#f{index:03d}', 'SK': 'PROFILE',
+                       'fund_id': f'f{index:03d}', 'name': f'Fondo {index}',
+                       'min_amount': 50000 + index * 25000,
+                       'category': category})
+        users = ClientUserAdapter(dynamodb_resource, dynamodb_client)
+        funds = ClientFundAdapter(dynamodb_resource, dynamodb_client)
+
+        # Act
+        many = users.get_many(["u002", "u404", "u001"])
+
+        # Assert
+        assert many == UserAdapter(dynamodb_resource).get_many(
+            ["u002", "u404", "u001"]
+        )
+        assert users.get_by_id("u001").phone == "+573001234567"
+        assert users.get_many(["u001"], fields=["phone"]) == (
+            UserAdapter(dynamodb_resource).get_many(["u001"], fields=["phone"])
+        )
+        with pytest.raises(ValueError):
+            users.get_by_id("u404")
+        resource_funds = FundAdapter(dynamodb_resource)
+        assert funds.get_by_id("f001") == resource_funds.get_by_id("f001")
+        assert funds.search("FPV", limit=1) == (
+            resource_funds.search("FPV", limit=1)
+        )
+        assert funds.list_all(limit=2) == resource_funds.list_all(limit=2)
@@ -0,0 +1,109 @@
+import pytest
+
+from app.infrastructure.adapters.cached_funds import CachedFundAdapter
+from app.infrastructure.adapters.client_adapters import (
+    ClientSubscriptionAdapter,
+    ClientTransactionAdapter,
+    ClientUserAdapter
+)
+from app.infrastructure.adapters.funds import FundAdapter
+from app.infrastructure.container import Container
+from app.infrastructure.dynamodb import dynamodb_config
+
+
+class TestContainer:
+    """
+    Tests del contenedor de adapters y casos de uso por proceso.
+    """
+
+    def test_adapters_share_one_resource(self, dynamodb_resource):
+        """
+        Todos los adapters y casos de uso usan el mismo recurso DynamoDB
+        y por lo tanto el mismo cliente y pool de conexiones.
+        """
+        # Act
+        container = Container(dynamodb_resource)
+
+        # Assert
+        adapters = [
+            container.subscription_port,
+            container.transaction_port,
+            container.user_port,
+            container.unit_of_work,
+        ]
+        assert all(a.dynamodb is dynamodb_resource for a in adapters)
+        use_case = container.subscription_use_case
+        assert use_case._funds_port is container.fund_port
+        assert use_case._unit_of_work is container.unit_of_work
+        assert (container.transaction_use_case.transaction_port
+                is container.transaction_port)
+
+    def test_fund_cache_can_be_disabled(self, dynamodb_resource,
+                                        monkeypatch):
+        """
+        FUND_CACHE_TTL_SECONDS=0 usa el adapter de fondos sin caché.
+        """
+        # Arrange
+        monkeypatch.setenv('FUND_CACHE_TTL_SECONDS', '0')
+
+        # Act
+        container = Container(dynamodb_resource)
+
+        # Assert
+        assert isinstance(container.fund_port.wrapped, FundAdapter)
+        assert not isinstance(container.fund_port.wrapped, CachedFundAdapter)
+
+    def test_client_backend_from_environment(self, memory_dynamodb,
+                                             dynamodb_resource, monkeypatch):
+        """
+        DYNAMODB_BACKEND=client lee usuarios, suscripciones y transacciones
+        con el cliente de bajo nivel; las escrituras siguen en el recurso.
+        """
+        # Arrange
+        monkeypatch.setenv('DYNAMODB_BACKEND', 'client')
+        monkeypatch.setenv('USER_CACHE_TTL_SECONDS', '0')
+        client = memory_dynamodb.client()
+
+        # Act
+        container = Container(dynamodb_resource, dynamodb_client=client)
+
+        # Assert
+        assert isinstance(container.transaction_port, ClientTransactionAdapter)
+        assert isinstance(
+            container.subscription_port.wrapped, ClientSubscriptionAdapter
+        )
+        assert isinstance(container.user_port.wrapped, ClientUserAdapter)
+        assert isinstance(
+            container.user_profile_port.wrapped, ClientUserAdapter
+        )
+        assert container.transaction_port.dynamodb is dynamodb_resource
+
+    def test_unknown_backend_is_rejected(self, dynamodb_resource,
+                                         monkeypatch):
+        """
+        Un valor desconocido de DYNAMODB_BACKEND falla al arrancar.
+        """
+        # Arrange
+        monkeypatch.setenv('DYNAMODB_BACKEND', 'http')
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            Container(dynamodb_resource)
+
+    def test_client_config_from_environment(self, monkeypatch):
+        """
+        El pool, los timeouts y los reintentos se configuran por entorno.
+        """
+        # Arrange
+        monkeypatch.setenv('DYNAMODB_MAX_POOL_CONNECTIONS', '20')
+        monkeypatch.setenv('DYNAMODB_READ_TIMEOUT', '2.5')
+        monkeypatch.setenv('DYNAMODB_MAX_ATTEMPTS', '5')
+
+        # Act
+        config = dynamodb_config()
+
+        # Assert
+        assert config.max_pool_connections == 20
+        assert config.read_timeout == 2.5
+        assert config.tcp_keepalive is True
+        assert config.retries == {'mode': 'adaptive', 'max_attempts': 5}
@@ -0,0 +1,176 @@
+import asyncio
+
+import pytest
+
+from app.domain.models.subscription import Subscription, Status
+from app.domain.models.transaction import Transaction, TransactionType
+from app.infrastructure.adapters.fund_stats import (
+    FundStatsAdapter,
+    shard_for,
+    stats_action,
+    stats_shards
+)
+from app.infrastructure.adapters.parallel_scan import parallel_scan
+from app.infrastructure.adapters.unit_of_work import UnitOfWorkAdapter
+from app.infrastructure.container import Container
+from app.infrastructure.jobs.check_fund_stats import check_fund_stats
+
+
+def _seed_user(table, user_id, balance=500000):
+    table.put({'PK': f'USER#{user_id}', 'SK': 'PROFILE',
+               'user_id': user_id, 'name': 'Test User',
+               'balance': balance, 'notify_channel': 'email'})
+
+
+def _entry(user_id, amount=100000, fund_id="f001", prev_balance=500000):
+    subscription = Subscription(user_id=user_id, fund_id=fund_id,
+                                amount=amount, status=Status.ACTIVE,
+                                created_at="2025-08-22T10:00:00")
+    transaction = Transaction(user_id=user_id, fund_id=fund_id, amount=amount,
+                              transaction_type=TransactionType.OPEN,
+                              timestamp="2025-08-22T10:00:00.000001",
+                              prev_balance=prev_balance,
+                              new_balance=prev_balance - amount)
+    return subscription, transaction
+
+
+def _stats_items(table):
+    return [item for item in table if item['SK'] == 'STATS']
+
+
+class TestFundStatsCounters:
+    """
+    Tests de los contadores por fondo repartidos en shards.
+    """
+
+    def test_subscribe_and_cancel_update_the_counters(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        Suscribir suma al AUM y a los suscriptores activos; cancelar resta.
+        """
+        # Arrange
+        unit_of_work = UnitOfWorkAdapter(dynamodb_resource, shards=4)
+        stats = FundStatsAdapter(dynamodb_resource, shards=4)
+        for index in range(12):
+            _seed_user(table, f"u{index:03d}")
+            unit_of_work.subscribe(*_entry(f"u{index:03d}", 10000 + index))
+        subscription, transaction = _entry("u000", 10000, prev_balance=490000)
+
+        # Act
+        unit_of_work.cancel(subscription, transaction)
+        memory_dynamodb.reset_metrics()
+        result = stats.get("f001")
+
+        # Assert
+        assert result.active_subscribers == 11
+        assert result.aum == sum(10000 + index for index in range(1, 12))
+        assert len({item['PK'] for item in _stats_items(table)}) > 1
+        assert memory_dynamodb.operations == {'BatchGetItem': 1}
+
+    def test_bulk_subscribe_merges_counters_per_chunk(
+        self, table, dynamodb_resource
+    ):
+        """
+        En la suscripción masiva cada bloque escribe un solo contador.
+        """
+        # Arrange
+        entries = []
+        for index in range(45):
+            _seed_user(table, f"u{index:03d}")
+            entries.append(_entry(f"u{index:03d}"))
+        unit_of_work = UnitOfWorkAdapter(dynamodb_resource, shards=4)
+
+        # Act
+        unit_of_work.subscribe_many(entries)
+        result = FundStatsAdapter(dynamodb_resource, shards=4).get("f001")
+
+        # Assert
+        assert result.active_subscribers == 45
+        assert result.aum == 4500000
+
+    def test_unknown_fund_is_not_found(self, dynamodb_resource):
+        """
+        Pedir las estadísticas de un fondo inexistente falla.
+        """
+        # Arrange
+        container = Container(dynamodb_resource)
+
+        # Act / Assert
+        with pytest.raises(ValueError):
+            asyncio.run(container.async_fund_use_case.get_stats("f404"))
+        container.executor.shutdown()
+
+
+class TestCheckFundStats:
+    """
+    Tests del verificador de consistencia de los contadores.
+    """
+
+    def test_detects_and_repairs_drift(self, table, dynamodb_resource):
+        """
+        Los contadores que no coinciden con las suscripciones activas se
+        detectan y se corrigen.
+        """
+        # Arrange
+        _seed_user(table, "u001")
+        UnitOfWorkAdapter(dynamodb_resource).subscribe(*_entry("u001"))
+        # Written before the counters existed
+        table.put({'PK': 'USER#u002', 'SK': 'SUB#f001', 'user_id': 'u002',
+                   'fund_id': 'f001', 'amount': 70000, 'status': 'active'})
+        table.put({'PK': 'USER#u003', 'SK': 'SUB#f001', 'user_id': 'u003',
+                   'fund_id': 'f001', 'amount': 90000,
+                   'status': 'cancelled'})
+
+        # Act
+        drift = check_fund_stats(dynamodb_resource, 'AppChallenge',
+                                 repair=True)
+        after = check_fund_stats(dynamodb_resource, 'AppChallenge')
+
+        # Assert
+        wanted, stored = drift["f001"]
+        assert (wanted.aum, wanted.active_subscribers) == (170000, 2)
+        assert (stored.aum, stored.active_subscribers) == (100000, 1)
+        assert after == {}
+        assert FundStatsAdapter(dynamodb_resource).get("f001").aum == 170000
+
+    def test_transient_drift_is_not_repaired(
+        self, monkeypatch, table, dynamodb_resource
+    ):
+        """
+        Una suscripción vista a medio escribir por el primer escaneo no se
+        corrige: el segundo escaneo ya la ve completa.
+        """
+        # Arrange
+        _seed_user(table, "u001")
+        UnitOfWorkAdapter(dynamodb_resource).subscribe(*_entry("u001"))
+        # The subscription is written, its counter update not yet
+        table.put({'PK': 'USER#u002', 'SK': 'SUB#f001', 'user_id': 'u002',
+                   'fund_id': 'f001', 'amount': 70000, 'status': 'active'})
+        scans = []
+
+        def scan_then_finish_write(*args, **kwargs):
+            items = list(parallel_scan(*args, **kwargs))
+            if not scans:
+                dynamodb_resource.Table('AppChallenge').update_item(
+                    **stats_action('AppChallenge', 'f001',
+                                   shard_for('u002', stats_shards()),
+                                   70000, 1)['Update']
+                )
+            scans.append(items)
+            return iter(items)
+
+        monkeypatch.setattr(
+            'app.infrastructure.jobs.check_fund_stats.parallel_scan',
+            scan_then_finish_write
+        )
+
+        # Act
+        drift = check_fund_stats(dynamodb_resource, 'AppChallenge',
+                                 repair=True)
+
+        # Assert
+        assert len(scans) == 2
+        assert drift == {}
+        result = FundStatsAdapter(dynamodb_resource).get("f001")
+        assert (result.aum, result.active_subscribers) == (170000, 2)
@@ -0,0 +1,182 @@
+import pytest
+
+from app.application.ports.errors import IdempotencyConflict
+from app.domain.models.idempotency import IdempotencyStatus
+from app.domain.models.subscription import Subscription, Status
+from app.domain.models.transaction import Transaction, TransactionType
+from app.infrastructure.adapters.idempotency import IdempotencyAdapter
+from app.infrastructure.adapters.unit_of_work import UnitOfWorkAdapter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestIdempotencyAdapter:
+    """
+    Tests de los registros de idempotencia con put condicional.
+    """
+
+    def setup_method(self):
+        """Setup para cada test - reloj controlado."""
+        self.clock = FakeClock()
+
+    def _adapter(self, dynamodb_resource):
+        return IdempotencyAdapter(dynamodb_resource, ttl=3600,
+                                  lock_timeout=30, clock=self.clock)
+
+    def test_first_request_claims_the_key(self, table, dynamodb_resource):
+        """
+        La primera petición reserva la clave con TTL y debe ejecutarse.
+        """
+        # Act
+        record = self._adapter(dynamodb_resource).begin("k1", "fp")
+
+        # Assert
+        assert record.status == IdempotencyStatus.IN_PROGRESS
+        item = table.get({'PK': 'IDEMPOTENCY#k1', 'SK': 'IDEMPOTENCY'})
+        assert item['status'] == 'in_progress'
+        assert item['expires_at'] == 1_000_000 + 3600
+
+    def test_completed_request_is_replayed(self, dynamodb_resource):
+        """
+        Un reintento con la misma clave y datos devuelve la respuesta
+        guardada.
+        """
+        # Arrange
+        adapter = self._adapter(dynamodb_resource)
+        claim = adapter.begin("k1", "fp")
+        adapter.complete(claim, 200, {"amount": 100000, "rate": 1.5})
+
+        # Act
+        record = adapter.begin("k1", "fp")
+
+        # Assert
+        assert record.status == IdempotencyStatus.COMPLETED
+        assert record.status_code == 200
+        assert record.body == {"amount": 100000, "rate": 1.5}
+
+    def test_different_payload_conflicts(self, dynamodb_resource):
+        """
+        Reusar la clave con otra petición es un conflicto.
+        """
+        # Arrange
+        adapter = self._adapter(dynamodb_resource)
+        adapter.complete(adapter.begin("k1", "fp"), 200, {})
+
+        # Act / Assert
+        with pytest.raises(IdempotencyConflict, match="different request"):
+            adapter.begin("k1", "other")
+
+    def test_request_in_progress_conflicts_until_the_lock_expires(
+        self, dynamodb_resource
+    ):
+        """
+        Mientras la primera petición corre, un reintento es un conflicto;
+        si nunca termina, la clave se libera al vencer el bloqueo.
+        """
+        # Arrange
+        adapter = self._adapter(dynamodb_resource)
+        adapter.begin("k1", "fp")
+
+        # Act / Assert
+        with pytest.raises(IdempotencyConflict, match="in progress"):
+            adapter.begin("k1", "fp")
+        self.clock.now += 31
+        assert adapter.begin("k1", "fp").status == IdempotencyStatus.IN_PROGRESS
+
+    def test_expired_and_released_keys_can_be_reused(self, dynamodb_resource):
+        """
+        Una clave vencida (aunque el TTL no la haya borrado) o liberada
+        tras un error vuelve a estar disponible.
+        """
+        # Arrange
+        adapter = self._adapter(dynamodb_resource)
+        adapter.complete(adapter.begin("k1", "fp"), 200, {})
+        adapter.release(adapter.begin("k2", "fp"))
+        self.clock.now += 3601
+
+        # Act
+        reused = [adapter.begin("k1", "other"), adapter.begin("k2", "fp")]
+
+        # Assert
+        assert [r.status for r in reused] == [IdempotencyStatus.IN_PROGRESS] * 2
+
+
+class TestIdempotentUnitOfWork:
+    """
+    Tests de la respuesta idempotente guardada en la misma transacción que
+    la suscripción.
+    """
+
+    def setup_method(self):
+        """Setup para cada test - reloj controlado."""
+        self.clock = FakeClock()
+
+    def _subscribe(self, unit_of_work, claim):
+        subscription = Subscription(user_id="u001", fund_id="f001",
+                                    amount=100000, status=Status.ACTIVE,
+                                    created_at="2025-08-22T10:00:00")
+        transaction = Transaction(user_id="u001", fund_id="f001",
+                                  amount=100000,
+                                  transaction_type=TransactionType.OPEN,
+                                  timestamp="2025-08-22T10:00:00.000001",
+                                  prev_balance=500000, new_balance=400000)
+        return unit_of_work.subscribe(subscription, transaction, claim)
+
+    def test_crash_after_the_write_replays_instead_of_debiting_again(
+        self, table, dynamodb_resource
+    ):
+        """
+        Si el proceso muere justo después de suscribir, sin completar la
+        clave, el reintento tras vencer el bloqueo repite la respuesta y
+        no vuelve a debitar.
+        """
+        # Arrange
+        table.put({'PK': 'USER#u001', 'SK': 'PROFILE', 'user_id': 'u001',
+                   'balance': 500000})
+        adapter = IdempotencyAdapter(dynamodb_resource, ttl=3600,
+                                     lock_timeout=30, clock=self.clock)
+        unit_of_work = UnitOfWorkAdapter(dynamodb_resource)
+        stored = self._subscribe(unit_of_work, adapter.begin("k1", "fp"))
+        # The process dies here: neither complete nor release runs
+
+        # Act
+        self.clock.now += 31
+        retry = adapter.begin("k1", "fp")
+
+        # Assert
+        assert retry.status == IdempotencyStatus.COMPLETED
+        assert retry.status_code == 200
+        assert retry.body == stored.model_dump(mode='json')
+        assert table.get({'PK': 'USER#u001', 'SK': 'PROFILE'})[
+            'balance'] == 400000
+
+    def test_write_with_a_taken_over_claim_is_rejected(
+        self, table, dynamodb_resource
+    ):
+        """
+        Si otra petición tomó la clave al vencer el bloqueo, la escritura
+        del primer dueño se cancela completa.
+        """
+        # Arrange
+        table.put({'PK': 'USER#u001', 'SK': 'PROFILE', 'user_id': 'u001',
+                   'balance': 500000})
+        adapter = IdempotencyAdapter(dynamodb_resource, ttl=3600,
+                                     lock_timeout=30, clock=self.clock)
+        stale = adapter.begin("k1", "fp")
+        self.clock.now += 31
+        adapter.begin("k1", "fp")
+
+        # Act / Assert
+        with pytest.raises(IdempotencyConflict, match="in progress"):
+            self._subscribe(UnitOfWorkAdapter(dynamodb_resource), stale)
+        assert table.get({'PK': 'USER#u001', 'SK': 'PROFILE'})[
+            'balance'] == 500000
+        adapter.release(stale)
+        with pytest.raises(IdempotencyConflict, match="in progress"):
+            adapter.begin("k1", "fp")
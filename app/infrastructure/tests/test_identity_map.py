@@ -0,0 +1,267 @@
+import asyncio
+
+import pytest
+
+from app.domain.models.requests import BulkSubscribeItem
+from app.domain.models.subscription import Status
+from app.domain.models.user import User
+from app.infrastructure.adapters.identity_map import (
+    IdentityMapFundAdapter,
+    IdentityMapSubscriptionAdapter,
+    IdentityMapUserAdapter,
+    request_scope
+)
+from app.infrastructure.adapters.funds import FundAdapter
+from app.infrastructure.adapters.subscription import SubscriptionAdapter
+from app.infrastructure.adapters.users import UserAdapter
+from app.infrastructure.container import Container
+
+
+def _seed_user(table, user_id="u001", balance=500000):
+    table.put({'PK': f'USER#{user_id}', 'SK': 'PROFILE',
+               'user_id': user_id, 'name': 'Test User',
+               'email': f'{user_id}@example.com', 'phone': '0',
+               'balance': balance, 'notify_channel': 'email'})
+
+
+def _seed_fund(table, fund_id="f001"):
+    table.put({'PK': f'FUND#{fund_id}', 'SK': 'PROFILE', 'fund_id': fund_id,
+               'name': 'Fondo', 'min_amount': 50000, 'category': 'FPV'})
+
+
+def _user(user_id="u001", balance=500000):
+    return User(user_id=user_id, name="Test User",
+                email=f"{user_id}@example.com", phone="0",
+                balance=balance, notify_channel="email")
+
+
+class TestIdentityMapAdapters:
+    """
+    Tests de las lecturas deduplicadas dentro de una petición.
+    """
+
+    def test_repeated_reads_hit_dynamodb_once(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        Leer el mismo usuario varias veces en una petición hace un solo
+        GetItem.
+        """
+        # Arrange
+        _seed_user(table)
+        adapter = IdentityMapUserAdapter(UserAdapter(dynamodb_resource))
+
+        # Act
+        with request_scope() as identity_map:
+            first = adapter.get_by_id("u001")
+            second = adapter.get_by_id("u001")
+
+        # Assert
+        assert first is second
+        assert identity_map.hits == 1
+        assert memory_dynamodb.operations == {'GetItem': 1}
+
+    def test_not_found_is_remembered(
+        self, memory_dynamodb, dynamodb_resource
+    ):
+        """
+        Un usuario inexistente tampoco se vuelve a pedir.
+        """
+        # Arrange
+        adapter = IdentityMapUserAdapter(UserAdapter(dynamodb_resource))
+
+        # Act & Assert
+        with request_scope():
+            for _ in range(2):
+                with pytest.raises(ValueError):
+                    adapter.get_by_id("missing")
+        assert memory_dynamodb.operations == {'GetItem': 1}
+
+    def test_partial_reads_are_not_mapped(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        Un usuario leído con fields no responde lecturas completas, pero
+        uno completo ya leído sí responde las parciales.
+        """
+        # Arrange
+        _seed_user(table)
+        adapter = IdentityMapUserAdapter(UserAdapter(dynamodb_resource))
+
+        # Act
+        with request_scope():
+            partial = adapter.get_by_id("u001", fields=["balance"])
+            full = adapter.get_by_id("u001")
+            again = adapter.get_by_id("u001", fields=["balance"])
+
+        # Assert
+        assert partial.balance == full.balance
+        assert full.name == "Test User"
+        assert again is full
+        assert memory_dynamodb.operations == {'GetItem': 2}
+
+    def test_get_many_reads_only_unseen_ids(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        get_many solo pide las claves que la petición no ha leído.
+        """
+        # Arrange
+        _seed_fund(table, "f001")
+        _seed_fund(table, "f002")
+        adapter = IdentityMapFundAdapter(FundAdapter(dynamodb_resource))
+
+        # Act
+        with request_scope():
+            adapter.get_by_id("f001")
+            funds = adapter.get_many(["f002", "f001", "f003", "f002"])
+            again = adapter.get_many(["f003", "f002"])
+
+        # Assert
+        assert [f.fund_id for f in funds] == ["f002", "f001"]
+        assert [f.fund_id for f in again] == ["f002"]
+        assert memory_dynamodb.operations == {'GetItem': 1, 'BatchGetItem': 1}
+
+    def test_update_result_is_reused(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        El item ALL_NEW devuelto por update se usa en las lecturas
+        siguientes sin releerlo.
+        """
+        # Arrange
+        _seed_user(table)
+        adapter = IdentityMapUserAdapter(UserAdapter(dynamodb_resource))
+
+        # Act
+        with request_scope():
+            adapter.update("u001", balance=123)
+            user = adapter.get_by_id("u001")
+
+        # Assert
+        assert user.balance == 123
+        assert memory_dynamodb.operations == {'UpdateItem': 1}
+
+    def test_listed_subscriptions_are_mapped(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        Las suscripciones listadas de un usuario no se vuelven a leer
+        una por una, y la ausencia de una también se recuerda.
+        """
+        # Arrange
+        table.put({'PK': 'USER#u001', 'SK': 'SUB#f001', 'user_id': 'u001',
+                   'fund_id': 'f001', 'amount': 100000, 'status': 'active',
+                   'created_at': '2025-08-22T10:00:00'})
+        adapter = IdentityMapSubscriptionAdapter(
+            SubscriptionAdapter(dynamodb_resource)
+        )
+
+        # Act
+        with request_scope():
+            listed = list(adapter.list_by_user("u001"))
+            found = adapter.get("u001", "f001")
+            missing = [adapter.get("u001", "f002") for _ in range(2)]
+
+        # Assert
+        assert found == listed[0]
+        assert missing == [None, None]
+        assert memory_dynamodb.operations == {'Query': 1, 'GetItem': 1}
+
+    def test_outside_a_scope_reads_pass_through(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        Fuera de una petición no se guarda nada entre llamadas.
+        """
+        # Arrange
+        _seed_user(table)
+        adapter = IdentityMapUserAdapter(UserAdapter(dynamodb_resource))
+
+        # Act
+        adapter.get_by_id("u001")
+        adapter.get_by_id("u001")
+
+        # Assert
+        assert memory_dynamodb.operations == {'GetItem': 2}
+
+
+class TestIdentityMapUseCases:
+    """
+    Llamadas a DynamoDB por método de caso de uso dentro de una petición.
+    """
+
+    @pytest.fixture
+    def container(self, table, dynamodb_resource, monkeypatch):
+        # Without the process-wide fund cache every fund read is visible
+        monkeypatch.setenv('FUND_CACHE_TTL_SECONDS', '0')
+        _seed_user(table)
+        _seed_fund(table)
+        container = Container(dynamodb_resource)
+        yield container
+        container.executor.shutdown()
+
+    def test_subscribe(self, memory_dynamodb, container):
+        """
+        Suscribir lee el fondo y escribe todo en una transacción.
+        """
+        # Act
+        with request_scope():
+            container.subscription_use_case.subscribe(
+                fund_id="f001", user=_user(), amount=100000
+            )
+
+        # Assert
+        assert memory_dynamodb.operations == {
+            'GetItem': 1, 'TransactWriteItems': 1
+        }
+
+    def test_subscribe_then_cancel_reuses_what_was_written(
+        self, memory_dynamodb, container
+    ):
+        """
+        Cancelar en la misma petición no relee el fondo ni la
+        suscripción recién escrita.
+        """
+        # Arrange
+        use_case = container.subscription_use_case
+
+        # Act
+        with request_scope():
+            use_case.subscribe(fund_id="f001", user=_user(), amount=100000)
+            cancelled = use_case.cancel_subscription(
+                fund_id="f001", user=_user(balance=400000)
+            )
+
+        # Assert
+        assert cancelled.status == Status.CANCELLED
+        assert memory_dynamodb.operations == {
+            'GetItem': 1, 'TransactWriteItems': 2
+        }
+
+    def test_subscribe_many(self, memory_dynamodb, table, container):
+        """
+        La suscripción masiva no vuelve a leer los usuarios ya leídos
+        en la petición.
+        """
+        # Arrange
+        _seed_user(table, "u002")
+        use_case = container.async_subscription_use_case
+        items = [BulkSubscribeItem(user_id="u001", amount=100000),
+                 BulkSubscribeItem(user_id="u002", amount=100000)]
+
+        async def run():
+            with request_scope():
+                container.user_port.get_by_id("u001")
+                return await use_case.subscribe_many(
+                    fund_id="f001", items=items
+                )
+
+        # Act
+        report = asyncio.run(run())
+
+        # Assert
+        assert report.succeeded == 2
+        assert memory_dynamodb.operations == {
+            'GetItem': 2, 'BatchGetItem': 1, 'TransactWriteItems': 1
+        }
@@ -0,0 +1,93 @@
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from app.infrastructure.adapters.ids import (
+    UlidGenerator,
+    epoch_ms,
+    is_ulid,
+    new_ulid,
+    ulid_ceiling,
+    ulid_floor
+)
+
+
+def _ulids(count):
+    return [new_ulid(1_700_000_000_000) for _ in range(count)]
+
+
+class TestUlidGenerator:
+    """
+    Tests de los ids ordenables por tiempo de las transacciones.
+    """
+
+    def test_ids_in_the_same_millisecond_are_increasing(self):
+        """
+        Los ids del mismo milisegundo son únicos y crecientes.
+        """
+        # Arrange
+        generator = UlidGenerator()
+
+        # Act
+        ids = [generator.new(1_700_000_000_000) for _ in range(1000)]
+
+        # Assert
+        assert all(is_ulid(value) for value in ids)
+        assert ids == sorted(ids)
+        assert len(set(ids)) == 1000
+
+    def test_ids_sort_by_time(self):
+        """
+        Un id de un milisegundo posterior ordena después.
+        """
+        # Arrange
+        generator = UlidGenerator()
+
+        # Act
+        ids = [generator.new(ms) for ms in (5, 1000, 2 ** 40, 2 ** 47)]
+
+        # Assert
+        assert ids == sorted(ids)
+
+    def test_concurrent_threads_never_repeat_an_id(self):
+        """
+        100.000 ids pedidos desde varios hilos a la vez son únicos.
+        """
+        # Act
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            batches = list(executor.map(_ulids, [12_500] * 8))
+
+        # Assert
+        ids = [value for batch in batches for value in batch]
+        assert len(set(ids)) == 100_000
+
+    def test_forked_processes_draw_their_own_ids(self):
+        """
+        Un proceso hijo no continúa la secuencia del padre.
+        """
+        # Arrange
+        new_ulid(1_700_000_000_000)
+        context = multiprocessing.get_context('fork')
+
+        # Act
+        with context.Pool(4) as pool:
+            batches = pool.map(_ulids, [1000] * 4)
+
+        # Assert
+        ids = [value for batch in batches for value in batch]
+        assert len(set(ids)) == 4000
+
+    def test_floor_and_ceiling_bound_the_millisecond(self):
+        """
+        Todo id de un instante queda entre su piso y su techo.
+        """
+        # Arrange
+        moment = datetime(2025, 8, 22, 10, 0, 0, 123000)
+
+        # Act
+        value = new_ulid(epoch_ms(moment))
+
+        # Assert
+        assert ulid_floor(moment) <= value <= ulid_ceiling(moment)
+        aware = moment.replace(tzinfo=timezone.utc)
+        assert epoch_ms(aware) == epoch_ms(moment)
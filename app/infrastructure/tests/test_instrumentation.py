@@ -0,0 +1,99 @@
+from datetime import datetime
+
+from app.infrastructure.adapters.transactions import TransactionAdapter
+from app.infrastructure.adapters.users import UserAdapter
+from app.infrastructure.instrumentation import collect, instrument
+
+
+def _seed_user(table, user_id):
+    table.put({'PK': f'USER#{user_id}', 'SK': 'PROFILE',
+               'user_id': user_id, 'name': 'Test User',
+               'email': f'{user_id}@example.com', 'phone': '0',
+               'balance': 500000, 'notify_channel': 'email'})
+
+
+class TestDynamoDBInstrumentation:
+    """
+    Tests de la medición de capacidad y latencia por llamada a DynamoDB.
+    """
+
+    def test_records_capacity_items_and_time_per_operation(
+            self, table, dynamodb_resource
+            ):
+        """
+        Cada operación acumula llamadas, RCU, items devueltos y tiempo;
+        las consultas a un GSI se registran con el nombre del índice.
+        """
+        # Arrange
+        _seed_user(table, "u001")
+        for index in range(3):
+            table.put({'PK': 'USER#u001', 'SK': f'TX#{index:06d}',
+                       'user_id': 'u001', 'fund_id': 'f001',
+                       'amount': 1000, 'transaction_type': 'open',
+                       'timestamp': f'2025-08-22T10:00:0{index}',
+                       'tx_bucket': 'TXB#2025-08-22',
+                       'prev_balance': 0, 'new_balance': 0})
+        instrument(dynamodb_resource.meta.client)
+        users = UserAdapter(dynamodb_resource)
+        transactions = TransactionAdapter(dynamodb_resource)
+
+        # Act
+        with collect() as metrics:
+            users.get_by_id("u001")
+            users.get_by_id("u001")
+            transactions.get_by_user_page("u001", limit=10)
+            transactions.get_all_page(
+                limit=2, since=datetime(2025, 8, 22, 10)
+            )
+
+        # Assert
+        get_item = metrics.operations['GetItem']
+        assert (get_item.calls, get_item.read_units, get_item.items) == (
+            2, 1.0, 2
+        )
+        assert metrics.operations['Query'].items == 3
+        assert metrics.operations['Query:tx_time-index'].calls == 1
+        assert metrics.total().elapsed_ms > 0
+        assert 'ddb-Query.tx_time-index;dur=' in metrics.server_timing()
+
+    def test_calls_on_worker_threads_count_for_the_request(
+            self, memory_dynamodb, table, dynamodb_resource
+            ):
+        """
+        Los lotes de BatchGetItem leídos en paralelo se atribuyen al
+        request que los pidió.
+        """
+        # Arrange
+        for index in range(250):
+            _seed_user(table, f"u{index:03d}")
+        instrument(dynamodb_resource.meta.client)
+        users = UserAdapter(dynamodb_resource)
+
+        # Act
+        with collect() as metrics:
+            users.get_many([f"u{index:03d}" for index in range(250)])
+
+        # Assert
+        assert metrics.operations['BatchGetItem'].calls == 3
+        assert metrics.operations['BatchGetItem'].items == 250
+
+    def test_nothing_is_recorded_outside_a_request(
+            self, table, dynamodb_resource
+            ):
+        """
+        Fuera de collect() no se pide ConsumedCapacity ni se registra nada.
+        """
+        # Arrange
+        _seed_user(table, "u001")
+        instrument(dynamodb_resource.meta.client)
+        app_table = dynamodb_resource.Table('AppChallenge')
+
+        # Act
+        with collect() as metrics:
+            pass
+        response = app_table.get_item(Key={'PK': 'USER#u001',
+                                           'SK': 'PROFILE'})
+
+        # Assert
+        assert 'ConsumedCapacity' not in response
+        assert metrics.operations == {}
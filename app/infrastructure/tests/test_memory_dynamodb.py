@@ -0,0 +1,134 @@
+import pytest
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
+
+
+def _seed_transactions(table, user_id, count, padding=0):
+    for index in range(count):
+        table.put({
+            'PK': f'USER#{user_id}',
+            'SK': f'TX#{index:06d}',
+            'tx_bucket': 'TXB#2025-08-22',
+            'timestamp': f'2025-08-22T10:00:00.{index:06d}',
+            'amount': 75000,
+            'notes': 'x' * padding
+        })
+
+
+class TestMemoryDynamoDBReads:
+    """
+    Tests de las reglas de Query/Scan que el emulador reproduce.
+    """
+
+    def test_limit_counts_evaluated_items_before_the_filter(
+            self, dynamodb_resource, table
+            ):
+        """
+        Limit corta por items evaluados: con un filtro que descarta casi
+        todo, la página vuelve con pocos items y LastEvaluatedKey.
+        """
+        # Arrange
+        _seed_transactions(table, "u001", 30)
+        table.put({'PK': 'USER#u001', 'SK': 'TX#000005', 'amount': 1})
+        app_table = dynamodb_resource.Table('AppChallenge')
+
+        # Act
+        response = app_table.query(
+            KeyConditionExpression=Key('PK').eq('USER#u001'),
+            FilterExpression=Attr('amount').eq(1),
+            Limit=10
+        )
+
+        # Assert
+        assert response['ScannedCount'] == 10
+        assert response['Count'] == 1
+        assert response['LastEvaluatedKey'] == {
+            'PK': 'USER#u001', 'SK': 'TX#000009'
+        }
+
+    def test_pages_are_cut_at_one_megabyte(self, dynamodb_resource, table):
+        """
+        Sin Limit, la página se corta al acumular 1 MB de items leídos.
+        """
+        # Arrange
+        _seed_transactions(table, "u001", 100, padding=30000)
+        app_table = dynamodb_resource.Table('AppChallenge')
+
+        # Act
+        response = app_table.query(
+            KeyConditionExpression=Key('PK').eq('USER#u001')
+        )
+
+        # Assert
+        assert 30 <= response['Count'] < 40
+        assert 'LastEvaluatedKey' in response
+
+    def test_scan_charges_every_evaluated_item(self, dynamodb_resource, table):
+        """
+        Un Scan filtrado cobra lo leído de toda la tabla; un Query con
+        begins_with cobra sólo la partición.
+        """
+        # Arrange
+        for user in range(50):
+            _seed_transactions(table, f"u{user:03d}", 20, padding=500)
+        app_table = dynamodb_resource.Table('AppChallenge')
+
+        # Act
+        scan = app_table.scan(
+            FilterExpression=Attr('PK').eq('USER#u007'),
+            ReturnConsumedCapacity='TOTAL'
+        )
+        query = app_table.query(
+            KeyConditionExpression=(
+                Key('PK').eq('USER#u007') & Key('SK').begins_with('TX#')
+            ),
+            ReturnConsumedCapacity='TOTAL'
+        )
+
+        # Assert
+        assert scan['Count'] == query['Count'] == 20
+        assert scan['ScannedCount'] == 1000
+        assert query['ConsumedCapacity']['CapacityUnits'] == 1.5
+        assert scan['ConsumedCapacity']['CapacityUnits'] > 60
+
+    def test_index_capacity_is_reported_per_index(
+            self, dynamodb_resource, table
+            ):
+        """
+        Con ReturnConsumedCapacity=INDEXES el consumo de un GSI se
+        informa bajo GlobalSecondaryIndexes.
+        """
+        # Arrange
+        _seed_transactions(table, "u001", 5)
+        app_table = dynamodb_resource.Table('AppChallenge')
+
+        # Act
+        response = app_table.query(
+            IndexName='tx_time-index',
+            KeyConditionExpression=(
+                Key('tx_bucket').eq('TXB#2025-08-22') &
+                Key('timestamp').gte('2025-08-22T10:00:00.000003')
+            ),
+            ReturnConsumedCapacity='INDEXES'
+        )
+
+        # Assert
+        assert response['Count'] == 2
+        assert response['ConsumedCapacity']['GlobalSecondaryIndexes'] == {
+            'tx_time-index': {'CapacityUnits': 0.5}
+        }
+
+    def test_consistent_reads_on_an_index_are_rejected(
+            self, dynamodb_resource
+            ):
+        """
+        Los GSI no admiten lecturas consistentes.
+        """
+        app_table = dynamodb_resource.Table('AppChallenge')
+
+        with pytest.raises(ClientError, match='Consistent reads'):
+            app_table.query(
+                IndexName='tx_time-index',
+                KeyConditionExpression=Key('tx_bucket').eq('TXB#2025-08-22'),
+                ConsistentRead=True
+            )
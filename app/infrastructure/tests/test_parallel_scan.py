@@ -0,0 +1,143 @@
+import io
+import json
+import threading
+from datetime import datetime
+
+import pytest
+
+from app.application.ports.errors import InvalidTimeRange
+from app.infrastructure.adapters.parallel_scan import parallel_scan
+from app.infrastructure.adapters.transactions import TransactionAdapter
+from app.infrastructure.jobs.export_transactions import export_transactions
+from app.use_cases.transactions import TransactionUseCase
+
+
+def _seed(table, users=40, per_user=5):
+    for user in range(users):
+        table.put({'PK': f'USER#u{user:03d}', 'SK': 'PROFILE'})
+        for index in range(per_user):
+            minute = (user * per_user + index) % 60
+            table.put({
+                'PK': f'USER#u{user:03d}',
+                'SK': f'TX#{index:04d}',
+                'user_id': f'u{user:03d}',
+                'fund_id': 'f001',
+                'amount': 75000,
+                'transaction_type': 'open',
+                'timestamp': f'2025-08-{10 + user % 20:02d}T10:{minute:02d}:00',
+                'tx_bucket': f'TXB#2025-08-{10 + user % 20:02d}',
+                'prev_balance': 500000,
+                'new_balance': 425000
+            })
+
+
+class TestParallelScan:
+    """
+    Tests del scan paralelo por segmentos usado para exportaciones.
+    """
+
+    def test_parallel_export_matches_sequential_scan(
+            self, table, dynamodb_resource
+            ):
+        """
+        Los segmentos cubren la tabla completa sin duplicados.
+        """
+        # Arrange
+        _seed(table)
+        adapter = TransactionAdapter(dynamodb_resource)
+
+        # Act
+        sequential = list(adapter.get_all(limit=None))
+        parallel = list(adapter.get_all_parallel(total_segments=4))
+
+        # Assert
+        key = lambda t: (t.user_id, t.timestamp)  # noqa: E731
+        assert len(parallel) == 200
+        assert sorted(parallel, key=key) == sorted(sequential, key=key)
+
+    def test_ordered_export_is_sorted_by_timestamp(
+            self, memory_dynamodb, table, dynamodb_resource
+            ):
+        """
+        El modo ordenado devuelve las transacciones por timestamp,
+        consultando el índice por día en lugar de ordenar un scan.
+        """
+        # Arrange
+        _seed(table)
+        adapter = TransactionAdapter(dynamodb_resource)
+        memory_dynamodb.operations.clear()
+
+        # Act
+        timestamps = [
+            t.timestamp
+            for t in adapter.get_all_parallel(
+                total_segments=4, since=datetime(2025, 8, 12), ordered=True
+            )
+        ]
+
+        # Assert
+        assert len(timestamps) == 180
+        assert timestamps == sorted(timestamps)
+        assert 'Scan' not in memory_dynamodb.operations
+
+    def test_ordered_export_needs_since(self, table, dynamodb_resource):
+        """
+        Sin since el export ordenado se rechaza: no se ordena la tabla
+        completa en memoria.
+        """
+        # Arrange
+        adapter = TransactionAdapter(dynamodb_resource)
+
+        # Act / Assert
+        with pytest.raises(InvalidTimeRange):
+            adapter.get_all_parallel(total_segments=4, ordered=True)
+
+    def test_export_job_dumps_the_table_with_segments(
+            self, memory_dynamodb, table, dynamodb_resource
+            ):
+        """
+        El job de exportación escribe una línea NDJSON por transacción,
+        leyendo la tabla por segmentos.
+        """
+        # Arrange
+        _seed(table)
+        use_case = TransactionUseCase(TransactionAdapter(dynamodb_resource))
+        out = io.StringIO()
+        memory_dynamodb.operations.clear()
+
+        # Act
+        count = export_transactions(use_case, out, total_segments=4)
+
+        # Assert
+        lines = out.getvalue().splitlines()
+        assert count == len(lines) == 200
+        assert {json.loads(line)['fund_id'] for line in lines} == {'f001'}
+        assert memory_dynamodb.operations['Scan'] >= 4
+
+    def test_backpressure_bounds_pages_read_ahead(
+            self, memory_dynamodb, table, dynamodb_resource
+            ):
+        """
+        Si el consumidor se detiene, los workers no siguen leyendo la
+        tabla: las páginas leídas quedan acotadas por el buffer.
+        """
+        # Arrange
+        _seed(table, users=100, per_user=10)
+        threads_before = threading.active_count()
+
+        # Act
+        items = parallel_scan(
+            dynamodb_resource.meta.client,
+            {'TableName': 'AppChallenge'},
+            total_segments=2,
+            max_buffered_pages=1,
+            page_size=10
+        )
+        consumed = [next(items) for _ in range(15)]
+        items.close()
+
+        # Assert
+        assert len(consumed) == 15
+        # 2 páginas consumidas + 1 en buffer + 1 bloqueada por worker
+        assert memory_dynamodb.operations['Scan'] <= 5
+        assert threading.active_count() == threads_before
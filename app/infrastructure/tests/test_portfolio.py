@@ -0,0 +1,131 @@
+from app.domain.models.subscription import Subscription, Status
+from app.domain.models.transaction import Transaction, TransactionType
+from app.infrastructure.adapters.portfolio import PortfolioAdapter
+from app.infrastructure.adapters.unit_of_work import UnitOfWorkAdapter
+from app.infrastructure.jobs.rebuild_portfolios import (
+    rebuild_portfolio,
+    rebuild_portfolios
+)
+
+
+def _seed_user(table, user_id, balance=500000):
+    table.put({'PK': f'USER#{user_id}', 'SK': 'PROFILE',
+               'user_id': user_id, 'name': 'Test User',
+               'balance': balance, 'notify_channel': 'email'})
+
+
+def _seed_subscription(table, user_id, fund_id, amount, status='active'):
+    table.put({'PK': f'USER#{user_id}', 'SK': f'SUB#{fund_id}',
+               'user_id': user_id, 'fund_id': fund_id, 'amount': amount,
+               'status': status, 'created_at': '2025-08-22T10:00:00'})
+
+
+def _entry(fund_id, amount, timestamp, prev_balance=500000):
+    subscription = Subscription(user_id="u001", fund_id=fund_id,
+                                amount=amount, status=Status.ACTIVE,
+                                created_at="2025-08-22T10:00:00")
+    transaction = Transaction(user_id="u001", fund_id=fund_id, amount=amount,
+                              transaction_type=TransactionType.OPEN,
+                              timestamp=timestamp, prev_balance=prev_balance,
+                              new_balance=prev_balance - amount)
+    return subscription, transaction
+
+
+class TestPortfolioSummary:
+    """
+    Tests del resumen de portafolio mantenido por la unidad de trabajo.
+    """
+
+    def test_subscribe_and_cancel_keep_the_summary(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        Cada suscripción suma al resumen y cada cancelación lo descuenta,
+        en la misma transacción.
+        """
+        # Arrange
+        _seed_user(table, "u001")
+        unit_of_work = UnitOfWorkAdapter(dynamodb_resource)
+        portfolio = PortfolioAdapter(dynamodb_resource)
+        first = _entry("f001", 100000, "2025-08-22T10:00:00.000001")
+        second = _entry("f002", 75000, "2025-08-22T10:00:00.000002", 400000)
+        unit_of_work.subscribe(*first)
+        unit_of_work.subscribe(*second)
+        close = _entry("f001", 100000, "2025-08-22T10:00:00.000003",
+                       325000)[1]
+
+        # Act
+        opened = portfolio.get("u001")
+        unit_of_work.cancel(first[0], close)
+        memory_dynamodb.reset_metrics()
+        after_cancel = portfolio.get("u001")
+
+        # Assert
+        assert opened.fund_ids == ["f001", "f002"]
+        assert opened.amounts == {"f001": 100000, "f002": 75000}
+        assert opened.total_invested == 175000
+        assert after_cancel.fund_ids == ["f002"]
+        assert after_cancel.total_invested == 75000
+        assert memory_dynamodb.operations == {'GetItem': 1}
+
+    def test_user_without_investments_has_an_empty_portfolio(
+        self, dynamodb_resource
+    ):
+        """
+        Un usuario sin suscripciones tiene un portafolio vacío.
+        """
+        # Act
+        result = PortfolioAdapter(dynamodb_resource).get("u404")
+
+        # Assert
+        assert result.fund_ids == []
+        assert result.total_invested == 0
+
+
+class TestRebuildPortfolios:
+    """
+    Tests del job que recalcula los resúmenes desde los items SUB#.
+    """
+
+    def test_rebuilds_missing_and_stale_summaries(
+        self, table, dynamodb_resource
+    ):
+        """
+        Se crean los resúmenes faltantes, se corrigen los desactualizados
+        y una segunda pasada no encuentra nada que hacer.
+        """
+        # Arrange
+        _seed_subscription(table, "u001", "f001", 100000)
+        _seed_subscription(table, "u001", "f002", 50000, status='cancelled')
+        _seed_subscription(table, "u002", "f003", 80000)
+        table.put({'PK': 'USER#u002', 'SK': 'PORTFOLIO', 'user_id': 'u002',
+                   'total_invested': 1, 'amount#f009': 1, 'version': 4})
+        portfolio = PortfolioAdapter(dynamodb_resource)
+
+        # Act
+        first = rebuild_portfolios(dynamodb_resource, 'AppChallenge')
+        second = rebuild_portfolios(dynamodb_resource, 'AppChallenge')
+
+        # Assert
+        assert (first, second) == (2, 0)
+        assert portfolio.get("u001").amounts == {"f001": 100000}
+        assert portfolio.get("u002").amounts == {"f003": 80000}
+        assert portfolio.get("u002").total_invested == 80000
+        summary = table.get({'PK': 'USER#u002', 'SK': 'PORTFOLIO'})
+        assert summary['version'] == 5
+
+    def test_rebuild_single_user(self, table, dynamodb_resource):
+        """
+        Se puede recalcular el resumen de un solo usuario.
+        """
+        # Arrange
+        _seed_subscription(table, "u001", "f001", 100000)
+        _seed_subscription(table, "u001", "f002", 60000)
+
+        # Act
+        result = rebuild_portfolio(dynamodb_resource, 'AppChallenge', "u001")
+
+        # Assert
+        assert result.total_invested == 160000
+        stored = PortfolioAdapter(dynamodb_resource).get("u001")
+        assert stored.amounts == {"f001": 100000, "f002": 60000}
@@ -0,0 +1,213 @@
+import pytest
+
+from app.application.ports.errors import InvalidCursor
+from app.domain.models.partial import PartialRecord
+from app.infrastructure.adapters.subscription import SubscriptionAdapter
+from app.infrastructure.jobs.backfill_subscriber_index import (
+    backfill_subscriber_index
+)
+from app.domain.models.subscription import Status, Subscription
+
+
+def _seed_subscription(table, user_id, fund_id, status="active", **extra):
+    table.put({
+        'PK': f'USER#{user_id}',
+        'SK': f'SUB#{fund_id}',
+        'user_id': user_id,
+        'fund_id': fund_id,
+        'amount': 75000,
+        'status': status,
+        'created_at': "2025-08-22T10:00:00",
+        **extra
+    })
+
+
+class TestSubscriptionAdapterListByUser:
+    """
+    Tests de list_by_user contra la tabla en memoria.
+    """
+
+    def test_queries_only_the_user_partition(self, table, dynamodb_resource):
+        """
+        list_by_user debe usar Query sobre la partición del usuario,
+        sin leer items de otros usuarios ni de otro tipo.
+        """
+        # Arrange
+        _seed_subscription(table, "u001", "f001")
+        _seed_subscription(table, "u001", "f002")
+        for index in range(200):
+            _seed_subscription(table, f"u{index + 100}", "f001")
+        table.put({'PK': 'USER#u001', 'SK': 'PROFILE', 'user_id': 'u001'})
+        adapter = SubscriptionAdapter(dynamodb_resource)
+
+        # Act
+        subscriptions = list(adapter.list_by_user("u001"))
+
+        # Assert
+        assert [s.fund_id for s in subscriptions] == ["f001", "f002"]
+        assert table.read_units == 0.5
+
+    def test_follows_last_evaluated_key_across_pages(
+            self, memory_dynamodb, dynamodb_resource
+            ):
+        """
+        Un portafolio que supera la página de 1 MB debe devolverse completo.
+        """
+        # Arrange
+        table = memory_dynamodb.tables['AppChallenge']
+        for index in range(120):
+            _seed_subscription(
+                table, "u001", f"f{index:03d}", notes="x" * 20000
+            )
+        adapter = SubscriptionAdapter(dynamodb_resource)
+
+        # Act
+        subscriptions = list(adapter.list_by_user("u001"))
+
+        # Assert
+        assert len(subscriptions) == 120
+        assert memory_dynamodb.operations['Query'] == 3
+
+    def test_pushes_status_filter_down(self, table, dynamodb_resource):
+        """
+        El filtro por estado se resuelve en DynamoDB.
+        """
+        # Arrange
+        _seed_subscription(table, "u001", "f001", status="active")
+        _seed_subscription(table, "u001", "f002", status="cancelled")
+        adapter = SubscriptionAdapter(dynamodb_resource)
+
+        # Act
+        subscriptions = list(
+            adapter.list_by_user("u001", status=Status.CANCELLED)
+        )
+
+        # Assert
+        assert [s.fund_id for s in subscriptions] == ["f002"]
+        assert subscriptions[0].status == Status.CANCELLED
+
+    def test_fields_read_partial_subscriptions(self, table, dynamodb_resource):
+        """
+        Con fields se proyectan solo esos atributos, también junto al
+        filtro por estado.
+        """
+        # Arrange
+        _seed_subscription(table, "u001", "f001", status="active")
+        _seed_subscription(table, "u001", "f002", status="cancelled")
+        adapter = SubscriptionAdapter(dynamodb_resource)
+
+        # Act
+        one = adapter.get("u001", "f001", fields=("status", "amount"))
+        listed = list(adapter.list_by_user(
+            "u001", status=Status.CANCELLED, fields=("fund_id",)
+        ))
+
+        # Assert
+        assert isinstance(one, PartialRecord)
+        assert (one.status, one.amount) == (Status.ACTIVE, 75000)
+        with pytest.raises(AttributeError):
+            one.created_at
+        assert [s.fund_id for s in listed] == ["f002"]
+        assert adapter.get("u001", "f404", fields=("status",)) is None
+
+
+def _subscription(user_id, fund_id="f001"):
+    return Subscription(user_id=user_id, fund_id=fund_id, amount=75000,
+                        status=Status.ACTIVE,
+                        created_at="2025-08-22T10:00:00")
+
+
+class TestSubscriptionAdapterListByFund:
+    """
+    Tests de list_by_fund sobre el índice disperso fund_status-index.
+    """
+
+    def test_lists_a_fund_status_with_one_query(
+            self, memory_dynamodb, table, dynamodb_resource
+            ):
+        """
+        Los suscriptores activos de un fondo se leen con un Query sobre el
+        índice, sin cancelados, otros fondos ni otros items.
+        """
+        # Arrange
+        adapter = SubscriptionAdapter(dynamodb_resource)
+        for index in range(5):
+            adapter.save(_subscription(f"u{index:03d}"))
+            adapter.save(_subscription(f"u{index:03d}", "f002"))
+        adapter.cancel("u001", "f001")
+        table.put({'PK': 'FUND#f001', 'SK': 'PROFILE', 'fund_id': 'f001'})
+        memory_dynamodb.reset_metrics()
+
+        # Act
+        active, cursor = adapter.list_by_fund("f001")
+        cancelled, _ = adapter.list_by_fund("f001", Status.CANCELLED.value)
+
+        # Assert
+        assert [s.user_id for s in active] == [
+            "u000", "u002", "u003", "u004"
+        ]
+        assert cursor is None
+        assert [s.user_id for s in cancelled] == ["u001"]
+        assert memory_dynamodb.operations == {'Query': 2}
+
+    def test_cursor_walks_every_shard(
+            self, monkeypatch, memory_dynamodb, dynamodb_resource
+            ):
+        """
+        Con el índice particionado el cursor recorre todas las
+        particiones, cada suscriptor exactamente una vez.
+        """
+        # Arrange
+        monkeypatch.setenv('SUBSCRIBER_INDEX_SHARDS', '4')
+        adapter = SubscriptionAdapter(dynamodb_resource)
+        for index in range(23):
+            adapter.save(_subscription(f"u{index:03d}"))
+
+        # Act
+        seen, cursor = [], None
+        while True:
+            page, cursor = adapter.list_by_fund("f001", limit=5, cursor=cursor)
+            seen.extend(s.user_id for s in page)
+            if cursor is None:
+                break
+
+        # Assert
+        assert sorted(seen) == [f"u{index:03d}" for index in range(23)]
+        assert len(seen) == 23
+
+    def test_cursor_of_another_fund_is_rejected(self, dynamodb_resource):
+        """
+        Un cursor de otro fondo no se puede usar para este listado.
+        """
+        # Arrange
+        adapter = SubscriptionAdapter(dynamodb_resource)
+        for index in range(3):
+            adapter.save(_subscription(f"u{index:03d}", "f002"))
+        _, cursor = adapter.list_by_fund("f002", limit=1)
+
+        # Act & Assert
+        with pytest.raises(InvalidCursor):
+            adapter.list_by_fund("f001", cursor=cursor)
+
+    def test_backfill_indexes_existing_subscriptions(
+            self, table, dynamodb_resource
+            ):
+        """
+        Las suscripciones previas al índice aparecen tras el backfill.
+        """
+        # Arrange
+        for index in range(3):
+            _seed_subscription(table, f"u{index:03d}", "f001")
+        adapter = SubscriptionAdapter(dynamodb_resource)
+        assert adapter.list_by_fund("f001") == ([], None)
+
+        # Act
+        updated = backfill_subscriber_index(
+            dynamodb_resource, 'AppChallenge', total_segments=2
+        )
+        again = backfill_subscriber_index(dynamodb_resource, 'AppChallenge')
+
+        # Assert
+        assert (updated, again) == (3, 0)
+        subscriptions, _ = adapter.list_by_fund("f001")
+        assert len(subscriptions) == 3
@@ -0,0 +1,447 @@
+import os
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+
+from app.application.ports.errors import InvalidCursor
+from app.domain.models.transaction import Transaction, TransactionType
+from app.infrastructure.adapters import transactions
+from app.infrastructure.adapters.transactions import TransactionAdapter
+from app.infrastructure.jobs.backfill_transaction_buckets import (
+    backfill_transaction_buckets
+)
+from app.infrastructure.jobs.rekey_transactions import rekey_transactions
+
+
+def _seed_transaction(table, user_id, index, fund_id="f001"):
+    timestamp = f"2025-08-22T10:{index // 60:02d}:{index % 60:02d}"
+    table.put({
+        'PK': f'USER#{user_id}',
+        'SK': f'TX#{index:06d}',
+        'user_id': user_id,
+        'fund_id': fund_id,
+        'amount': 75000,
+        'transaction_type': 'open',
+        'timestamp': timestamp,
+        'prev_balance': 500000,
+        'new_balance': 425000
+    })
+
+
+class TestTransactionAdapterPagination:
+    """
+    Tests de paginación por cursor del adapter de transacciones.
+    """
+
+    def test_get_all_fills_limit_despite_sparse_transactions(
+            self, table, dynamodb_resource
+            ):
+        """
+        El límite aplica sobre transacciones, no sobre items evaluados:
+        aunque la mayoría de items no sean TX#, se devuelven `limit`.
+        """
+        # Arrange
+        for index in range(300):
+            table.put({'PK': f'USER#x{index}', 'SK': 'PROFILE'})
+        for index in range(30):
+            _seed_transaction(table, f"u{index}", index)
+        adapter = TransactionAdapter(dynamodb_resource)
+
+        # Act
+        transactions = list(adapter.get_all(limit=20, page_size=25))
+
+        # Assert
+        assert len(transactions) == 20
+
+    def test_cursor_walks_user_history_without_gaps(
+            self, table, dynamodb_resource
+            ):
+        """
+        Recorrer el historial con el cursor devuelve cada transacción
+        exactamente una vez y termina con cursor nulo.
+        """
+        # Arrange
+        for index in range(23):
+            _seed_transaction(table, "u001", index)
+        adapter = TransactionAdapter(dynamodb_resource)
+
+        # Act
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = adapter.get_by_user_page(
+                "u001", limit=10, cursor=cursor
+            )
+            seen.extend(page)
+            if cursor is None:
+                break
+
+        # Assert
+        assert len(seen) == 23
+        assert len({t.timestamp for t in seen}) == 23
+
+    def test_iteration_fetches_pages_lazily(
+            self, memory_dynamodb, table, dynamodb_resource
+            ):
+        """
+        El generador sólo pide la siguiente página cuando se consume.
+        """
+        # Arrange
+        for index in range(50):
+            _seed_transaction(table, "u001", index)
+        adapter = TransactionAdapter(dynamodb_resource)
+
+        # Act
+        transactions = adapter.get_by_user("u001", limit=None, page_size=10)
+        first = [next(transactions) for _ in range(10)]
+
+        # Assert
+        assert len(first) == 10
+        assert memory_dynamodb.operations['Query'] == 1
+        assert len(list(transactions)) == 40
+
+    def test_invalid_cursor_is_rejected(self, dynamodb_resource):
+        """
+        Un cursor corrupto debe rechazarse con InvalidCursor.
+        """
+        adapter = TransactionAdapter(dynamodb_resource)
+
+        with pytest.raises(InvalidCursor):
+            adapter.get_by_user_page("u001", cursor="not-a-cursor")
+
+
+class TestTransactionRows:
+    """
+    Tests de la lectura de transacciones como filas sin validar.
+    """
+
+    def test_rows_page_matches_transactions_page(
+            self, table, dynamodb_resource
+            ):
+        """
+        Las filas tienen los mismos datos y el mismo cursor que los
+        modelos de la página equivalente.
+        """
+        # Arrange
+        for index in range(15):
+            _seed_transaction(table, "u001", index)
+        adapter = TransactionAdapter(dynamodb_resource)
+
+        # Act
+        transactions, cursor = adapter.get_by_user_page("u001", limit=10)
+        rows, rows_cursor = adapter.get_by_user_rows_page("u001", limit=10)
+
+        # Assert
+        assert rows_cursor == cursor
+        assert [asdict(row) for row in rows] == [
+            t.model_dump(mode='json') for t in transactions
+        ]
+        assert all(type(row.amount) is int for row in rows)
+
+
+def _transaction(user_id, timestamp):
+    return Transaction(
+        user_id=user_id,
+        fund_id="f001",
+        amount=75000,
+        transaction_type=TransactionType.OPEN,
+        timestamp=timestamp,
+        prev_balance=500000,
+        new_balance=425000
+    )
+
+
+class TestTransactionTimeIndex:
+    """
+    Tests de consultas por rango de fechas sobre tx_time-index.
+    """
+
+    def test_since_reads_only_the_window_in_time_order(
+            self, memory_dynamodb, table, dynamodb_resource
+            ):
+        """
+        get_all(since) consulta sólo los buckets de la ventana y devuelve
+        las transacciones ordenadas por timestamp.
+        """
+        # Arrange
+        adapter = TransactionAdapter(dynamodb_resource)
+        now = datetime.now()
+        for days_ago in range(60):
+            for user in range(5):
+                moment = now - timedelta(days=days_ago, minutes=user)
+                adapter.save(_transaction(f"u{user}", moment.isoformat()))
+        memory_dynamodb.reset_metrics()
+        since = now - timedelta(days=2, hours=1)
+
+        # Act
+        transactions = list(adapter.get_all(limit=None, since=since))
+
+        # Assert
+        timestamps = [t.timestamp for t in transactions]
+        assert len(transactions) == 15
+        assert timestamps == sorted(timestamps)
+        assert memory_dynamodb.operations['Scan'] == 0
+        assert memory_dynamodb.operations['Query'] <= 4
+
+    def test_since_cursor_resumes_across_buckets(self, dynamodb_resource):
+        """
+        El cursor de una consulta por fechas retoma en el bucket correcto.
+        """
+        # Arrange
+        adapter = TransactionAdapter(dynamodb_resource)
+        now = datetime.now()
+        for hours_ago in range(0, 72, 4):
+            moment = now - timedelta(hours=hours_ago)
+            adapter.save(_transaction("u001", moment.isoformat()))
+        since = now - timedelta(days=4)
+
+        # Act
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = adapter.get_all_page(
+                limit=5, since=since, cursor=cursor
+            )
+            seen.extend(t.timestamp for t in page)
+            if cursor is None:
+                break
+
+        # Assert
+        assert len(seen) == 18
+        assert seen == sorted(seen)
+
+    def test_offset_since_is_read_in_utc(
+            self, memory_dynamodb, dynamodb_resource
+            ):
+        """
+        Un since con zona horaria se pasa a UTC antes de elegir el primer
+        bucket y comparar timestamps.
+        """
+        # Arrange
+        adapter = TransactionAdapter(dynamodb_resource)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        for hours in (-2, 1, 3):
+            moment = midnight + timedelta(hours=hours)
+            adapter.save(_transaction("u001", moment.isoformat()))
+        memory_dynamodb.reset_metrics()
+        # 02:00 UTC today, written as the previous day in UTC-5
+        since = (midnight + timedelta(hours=2)).replace(
+            tzinfo=timezone.utc
+        ).astimezone(timezone(timedelta(hours=-5)))
+
+        # Act
+        transactions = list(adapter.get_all(limit=None, since=since))
+
+        # Assert
+        assert [t.timestamp for t in transactions] == [
+            (midnight + timedelta(hours=3)).isoformat()
+        ]
+        assert memory_dynamodb.operations['Query'] == 1
+
+    def test_backfill_makes_legacy_transactions_visible(
+            self, table, dynamodb_resource
+            ):
+        """
+        Las transacciones previas al índice aparecen tras el backfill.
+        """
+        # Arrange
+        adapter = TransactionAdapter(dynamodb_resource)
+        timestamp = datetime.now().isoformat()
+        for index in range(3):
+            _seed_transaction(table, f"u{index}", index)
+            item = table.get({'PK': f'USER#u{index}', 'SK': f'TX#{index:06d}'})
+            table.put(dict(item, timestamp=timestamp))
+        since = datetime.now() - timedelta(hours=1)
+        assert list(adapter.get_all(since=since)) == []
+
+        # Act
+        updated = backfill_transaction_buckets(
+            dynamodb_resource, 'AppChallenge', total_segments=2
+        )
+
+        # Assert
+        assert updated == 3
+        assert len(list(adapter.get_all(since=since))) == 3
+
+
+class TestTransactionUlidKeys:
+    """
+    Tests de las claves ULID: escrituras sin pisar y rangos from/to.
+    """
+
+    def test_same_timestamp_saves_do_not_overwrite(
+            self, table, dynamodb_resource
+            ):
+        """
+        Dos transacciones con el mismo timestamp quedan como dos items.
+        """
+        # Arrange
+        adapter = TransactionAdapter(dynamodb_resource)
+
+        # Act
+        for _ in range(2):
+            adapter.save(_transaction("u001", "2025-08-22T10:00:00"))
+
+        # Assert
+        items = [i for i in table if i['SK'].startswith('TX#')]
+        assert len(items) == 2
+        assert all(i['SK'] == f"TX#{i['transaction_id']}" for i in items)
+
+    def test_taken_id_is_drawn_again(
+            self, monkeypatch, table, dynamodb_resource
+            ):
+        """
+        Si el id ya existe, save no lo pisa y reintenta con otro.
+        """
+        # Arrange
+        adapter = TransactionAdapter(dynamodb_resource)
+        ids = iter(['01K3B0000000000000000000AA'] * 2 +
+                   ['01K3B0000000000000000000AB'])
+        monkeypatch.setattr(transactions, 'new_ulid', lambda _: next(ids))
+        adapter.save(_transaction("u001", "2025-08-22T10:00:00"))
+
+        # Act
+        adapter.save(_transaction("u001", "2025-08-22T10:00:01"))
+
+        # Assert
+        first = table.get({'PK': 'USER#u001',
+                           'SK': 'TX#01K3B0000000000000000000AA'})
+        second = table.get({'PK': 'USER#u001',
+                            'SK': 'TX#01K3B0000000000000000000AB'})
+        assert first['timestamp'] == "2025-08-22T10:00:00"
+        assert second['timestamp'] == "2025-08-22T10:00:01"
+
+    def test_from_and_to_query_only_the_range(
+            self, memory_dynamodb, dynamodb_resource
+            ):
+        """
+        from/to se traducen a un BETWEEN sobre SK: sólo se leen las
+        transacciones del rango, ambos extremos incluidos.
+        """
+        # Arrange
+        adapter = TransactionAdapter(dynamodb_resource)
+        start = datetime(2025, 8, 1, 12, 0, 0)
+        for days in range(30):
+            moment = start + timedelta(days=days)
+            adapter.save(_transaction("u001", moment.isoformat()))
+        memory_dynamodb.reset_metrics()
+
+        # Act
+        transactions = list(adapter.get_by_user(
+            "u001", limit=None,
+            from_time=start + timedelta(days=10),
+            to_time=start + timedelta(days=14)
+        ))
+
+        # Assert
+        assert [t.timestamp[:10] for t in transactions] == [
+            f"2025-08-{day}" for day in range(11, 16)
+        ]
+        assert memory_dynamodb.operations == {'Query': 1}
+
+    def test_open_ended_ranges(self, dynamodb_resource):
+        """
+        Con sólo from o sólo to el rango queda abierto del otro lado.
+        """
+        # Arrange
+        adapter = TransactionAdapter(dynamodb_resource)
+        start = datetime(2025, 8, 1, 12, 0, 0)
+        for days in range(10):
+            moment = start + timedelta(days=days)
+            adapter.save(_transaction("u001", moment.isoformat()))
+        middle = start + timedelta(days=4, hours=1)
+
+        # Act
+        after = list(adapter.get_by_user("u001", from_time=middle))
+        before = list(adapter.get_by_user("u001", to_time=middle))
+
+        # Assert
+        assert len(after) == 5
+        assert len(before) == 5
+
+    def test_concurrent_saves_lose_nothing(self, table, dynamodb_resource):
+        """
+        Muchas escrituras concurrentes con el mismo timestamp quedan
+        todas guardadas (TX_WRITE_TEST_SIZE=100000 para la prueba larga).
+        """
+        # Arrange
+        adapter = TransactionAdapter(dynamodb_resource)
+        size = int(os.getenv('TX_WRITE_TEST_SIZE', '2000'))
+        timestamp = "2025-08-22T10:00:00"
+
+        # Act
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(
+                lambda index: adapter.save(
+                    _transaction(f"u{index % 10}", timestamp)
+                ),
+                range(size)
+            ))
+
+        # Assert
+        items = [i for i in table if i['SK'].startswith('TX#')]
+        assert len(items) == size
+        assert len({i['transaction_id'] for i in items}) == size
+
+    def test_rekey_moves_legacy_keys_into_ranges(
+            self, table, dynamodb_resource
+            ):
+        """
+        Las transacciones con clave TX#<timestamp> pasan a ULID y
+        aparecen en las consultas por rango.
+        """
+        # Arrange
+        adapter = TransactionAdapter(dynamodb_resource)
+        for index in range(3):
+            _seed_transaction(table, "u001", index)
+        adapter.save(_transaction("u001", "2025-08-22T11:00:00"))
+        since = datetime(2025, 8, 22, 10, 0, 0)
+
+        # Act
+        moved = rekey_transactions(
+            dynamodb_resource, 'AppChallenge', total_segments=2
+        )
+        again = rekey_transactions(dynamodb_resource, 'AppChallenge')
+
+        # Assert
+        assert (moved, again) == (3, 0)
+        transactions = list(adapter.get_by_user("u001", from_time=since))
+        assert [t.timestamp for t in transactions] == [
+            "2025-08-22T10:00:00", "2025-08-22T10:00:01",
+            "2025-08-22T10:00:02", "2025-08-22T11:00:00"
+        ]
+
+
+class TestTransactionFundIndex:
+    """
+    Tests de get_by_fund sobre fund_id-index.
+    """
+
+    def test_fund_page_reads_only_its_transactions_in_time_order(
+            self, memory_dynamodb, table, dynamodb_resource
+            ):
+        """
+        Las transacciones del fondo salen del índice ordenadas por
+        timestamp, sin perfiles, suscripciones ni contadores del fondo.
+        """
+        # Arrange
+        adapter = TransactionAdapter(dynamodb_resource)
+        for minute in (30, 10, 20):
+            adapter.save(_transaction("u001", f"2025-08-22T10:{minute}:00"))
+        table.put({'PK': 'FUND#f001', 'SK': 'PROFILE', 'fund_id': 'f001'})
+        table.put({'PK': 'USER#u001', 'SK': 'SUB#f001', 'fund_id': 'f001',
+                   'user_id': 'u001', 'status': 'active'})
+        memory_dynamodb.reset_metrics()
+
+        # Act
+        first, cursor = adapter.get_by_fund_page("f001", limit=2)
+        rest, last = adapter.get_by_fund_page("f001", limit=2, cursor=cursor)
+
+        # Assert
+        assert [t.timestamp[11:16] for t in first + rest] == [
+            "10:10", "10:20", "10:30"
+        ]
+        assert last is None
+        assert memory_dynamodb.operations == {'Query': 2}
@@ -0,0 +1,310 @@
+import threading
+
+import pytest
+
+from app.application.ports.errors import (
+    InsufficientBalance,
+    OptimisticLockError,
+    StaleBalance,
+    SubscriptionConflict,
+    SubscriptionNotFound,
+    UserNotFound
+)
+from app.domain.models.subscription import Subscription, Status
+from app.domain.models.transaction import Transaction, TransactionType
+from app.infrastructure.adapters import transactions
+from app.infrastructure.adapters.unit_of_work import UnitOfWorkAdapter
+
+
+def _seed_user(table, user_id, balance):
+    table.put({'PK': f'USER#{user_id}', 'SK': 'PROFILE',
+               'user_id': user_id, 'name': 'Test User',
+               'balance': balance, 'notify_channel': 'email'})
+
+
+def _subscription(user_id="u001", fund_id="f001", amount=100000):
+    return Subscription(user_id=user_id, fund_id=fund_id, amount=amount,
+                        status=Status.ACTIVE,
+                        created_at="2025-08-22T10:00:00")
+
+
+def _transaction(user_id="u001", fund_id="f001", amount=100000,
+                 timestamp="2025-08-22T10:00:00.000001",
+                 prev_balance=500000):
+    return Transaction(user_id=user_id, fund_id=fund_id, amount=amount,
+                       transaction_type=TransactionType.OPEN,
+                       timestamp=timestamp, prev_balance=prev_balance,
+                       new_balance=prev_balance - amount)
+
+
+def _refund(amount=100000, prev_balance=400000):
+    return Transaction(user_id="u001", fund_id="f001", amount=amount,
+                       transaction_type=TransactionType.CANCEL,
+                       timestamp="2025-08-22T11:00:00",
+                       prev_balance=prev_balance,
+                       new_balance=prev_balance + amount)
+
+
+def _balance(table, user_id="u001"):
+    return table.get({'PK': f'USER#{user_id}', 'SK': 'PROFILE'})['balance']
+
+
+class TestUnitOfWorkSubscribe:
+    """
+    Tests de la suscripción atómica con TransactWriteItems.
+    """
+
+    def test_commits_everything_in_one_request(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        El débito, la suscripción y la transacción se escriben
+        en una sola llamada a DynamoDB.
+        """
+        # Arrange
+        _seed_user(table, "u001", 500000)
+        unit_of_work = UnitOfWorkAdapter(dynamodb_resource)
+
+        # Act
+        result = unit_of_work.subscribe(_subscription(), _transaction())
+
+        # Assert
+        assert memory_dynamodb.operations == {'TransactWriteItems': 1}
+        assert result.status == Status.ACTIVE
+        assert _balance(table) == 400000
+        assert table.get({'PK': 'USER#u001', 'SK': 'SUB#f001'})['status'] == \
+            "active"
+        assert len([i for i in table if i['SK'].startswith('TX#')]) == 1
+
+    def test_insufficient_balance_writes_nothing(self, table,
+                                                 dynamodb_resource):
+        """
+        Si el saldo guardado no cubre el monto, la condición falla
+        y no se escribe ningún item.
+        """
+        # Arrange
+        _seed_user(table, "u001", 50000)
+        unit_of_work = UnitOfWorkAdapter(dynamodb_resource)
+
+        # Act & Assert
+        with pytest.raises(InsufficientBalance):
+            unit_of_work.subscribe(_subscription(), _transaction())
+
+        assert _balance(table) == 50000
+        assert len(table) == 1
+
+    def test_balance_changed_since_read_writes_nothing(
+        self, table, dynamodb_resource
+    ):
+        """
+        Si el saldo guardado no es el prev_balance de la transacción, no
+        se debita: la transacción registraría saldos equivocados.
+        """
+        # Arrange
+        _seed_user(table, "u001", 300000)
+        unit_of_work = UnitOfWorkAdapter(dynamodb_resource)
+
+        # Act & Assert
+        with pytest.raises(StaleBalance):
+            unit_of_work.subscribe(_subscription(), _transaction())
+
+        assert _balance(table) == 300000
+        assert len(table) == 1
+
+    def test_unknown_user_is_reported(self, table, dynamodb_resource):
+        """
+        Un usuario inexistente no se crea con saldo negativo.
+        """
+        # Arrange
+        unit_of_work = UnitOfWorkAdapter(dynamodb_resource)
+
+        # Act & Assert
+        with pytest.raises(UserNotFound):
+            unit_of_work.subscribe(_subscription(), _transaction())
+
+        assert len(table) == 0
+
+    def test_active_subscription_is_not_overwritten(self, table,
+                                                    dynamodb_resource):
+        """
+        No se puede abrir dos veces la misma suscripción activa.
+        """
+        # Arrange
+        _seed_user(table, "u001", 500000)
+        unit_of_work = UnitOfWorkAdapter(dynamodb_resource)
+        unit_of_work.subscribe(_subscription(), _transaction())
+
+        # Act & Assert
+        with pytest.raises(SubscriptionConflict, match="already exists"):
+            unit_of_work.subscribe(
+                _subscription(),
+                _transaction(timestamp="2025-08-22T10:00:01.000001",
+                             prev_balance=400000)
+            )
+
+        assert _balance(table) == 400000
+
+    def test_concurrent_subscriptions_never_overdraw(self, table,
+                                                     dynamodb_resource):
+        """
+        Con suscripciones concurrentes el saldo nunca queda negativo y
+        cada transacción registra el saldo que realmente debitó: quien
+        leyó un saldo ya cambiado lo vuelve a leer.
+        """
+        # Arrange
+        _seed_user(table, "u001", 500000)
+        unit_of_work = UnitOfWorkAdapter(dynamodb_resource)
+        outcomes = []
+
+        def subscribe(index):
+            while True:
+                try:
+                    unit_of_work.subscribe(
+                        _subscription(fund_id=f"f{index:03d}"),
+                        _transaction(fund_id=f"f{index:03d}",
+                                     timestamp=f"2025-08-22T10:00:{index:02d}",
+                                     prev_balance=_balance(table))
+                    )
+                    outcomes.append(True)
+                    return
+                except InsufficientBalance:
+                    outcomes.append(False)
+                    return
+                except OptimisticLockError:
+                    continue
+
+        # Act
+        threads = [threading.Thread(target=subscribe, args=(index,))
+                   for index in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert outcomes.count(True) == 5
+        assert _balance(table) == 0
+        logged = sorted(
+            (i['prev_balance'], i['new_balance'])
+            for i in table if i['SK'].startswith('TX#')
+        )
+        assert logged == [(b + 100000, b) for b in range(0, 500000, 100000)]
+
+    def test_taken_transaction_id_is_a_lock_conflict(
+        self, monkeypatch, table, dynamodb_resource
+    ):
+        """
+        Si el id de la transacción ya existe no se pisa: nada se escribe
+        y se pide reintentar.
+        """
+        # Arrange
+        _seed_user(table, "u001", 500000)
+        table.put({'PK': 'USER#u001', 'SK': 'TX#01K3B0000000000000000000AA'})
+        monkeypatch.setattr(transactions, 'new_ulid',
+                            lambda _: '01K3B0000000000000000000AA')
+        unit_of_work = UnitOfWorkAdapter(dynamodb_resource)
+
+        # Act & Assert
+        with pytest.raises(OptimisticLockError):
+            unit_of_work.subscribe(_subscription(), _transaction())
+
+        assert _balance(table) == 500000
+        assert table.get({'PK': 'USER#u001', 'SK': 'SUB#f001'}) is None
+
+
+class TestUnitOfWorkCancel:
+    """
+    Tests de la cancelación atómica con TransactWriteItems.
+    """
+
+    def test_refunds_and_cancels_in_one_request(
+        self, memory_dynamodb, table, dynamodb_resource
+    ):
+        """
+        La devolución del monto y la cancelación van juntas.
+        """
+        # Arrange
+        _seed_user(table, "u001", 500000)
+        unit_of_work = UnitOfWorkAdapter(dynamodb_resource)
+        subscription = unit_of_work.subscribe(_subscription(), _transaction())
+        memory_dynamodb.reset_metrics()
+
+        # Act
+        result = unit_of_work.cancel(subscription, _refund())
+
+        # Assert
+        assert memory_dynamodb.operations == {'TransactWriteItems': 1}
+        [refund] = [i for i in table if i['SK'].startswith('TX#')
+                    and i['transaction_type'] == 'cancel']
+        assert refund['amount'] == 100000
+        assert refund['new_balance'] == 500000
+        assert result.status == Status.CANCELLED
+        assert result.cancelled_at is not None
+        assert _balance(table) == 500000
+        assert table.get({'PK': 'USER#u001', 'SK': 'SUB#f001'})['status'] == \
+            "cancelled"
+
+    def test_cancelled_subscription_is_not_refunded_twice(
+        self, table, dynamodb_resource
+    ):
+        """
+        Una segunda cancelación no devuelve el dinero otra vez.
+        """
+        # Arrange
+        _seed_user(table, "u001", 500000)
+        unit_of_work = UnitOfWorkAdapter(dynamodb_resource)
+        subscription = unit_of_work.subscribe(_subscription(), _transaction())
+        unit_of_work.cancel(
+            subscription,
+            _transaction(timestamp="2025-08-22T11:00:00", prev_balance=400000)
+        )
+
+        # Act & Assert
+        with pytest.raises(SubscriptionNotFound):
+            unit_of_work.cancel(
+                subscription, _transaction(timestamp="2025-08-22T12:00:00")
+            )
+
+        assert _balance(table) == 500000
+
+    def test_balance_changed_since_read_is_not_refunded(
+        self, table, dynamodb_resource
+    ):
+        """
+        La devolución también exige el saldo leído: si cambió, no se
+        cancela nada.
+        """
+        # Arrange
+        _seed_user(table, "u001", 500000)
+        unit_of_work = UnitOfWorkAdapter(dynamodb_resource)
+        subscription = unit_of_work.subscribe(_subscription(), _transaction())
+
+        # Act & Assert
+        with pytest.raises(StaleBalance):
+            unit_of_work.cancel(
+                subscription, _transaction(timestamp="2025-08-22T11:00:00")
+            )
+
+        assert _balance(table) == 400000
+        assert table.get({'PK': 'USER#u001', 'SK': 'SUB#f001'})['status'] == \
+            "active"
+
+    def test_changed_subscription_is_a_lock_conflict(self, table,
+                                                     dynamodb_resource):
+        """
+        Si el monto cambió desde que se leyó, la cancelación se rechaza.
+        """
+        # Arrange
+        _seed_user(table, "u001", 500000)
+        unit_of_work = UnitOfWorkAdapter(dynamodb_resource)
+        unit_of_work.subscribe(_subscription(amount=150000), _transaction())
+
+        # Act & Assert
+        with pytest.raises(OptimisticLockError):
+            unit_of_work.cancel(
+                _subscription(amount=100000),
+                _transaction(timestamp="2025-08-22T11:00:00",
+                             prev_balance=350000)
+            )
+
+        assert _balance(table) == 350000
@@ -0,0 +1,198 @@
+import pytest
+
+from app.domain.models.partial import PartialRecord, partial_model
+from app.domain.models.user import NotifyChannel, User
+from app.infrastructure.adapters.fund_stats import stats_key
+from app.infrastructure.adapters.funds import FundAdapter
+from app.infrastructure.adapters.users import UserAdapter
+
+
+def _seed_user(table, user_id, balance=500000):
+    table.put({'PK': f'USER#{user_id}', 'SK': 'PROFILE',
+               'user_id': user_id, 'name': 'Test User',
+               'email': f'{user_id}@example.com', 'phone': '0',
+               'balance': balance, 'notify_channel': 'email'})
+
+
+def _seed_fund(table, fund_id, min_amount=50000, category='FPV'):
+    table.put({'PK': f'FUND#{fund_id}', 'SK': 'PROFILE', 'fund_id': fund_id,
+               'name': f'Fondo {fund_id}', 'min_amount': min_amount,
+               'category': category})
+
+
+class TestUserAdapter:
+    """
+    Tests del adapter de usuarios contra la tabla en memoria.
+    """
+
+    def test_get_by_id_reads_the_profile_item(
+            self, memory_dynamodb, table, dynamodb_resource
+            ):
+        """
+        Un usuario se lee con un único GetItem sobre USER#id / PROFILE.
+        """
+        # Arrange
+        _seed_user(table, "u001")
+        adapter = UserAdapter(dynamodb_resource)
+
+        # Act
+        user = adapter.get_by_id("u001")
+
+        # Assert
+        assert user.balance == 500000
+        assert user.notify_channel == NotifyChannel.EMAIL
+        assert memory_dynamodb.operations == {'GetItem': 1}
+        assert table.read_units == 0.5
+
+    def test_get_by_id_of_a_missing_user_raises(self, dynamodb_resource):
+        """
+        Un usuario inexistente levanta ValueError.
+        """
+        adapter = UserAdapter(dynamodb_resource)
+
+        with pytest.raises(ValueError, match="not found"):
+            adapter.get_by_id("missing")
+
+    def test_fields_read_partial_users(self, table, dynamodb_resource):
+        """
+        Con fields solo se leen esos atributos y el usuario es parcial;
+        get_many siempre incluye user_id para ordenar el resultado.
+        """
+        # Arrange
+        _seed_user(table, "u001", balance=100)
+        _seed_user(table, "u002", balance=200)
+        adapter = UserAdapter(dynamodb_resource)
+
+        # Act
+        user = adapter.get_by_id("u001", fields=["balance"])
+        users = adapter.get_many(["u002", "u404", "u001"], fields=["balance"])
+
+        # Assert
+        assert isinstance(user, PartialRecord)
+        assert user.balance == 100
+        with pytest.raises(AttributeError):
+            user.name
+        assert [(u.user_id, u.balance) for u in users] == [
+            ("u002", 200), ("u001", 100)
+        ]
+        with pytest.raises(ValueError, match="not found"):
+            adapter.get_by_id("u404", fields=["balance"])
+
+    def test_partial_model_of_every_field_is_the_model(self):
+        """
+        Pedir todos los campos devuelve el modelo completo; un campo
+        desconocido es un error de programación.
+        """
+        assert partial_model(User, User.model_fields) is User
+        with pytest.raises(TypeError, match="salary"):
+            partial_model(User, ["balance", "salary"])
+
+    def test_update_returns_the_stored_user(self, table, dynamodb_resource):
+        """
+        update escribe sólo los campos pedidos y devuelve el item final.
+        """
+        # Arrange
+        _seed_user(table, "u001")
+        adapter = UserAdapter(dynamodb_resource)
+
+        # Act
+        user = adapter.update("u001", balance=1000, notify_channel="sms")
+
+        # Assert
+        assert user.balance == 1000
+        assert user.notify_channel == NotifyChannel.SMS
+        stored = table.get({'PK': 'USER#u001', 'SK': 'PROFILE'})
+        assert stored['user_id'] == "u001"
+        assert stored['email'] == "u001@example.com"
+
+
+class TestFundAdapter:
+    """
+    Tests del adapter de fondos contra la tabla en memoria.
+    """
+
+    def test_get_by_id_of_a_missing_fund_raises(self, dynamodb_resource):
+        """
+        Un fondo inexistente levanta ValueError.
+        """
+        adapter = FundAdapter(dynamodb_resource)
+
+        with pytest.raises(ValueError, match="not found"):
+            adapter.get_by_id("missing")
+
+    def test_list_all_pages_over_fund_profiles_only(
+            self, table, dynamodb_resource
+            ):
+        """
+        El listado recorre todos los fondos con el cursor y omite
+        usuarios y contadores de fondos.
+        """
+        # Arrange
+        for index in range(7):
+            _seed_fund(table, f"f{index:03d}")
+            _seed_user(table, f"u{index:03d}")
+            table.put({**stats_key(f"f{index:03d}", 0), 'aum': 0})
+        adapter = FundAdapter(dynamodb_resource)
+
+        # Act
+        seen = []
+        cursor = None
+        while True:
+            funds, cursor = adapter.list_all(limit=3, last_key=cursor)
+            seen.extend(funds)
+            if cursor is None:
+                break
+
+        # Assert
+        assert sorted(f.fund_id for f in seen) == [
+            f"f{index:03d}" for index in range(7)
+        ]
+
+    def test_search_is_one_query_on_the_category_index(
+            self, memory_dynamodb, table, dynamodb_resource
+            ):
+        """
+        Buscar por categoría y monto mínimo máximo es un único Query,
+        ordenado por monto mínimo, sin leer otros items.
+        """
+        # Arrange
+        for index in range(6):
+            _seed_fund(table, f"f{index:03d}", min_amount=(6 - index) * 10000,
+                       category='FPV' if index % 2 else 'FIC')
+            _seed_user(table, f"u{index:03d}")
+        adapter = FundAdapter(dynamodb_resource)
+
+        # Act
+        funds, cursor = adapter.search("FPV", max_min_amount=40000)
+
+        # Assert
+        assert [(f.fund_id, f.min_amount) for f in funds] == [
+            ("f005", 10000.0), ("f003", 30000.0)
+        ]
+        assert cursor is None
+        assert memory_dynamodb.operations == {'Query': 1}
+
+    def test_search_cursor_walks_the_category(
+            self, table, dynamodb_resource
+            ):
+        """
+        El cursor recorre la categoría completa, incluso con montos
+        mínimos repetidos.
+        """
+        # Arrange
+        for index in range(7):
+            _seed_fund(table, f"f{index:03d}", min_amount=50000)
+        _seed_fund(table, "f100", category='FIC')
+        adapter = FundAdapter(dynamodb_resource)
+
+        # Act
+        seen = []
+        cursor = None
+        while True:
+            funds, cursor = adapter.search("FPV", limit=3, cursor=cursor)
+            seen.extend(f.fund_id for f in funds)
+            if cursor is None:
+                break
+
+        # Assert
+        assert sorted(seen) == [f"f{index:03d}" for index in range(7)]
@@ -1,9 +1,19 @@
+import os
 from fastapi import FastAPI
-from dotenv import load_dotenv
 from mangum import Mangum
 
-# Load environment variables from .env file
-load_dotenv()
+from app.infrastructure.adapters.identity_map import identity_map_middleware
+from app.routes.metrics import dynamodb_metrics
+from app.routes.routes import router
+
+# Inside Lambda the environment comes from the function configuration,
+# so the .env file is only read when running locally
+IN_LAMBDA = bool(os.getenv('AWS_LAMBDA_FUNCTION_NAME'))
+if not IN_LAMBDA:
+    from dotenv import load_dotenv
+
+    # Load environment variables from .env file
+    load_dotenv()
 
 app = FastAPI(
     title="Fund Subscription API",
@@ -11,9 +21,23 @@ app = FastAPI(
     version="1.0.0",
     root_path="/Prod"
 )
+app.include_router(router)
+app.middleware("http")(identity_map_middleware)
+app.middleware("http")(dynamodb_metrics)
+
+
+def warm_up() -> None:
+    """Build the adapters and the DynamoDB client ahead of the first request."""
+    from app.infrastructure.dependencies import get_container
+
+    get_container()
+
 
-# Import routes to register endpoints
-from app.routes import routes
+# boto3 and the adapters are imported on first use. In Lambda, build them
+# during the init phase instead, so the first invocation does not pay
+# for it (EAGER_INIT=false leaves it to the first request).
+if IN_LAMBDA and os.getenv('EAGER_INIT', 'true').lower() == 'true':
+    warm_up()
 
 # Lambda handler
 lambda_handler = Mangum(app)
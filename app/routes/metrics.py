@@ -0,0 +1,80 @@
+"""
+Per-request DynamoDB metrics for the API.
+
+With ``SERVER_TIMING=true`` (dev only) adds a ``Server-Timing`` header
+with the DynamoDB time, capacity and items of the request, total and per
+operation (``ddb-Query.tx_time-index`` for index queries). Logs the same
+numbers once the body has been sent:
+as CloudWatch Embedded Metric Format (``DYNAMODB_METRICS=emf``, the
+default in Lambda) or as a JSON log line (``log``).
+"""
+import logging
+import os
+import time
+from typing import AsyncIterator, Awaitable, Callable
+
+from fastapi import Request, Response
+
+from app.infrastructure.instrumentation import RequestMetrics, collect
+
+
+logger = logging.getLogger(__name__)
+
+
+def metrics_mode() -> str:
+    default = 'emf' if os.getenv('AWS_LAMBDA_FUNCTION_NAME') else 'off'
+    return os.getenv('DYNAMODB_METRICS', default).lower()
+
+
+def _route(request: Request) -> str:
+    # The path template, not the URL: one metric per endpoint
+    route = request.scope.get('route')
+    return f"{request.method} {getattr(route, 'path', 'unmatched')}"
+
+
+async def _emit_after_body(
+        body: AsyncIterator[bytes],
+        metrics: RequestMetrics,
+        request: Request,
+        status_code: int,
+        started: float,
+        mode: str
+) -> AsyncIterator[bytes]:
+    try:
+        async for chunk in body:
+            yield chunk
+    finally:
+        # Streaming exports keep calling DynamoDB while the body is sent
+        document = metrics.emf_json(
+            os.getenv('METRICS_NAMESPACE', 'AppChallenge'),
+            _route(request),
+            status_code,
+            (time.perf_counter() - started) * 1000
+        )
+        if mode == 'emf':
+            # EMF lines must be bare JSON on stdout, without a log prefix
+            print(document, flush=True)
+        else:
+            logger.info(document)
+
+
+async def dynamodb_metrics(
+        request: Request,
+        call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """HTTP middleware collecting the DynamoDB calls of each request."""
+    started = time.perf_counter()
+    with collect() as metrics:
+        response = await call_next(request)
+
+    # Off unless asked for: it shows clients the table's index names
+    if os.getenv('SERVER_TIMING', 'false').lower() == 'true':
+        response.headers['Server-Timing'] = metrics.server_timing()
+
+    mode = metrics_mode()
+    if mode != 'off':
+        response.body_iterator = _emit_after_body(
+            response.body_iterator, metrics, request,
+            response.status_code, started, mode
+        )
+    return response
@@ -1,71 +1,379 @@
-from fastapi import Depends
-from app.main import app
-from app.use_cases.subscriptions import SubscriptionUseCase
-from app.use_cases.transactions import TransactionUseCase
-from app.domain.models.requests import SubscribeRequest
-from app.domain.models.user import User, NotifyChannel
+from datetime import datetime
+from typing import Any, Awaitable, Callable
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from app.application.ports.errors import (
+    FundNotFound,
+    IdempotencyConflict,
+    InsufficientBalance,
+    InvalidCursor,
+    InvalidTimeRange,
+    MinAmountViolation,
+    OptimisticLockError,
+    SubscriptionConflict,
+    SubscriptionNotFound,
+    UserNotFound
+)
+from app.application.ports.users import AsyncUserPort
+from app.use_cases.funds import AsyncFundUseCase
+from app.use_cases.idempotency import (
+    AsyncIdempotencyUseCase,
+    request_fingerprint
+)
+from app.use_cases.portfolio import AsyncPortfolioUseCase
+from app.use_cases.subscriptions import AsyncSubscriptionUseCase
+from app.use_cases.transactions import AsyncTransactionUseCase
+from app.domain.models.fund import FundPage
+from app.domain.models.fund_stats import FundStats
+from app.domain.models.idempotency import IdempotencyRecord
+from app.domain.models.portfolio import Portfolio
+from app.domain.models.requests import BulkSubscribeRequest, SubscribeRequest
+from app.domain.models.subscription import (
+    BulkSubscriptionReport,
+    Status,
+    SubscriptionPage
+)
+from app.domain.models.user import User
+from app.domain.models.transaction import TransactionPage, TransactionRow
+from app.routes.responses import (
+    ExportFormat,
+    RowsJSONResponse,
+    export_response
+)
 from app.infrastructure.dependencies import (
-    get_subscription_use_case,
-    get_transaction_use_case
+    get_async_fund_use_case,
+    get_async_idempotency_use_case,
+    get_async_portfolio_use_case,
+    get_async_subscription_use_case,
+    get_async_transaction_use_case,
+    get_async_user_profiles
 )
 
 
-@app.get("/user/{user_id}/transactions")
+router = APIRouter()
+
+# HTTP status of the expected errors of subscribing and cancelling
+_WRITE_ERRORS = {
+    InsufficientBalance: 400,
+    MinAmountViolation: 400,
+    FundNotFound: 404,
+    SubscriptionNotFound: 404,
+    UserNotFound: 404,
+    SubscriptionConflict: 409,
+}
+
+
+async def _run_idempotent(
+    idempotency: AsyncIdempotencyUseCase,
+    key: str | None,
+    fingerprint: str,
+    handler: Callable[[IdempotencyRecord | None], Awaitable[Any]]
+) -> Any:
+    """Run ``handler`` once per Idempotency-Key, replaying its response.
+
+    ``handler`` gets the claim on the key, to store its response in the
+    same write as its data. A lock conflict (409) asks the client to
+    retry: the key is released rather than completed with it.
+    """
+    try:
+        return await _run_claimed(idempotency, key, fingerprint, handler)
+    except OptimisticLockError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+async def _run_claimed(
+    idempotency: AsyncIdempotencyUseCase,
+    key: str | None,
+    fingerprint: str,
+    handler: Callable[[IdempotencyRecord | None], Awaitable[Any]]
+) -> Any:
+    if key is None:
+        return await handler(None)
+
+    async def operation(claim: IdempotencyRecord) -> tuple[int, Any]:
+        try:
+            return 200, jsonable_encoder(await handler(claim))
+        except HTTPException as e:
+            # Client errors are final and replayed like a success; a lock
+            # conflict is raised past here, so the key is released
+            if e.status_code >= 500:
+                raise
+            return e.status_code, {'detail': e.detail}
+
+    try:
+        status_code, body, replayed = await idempotency.run(
+            key, fingerprint, operation
+        )
+    except IdempotencyConflict as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    headers = {'Idempotent-Replayed': 'true'} if replayed else None
+    return JSONResponse(body, status_code=status_code, headers=headers)
+
+
+def _write_error(error: Exception) -> HTTPException:
+    """The client error for an expected error of a write."""
+    return HTTPException(
+        status_code=_WRITE_ERRORS[type(error)], detail=str(error)
+    )
+
+
+async def _load_user(profiles: AsyncUserPort, user_id: str) -> User:
+    """The stored profile of ``user_id``, or 404."""
+    try:
+        return await profiles.get_by_id(user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+def _check_range(from_time: datetime | None, to_time: datetime | None):
+    if from_time and to_time and from_time > to_time:
+        raise HTTPException(
+            status_code=400, detail="'from' must not be after 'to'"
+        )
+
+
+@router.get("/user/{user_id}/transactions", response_model=TransactionPage)
 async def get_transactions_by_user(
     user_id: str,
-    use_case: TransactionUseCase = Depends(get_transaction_use_case)
+    limit: int = Query(50, ge=1, le=1000),
+    cursor: str | None = None,
+    from_time: datetime | None = Query(None, alias="from"),
+    to_time: datetime | None = Query(None, alias="to"),
+    use_case: AsyncTransactionUseCase = Depends(
+        get_async_transaction_use_case
+    )
+):
+    """Get a page of transactions for a user, optionally in a time range."""
+    _check_range(from_time, to_time)
+    try:
+        page = await use_case.get_transaction_rows_by_user_page(
+            user_id=user_id,
+            limit=limit,
+            cursor=cursor,
+            from_time=from_time,
+            to_time=to_time
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # response_model only documents the schema: rows skip revalidation
+    return RowsJSONResponse(page)
+
+
+@router.get("/user/{user_id}/transactions/export")
+async def export_transactions_by_user(
+    user_id: str,
+    format: ExportFormat = ExportFormat.NDJSON,
+    from_time: datetime | None = Query(None, alias="from"),
+    to_time: datetime | None = Query(None, alias="to"),
+    use_case: AsyncTransactionUseCase = Depends(
+        get_async_transaction_use_case
+    )
 ):
-    """Get all transactions for a user."""
-    return use_case.get_transactions_by_user(
-        user_id=user_id
+    """Stream a user's whole transaction history as NDJSON or CSV."""
+    _check_range(from_time, to_time)
+    return export_response(
+        use_case.export_transaction_rows_by_user(
+            user_id, from_time=from_time, to_time=to_time
+        ),
+        format,
+        TransactionRow,
+        f"transactions-{user_id}"
     )
 
 
-@app.post("/user/{user_id}/subscribe/{fund_id}")
+@router.get("/user/{user_id}/portfolio", response_model=Portfolio)
+async def get_portfolio(
+    user_id: str,
+    use_case: AsyncPortfolioUseCase = Depends(get_async_portfolio_use_case)
+):
+    """Get a user's active funds and total invested."""
+    return await use_case.get_portfolio(user_id)
+
+
+@router.post("/user/{user_id}/subscribe/{fund_id}")
 async def subscribe(
     fund_id: str,
     user_id: str,
     request: SubscribeRequest,
-    use_case: SubscriptionUseCase = Depends(get_subscription_use_case)
+    idempotency_key: str | None = Header(None),
+    use_case: AsyncSubscriptionUseCase = Depends(
+        get_async_subscription_use_case
+    ),
+    idempotency: AsyncIdempotencyUseCase = Depends(
+        get_async_idempotency_use_case
+    ),
+    profiles: AsyncUserPort = Depends(get_async_user_profiles)
 ):
     """Subscribe a user to a fund."""
-    return use_case.subscribe(
-        user=User(
-            user_id=user_id,
-            balance=300000,
-            email="eve@example.com",
-            name="Eve",
-            notify_channel=NotifyChannel.EMAIL,
-            phone="+1-202-555-0105"
-        ),
-        fund_id=fund_id,
-        amount=request.amount
+    async def handler(claim):
+        try:
+            return await use_case.subscribe(
+                # A cached balance is fine: the write is conditioned on
+                # it and the use case reads the stored one if it changed
+                user=await _load_user(profiles, user_id),
+                fund_id=fund_id,
+                amount=request.amount,
+                claim=claim
+            )
+        except tuple(_WRITE_ERRORS) as e:
+            raise _write_error(e)
+
+    return await _run_idempotent(
+        idempotency,
+        idempotency_key,
+        request_fingerprint('POST', user_id, fund_id, request.model_dump()),
+        handler
+    )
+
+
+@router.get("/funds", response_model=FundPage)
+async def search_funds(
+    category: str,
+    max_min_amount: float | None = Query(None, ge=0),
+    limit: int = Query(50, ge=1, le=1000),
+    cursor: str | None = None,
+    use_case: AsyncFundUseCase = Depends(get_async_fund_use_case)
+):
+    """Get a page of a category's funds, cheapest minimum amount first."""
+    try:
+        return await use_case.search(
+            category,
+            max_min_amount,
+            limit=limit,
+            cursor=cursor
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/funds/{fund_id}/stats", response_model=FundStats)
+async def get_fund_stats(
+    fund_id: str,
+    use_case: AsyncFundUseCase = Depends(get_async_fund_use_case)
+):
+    """Get a fund's assets under management and active subscribers."""
+    try:
+        return await use_case.get_stats(fund_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get("/funds/{fund_id}/subscribers", response_model=SubscriptionPage)
+async def list_fund_subscribers(
+    fund_id: str,
+    status: Status = Status.ACTIVE,
+    limit: int = Query(50, ge=1, le=1000),
+    cursor: str | None = None,
+    use_case: AsyncSubscriptionUseCase = Depends(
+        get_async_subscription_use_case
+    )
+):
+    """Get a page of a fund's subscriptions in a status."""
+    try:
+        return await use_case.list_subscribers(
+            fund_id,
+            status,
+            limit=limit,
+            cursor=cursor
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except FundNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.post(
+    "/funds/{fund_id}/subscriptions/bulk",
+    response_model=BulkSubscriptionReport
+)
+async def subscribe_many(
+    fund_id: str,
+    request: BulkSubscribeRequest,
+    use_case: AsyncSubscriptionUseCase = Depends(
+        get_async_subscription_use_case
     )
+):
+    """Subscribe many users to a fund, reporting each item's outcome."""
+    try:
+        return await use_case.subscribe_many(
+            fund_id=fund_id,
+            items=request.items
+        )
+    except FundNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
 
 
-@app.delete("/user/{user_id}/subscribe/{fund_id}")
+@router.delete("/user/{user_id}/subscribe/{fund_id}")
 async def cancel_subs(
     fund_id: str,
     user_id: str,  # TODO: Get from authentication
-    use_case: SubscriptionUseCase = Depends(get_subscription_use_case)
+    idempotency_key: str | None = Header(None),
+    use_case: AsyncSubscriptionUseCase = Depends(
+        get_async_subscription_use_case
+    ),
+    idempotency: AsyncIdempotencyUseCase = Depends(
+        get_async_idempotency_use_case
+    ),
+    profiles: AsyncUserPort = Depends(get_async_user_profiles)
 ):
     """Cancel a user's subscription to a fund."""
-    return use_case.cancel_subscription(
-        fund_id=fund_id,
-        user=User(
-            user_id=user_id,
-            balance=300000,
-            email="eve@example.com",
-            name="Eve",
-            notify_channel=NotifyChannel.EMAIL,
-            phone="+1-202-555-0105"
-        )
-        )
+    async def handler(claim):
+        try:
+            return await use_case.cancel_subscription(
+                fund_id=fund_id,
+                user=await _load_user(profiles, user_id),
+                claim=claim
+            )
+        except tuple(_WRITE_ERRORS) as e:
+            raise _write_error(e)
+
+    return await _run_idempotent(
+        idempotency,
+        idempotency_key,
+        request_fingerprint('DELETE', user_id, fund_id),
+        handler
+    )
 
 
-@app.get("/transactions")
+@router.get("/transactions", response_model=TransactionPage)
 async def history(
-    use_case: TransactionUseCase = Depends(get_transaction_use_case)
+    limit: int = Query(50, ge=1, le=1000),
+    cursor: str | None = None,
+    since: datetime | None = None,
+    use_case: AsyncTransactionUseCase = Depends(
+        get_async_transaction_use_case
+    )
 ):
-    """Get transaction history."""
-    return use_case.get_all_transactions()
+    """Get a page of the transaction history."""
+    try:
+        page = await use_case.get_transaction_rows_page(
+            limit=limit,
+            cursor=cursor,
+            since=since
+        )
+    except (InvalidCursor, InvalidTimeRange) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return RowsJSONResponse(page)
+
+
+@router.get("/transactions/export")
+async def export_history(
+    format: ExportFormat = ExportFormat.NDJSON,
+    since: datetime | None = None,
+    use_case: AsyncTransactionUseCase = Depends(
+        get_async_transaction_use_case
+    )
+):
+    """Stream the whole transaction history as NDJSON or CSV."""
+    try:
+        pages = use_case.export_transaction_rows(since=since)
+    except InvalidTimeRange as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return export_response(
+        pages,
+        format,
+        TransactionRow,
+        "transactions"
+    )
@@ -0,0 +1,80 @@
+from fastapi.testclient import TestClient
+
+from app.infrastructure.container import Container
+from app.infrastructure.dependencies import get_async_fund_use_case
+from app.infrastructure.tests.memory_dynamodb import MemoryDynamoDB
+from app.main import app
+
+
+class TestFundCatalogRoutes:
+    """
+    Tests del catálogo de fondos por categoría.
+    """
+
+    def setup_method(self):
+        """Setup para cada test - app con la tabla en memoria."""
+        self.dynamodb = MemoryDynamoDB()
+        self.table = self.dynamodb.create_table('AppChallenge')
+        for index, (category, min_amount) in enumerate([
+            ('FPV', 75000), ('FPV', 125000), ('FIC', 50000), ('FPV', 50000)
+        ]):
+            self.table.put({'PK': f'FUND#f{index:03d}', 'SK': 'PROFILE',
+                            'fund_id': f'f{index:03d}',
+                            'name': f'Fondo {index}',
+                            'min_amount': min_amount, 'category': category})
+        self.container = Container(self.dynamodb.resource())
+        app.dependency_overrides[get_async_fund_use_case] = (
+            lambda: self.container.async_fund_use_case
+        )
+        self.client = TestClient(app)
+
+    def teardown_method(self):
+        app.dependency_overrides.clear()
+        self.container.executor.shutdown()
+
+    def test_filters_by_category_and_max_min_amount(self):
+        """
+        Devuelve los fondos de la categoría que se pueden abrir con el
+        monto dado, del menor monto mínimo al mayor.
+        """
+        # Act
+        response = self.client.get(
+            '/funds', params={'category': 'FPV', 'max_min_amount': 100000}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        body = response.json()
+        assert [f['fund_id'] for f in body['items']] == ['f003', 'f000']
+        assert body['next_cursor'] is None
+        assert self.dynamodb.operations == {'Query': 1}
+
+    def test_pages_with_the_cursor(self):
+        """
+        next_cursor lleva a la siguiente página.
+        """
+        # Act
+        first = self.client.get(
+            '/funds', params={'category': 'FPV', 'limit': 2}
+        ).json()
+        second = self.client.get(
+            '/funds', params={'category': 'FPV', 'limit': 2,
+                              'cursor': first['next_cursor']}
+        ).json()
+
+        # Assert
+        assert [f['fund_id'] for f in first['items']] == ['f003', 'f000']
+        assert [f['fund_id'] for f in second['items']] == ['f001']
+        assert second['next_cursor'] is None
+
+    def test_invalid_cursor_is_rejected(self):
+        """
+        Un cursor corrupto responde 400.
+        """
+        # Act
+        response = self.client.get(
+            '/funds', params={'category': 'FPV', 'cursor': 'not-a-cursor'}
+        )
+
+        # Assert
+        assert response.status_code == 400
@@ -0,0 +1,167 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from app.application.ports.errors import OptimisticLockError
+from app.infrastructure.container import Container
+from app.infrastructure.dependencies import (
+    get_async_idempotency_use_case,
+    get_async_subscription_use_case,
+    get_async_user_profiles
+)
+from app.infrastructure.tests.memory_dynamodb import MemoryDynamoDB
+from app.main import app
+
+
+class TestIdempotencyKeyRoutes:
+    """
+    Tests del header Idempotency-Key en las rutas de suscripción.
+    """
+
+    def setup_method(self):
+        """Setup para cada test - app con la tabla en memoria."""
+        self.dynamodb = MemoryDynamoDB()
+        self.table = self.dynamodb.create_table('AppChallenge')
+        self.table.put({'PK': 'FUND#f001', 'SK': 'PROFILE',
+                        'fund_id': 'f001', 'name': 'Fondo',
+                        'min_amount': 50000, 'category': 'FPV'})
+        self.table.put({'PK': 'USER#u001', 'SK': 'PROFILE',
+                        'user_id': 'u001', 'name': 'Test User',
+                        'email': 'u001@example.com', 'phone': '0',
+                        'balance': 500000, 'notify_channel': 'email'})
+        self.container = Container(self.dynamodb.resource())
+        app.dependency_overrides[get_async_subscription_use_case] = (
+            lambda: self.container.async_subscription_use_case
+        )
+        app.dependency_overrides[get_async_idempotency_use_case] = (
+            lambda: self.container.async_idempotency_use_case
+        )
+        app.dependency_overrides[get_async_user_profiles] = (
+            lambda: self.container.async_user_profile_port
+        )
+        self.client = TestClient(app)
+
+    def teardown_method(self):
+        app.dependency_overrides.clear()
+        self.container.executor.shutdown()
+
+    def _balance(self):
+        return self.table.get({'PK': 'USER#u001', 'SK': 'PROFILE'})['balance']
+
+    def test_retry_replays_without_debiting_twice(self):
+        """
+        Un reintento con la misma clave devuelve la misma respuesta sin
+        volver a ejecutar la suscripción.
+        """
+        # Arrange
+        headers = {'Idempotency-Key': 'abc-1'}
+
+        # Act
+        first = self.client.post('/user/u001/subscribe/f001',
+                                 json={'amount': 100000}, headers=headers)
+        self.dynamodb.reset_metrics()
+        retry = self.client.post('/user/u001/subscribe/f001',
+                                 json={'amount': 100000}, headers=headers)
+
+        # Assert
+        assert first.status_code == retry.status_code == 200
+        assert retry.json() == first.json()
+        assert retry.headers['Idempotent-Replayed'] == 'true'
+        assert self._balance() == 400000
+        assert self.dynamodb.operations == {'PutItem': 1}
+
+    def test_same_key_with_another_payload_is_rejected(self):
+        """
+        Reusar la clave con otro monto responde 409.
+        """
+        # Arrange
+        headers = {'Idempotency-Key': 'abc-1'}
+        self.client.post('/user/u001/subscribe/f001',
+                         json={'amount': 100000}, headers=headers)
+
+        # Act
+        response = self.client.post('/user/u001/subscribe/f001',
+                                    json={'amount': 200000}, headers=headers)
+
+        # Assert
+        assert response.status_code == 409
+        assert self._balance() == 400000
+
+    def test_client_errors_are_replayed(self):
+        """
+        Un error de negocio (saldo insuficiente) también se guarda y se
+        repite igual.
+        """
+        # Arrange
+        headers = {'Idempotency-Key': 'abc-2'}
+
+        # Act
+        first = self.client.post('/user/u001/subscribe/f001',
+                                 json={'amount': 900000}, headers=headers)
+        retry = self.client.post('/user/u001/subscribe/f001',
+                                 json={'amount': 900000}, headers=headers)
+
+        # Assert
+        assert first.status_code == retry.status_code == 400
+        assert retry.json() == first.json()
+
+    def test_lock_conflict_is_not_replayed(self, monkeypatch):
+        """
+        Un 409 por conflicto de escritura pide reintentar: la clave se
+        libera y el reintento con la misma clave sí cancela.
+        """
+        # Arrange
+        self.client.post('/user/u001/subscribe/f001', json={'amount': 100000})
+        unit_of_work = self.container.unit_of_work
+        cancel = unit_of_work.cancel
+        attempts = []
+
+        def conflicting_cancel(*args, **kwargs):
+            attempts.append(args)
+            if len(attempts) == 1:
+                raise OptimisticLockError(
+                    "Concurrent transaction on the same items, "
+                    "retry the request"
+                )
+            return cancel(*args, **kwargs)
+
+        monkeypatch.setattr(unit_of_work, 'cancel', conflicting_cancel)
+        headers = {'Idempotency-Key': 'abc-5'}
+
+        # Act
+        first = self.client.delete('/user/u001/subscribe/f001',
+                                   headers=headers)
+        retry = self.client.delete('/user/u001/subscribe/f001',
+                                   headers=headers)
+
+        # Assert
+        assert first.status_code == 409
+        assert retry.status_code == 200
+        assert 'Idempotent-Replayed' not in retry.headers
+        assert retry.json()['status'] == 'cancelled'
+        assert len(attempts) == 2
+        assert self._balance() == 500000
+
+    def test_response_is_stored_with_the_write(self):
+        """
+        La respuesta se guarda en la misma TransactWriteItems que el
+        débito: no queda una segunda escritura que un fallo pueda perder.
+        """
+        # Arrange
+        headers = {'Idempotency-Key': 'abc-3'}
+
+        # Act
+        subscribed = self.client.post('/user/u001/subscribe/f001',
+                                      json={'amount': 100000},
+                                      headers=headers)
+        cancelled = self.client.delete('/user/u001/subscribe/f001',
+                                       headers={'Idempotency-Key': 'abc-4'})
+
+        # Assert
+        assert subscribed.status_code == cancelled.status_code == 200
+        assert self.dynamodb.operations['TransactWriteItems'] == 2
+        assert 'UpdateItem' not in self.dynamodb.operations
+        stored = self.table.get({'PK': 'IDEMPOTENCY#abc-4',
+                                 'SK': 'IDEMPOTENCY'})
+        assert stored['status'] == 'completed'
+        assert json.loads(stored['response']) == cancelled.json()
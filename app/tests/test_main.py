@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+
+
+def _import_main(**env: str) -> str:
+    """Importa app.main en un intérprete nuevo y devuelve lo que imprime."""
+    probe = (
+        "import sys\n"
+        "import app.main\n"
+        "print('boto3' in sys.modules, 'dotenv' in sys.modules,\n"
+        "      'app.infrastructure.container' in sys.modules)\n"
+    )
+    environment = {
+        name: value for name, value in os.environ.items()
+        if name != 'AWS_LAMBDA_FUNCTION_NAME'
+    }
+    environment.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+    environment.update(env)
+    completed = subprocess.run(
+        [sys.executable, '-c', probe],
+        capture_output=True, text=True, env=environment, check=True
+    )
+    return completed.stdout.strip()
+
+
+class TestColdStart:
+    """
+    Tests del arranque en frío del punto de entrada de Lambda.
+    """
+
+    def test_local_import_defers_boto3(self):
+        """
+        Fuera de Lambda, boto3 y los adapters se importan recién
+        en el primer request.
+        """
+        # Act
+        boto3_loaded, dotenv_loaded, container_loaded = \
+            _import_main().split()
+
+        # Assert
+        assert boto3_loaded == "False"
+        assert dotenv_loaded == "True"
+        assert container_loaded == "False"
+
+    def test_lambda_init_builds_container_without_dotenv(self):
+        """
+        En Lambda no se lee .env y el contenedor se construye durante
+        la fase de inicialización.
+        """
+        # Act
+        boto3_loaded, dotenv_loaded, container_loaded = \
+            _import_main(AWS_LAMBDA_FUNCTION_NAME='test').split()
+
+        # Assert
+        assert boto3_loaded == "True"
+        assert dotenv_loaded == "False"
+        assert container_loaded == "True"
+
+    def test_lambda_eager_init_can_be_disabled(self):
+        """
+        EAGER_INIT=false deja la construcción para el primer request.
+        """
+        # Act
+        boto3_loaded, _, container_loaded = _import_main(
+            AWS_LAMBDA_FUNCTION_NAME='test', EAGER_INIT='false'
+        ).split()
+
+        # Assert
+        assert boto3_loaded == "False"
+        assert container_loaded == "False"
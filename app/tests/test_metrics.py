@@ -0,0 +1,83 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from app.infrastructure.container import Container
+from app.infrastructure.dependencies import get_async_transaction_use_case
+from app.infrastructure.tests.memory_dynamodb import MemoryDynamoDB
+from app.main import app
+
+
+class TestRequestMetrics:
+    """
+    Tests de las métricas de DynamoDB por request.
+    """
+
+    def setup_method(self):
+        """Setup para cada test - app con la tabla en memoria."""
+        self.dynamodb = MemoryDynamoDB()
+        table = self.dynamodb.create_table('AppChallenge')
+        table.put({'PK': 'USER#u001', 'SK': 'TX#000001',
+                   'user_id': 'u001', 'fund_id': 'f001', 'amount': 1000,
+                   'transaction_type': 'open',
+                   'timestamp': '2025-08-22T10:00:00',
+                   'prev_balance': 0, 'new_balance': 0})
+        self.container = Container(self.dynamodb.resource())
+        app.dependency_overrides[get_async_transaction_use_case] = (
+            lambda: self.container.async_transaction_use_case
+        )
+        self.client = TestClient(app)
+
+    def teardown_method(self):
+        app.dependency_overrides.clear()
+        self.container.executor.shutdown()
+
+    def test_server_timing_header_is_off_by_default(self, monkeypatch):
+        """
+        Sin SERVER_TIMING el header no se envía a los clientes.
+        """
+        # Arrange
+        monkeypatch.delenv('SERVER_TIMING', raising=False)
+
+        # Act
+        response = self.client.get('/user/u001/transactions')
+
+        # Assert
+        assert response.status_code == 200
+        assert 'Server-Timing' not in response.headers
+
+    def test_server_timing_header_names_each_operation(self, monkeypatch):
+        """
+        Con SERVER_TIMING=true el header trae el total y cada operación.
+        """
+        # Arrange
+        monkeypatch.setenv('SERVER_TIMING', 'true')
+
+        # Act
+        response = self.client.get('/user/u001/transactions')
+
+        # Assert
+        timing = response.headers['Server-Timing']
+        assert timing.startswith('ddb;dur=')
+        assert 'ddb-Query;dur=' in timing
+        assert 'desc="1 calls, 0.5 RCU, 0 WCU, 1 items"' in timing
+
+    def test_emf_document_is_logged_per_route(self, monkeypatch, capsys):
+        """
+        En modo emf se imprime un documento EMF por request, con la ruta
+        como dimensión.
+        """
+        # Arrange
+        monkeypatch.setenv('DYNAMODB_METRICS', 'emf')
+
+        # Act
+        self.client.get('/user/u001/transactions')
+
+        # Assert
+        document = json.loads(capsys.readouterr().out.strip())
+        assert document['Route'] == 'GET /user/{user_id}/transactions'
+        assert document['DynamoDBCalls'] == 1
+        assert document['DynamoDBReadUnits'] == 0.5
+        assert document['_aws']['CloudWatchMetrics'][0]['Dimensions'] == [
+            ['Route']
+        ]
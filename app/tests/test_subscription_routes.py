@@ -0,0 +1,281 @@
+from fastapi.testclient import TestClient
+
+from app.infrastructure.container import Container
+from app.infrastructure.dependencies import (
+    get_async_idempotency_use_case,
+    get_async_subscription_use_case,
+    get_async_user_profiles
+)
+from app.infrastructure.tests.memory_dynamodb import MemoryDynamoDB
+from app.main import app
+
+
+class TestSubscriptionRoutesUserProfile:
+    """
+    Tests de las rutas de suscripción con el perfil real del usuario.
+    """
+
+    def setup_method(self):
+        """Setup para cada test - app con la tabla en memoria."""
+        self.dynamodb = MemoryDynamoDB()
+        self.table = self.dynamodb.create_table('AppChallenge')
+        self.table.put({'PK': 'FUND#f001', 'SK': 'PROFILE',
+                        'fund_id': 'f001', 'name': 'Fondo',
+                        'min_amount': 50000, 'category': 'FPV'})
+        self._set_balance(500000)
+        self.container = Container(self.dynamodb.resource())
+        app.dependency_overrides[get_async_subscription_use_case] = (
+            lambda: self.container.async_subscription_use_case
+        )
+        app.dependency_overrides[get_async_idempotency_use_case] = (
+            lambda: self.container.async_idempotency_use_case
+        )
+        app.dependency_overrides[get_async_user_profiles] = (
+            lambda: self.container.async_user_profile_port
+        )
+        self.client = TestClient(app)
+
+    def teardown_method(self):
+        app.dependency_overrides.clear()
+        self.container.executor.shutdown()
+
+    def _set_balance(self, balance):
+        self.table.put({'PK': 'USER#u001', 'SK': 'PROFILE',
+                        'user_id': 'u001', 'name': 'Test User',
+                        'email': 'u001@example.com', 'phone': '0',
+                        'balance': balance, 'notify_channel': 'email'})
+
+    def _transactions(self):
+        return [i for i in self.table if i['SK'].startswith('TX#')]
+
+    def test_transaction_records_the_stored_balance(self):
+        """
+        La transacción registra el saldo guardado del usuario, no uno fijo.
+        """
+        # Act
+        response = self.client.post('/user/u001/subscribe/f001',
+                                    json={'amount': 100000})
+
+        # Assert
+        assert response.status_code == 200
+        [transaction] = self._transactions()
+        assert transaction['prev_balance'] == 500000
+        assert transaction['new_balance'] == 400000
+
+    def test_unknown_user_is_not_found(self):
+        """
+        Un usuario inexistente responde 404 sin intentar escribir.
+        """
+        # Act
+        response = self.client.post('/user/u404/subscribe/f001',
+                                    json={'amount': 100000})
+
+        # Assert
+        assert response.status_code == 404
+        assert 'TransactWriteItems' not in self.dynamodb.operations
+
+    def test_cached_profile_saves_the_user_read(self):
+        """
+        Con el perfil en caché, suscribir no lee el usuario de DynamoDB.
+        """
+        # Arrange
+        self.container.user_cache.get_by_id('u001')
+        self.dynamodb.reset_metrics()
+
+        # Act
+        response = self.client.post('/user/u001/subscribe/f001',
+                                    json={'amount': 100000})
+
+        # Assert
+        assert response.status_code == 200
+        # The only read left is the fund's
+        assert self.dynamodb.operations == {
+            'GetItem': 1, 'TransactWriteItems': 1
+        }
+
+    def test_each_write_invalidates_the_cached_profile(self):
+        """
+        Después de suscribir, cancelar lee el saldo ya debitado y no el
+        perfil cacheado antes de la escritura.
+        """
+        # Act
+        self.client.post('/user/u001/subscribe/f001',
+                         json={'amount': 100000})
+        response = self.client.delete('/user/u001/subscribe/f001')
+
+        # Assert
+        assert response.status_code == 200
+        latest = max(self._transactions(), key=lambda t: t['timestamp'])
+        assert latest['transaction_type'] == 'cancel'
+        assert latest['amount'] == 100000
+        assert latest['prev_balance'] == 400000
+        assert latest['new_balance'] == 500000
+        assert self.container.user_cache.stats()['misses'] == 2
+
+    def test_stale_cached_balance_cannot_overdraw(self):
+        """
+        Si otro proceso gastó el saldo, el perfil cacheado no permite
+        sobregirar: la escritura condicional responde 400.
+        """
+        # Arrange
+        self.container.user_cache.get_by_id('u001')
+        self._set_balance(1000)
+
+        # Act
+        response = self.client.post('/user/u001/subscribe/f001',
+                                    json={'amount': 100000})
+
+        # Assert
+        assert response.status_code == 400
+        assert self.table.get({'PK': 'USER#u001', 'SK': 'PROFILE'})[
+            'balance'] == 1000
+        assert self._transactions() == []
+
+    def test_stale_cached_balance_is_read_again(self):
+        """
+        Si otro proceso cambió el saldo, la transacción registra el saldo
+        guardado y no el del perfil cacheado.
+        """
+        # Arrange
+        self.container.user_cache.get_by_id('u001')
+        self._set_balance(300000)
+
+        # Act
+        response = self.client.post('/user/u001/subscribe/f001',
+                                    json={'amount': 100000})
+
+        # Assert
+        assert response.status_code == 200
+        assert self.table.get({'PK': 'USER#u001', 'SK': 'PROFILE'})[
+            'balance'] == 200000
+        [transaction] = self._transactions()
+        assert transaction['prev_balance'] == 300000
+        assert transaction['new_balance'] == 200000
+
+    def test_stale_cached_balance_is_read_again_on_cancel(self):
+        """
+        Al cancelar con un saldo cacheado viejo, la devolución registra
+        el saldo guardado.
+        """
+        # Arrange
+        self.client.post('/user/u001/subscribe/f001',
+                         json={'amount': 100000})
+        self.container.user_cache.get_by_id('u001')
+        self._set_balance(250000)
+
+        # Act
+        response = self.client.delete('/user/u001/subscribe/f001')
+
+        # Assert
+        assert response.status_code == 200
+        latest = max(self._transactions(), key=lambda t: t['timestamp'])
+        assert latest['prev_balance'] == 250000
+        assert latest['new_balance'] == 350000
+
+    def test_fund_subscribers_follow_subscribe_and_cancel(self):
+        """
+        El listado de suscriptores refleja la suscripción y la
+        cancelación hechas por la unidad de trabajo.
+        """
+        # Act
+        self.client.post('/user/u001/subscribe/f001', json={'amount': 100000})
+        subscribed = self.client.get('/funds/f001/subscribers').json()
+        self.client.delete('/user/u001/subscribe/f001')
+        active = self.client.get('/funds/f001/subscribers').json()
+        cancelled = self.client.get(
+            '/funds/f001/subscribers', params={'status': 'cancelled'}
+        ).json()
+
+        # Assert
+        assert [s['user_id'] for s in subscribed['items']] == ['u001']
+        assert active == {'items': [], 'next_cursor': None}
+        assert [s['user_id'] for s in cancelled['items']] == ['u001']
+
+    def test_subscribers_of_an_unknown_fund_are_not_found(self):
+        """
+        Un fondo inexistente responde 404.
+        """
+        # Act
+        response = self.client.get('/funds/f404/subscribers')
+
+        # Assert
+        assert response.status_code == 404
+
+    def test_subscribing_twice_is_a_conflict(self):
+        """
+        Suscribirse de nuevo a un fondo activo responde 409 sin debitar.
+        """
+        # Arrange
+        self.client.post('/user/u001/subscribe/f001', json={'amount': 100000})
+
+        # Act
+        response = self.client.post('/user/u001/subscribe/f001',
+                                    json={'amount': 100000})
+
+        # Assert
+        assert response.status_code == 409
+        assert response.json() == {
+            'detail': 'Active subscription already exists'
+        }
+        assert self.table.get({'PK': 'USER#u001', 'SK': 'PROFILE'})[
+            'balance'] == 400000
+
+    def test_subscribing_to_an_unknown_fund_is_not_found(self):
+        """
+        Suscribirse a un fondo inexistente responde 404.
+        """
+        # Act
+        response = self.client.post('/user/u001/subscribe/f404',
+                                    json={'amount': 100000})
+
+        # Assert
+        assert response.status_code == 404
+        assert 'TransactWriteItems' not in self.dynamodb.operations
+
+    def test_amount_below_the_fund_minimum_is_rejected(self):
+        """
+        Un monto menor al mínimo del fondo responde 400.
+        """
+        # Act
+        response = self.client.post('/user/u001/subscribe/f001',
+                                    json={'amount': 1000})
+
+        # Assert
+        assert response.status_code == 400
+        assert 'No tiene saldo disponible' in response.json()['detail']
+
+    def test_cancelling_an_inactive_subscription_is_not_found(self):
+        """
+        Cancelar una suscripción ya cancelada o inexistente responde 404,
+        también al cancelar en un fondo inexistente.
+        """
+        # Arrange
+        self.client.post('/user/u001/subscribe/f001', json={'amount': 100000})
+        self.client.delete('/user/u001/subscribe/f001')
+
+        # Act
+        cancelled = self.client.delete('/user/u001/subscribe/f001')
+        unknown = self.client.delete('/user/u001/subscribe/f404')
+
+        # Assert
+        assert cancelled.status_code == 404
+        assert cancelled.json() == {'detail': 'Active subscription not found'}
+        assert unknown.status_code == 404
+
+    def test_business_errors_are_replayed(self):
+        """
+        Con Idempotency-Key un error de negocio se guarda y se repite igual.
+        """
+        # Arrange
+        headers = {'Idempotency-Key': 'k-min-amount'}
+
+        # Act
+        first = self.client.post('/user/u001/subscribe/f001',
+                                 json={'amount': 1000}, headers=headers)
+        second = self.client.post('/user/u001/subscribe/f001',
+                                  json={'amount': 1000}, headers=headers)
+
+        # Assert
+        assert first.status_code == second.status_code == 400
+        assert second.json() == first.json()
+        assert second.headers['Idempotent-Replayed'] == 'true'
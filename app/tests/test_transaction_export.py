@@ -0,0 +1,148 @@
+import asyncio
+import tracemalloc
+
+from fastapi.testclient import TestClient
+
+from app.domain.models.transaction import TransactionRow
+from app.infrastructure.container import Container
+from app.infrastructure.dependencies import get_async_transaction_use_case
+from app.infrastructure.tests.memory_dynamodb import MemoryDynamoDB
+from app.main import app
+from app.routes.responses import ExportFormat, encode_pages
+from app.use_cases.transactions import AsyncTransactionUseCase
+
+
+class SyntheticTransactionPort:
+    """Port de reemplazo: `pages` páginas que reutilizan las mismas filas."""
+
+    def __init__(self, pages: int, page_size: int):
+        self.pages = pages
+        self.rows = [
+            TransactionRow("u0001", "f001", 75000, "open",
+                           f"2025-08-22T10:00:00.{row:06d}", 500000, 425000)
+            for row in range(page_size)
+        ]
+
+    async def get_all_rows_page(self, limit=50, since=None, cursor=None,
+                                page_size=None):
+        index = int(cursor or 0)
+        next_cursor = str(index + 1) if index + 1 < self.pages else None
+        return self.rows, next_cursor
+
+
+async def _drain(chunks):
+    size = lines = 0
+    async for chunk in chunks:
+        size += len(chunk)
+        lines += chunk.count(b'\n')
+    return size, lines
+
+
+class TestExportMemory:
+    """
+    Tests de memoria acotada de la exportación por streaming.
+    """
+
+    def _peak_while_exporting(self, export_format, pages):
+        use_case = AsyncTransactionUseCase(
+            SyntheticTransactionPort(pages=pages, page_size=1000)
+        )
+        chunks = encode_pages(
+            use_case.export_transaction_rows(), export_format, TransactionRow
+        )
+        tracemalloc.start()
+        try:
+            size, lines = asyncio.run(_drain(chunks))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return size, lines, peak
+
+    def test_million_rows_ndjson_in_constant_memory(self):
+        """
+        Exportar 1M de filas sólo retiene una página a la vez: la memoria
+        pico no depende del tamaño exportado (~150 MiB).
+        """
+        # Act
+        size, lines, peak = self._peak_while_exporting(
+            ExportFormat.NDJSON, pages=1000
+        )
+
+        # Assert
+        assert lines == 1_000_000
+        assert size > 150 * 2 ** 20
+        assert peak < 4 * 2 ** 20
+
+    def test_csv_export_in_constant_memory(self):
+        """
+        El CSV también se escribe página a página, con la cabecera primero.
+        """
+        # Act
+        size, lines, peak = self._peak_while_exporting(
+            ExportFormat.CSV, pages=100
+        )
+
+        # Assert
+        assert lines == 100_000 + 1
+        assert size > 6 * 2 ** 20
+        assert peak < 4 * 2 ** 20
+
+
+class TestExportRoutes:
+    """
+    Tests de las rutas de exportación contra la tabla en memoria.
+    """
+
+    def setup_method(self):
+        """Setup para cada test - app con la tabla en memoria."""
+        self.dynamodb = MemoryDynamoDB()
+        table = self.dynamodb.create_table('AppChallenge')
+        for index in range(3):
+            table.put({
+                'PK': 'USER#u001', 'SK': f'TX#{index:06d}',
+                'user_id': 'u001', 'fund_id': 'f001', 'amount': 75000,
+                'transaction_type': 'open',
+                'timestamp': f'2025-08-22T10:00:0{index}',
+                'prev_balance': 500000, 'new_balance': 425000
+            })
+        self.container = Container(self.dynamodb.resource())
+        app.dependency_overrides[get_async_transaction_use_case] = (
+            lambda: self.container.async_transaction_use_case
+        )
+        self.client = TestClient(app)
+
+    def teardown_method(self):
+        app.dependency_overrides.clear()
+        self.container.executor.shutdown()
+
+    def test_csv_export_has_header_and_one_line_per_transaction(self):
+        """
+        El CSV trae la cabecera con los campos y una línea por transacción.
+        """
+        # Act
+        response = self.client.get('/user/u001/transactions/export?format=csv')
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers['content-type'].startswith('text/csv')
+        lines = response.text.splitlines()
+        assert lines[0] == (
+            'user_id,fund_id,amount,transaction_type,timestamp,'
+            'prev_balance,new_balance'
+        )
+        assert lines[1] == (
+            'u001,f001,75000,open,2025-08-22T10:00:00,500000,425000'
+        )
+        assert len(lines) == 4
+
+    def test_ndjson_export_of_an_empty_history(self):
+        """
+        Un usuario sin transacciones exporta un archivo vacío.
+        """
+        # Act
+        response = self.client.get('/user/u999/transactions/export')
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers['content-type'] == 'application/x-ndjson'
+        assert response.content == b''
@@ -0,0 +1,176 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+
+from app.domain.models.transaction import (
+    Transaction,
+    TransactionPage,
+    TransactionType
+)
+from app.infrastructure.container import Container
+from app.infrastructure.dependencies import get_async_transaction_use_case
+from app.infrastructure.tests.memory_dynamodb import MemoryDynamoDB
+from app.main import app
+from app.routes import responses
+
+
+class TestTransactionHistoryRoutes:
+    """
+    Tests del historial servido como filas serializadas directamente.
+    """
+
+    def setup_method(self):
+        """Setup para cada test - app con la tabla en memoria."""
+        self.dynamodb = MemoryDynamoDB()
+        self.table = self.dynamodb.create_table('AppChallenge')
+        for index in range(3):
+            self.table.put({
+                'PK': 'USER#u001', 'SK': f'TX#{index:06d}',
+                'user_id': 'u001', 'fund_id': 'f001', 'amount': 75000,
+                'transaction_type': 'cancel' if index else 'open',
+                'timestamp': f'2025-08-22T10:00:0{index}',
+                'prev_balance': 500000, 'new_balance': 425000
+            })
+        self.container = Container(self.dynamodb.resource())
+        app.dependency_overrides[get_async_transaction_use_case] = (
+            lambda: self.container.async_transaction_use_case
+        )
+        self.client = TestClient(app)
+
+    def teardown_method(self):
+        app.dependency_overrides.clear()
+        self.container.executor.shutdown()
+
+    def test_response_matches_the_documented_model(self):
+        """
+        La respuesta valida contra TransactionPage y trae el cursor.
+        """
+        # Act
+        response = self.client.get('/user/u001/transactions?limit=2')
+
+        # Assert
+        assert response.status_code == 200
+        page = TransactionPage.model_validate(response.json())
+        assert [t.timestamp for t in page.items] == [
+            '2025-08-22T10:00:00', '2025-08-22T10:00:01'
+        ]
+        assert page.next_cursor is not None
+
+    def test_stdlib_fallback_renders_the_same_bytes(self, monkeypatch):
+        """
+        Sin orjson el cuerpo es idéntico byte a byte.
+        """
+        # Arrange
+        expected = self.client.get('/transactions').content
+        monkeypatch.setattr(responses, 'orjson', None)
+
+        # Act
+        response = self.client.get('/transactions')
+
+        # Assert
+        assert response.content == expected
+
+    def test_from_and_to_limit_the_history(self):
+        """
+        from/to devuelven sólo las transacciones del rango.
+        """
+        # Arrange
+        adapter = self.container.transaction_port
+        for hour in range(10, 15):
+            adapter.save(Transaction(
+                user_id='u002', fund_id='f001', amount=75000,
+                transaction_type=TransactionType.OPEN,
+                timestamp=f'2025-08-22T{hour}:00:00',
+                prev_balance=500000, new_balance=425000
+            ))
+
+        # Act
+        response = self.client.get(
+            '/user/u002/transactions',
+            params={'from': '2025-08-22T11:00:00', 'to': '2025-08-22T13:00:00'}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert [t['timestamp'] for t in response.json()['items']] == [
+            '2025-08-22T11:00:00', '2025-08-22T12:00:00',
+            '2025-08-22T13:00:00'
+        ]
+
+    def test_from_after_to_is_rejected(self):
+        """
+        Un rango invertido responde 400 sin consultar DynamoDB.
+        """
+        # Act
+        response = self.client.get(
+            '/user/u001/transactions',
+            params={'from': '2025-08-23T00:00:00', 'to': '2025-08-22T00:00:00'}
+        )
+
+        # Assert
+        assert response.status_code == 400
+        assert 'Query' not in self.dynamodb.operations
+
+    def test_since_older_than_the_limit_is_rejected(self):
+        """
+        Un since más viejo que TRANSACTIONS_MAX_SINCE_DAYS responde 400
+        sin consultar un bucket por día, también al exportar.
+        """
+        # Act
+        response = self.client.get('/transactions',
+                                   params={'since': '2000-01-01'})
+        export = self.client.get('/transactions/export',
+                                 params={'since': '2000-01-01'})
+
+        # Assert
+        assert response.status_code == export.status_code == 400
+        assert '366 days' in response.json()['detail']
+        assert 'Query' not in self.dynamodb.operations
+
+    def _save_recent(self, count):
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        for index in range(count):
+            self.container.transaction_port.save(Transaction(
+                user_id='u002', fund_id='f001', amount=75000,
+                transaction_type=TransactionType.OPEN,
+                timestamp=(now - timedelta(minutes=index)).isoformat(),
+                prev_balance=500000, new_balance=425000
+            ))
+        return (now - timedelta(days=1)).isoformat()
+
+    def test_table_cursor_is_rejected_with_since(self):
+        """
+        Un cursor del listado completo no sirve para el listado con since
+        (índice por día): responde 400.
+        """
+        # Arrange
+        since = self._save_recent(2)
+        cursor = self.client.get('/transactions',
+                                 params={'limit': 1}).json()['next_cursor']
+
+        # Act
+        response = self.client.get('/transactions',
+                                   params={'since': since, 'cursor': cursor})
+
+        # Assert
+        assert response.status_code == 400
+        assert 'does not match' in response.json()['detail']
+
+    def test_index_cursor_is_rejected_without_since(self):
+        """
+        Un cursor del listado con since no se manda como ExclusiveStartKey
+        al Scan de la tabla: responde 400.
+        """
+        # Arrange
+        since = self._save_recent(2)
+        cursor = self.client.get(
+            '/transactions', params={'since': since, 'limit': 1}
+        ).json()['next_cursor']
+        self.dynamodb.reset_metrics()
+
+        # Act
+        response = self.client.get('/transactions', params={'cursor': cursor})
+
+        # Assert
+        assert response.status_code == 400
+        assert 'Scan' not in self.dynamodb.operations
@@ -0,0 +1,39 @@
+import asyncio
+from app.application.ports.fund_stats import AsyncFundStatsPort
+from app.application.ports.funds import AsyncFundPort
+from app.domain.models.fund import FundPage
+from app.domain.models.fund_stats import FundStats
+
+
+class AsyncFundUseCase:
+    """Fund stats and catalog search, for use inside the event loop."""
+
+    def __init__(
+            self,
+            funds_port: AsyncFundPort,
+            fund_stats_port: AsyncFundStatsPort
+            ) -> None:
+        self._funds_port = funds_port
+        self._fund_stats_port = fund_stats_port
+
+    async def get_stats(self, fund_id: str) -> FundStats:
+        """Get a fund's assets under management and active subscribers."""
+        # The fund read raises ValueError for unknown funds
+        _, stats = await asyncio.gather(
+            self._funds_port.get_by_id(fund_id),
+            self._fund_stats_port.get(fund_id)
+        )
+        return stats
+
+    async def search(
+            self,
+            category: str,
+            max_min_amount: float | None = None,
+            limit: int = 50,
+            cursor: str | None = None
+            ) -> FundPage:
+        """One page of a category's funds, cheapest minimum amount first."""
+        funds, next_cursor = await self._funds_port.search(
+            category, max_min_amount, limit=limit, cursor=cursor
+        )
+        return FundPage(items=funds, next_cursor=next_cursor)
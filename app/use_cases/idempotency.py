@@ -0,0 +1,52 @@
+import hashlib
+import json
+from typing import Any, Awaitable, Callable
+from app.application.ports.idempotency import AsyncIdempotencyPort
+from app.domain.models.idempotency import IdempotencyRecord, IdempotencyStatus
+
+
+# An operation returns (status_code, body); 5xx results are not stored,
+# so retrying after a server error runs the operation again. It gets the
+# claim on the key: a write that stores the response along with its own
+# data (see UnitOfWorkPort) leaves nothing for a crash to lose.
+Outcome = tuple[int, Any]
+
+
+def request_fingerprint(*parts: Any) -> str:
+    """Digest identifying a request, compared on every retry of a key."""
+    payload = json.dumps(parts, sort_keys=True, separators=(',', ':'),
+                         default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class AsyncIdempotencyUseCase:
+    """Idempotency-Key handling, for use inside the event loop."""
+
+    def __init__(self, idempotency_port: AsyncIdempotencyPort):
+        self.idempotency_port = idempotency_port
+
+    async def run(
+            self,
+            key: str,
+            fingerprint: str,
+            operation: Callable[[IdempotencyRecord], Awaitable[Outcome]]
+            ) -> tuple[int, Any, bool]:
+        """Run ``operation`` once per key; return (status, body, replayed)."""
+        record = await self.idempotency_port.begin(key, fingerprint)
+        if record.status == IdempotencyStatus.COMPLETED:
+            return record.status_code, record.body, True
+
+        try:
+            status_code, body = await operation(record)
+        except BaseException:
+            await self.idempotency_port.release(record)
+            raise
+
+        if record.status == IdempotencyStatus.COMPLETED:
+            # Already stored by the operation's own write
+            return status_code, body, False
+        if status_code >= 500:
+            await self.idempotency_port.release(record)
+        else:
+            await self.idempotency_port.complete(record, status_code, body)
+        return status_code, body, False
@@ -0,0 +1,13 @@
+from app.application.ports.portfolio import AsyncPortfolioPort
+from app.domain.models.portfolio import Portfolio
+
+
+class AsyncPortfolioUseCase:
+    """Portfolio summaries, for use inside the event loop."""
+
+    def __init__(self, portfolio_port: AsyncPortfolioPort):
+        self.portfolio_port = portfolio_port
+
+    async def get_portfolio(self, user_id: str) -> Portfolio:
+        """Get a user's active funds and total invested."""
+        return await self.portfolio_port.get(user_id)
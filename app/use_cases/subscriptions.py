@@ -1,11 +1,205 @@
-from app.application.ports.funds import FundPort
-from app.application.ports.subscriptions import SubscriptionPort
+import asyncio
+from app.application.ports.errors import (
+    FundNotFound,
+    InsufficientBalance,
+    MinAmountViolation,
+    StaleBalance,
+    SubscriptionNotFound,
+    UserNotFound
+)
+from app.application.ports.funds import AsyncFundPort, FundPort
+from app.application.ports.subscriptions import (
+    AsyncSubscriptionPort,
+    SubscriptionPort
+)
 from app.application.ports.transactions import TransactionPort
-from app.domain.models.subscription import Subscription, Status
-from app.application.ports.users import UserPort
+from app.domain.models.clock import utc_now
+from app.domain.models.fund import Fund
+from app.domain.models.idempotency import IdempotencyRecord
+from app.domain.models.partial import PartialRecord
+from app.domain.models.requests import BulkSubscribeItem
+from app.domain.models.subscription import (
+    BulkItemStatus,
+    BulkSubscriptionReport,
+    BulkSubscriptionResult,
+    Subscription,
+    SubscriptionPage,
+    Status
+)
+from app.application.ports.users import AsyncUserPort, UserPort
+from app.application.ports.unit_of_work import (
+    AsyncUnitOfWorkPort,
+    UnitOfWorkPort
+)
 from app.domain.models.user import User
 from app.domain.models.transaction import Transaction, TransactionType
-from datetime import datetime
+
+
+# Business rules shared by the sync and async use cases.
+
+# What the subscribe rules read of a stored user. Cancelling reads the
+# whole subscription: it is returned, cancelled, as the response.
+USER_FIELDS = ('user_id', 'balance')
+
+# The given user may come from a cache: the write is conditioned on its
+# balance, and a stale one is read again from the table this many times
+BALANCE_ATTEMPTS = 3
+
+
+def _insufficient_balance(fund: Fund) -> str:
+    return f"No hay suficiente saldo para vincularse al fondo ${fund.name}"
+
+
+def _fund_not_found(fund_id: str) -> FundNotFound:
+    return FundNotFound(f"Fund with ID {fund_id} not found")
+
+
+def _user_not_found(user_id: str) -> UserNotFound:
+    return UserNotFound(f"User with ID {user_id} not found")
+
+
+def _open_subscription(
+        fund: Fund | None,
+        fund_id: str,
+        user: User | PartialRecord,
+        amount: int
+        ) -> tuple[Subscription, Transaction]:
+    """Validate a subscription and build its records."""
+    if not fund:
+        raise _fund_not_found(fund_id)
+
+    # check if the amount is less than the minimum required
+    if amount < fund.min_amount:
+        raise MinAmountViolation(f"No tiene saldo disponible para vincularse al fondo ${fund.name}")
+
+    # calculate new balance
+    new_balance = user.balance - amount
+
+    subscription = Subscription(
+        user_id=user.user_id,
+        fund_id=fund_id,
+        amount=amount,
+        status=Status.ACTIVE,
+    )
+
+    # create a transaction for the subscription
+    transaction = Transaction(
+        user_id=user.user_id,
+        fund_id=fund_id,
+        amount=amount,
+        transaction_type=TransactionType.OPEN,
+        timestamp=utc_now().isoformat(),
+        prev_balance=user.balance,
+        new_balance=new_balance
+    )
+    return subscription, transaction
+
+
+def _close_subscription(
+        fund: Fund | None,
+        fund_id: str,
+        user: User | PartialRecord,
+        subs: Subscription | None
+        ) -> Transaction:
+    """Validate a cancellation and build its transaction."""
+    if not fund:
+        raise _fund_not_found(fund_id)
+
+    if not subs or subs.status != Status.ACTIVE:
+        raise SubscriptionNotFound("Active subscription not found")
+
+    # calculate new balance
+    new_balance = user.balance + subs.amount
+
+    # create a transaction for the cancellation
+    return Transaction(
+        user_id=user.user_id,
+        fund_id=fund_id,
+        amount=subs.amount,
+        transaction_type=TransactionType.CANCEL,
+        timestamp=utc_now().isoformat(),
+        prev_balance=user.balance,
+        new_balance=new_balance
+    )
+
+
+def _failed_item(user_id: str, error: str) -> BulkSubscriptionResult:
+    return BulkSubscriptionResult(
+        user_id=user_id, status=BulkItemStatus.FAILED, error=error
+    )
+
+
+def _plan_bulk(
+        fund: Fund | None,
+        fund_id: str,
+        items: list[BulkSubscribeItem],
+        users: list[User | PartialRecord]
+        ) -> tuple[list, list[tuple[Subscription, Transaction]], list[int]]:
+    """Validate a bulk subscribe against the loaded users.
+
+    Returns the results of the items rejected up front (None for the
+    others), the records to write and the position of each in ``items``.
+    """
+    if not fund:
+        raise _fund_not_found(fund_id)
+
+    by_id = {user.user_id: user for user in users}
+    results: list[BulkSubscriptionResult | None] = [None] * len(items)
+    entries: list[tuple[Subscription, Transaction]] = []
+    positions: list[int] = []
+    seen: set[str] = set()
+
+    for index, item in enumerate(items):
+        user = by_id.get(item.user_id)
+        if item.user_id in seen:
+            results[index] = _failed_item(
+                item.user_id, "Duplicate user in request"
+            )
+        elif user is None:
+            results[index] = _failed_item(
+                item.user_id, f"User with ID {item.user_id} not found"
+            )
+        else:
+            try:
+                entries.append(
+                    _open_subscription(fund, fund_id, user, item.amount)
+                )
+                positions.append(index)
+            except MinAmountViolation as e:
+                results[index] = _failed_item(item.user_id, str(e))
+        seen.add(item.user_id)
+
+    return results, entries, positions
+
+
+def _bulk_report(
+        fund: Fund,
+        fund_id: str,
+        items: list[BulkSubscribeItem],
+        results: list,
+        positions: list[int],
+        outcomes: list[Subscription | Exception]
+        ) -> BulkSubscriptionReport:
+    """Merge the write outcomes into the per-item report."""
+    for index, outcome in zip(positions, outcomes):
+        if isinstance(outcome, InsufficientBalance):
+            outcome = InsufficientBalance(_insufficient_balance(fund))
+        if isinstance(outcome, Exception):
+            results[index] = _failed_item(items[index].user_id, str(outcome))
+        else:
+            results[index] = BulkSubscriptionResult(
+                user_id=items[index].user_id,
+                status=BulkItemStatus.SUBSCRIBED,
+                subscription=outcome
+            )
+
+    succeeded = sum(r.status == BulkItemStatus.SUBSCRIBED for r in results)
+    return BulkSubscriptionReport(
+        fund_id=fund_id,
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        results=results
+    )
 
 
 class SubscriptionUseCase:
@@ -13,57 +207,109 @@ class SubscriptionUseCase:
             self, funds_port: FundPort,
             subscription_port: SubscriptionPort,
             transaction_port: TransactionPort,
-            user_port: UserPort
+            user_port: UserPort,
+            unit_of_work: UnitOfWorkPort | None = None
             ) -> None:
         self._funds_port = funds_port
         self._subscription_port = subscription_port
         self._user_port = user_port
         self._transaction_port = transaction_port
+        # With a unit of work the writes are committed atomically;
+        # without it they are issued one by one through the ports.
+        self._unit_of_work = unit_of_work
 
     def subscribe(
             self,
             fund_id: str,
             user: User,
-            amount: int
+            amount: int,
+            claim: IdempotencyRecord | None = None
             ) -> Subscription:
-        """Subscribe a user to a fund."""
-        fund = self._funds_port.get_by_id(fund_id)
-        if not fund:
-            raise ValueError("Fund not found")
+        """Subscribe a user to a fund.
+
+        ``claim`` is the request's Idempotency-Key, stored with the write
+        by the unit of work.
+        """
+        fund = self._fund(fund_id)
+        for attempt in range(1, BALANCE_ATTEMPTS + 1):
+            subscription, transaction = _open_subscription(
+                fund, fund_id, user, amount
+            )
+            try:
+                return self._save(fund, subscription, transaction, claim)
+            except StaleBalance:
+                if attempt == BALANCE_ATTEMPTS:
+                    raise
+                user = self._stored_user(user.user_id)
+
+    def subscribe_many(
+            self,
+            fund_id: str,
+            items: list[BulkSubscribeItem]
+            ) -> BulkSubscriptionReport:
+        """Subscribe many users to a fund, reporting each one's outcome."""
+        fund = self._fund(fund_id)
+        users = self._user_port.get_many(
+            [item.user_id for item in items], fields=USER_FIELDS
+        )
+        results, entries, positions = _plan_bulk(fund, fund_id, items, users)
+
+        if self._unit_of_work is not None:
+            outcomes = self._unit_of_work.subscribe_many(entries)
+        else:
+            outcomes = []
+            for subscription, transaction in entries:
+                try:
+                    outcomes.append(
+                        self._save(fund, subscription, transaction)
+                    )
+                except Exception as e:
+                    outcomes.append(e)
+
+        return _bulk_report(fund, fund_id, items, results, positions, outcomes)
 
-        # check if the amount is less than the minimum required
-        if amount < fund.min_amount:
-            raise ValueError(f"No tiene saldo disponible para vincularse al fondo ${fund.name}")
+    def _fund(self, fund_id: str) -> Fund:
+        """The fund ``fund_id``, or FundNotFound."""
+        try:
+            return self._funds_port.get_by_id(fund_id)
+        except ValueError:
+            raise _fund_not_found(fund_id)
 
-        # calculate new balance
-        new_balance = user.balance - amount
+    def _stored_user(self, user_id: str) -> PartialRecord:
+        """The balance of ``user_id`` as stored, or UserNotFound."""
+        try:
+            return self._user_port.get_by_id(user_id, fields=USER_FIELDS)
+        except ValueError:
+            raise _user_not_found(user_id)
+
+    def _save(
+            self,
+            fund: Fund,
+            subscription: Subscription,
+            transaction: Transaction,
+            claim: IdempotencyRecord | None = None
+            ) -> Subscription:
+        """Store a validated subscription with its transaction."""
+        if self._unit_of_work is not None:
+            # The stored balance is checked by the write itself
+            # (balance >= amount), not by the possibly stale user given.
+            try:
+                return self._unit_of_work.subscribe(
+                    subscription, transaction, claim
+                )
+            except InsufficientBalance:
+                raise InsufficientBalance(_insufficient_balance(fund))
 
         # check if the user has enough balance
-        if new_balance < 0:
-            raise ValueError(f"No hay suficiente saldo para vincularse al fondo ${fund.name}")
-        
+        if transaction.new_balance < 0:
+            raise InsufficientBalance(_insufficient_balance(fund))
+
         # update user balance
-        self._user_port.update(user.user_id, new_balance=new_balance)
-
-        # create subscription
-        subscription = Subscription(
-            user_id=user.user_id,
-            fund_id=fund_id,
-            amount=amount,
-            status=Status.ACTIVE,
+        self._user_port.update(
+            subscription.user_id, new_balance=transaction.new_balance
         )
-        subscription = self._subscription_port.save(subscription)
 
-        # create a transaction for the subscription
-        transaction = Transaction(
-            user_id=user.user_id,
-            fund_id=fund_id,
-            amount=amount,
-            transaction_type=TransactionType.OPEN,
-            timestamp=datetime.now().isoformat(),
-            prev_balance=user.balance,
-            new_balance=new_balance
-        )
+        subscription = self._subscription_port.save(subscription)
 
         self._transaction_port.save(transaction)
         return subscription
@@ -72,39 +318,158 @@ class SubscriptionUseCase:
             self,
             fund_id: str,
             user: User,
+            claim: IdempotencyRecord | None = None
             ) -> Subscription:
-        """Subscribe a user to a fund."""
-        fund = self._funds_port.get_by_id(fund_id)
-        if not fund:
-            raise ValueError("Fund not found")
-        
+        """Cancel a user's subscription to a fund."""
+        fund = self._fund(fund_id)
+
         # get active user's active subscription
         subs = self._subscription_port.get(user.user_id, fund_id)
+        transaction = _close_subscription(fund, fund_id, user, subs)
 
-        if not subs or subs.status != Status.ACTIVE:
-            raise ValueError("Active subscription not found")
+        if self._unit_of_work is not None:
+            for attempt in range(1, BALANCE_ATTEMPTS + 1):
+                try:
+                    return self._unit_of_work.cancel(
+                        subs, transaction, claim
+                    )
+                except StaleBalance:
+                    if attempt == BALANCE_ATTEMPTS:
+                        raise
+                    transaction = _close_subscription(
+                        fund, fund_id, self._stored_user(user.user_id), subs
+                    )
 
-        # calculate new balance
-        new_balance = user.balance + subs.amount
-        
         # update user balance
-        self._user_port.update(user.user_id, new_balance=new_balance)
+        self._user_port.update(
+            user.user_id, new_balance=transaction.new_balance
+        )
 
         subscription = self._subscription_port.update(
             user.user_id,
             fund_id, status=Status.CANCELLED
         )
 
-        # create a transaction for the subscription
-        transaction = Transaction(
-            user_id=user.user_id,
-            fund_id=fund_id,
-            amount=new_balance,
-            transaction_type=TransactionType.OPEN,
-            timestamp=datetime.now().isoformat(),
-            prev_balance=user.balance,
-            new_balance=new_balance
-        )
-
         self._transaction_port.save(transaction)
         return subscription
+
+
+class AsyncSubscriptionUseCase:
+    """SubscriptionUseCase on async ports, for use inside the event loop.
+
+    Writes always go through the unit of work: there is no port-by-port
+    fallback to keep in step with the sync use case.
+    """
+
+    def __init__(
+            self, funds_port: AsyncFundPort,
+            subscription_port: AsyncSubscriptionPort,
+            user_port: AsyncUserPort,
+            unit_of_work: AsyncUnitOfWorkPort
+            ) -> None:
+        self._funds_port = funds_port
+        self._subscription_port = subscription_port
+        self._user_port = user_port
+        self._unit_of_work = unit_of_work
+
+    async def subscribe(
+            self,
+            fund_id: str,
+            user: User,
+            amount: int,
+            claim: IdempotencyRecord | None = None
+            ) -> Subscription:
+        """Subscribe a user to a fund.
+
+        ``claim`` is the request's Idempotency-Key, stored with the write
+        by the unit of work.
+        """
+        fund = await self._fund(fund_id)
+        for attempt in range(1, BALANCE_ATTEMPTS + 1):
+            subscription, transaction = _open_subscription(
+                fund, fund_id, user, amount
+            )
+            try:
+                return await self._unit_of_work.subscribe(
+                    subscription, transaction, claim
+                )
+            except InsufficientBalance:
+                raise InsufficientBalance(_insufficient_balance(fund))
+            except StaleBalance:
+                if attempt == BALANCE_ATTEMPTS:
+                    raise
+                user = await self._stored_user(user.user_id)
+
+    async def subscribe_many(
+            self,
+            fund_id: str,
+            items: list[BulkSubscribeItem]
+            ) -> BulkSubscriptionReport:
+        """Subscribe many users to a fund, reporting each one's outcome."""
+        # The fund and the users are independent reads
+        fund, users = await asyncio.gather(
+            self._fund(fund_id),
+            self._user_port.get_many(
+                [item.user_id for item in items], fields=USER_FIELDS
+            )
+        )
+        results, entries, positions = _plan_bulk(fund, fund_id, items, users)
+        outcomes = await self._unit_of_work.subscribe_many(entries)
+        return _bulk_report(fund, fund_id, items, results, positions, outcomes)
+
+    async def _fund(self, fund_id: str) -> Fund:
+        """The fund ``fund_id``, or FundNotFound."""
+        try:
+            return await self._funds_port.get_by_id(fund_id)
+        except ValueError:
+            raise _fund_not_found(fund_id)
+
+    async def _stored_user(self, user_id: str) -> PartialRecord:
+        """The balance of ``user_id`` as stored, or UserNotFound."""
+        try:
+            return await self._user_port.get_by_id(
+                user_id, fields=USER_FIELDS
+            )
+        except ValueError:
+            raise _user_not_found(user_id)
+
+    async def cancel_subscription(
+            self,
+            fund_id: str,
+            user: User,
+            claim: IdempotencyRecord | None = None
+            ) -> Subscription:
+        """Cancel a user's subscription to a fund."""
+        # The two reads are independent: run them concurrently
+        fund, subs = await asyncio.gather(
+            self._fund(fund_id),
+            self._subscription_port.get(user.user_id, fund_id)
+        )
+        transaction = _close_subscription(fund, fund_id, user, subs)
+        for attempt in range(1, BALANCE_ATTEMPTS + 1):
+            try:
+                return await self._unit_of_work.cancel(
+                    subs, transaction, claim
+                )
+            except StaleBalance:
+                if attempt == BALANCE_ATTEMPTS:
+                    raise
+                transaction = _close_subscription(
+                    fund, fund_id, await self._stored_user(user.user_id), subs
+                )
+
+    async def list_subscribers(
+            self,
+            fund_id: str,
+            status: Status = Status.ACTIVE,
+            limit: int = 50,
+            cursor: str | None = None
+            ) -> SubscriptionPage:
+        """One page of a fund's subscriptions in ``status``."""
+        _, (subscriptions, next_cursor) = await asyncio.gather(
+            self._fund(fund_id),
+            self._subscription_port.list_by_fund(
+                fund_id, status.value, limit=limit, cursor=cursor
+            )
+        )
+        return SubscriptionPage(items=subscriptions, next_cursor=next_cursor)
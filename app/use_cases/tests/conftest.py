@@ -82,10 +82,29 @@ def cancelled_subscription():
     )
 
 
+def _fake_get_many(port):
+    """
+    get_many que resuelve cada ID con get_by_id del mismo mock, en orden
+    y omitiendo los inexistentes, como los adapters reales.
+    """
+    def get_many(ids, fields=None):
+        found = []
+        for item_id in dict.fromkeys(ids):
+            try:
+                found.append(port.get_by_id(item_id))
+            except ValueError:
+                continue
+        return found
+
+    return get_many
+
+
 @pytest.fixture
 def mock_funds_port():
     """Mock del puerto de fondos."""
-    return Mock()
+    port = Mock()
+    port.get_many.side_effect = _fake_get_many(port)
+    return port
 
 
 @pytest.fixture
@@ -103,7 +122,9 @@ def mock_transaction_port():
 @pytest.fixture
 def mock_user_port():
     """Mock del puerto de usuarios."""
-    return Mock()
+    port = Mock()
+    port.get_many.side_effect = _fake_get_many(port)
+    return port
 
 
 @pytest.fixture
@@ -1,9 +1,24 @@
-import pytest
-from unittest.mock import Mock
+import asyncio
+import time
+from datetime import datetime, timezone
 
-from app.use_cases.subscriptions import SubscriptionUseCase
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from app.application.ports.errors import (
+    FundNotFound,
+    InsufficientBalance,
+    MinAmountViolation,
+    SubscriptionNotFound
+)
+from app.use_cases.subscriptions import (
+    USER_FIELDS,
+    AsyncSubscriptionUseCase,
+    SubscriptionUseCase
+)
 from app.domain.models.user import User, NotifyChannel
 from app.domain.models.fund import Fund
+from app.domain.models.requests import BulkSubscribeItem
 from app.domain.models.subscription import Subscription, Status
 from app.domain.models.transaction import TransactionType
 
@@ -53,7 +68,7 @@ class TestSubscriptionUseCaseBusinessRules:
 
         # Act & Assert
         with pytest.raises(
-            ValueError,
+            MinAmountViolation,
             match="No tiene saldo disponible para vincularse al fondo"
         ):
             # Intentar suscribirse con monto menor al mínimo
@@ -92,7 +107,7 @@ class TestSubscriptionUseCaseBusinessRules:
         self.funds_port.get_by_id.return_value = fund
 
         # Act & Assert
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(InsufficientBalance) as exc_info:
             self.use_case.subscribe(
                 fund_id="f001",
                 user=user,
@@ -238,8 +253,8 @@ class TestSubscriptionUseCaseBusinessRules:
         cancel_transaction = self.transaction_port.save.call_args[0][0]
         assert cancel_transaction.user_id == "u001"
         assert cancel_transaction.fund_id == "f001"
-        assert cancel_transaction.amount == 500000  # Balance final
-        assert cancel_transaction.transaction_type == TransactionType.OPEN
+        assert cancel_transaction.amount == 100000  # Monto devuelto
+        assert cancel_transaction.transaction_type == TransactionType.CANCEL
         assert cancel_transaction.prev_balance == 400000
         assert cancel_transaction.new_balance == 500000
 
@@ -278,7 +293,9 @@ class TestSubscriptionUseCaseBusinessRules:
         self.subscription_port.get.return_value = inactive_subscription
 
         # Act & Assert
-        with pytest.raises(ValueError, match="Active subscription not found"):
+        with pytest.raises(
+            SubscriptionNotFound, match="Active subscription not found"
+        ):
             self.use_case.cancel_subscription(
                 fund_id="f001",
                 user=user
@@ -314,7 +331,9 @@ class TestSubscriptionUseCaseBusinessRules:
         self.subscription_port.get.return_value = None
 
         # Act & Assert
-        with pytest.raises(ValueError, match="Active subscription not found"):
+        with pytest.raises(
+            SubscriptionNotFound, match="Active subscription not found"
+        ):
             self.use_case.cancel_subscription(
                 fund_id="f001",
                 user=user
@@ -338,9 +357,333 @@ class TestSubscriptionUseCaseBusinessRules:
         self.funds_port.get_by_id.return_value = None  # Fondo no existe
 
         # Act & Assert
-        with pytest.raises(ValueError, match="Fund not found"):
+        with pytest.raises(FundNotFound, match="f999 not found"):
             self.use_case.subscribe(
                 fund_id="f999",  # ID inexistente
                 user=user,
                 amount=100000
             )
+
+
+class TestSubscriptionUseCaseUnitOfWork:
+    """
+    Tests del caso de uso cuando las escrituras van en una unidad de trabajo.
+    """
+
+    def setup_method(self):
+        """Setup para cada test - mocks de los puertos y la unidad de trabajo."""
+        self.funds_port = Mock()
+        self.subscription_port = Mock()
+        self.transaction_port = Mock()
+        self.user_port = Mock()
+        self.unit_of_work = Mock()
+
+        self.use_case = SubscriptionUseCase(
+            funds_port=self.funds_port,
+            subscription_port=self.subscription_port,
+            transaction_port=self.transaction_port,
+            user_port=self.user_port,
+            unit_of_work=self.unit_of_work
+        )
+        self.user = User(
+            user_id="u001",
+            name="Test User",
+            email="test@example.com",
+            balance=500000,
+            notify_channel=NotifyChannel.EMAIL,
+            phone="+1-234-567-8900"
+        )
+        self.funds_port.get_by_id.return_value = Fund(
+            fund_id="f001",
+            name="Fondo Básico",
+            min_amount=50000,
+            category="FPV"
+        )
+
+    def test_subscribe_writes_through_the_unit_of_work(self):
+        """
+        La suscripción se confirma en una sola escritura atómica,
+        sin escrituras sueltas en los puertos.
+        """
+        # Arrange
+        self.unit_of_work.subscribe.side_effect = lambda s, t, claim: s
+
+        # Act
+        result = self.use_case.subscribe(
+            fund_id="f001",
+            user=self.user,
+            amount=100000
+        )
+
+        # Assert
+        self.unit_of_work.subscribe.assert_called_once()
+        subscription, transaction, claim = (
+            self.unit_of_work.subscribe.call_args[0]
+        )
+        assert claim is None
+        assert subscription.amount == 100000
+        assert subscription.status == Status.ACTIVE
+        assert transaction.prev_balance == 500000
+        assert transaction.new_balance == 400000
+        assert result == subscription
+        self.user_port.update.assert_not_called()
+        self.subscription_port.save.assert_not_called()
+        self.transaction_port.save.assert_not_called()
+
+    def test_timestamps_are_utc_outside_utc(self, monkeypatch):
+        """
+        Con una zona horaria local distinta de UTC, la suscripción y su
+        transacción se fechan en UTC sin offset.
+        """
+        # Arrange
+        self.unit_of_work.subscribe.side_effect = lambda s, t, claim: s
+        monkeypatch.setenv('TZ', 'America/Bogota')
+        time.tzset()
+
+        try:
+            # Act
+            before = datetime.now(timezone.utc).replace(tzinfo=None)
+            self.use_case.subscribe(
+                fund_id="f001",
+                user=self.user,
+                amount=100000
+            )
+            after = datetime.now(timezone.utc).replace(tzinfo=None)
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+        # Assert
+        subscription, transaction, _ = self.unit_of_work.subscribe.call_args[0]
+        for timestamp in (subscription.created_at, transaction.timestamp):
+            stored = datetime.fromisoformat(timestamp)
+            assert stored.tzinfo is None
+            assert before <= stored <= after
+
+    def test_insufficient_balance_keeps_fund_message(self):
+        """
+        Regla de negocio: el mensaje de saldo insuficiente nombra el fondo,
+        aunque la validación la haga DynamoDB.
+        """
+        # Arrange
+        self.unit_of_work.subscribe.side_effect = InsufficientBalance()
+
+        # Act & Assert
+        with pytest.raises(
+            InsufficientBalance,
+            match="No hay suficiente saldo para vincularse al fondo"
+        ):
+            self.use_case.subscribe(
+                fund_id="f001",
+                user=self.user,
+                amount=100000
+            )
+
+    def test_cancel_writes_through_the_unit_of_work(self):
+        """
+        Regla de negocio: al cancelar se devuelve el monto vinculado,
+        en la misma escritura que cancela la suscripción.
+        """
+        # Arrange
+        active = Subscription(
+            user_id="u001",
+            fund_id="f001",
+            amount=100000,
+            status=Status.ACTIVE
+        )
+        self.subscription_port.get.return_value = active
+
+        # Act
+        self.use_case.cancel_subscription(fund_id="f001", user=self.user)
+
+        # Assert
+        subscription, transaction, claim = (
+            self.unit_of_work.cancel.call_args[0]
+        )
+        assert subscription == active
+        assert transaction.transaction_type == TransactionType.CANCEL
+        assert transaction.amount == 100000
+        assert transaction.new_balance == 600000
+        self.user_port.update.assert_not_called()
+        self.subscription_port.update.assert_not_called()
+
+    def test_subscribe_many_reads_once_and_writes_in_bulk(self):
+        """
+        La suscripción masiva lee el fondo y los usuarios una sola vez
+        y escribe todos los registros con la unidad de trabajo.
+        """
+        # Arrange
+        other = self.user.model_copy(update={'user_id': "u002"})
+        self.user_port.get_many.return_value = [self.user, other]
+        self.unit_of_work.subscribe_many.side_effect = lambda entries: [
+            subscription for subscription, _ in entries
+        ]
+        items = [
+            BulkSubscribeItem(user_id="u001", amount=100000),
+            BulkSubscribeItem(user_id="u002", amount=100000),
+        ]
+
+        # Act
+        report = self.use_case.subscribe_many(fund_id="f001", items=items)
+
+        # Assert
+        assert report.succeeded == 2
+        self.funds_port.get_by_id.assert_called_once_with("f001")
+        self.user_port.get_many.assert_called_once_with(
+            ["u001", "u002"], fields=USER_FIELDS
+        )
+        entries = self.unit_of_work.subscribe_many.call_args[0][0]
+        assert [t.new_balance for _, t in entries] == [400000, 400000]
+        self.unit_of_work.subscribe.assert_not_called()
+
+
+class TestAsyncSubscriptionUseCase:
+    """
+    Tests del caso de uso asíncrono (puertos async).
+    """
+
+    def setup_method(self):
+        """Setup para cada test - mocks async de los puertos."""
+        self.funds_port = AsyncMock()
+        self.subscription_port = AsyncMock()
+        self.user_port = AsyncMock()
+        self.unit_of_work = AsyncMock()
+
+        self.use_case = AsyncSubscriptionUseCase(
+            funds_port=self.funds_port,
+            subscription_port=self.subscription_port,
+            user_port=self.user_port,
+            unit_of_work=self.unit_of_work
+        )
+        self.user = User(
+            user_id="u001",
+            name="Test User",
+            email="test@example.com",
+            balance=500000,
+            notify_channel=NotifyChannel.EMAIL,
+            phone="+1-234-567-8900"
+        )
+        self.fund = Fund(
+            fund_id="f001",
+            name="Fondo Básico",
+            min_amount=50000,
+            category="FPV"
+        )
+
+    def test_subscribe_applies_minimum_amount_rule(self):
+        """
+        Regla de negocio: el monto mínimo también se valida en async.
+        """
+        # Arrange
+        self.funds_port.get_by_id.return_value = self.fund
+
+        # Act & Assert
+        with pytest.raises(
+            MinAmountViolation,
+            match="No tiene saldo disponible para vincularse al fondo"
+        ):
+            asyncio.run(self.use_case.subscribe(
+                fund_id="f001", user=self.user, amount=1000
+            ))
+        self.unit_of_work.subscribe.assert_not_awaited()
+
+    def test_cancel_reads_fund_and_subscription_concurrently(self):
+        """
+        La lectura del fondo y de la suscripción corren a la vez.
+        """
+        # Arrange
+        both_started = asyncio.Event()
+        started = []
+
+        async def read(value):
+            started.append(value)
+            if len(started) == 2:
+                both_started.set()
+            # Solo termina si la otra lectura ya empezó
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return value
+
+        active = Subscription(
+            user_id="u001",
+            fund_id="f001",
+            amount=100000,
+            status=Status.ACTIVE
+        )
+
+        async def get_fund(fund_id):
+            return await read(self.fund)
+
+        async def get_subscription(user_id, fund_id):
+            return await read(active)
+
+        self.funds_port.get_by_id.side_effect = get_fund
+        self.subscription_port.get.side_effect = get_subscription
+        self.unit_of_work.cancel.side_effect = lambda s, t, claim: s
+
+        # Act
+        asyncio.run(self.use_case.cancel_subscription(
+            fund_id="f001", user=self.user
+        ))
+
+        # Assert
+        subscription, transaction, claim = (
+            self.unit_of_work.cancel.call_args[0]
+        )
+        assert subscription == active
+        assert transaction.transaction_type == TransactionType.CANCEL
+        assert transaction.amount == 100000
+        assert transaction.new_balance == 600000
+
+
+class TestSubscriptionUseCaseBulk:
+    """
+    Tests de la suscripción masiva con los puertos falsos del conftest.
+    """
+
+    def test_subscribe_many_without_unit_of_work(
+        self,
+        subscription_use_case,
+        mock_funds_port,
+        mock_subscription_port,
+        mock_user_port,
+        basic_fund,
+        default_user,
+        low_balance_user
+    ):
+        """
+        Sin unidad de trabajo cada usuario se escribe por separado y el
+        reporte refleja el resultado de cada uno.
+        """
+        # Arrange
+        users = {u.user_id: u for u in (default_user, low_balance_user)}
+
+        def get_by_id(user_id):
+            if user_id not in users:
+                raise ValueError(f"User with ID {user_id} not found")
+            return users[user_id]
+
+        mock_funds_port.get_by_id.return_value = basic_fund
+        mock_user_port.get_by_id.side_effect = get_by_id
+        mock_subscription_port.save.side_effect = lambda s: s
+        items = [
+            BulkSubscribeItem(user_id="u001", amount=100000),
+            BulkSubscribeItem(user_id="u002", amount=50000),
+            BulkSubscribeItem(user_id="u404", amount=100000),
+        ]
+
+        # Act
+        report = subscription_use_case.subscribe_many(
+            fund_id="f001", items=items
+        )
+
+        # Assert
+        assert [r.status.value for r in report.results] == [
+            "subscribed", "failed", "failed"
+        ]
+        assert "Fondo Básico" in report.results[1].error
+        mock_user_port.get_many.assert_called_once_with(
+            ["u001", "u002", "u404"], fields=USER_FIELDS
+        )
+        mock_user_port.update.assert_called_once_with(
+            "u001", new_balance=400000
+        )
@@ -1,28 +1,234 @@
-from app.application.ports.transactions import TransactionPort
-from datetime import datetime
-from typing import Iterable
-from app.domain.models.transaction import Transaction
+from app.application.ports.errors import InvalidTimeRange
+from app.application.ports.transactions import (
+    AsyncTransactionPort,
+    TransactionPort
+)
+from datetime import datetime, timezone
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Tuple
+from app.domain.models.transaction import (
+    Transaction,
+    TransactionPage,
+    TransactionRow,
+    TransactionRowPage
+)
+
+
+# Rows read per DynamoDB request while exporting; memory holds one page
+EXPORT_PAGE_SIZE = 1000
+
+# The history since a date is read one day bucket at a time, one Query
+# each: older starts are refused rather than run as thousands of queries
+MAX_SINCE_DAYS = 366
+
+
+def _check_since(since: datetime | None, max_days: int) -> None:
+    if since is None:
+        return
+    if since.tzinfo is None:
+        # Stored timestamps are naive UTC
+        since = since.replace(tzinfo=timezone.utc)
+    if (datetime.now(timezone.utc) - since).days > max_days:
+        raise InvalidTimeRange(
+            f"'since' must be within the last {max_days} days"
+        )
 
 
 class TransactionUseCase:
-    def __init__(self, transaction_port: TransactionPort):
+    def __init__(
+            self,
+            transaction_port: TransactionPort,
+            max_since_days: int = MAX_SINCE_DAYS
+            ):
         self.transaction_port = transaction_port
+        self.max_since_days = max_since_days
 
     def get_all_transactions(
             self,
-            limit: int = 50,
+            limit: int | None = 50,
             since: datetime | None = None
             ) -> Iterable[Transaction]:
         """Get all transactions, optionally filtered by a starting date."""
+        _check_since(since, self.max_since_days)
         if (since is not None):
             return self.transaction_port.get_all(limit=limit, since=since)
 
         return self.transaction_port.get_all(limit=limit)
-    
+
+    def export_all_transactions(
+            self,
+            total_segments: int = 8,
+            since: datetime | None = None,
+            ordered: bool = False
+            ) -> Iterable[Transaction]:
+        """Stream every transaction for an audit export.
+
+        An ordered export reads the time index one day at a time, so it
+        needs a ``since`` within the limit.
+        """
+        if ordered and since is None:
+            raise InvalidTimeRange("An ordered export needs 'since'")
+        _check_since(since, self.max_since_days)
+        return self.transaction_port.get_all_parallel(
+            total_segments=total_segments,
+            since=since,
+            ordered=ordered
+        )
+
+    def get_transaction_rows_page(
+            self,
+            limit: int = 50,
+            cursor: str | None = None,
+            since: datetime | None = None
+            ) -> TransactionRowPage:
+        """Get one page of the history as rows, for direct serialization."""
+        _check_since(since, self.max_since_days)
+        items, next_cursor = self.transaction_port.get_all_rows_page(
+            limit=limit, since=since, cursor=cursor
+        )
+        return TransactionRowPage(items=items, next_cursor=next_cursor)
+
     def get_transactions_by_user(
             self,
             user_id: str,
-            limit: int = 50
+            limit: int | None = 50
             ) -> Iterable[Transaction]:
         """Get all transactions for a specific user."""
         return self.transaction_port.get_by_user(user_id=user_id, limit=limit)
+
+    def get_transaction_rows_by_user_page(
+            self,
+            user_id: str,
+            limit: int = 50,
+            cursor: str | None = None,
+            from_time: datetime | None = None,
+            to_time: datetime | None = None
+            ) -> TransactionRowPage:
+        """Get one page of a user's history as rows."""
+        items, next_cursor = self.transaction_port.get_by_user_rows_page(
+            user_id=user_id, limit=limit, cursor=cursor,
+            from_time=from_time, to_time=to_time
+        )
+        return TransactionRowPage(items=items, next_cursor=next_cursor)
+
+
+class AsyncTransactionUseCase:
+    """Paged transaction history on the async port.
+
+    The routes' use case; TransactionUseCase keeps the blocking reads
+    (dev routes, benchmarks) and the parallel-scan export.
+    """
+
+    def __init__(
+            self,
+            transaction_port: AsyncTransactionPort,
+            max_since_days: int = MAX_SINCE_DAYS
+            ):
+        self.transaction_port = transaction_port
+        self.max_since_days = max_since_days
+
+    async def get_transactions_page(
+            self,
+            limit: int = 50,
+            cursor: str | None = None,
+            since: datetime | None = None
+            ) -> TransactionPage:
+        """Get one page of the transaction history."""
+        _check_since(since, self.max_since_days)
+        items, next_cursor = await self.transaction_port.get_all_page(
+            limit=limit, since=since, cursor=cursor
+        )
+        return TransactionPage(items=items, next_cursor=next_cursor)
+
+    async def get_transaction_rows_page(
+            self,
+            limit: int = 50,
+            cursor: str | None = None,
+            since: datetime | None = None
+            ) -> TransactionRowPage:
+        """Get one page of the history as rows, for direct serialization."""
+        _check_since(since, self.max_since_days)
+        items, next_cursor = await self.transaction_port.get_all_rows_page(
+            limit=limit, since=since, cursor=cursor
+        )
+        return TransactionRowPage(items=items, next_cursor=next_cursor)
+
+    async def get_transactions_by_user_page(
+            self,
+            user_id: str,
+            limit: int = 50,
+            cursor: str | None = None,
+            from_time: datetime | None = None,
+            to_time: datetime | None = None
+            ) -> TransactionPage:
+        """Get one page of a user's transaction history."""
+        items, next_cursor = await self.transaction_port.get_by_user_page(
+            user_id=user_id, limit=limit, cursor=cursor,
+            from_time=from_time, to_time=to_time
+        )
+        return TransactionPage(items=items, next_cursor=next_cursor)
+
+    async def get_transaction_rows_by_user_page(
+            self,
+            user_id: str,
+            limit: int = 50,
+            cursor: str | None = None,
+            from_time: datetime | None = None,
+            to_time: datetime | None = None
+            ) -> TransactionRowPage:
+        """Get one page of a user's history as rows."""
+        items, next_cursor = (
+            await self.transaction_port.get_by_user_rows_page(
+                user_id=user_id, limit=limit, cursor=cursor,
+                from_time=from_time, to_time=to_time
+            )
+        )
+        return TransactionRowPage(items=items, next_cursor=next_cursor)
+
+    def export_transaction_rows(
+            self,
+            since: datetime | None = None,
+            page_size: int = EXPORT_PAGE_SIZE
+            ) -> AsyncIterator[list[TransactionRow]]:
+        """Yield the whole history page by page, for streaming exports.
+
+        ``since`` is checked right away, before the response starts.
+        """
+        _check_since(since, self.max_since_days)
+        return self._pages(
+            lambda cursor: self.transaction_port.get_all_rows_page(
+                limit=page_size, since=since, cursor=cursor,
+                page_size=page_size
+            )
+        )
+
+    async def export_transaction_rows_by_user(
+            self,
+            user_id: str,
+            page_size: int = EXPORT_PAGE_SIZE,
+            from_time: datetime | None = None,
+            to_time: datetime | None = None
+            ) -> AsyncIterator[list[TransactionRow]]:
+        """Yield a user's whole history (or a range of it) page by page."""
+        async for rows in self._pages(
+            lambda cursor: self.transaction_port.get_by_user_rows_page(
+                user_id, limit=page_size, cursor=cursor, page_size=page_size,
+                from_time=from_time, to_time=to_time
+            )
+        ):
+            yield rows
+
+    async def _pages(
+            self,
+            read_page: Callable[
+                [str | None],
+                Awaitable[Tuple[list[TransactionRow], str | None]]
+            ]
+            ) -> AsyncIterator[list[TransactionRow]]:
+        # The next page is only read once the caller asks for it
+        cursor = None
+        while True:
+            rows, cursor = await read_page(cursor)
+            if rows:
+                yield rows
+            if cursor is None:
+                return
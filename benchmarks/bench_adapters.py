@@ -0,0 +1,134 @@
+"""
+pytest-benchmark suite: the four adapters against the in-memory table.
+
+Each size seeds ``size // 100`` users with a profile, 4 subscriptions and
+95 transactions, plus 100 funds. pytest-benchmark reports the latency of
+every operation; ``extra_info`` records the read units and DynamoDB calls
+of one run, so Scan vs Query cost is visible next to the timings.
+
+Not collected by the regular test run; needs ``pip install pytest-benchmark``.
+The 1M-item size takes a few minutes to seed, so it is opt-in:
+
+    python -m pytest benchmarks/bench_adapters.py --benchmark-group-by=func
+    BENCH_SIZES=10000,100000,1000000 python -m pytest benchmarks/bench_adapters.py
+"""
+import os
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, NamedTuple
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from boto3.dynamodb.conditions import Attr  # noqa: E402
+
+from app.infrastructure.adapters.funds import FundAdapter  # noqa: E402
+from app.infrastructure.adapters.pagination import iterate_items  # noqa: E402
+from app.infrastructure.adapters.subscription import (  # noqa: E402
+    SubscriptionAdapter
+)
+from app.infrastructure.adapters.transactions import (  # noqa: E402
+    TransactionAdapter,
+    time_bucket
+)
+from app.infrastructure.adapters.users import UserAdapter  # noqa: E402
+from app.infrastructure.tests.memory_dynamodb import MemoryDynamoDB  # noqa: E402
+
+
+SIZES = [
+    int(size) for size in
+    os.getenv('BENCH_SIZES', '10000,100000').split(',')
+]
+FUNDS = 100
+SUBSCRIPTIONS_PER_USER = 4
+TRANSACTIONS_PER_USER = 95
+
+
+def generate_items(size: int) -> Iterator[Dict[str, Any]]:
+    for index in range(FUNDS):
+        yield {'PK': f'FUND#f{index:03d}', 'SK': 'PROFILE',
+               'fund_id': f'f{index:03d}', 'name': 'Bench',
+               'min_amount': 1000, 'category': 'FPV'}
+    for user in range(size // 100):
+        user_id = f'u{user:07d}'
+        yield {'PK': f'USER#{user_id}', 'SK': 'PROFILE', 'user_id': user_id,
+               'name': 'Bench', 'email': 'bench@example.com', 'phone': '0',
+               'balance': 500000, 'notify_channel': 'email'}
+        for sub in range(SUBSCRIPTIONS_PER_USER):
+            fund_id = f'f{(user + sub) % FUNDS:03d}'
+            yield {'PK': f'USER#{user_id}', 'SK': f'SUB#{fund_id}',
+                   'user_id': user_id, 'fund_id': fund_id, 'amount': 1000,
+                   'status': 'active', 'created_at': '2025-08-01T10:00:00'}
+        for tx in range(TRANSACTIONS_PER_USER):
+            timestamp = (f'2025-08-{1 + (user + tx) % 28:02d}'
+                         f'T10:00:00.{user % 10 ** 6:06d}')
+            yield {'PK': f'USER#{user_id}', 'SK': f'TX#{tx:06d}',
+                   'user_id': user_id, 'fund_id': f'f{tx % FUNDS:03d}',
+                   'amount': 1000, 'transaction_type': 'open',
+                   'timestamp': timestamp, 'tx_bucket': time_bucket(timestamp),
+                   'prev_balance': 500000, 'new_balance': 499000}
+
+
+class Operation(NamedTuple):
+    name: str
+    build: Callable[[Any, int], Callable[[], Any]]
+    rounds: int = 20
+
+
+def _scan_user(resource, user_id: str) -> list:
+    """Baseline: what list_by_user would cost as a filtered Scan."""
+    table = resource.Table('AppChallenge')
+    return list(iterate_items(table.scan, {
+        'FilterExpression': (
+            Attr('PK').eq(f'USER#{user_id}') & Attr('SK').begins_with('SUB#')
+        )
+    }))
+
+
+OPERATIONS = [
+    Operation('user.get_by_id', lambda r, n: lambda: (
+        UserAdapter(r).get_by_id('u0000042'))),
+    Operation('user.get_many_100', lambda r, n: lambda: (
+        UserAdapter(r).get_many([f'u{i:07d}' for i in range(100)]))),
+    Operation('fund.get_by_id', lambda r, n: lambda: (
+        FundAdapter(r).get_by_id('f042'))),
+    Operation('fund.list_all', lambda r, n: lambda: (
+        FundAdapter(r).list_all(limit=50)), rounds=3),
+    Operation('subscription.list_by_user', lambda r, n: lambda: (
+        list(SubscriptionAdapter(r).list_by_user('u0000042')))),
+    Operation('subscription.scan_by_user', lambda r, n: lambda: (
+        _scan_user(r, 'u0000042')), rounds=3),
+    Operation('transaction.get_by_user_page', lambda r, n: lambda: (
+        TransactionAdapter(r).get_by_user_page('u0000042', limit=50))),
+    Operation('transaction.get_all_page', lambda r, n: lambda: (
+        TransactionAdapter(r).get_all_page(limit=50))),
+    Operation('transaction.get_all_page_since', lambda r, n: lambda: (
+        TransactionAdapter(r).get_all_page(
+            limit=50, since=datetime(2025, 8, 27)
+        ))),
+]
+
+
+@pytest.fixture(scope='module', params=SIZES, ids=lambda size: f'{size}')
+def seeded(request):
+    dynamodb = MemoryDynamoDB()
+    dynamodb.create_table('AppChallenge').load(generate_items(request.param))
+    return dynamodb, request.param
+
+
+@pytest.mark.parametrize(
+    'operation', OPERATIONS, ids=[operation.name for operation in OPERATIONS]
+)
+def test_adapter_operation(benchmark, seeded, operation):
+    dynamodb, size = seeded
+    call = operation.build(dynamodb.resource(), size)
+
+    dynamodb.reset_metrics()
+    call()
+    table = dynamodb.tables['AppChallenge']
+    benchmark.extra_info.update(
+        items=size,
+        read_units=table.read_units,
+        calls=dict(dynamodb.operations)
+    )
+    benchmark.pedantic(call, rounds=operation.rounds, warmup_rounds=1)
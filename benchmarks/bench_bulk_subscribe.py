@@ -0,0 +1,54 @@
+"""
+Benchmark: onboarding users one subscribe at a time vs subscribe_many.
+
+Every DynamoDB call pays ``--latency`` seconds. The per-user loop reads
+the fund and writes one transaction per user; the bulk path reads the
+fund once, the users 100 per BatchGetItem and writes 20 users per
+TransactWriteItems call.
+
+    python -m benchmarks.bench_bulk_subscribe --users 1000 --latency 0.01
+"""
+import argparse
+import time
+
+from app.domain.models.requests import BulkSubscribeItem
+from app.domain.models.user import User, NotifyChannel
+from benchmarks.bench_subscribe import build
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--latency', type=float, default=0.01)
+    args = parser.parse_args()
+
+    user_ids = [f'u{index:05d}' for index in range(args.users)]
+
+    print(f"{'method':>12} {'users/s':>10} {'calls':>8}")
+    for bulk in (False, True):
+        dynamodb, use_case = build(args.latency, True, args.users)
+        started = time.perf_counter()
+        if bulk:
+            report = use_case.subscribe_many(
+                fund_id='f001',
+                items=[BulkSubscribeItem(user_id=user_id, amount=10000)
+                       for user_id in user_ids]
+            )
+            assert report.failed == 0
+        else:
+            for user_id in user_ids:
+                use_case.subscribe(
+                    fund_id='f001',
+                    user=User(user_id=user_id, name='Bench',
+                              email='bench@example.com', balance=500000,
+                              notify_channel=NotifyChannel.EMAIL, phone='0'),
+                    amount=10000
+                )
+        elapsed = time.perf_counter() - started
+        calls = sum(dynamodb.operations.values())
+        name = 'bulk' if bulk else 'one-by-one'
+        print(f"{name:>12} {args.users / elapsed:>10.1f} {calls:>8}")
+
+
+if __name__ == '__main__':
+    main()
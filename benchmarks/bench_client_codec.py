@@ -0,0 +1,105 @@
+"""
+Benchmark: reading records through the resource layer vs the wire codec.
+
+The same pages are read with the resource adapters and the client
+adapters (``client_adapters``) from the in-memory table, and decoded into
+domain objects. Both paths include the emulator's own work, so the
+difference is what the client side spends: botocore's shape walk,
+``TypeDeserializer`` and ``Decimal`` conversions against ``json.loads``
+plus the per-record decoders. Reports rows per second, best of
+``--repeat``.
+
+    python -m benchmarks.bench_client_codec --rows 1000 --repeat 5
+"""
+import argparse
+import time
+from typing import Callable, Tuple
+
+from app.domain.models.subscription import Status, Subscription
+from app.domain.models.transaction import Transaction
+from app.infrastructure.adapters.client_adapters import (
+    ClientSubscriptionAdapter,
+    ClientTransactionAdapter,
+    ClientUserAdapter
+)
+from app.infrastructure.adapters.subscription import SubscriptionAdapter
+from app.infrastructure.adapters.transactions import TransactionAdapter
+from app.infrastructure.adapters.users import UserAdapter
+from app.infrastructure.tests.memory_dynamodb import MemoryDynamoDB
+
+
+def seed(dynamodb: MemoryDynamoDB, rows: int) -> None:
+    """``rows`` transactions and subscriptions of one user, and profiles."""
+    table = dynamodb.tables['AppChallenge']
+    transactions = TransactionAdapter(dynamodb.resource())
+    subscriptions = SubscriptionAdapter(dynamodb.resource())
+    for index in range(rows):
+        transactions.save(Transaction(
+            user_id='u0000', fund_id=f'f{index % 20:03d}', amount=75000,
+            transaction_type='open',
+            timestamp=f'2025-08-22T10:{index // 60 % 60:02d}:'
+                      f'{index % 60:02d}.{index:06d}',
+            prev_balance=500000, new_balance=425000
+        ))
+        subscriptions.save(Subscription(
+            user_id='u0000', fund_id=f'f{index:05d}', amount=75000,
+            status=Status.ACTIVE, created_at='2025-08-22T10:00:00'
+        ))
+        table.put({'PK': f'USER#u{index:04d}', 'SK': 'PROFILE',
+                   'user_id': f'u{index:04d}', 'name': 'Bench',
+                   'email': 'bench@example.com', 'balance': 500000,
+                   'notify_channel': 'email'})
+
+
+def best(operation: Callable[[], int], repeat: int) -> Tuple[int, float]:
+    """Rows read by ``operation`` and its best time in seconds."""
+    elapsed = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = operation()
+        elapsed = min(elapsed, time.perf_counter() - started)
+    return rows, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    dynamodb = MemoryDynamoDB()
+    dynamodb.create_table('AppChallenge')
+    seed(dynamodb, args.rows)
+    resource, client = dynamodb.resource(), dynamodb.client()
+    user_ids = [f'u{index:04d}' for index in range(args.rows)]
+
+    backends = {
+        'resource': (TransactionAdapter(resource),
+                     SubscriptionAdapter(resource), UserAdapter(resource)),
+        'client': (ClientTransactionAdapter(resource, client),
+                   ClientSubscriptionAdapter(resource, client),
+                   ClientUserAdapter(resource, client)),
+    }
+    reads = {
+        'tx models': lambda t, s, u: len(
+            t.get_by_user_page('u0000', limit=args.rows)[0]),
+        'tx rows': lambda t, s, u: len(
+            t.get_by_user_rows_page('u0000', limit=args.rows)[0]),
+        'subs': lambda t, s, u: len(list(s.list_by_user('u0000'))),
+        'users': lambda t, s, u: len(u.get_many(user_ids)),
+    }
+
+    print(f"{'read':>10} {'backend':>9} {'rows':>6} {'rows/s':>10} "
+          f"{'speedup':>8}")
+    for name, read in reads.items():
+        baseline = None
+        for backend, adapters in backends.items():
+            rows, elapsed = best(lambda: read(*adapters), args.repeat)
+            rate = rows / elapsed
+            baseline = baseline or rate
+            print(f"{name:>10} {backend:>9} {rows:>6} {rate:>10.0f} "
+                  f"{rate / baseline:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark: per-request cost of building adapters vs the shared container.
+
+Measures what the subscribe route paid before each request could reach
+its use case: building the adapters (most calling ``Table(...)``) plus
+the use case, with and without an already created boto3 resource, against
+the application-scoped container. Also times the whole subscribe route
+through FastAPI with the in-memory table.
+
+    python -m benchmarks.bench_container --repeat 200
+"""
+import argparse
+import time
+
+import boto3
+from fastapi.testclient import TestClient
+
+from app.infrastructure.adapters.funds import FundAdapter
+from app.infrastructure.adapters.subscription import SubscriptionAdapter
+from app.infrastructure.adapters.transactions import TransactionAdapter
+from app.infrastructure.adapters.users import UserAdapter
+from app.infrastructure.adapters.unit_of_work import UnitOfWorkAdapter
+from app.infrastructure.container import Container
+from app.infrastructure.dependencies import (
+    get_async_subscription_use_case,
+    get_async_user_profiles
+)
+from app.infrastructure.tests.memory_dynamodb import MemoryDynamoDB
+from app.use_cases.subscriptions import SubscriptionUseCase
+
+
+def per_request_use_case(resource) -> SubscriptionUseCase:
+    """The previous dependency graph, rebuilt on every request."""
+    return SubscriptionUseCase(
+        funds_port=FundAdapter(resource),
+        subscription_port=SubscriptionAdapter(resource),
+        transaction_port=TransactionAdapter(resource),
+        user_port=UserAdapter(resource),
+        unit_of_work=UnitOfWorkAdapter(resource)
+    )
+
+
+def measure(operation, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        operation()
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def route_client(dynamodb, container_per_request: bool):
+    from app.main import app
+
+    resource = dynamodb.resource()
+    shared = Container(resource)
+    if container_per_request:
+        app.dependency_overrides[get_async_subscription_use_case] = (
+            lambda: Container(
+                resource, executor=shared.executor
+            ).async_subscription_use_case
+        )
+    else:
+        app.dependency_overrides[get_async_subscription_use_case] = (
+            lambda: shared.async_subscription_use_case
+        )
+    app.dependency_overrides[get_async_user_profiles] = (
+        lambda: shared.async_user_profile_port
+    )
+    return TestClient(app)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    dynamodb = MemoryDynamoDB()
+    table = dynamodb.create_table('AppChallenge')
+    table.put({'PK': 'FUND#f001', 'SK': 'PROFILE', 'fund_id': 'f001',
+               'name': 'Bench', 'min_amount': 1000, 'category': 'FPV'})
+    resource = dynamodb.resource()
+    container = Container(resource)
+
+    print(f"{'dependency graph':>34} {'us/request':>12}")
+    rows = [
+        ('per request, new boto3 resource',
+         lambda: per_request_use_case(
+             boto3.resource('dynamodb', region_name='us-east-1')
+         ), max(1, args.repeat // 10)),
+        ('per request, shared resource',
+         lambda: per_request_use_case(resource), args.repeat),
+        ('application container',
+         lambda: container.subscription_use_case, args.repeat),
+    ]
+    for name, operation, repeat in rows:
+        print(f"{name:>34} {measure(operation, repeat):>12.1f}")
+
+    print(f"\n{'subscribe route':>34} {'us/request':>12}")
+    for name, per_request in (('per request adapters', True),
+                              ('application container', False)):
+        prefix = 'p' if per_request else 'c'
+        for index in range(args.repeat):
+            table.put({'PK': f'USER#{prefix}{index}', 'SK': 'PROFILE',
+                       'user_id': f'{prefix}{index}', 'name': 'Bench',
+                       'email': 'bench@example.com', 'phone': '0',
+                       'notify_channel': 'email', 'balance': 10 ** 9})
+        client = route_client(dynamodb, per_request)
+        counter = iter(range(args.repeat))
+        elapsed = measure(
+            lambda: client.post(
+                f'/user/{prefix}{next(counter)}/subscribe/f001',
+                json={'amount': 1000}
+            ),
+            args.repeat
+        )
+        print(f"{name:>34} {elapsed:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
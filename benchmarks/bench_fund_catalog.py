@@ -0,0 +1,70 @@
+"""
+Benchmark: loading one page of the fund catalog.
+
+A few hundred fund profiles live among ``--items`` user and transaction
+items. Compares a page of ``list_all`` (a Scan filtered on FUND#/PROFILE,
+which reads through the other items until the page is full) with a page
+of ``search`` (one Query on category-index). Reports the DynamoDB calls
+and read units per page.
+
+    python -m benchmarks.bench_fund_catalog --items 1000000 --funds 200
+"""
+import argparse
+import time
+
+from app.infrastructure.adapters.funds import FundAdapter
+from app.infrastructure.tests.memory_dynamodb import MemoryDynamoDB
+
+
+CATEGORIES = ('FPV', 'FIC')
+
+
+def seed(table, items: int, funds: int) -> None:
+    """``funds`` fund profiles and ``items`` other items around them."""
+    for index in range(funds):
+        table.put({'PK': f'FUND#f{index:05d}', 'SK': 'PROFILE',
+                   'fund_id': f'f{index:05d}', 'name': f'Fondo {index}',
+                   'min_amount': 50000 + (index * 7919) % 100 * 5000,
+                   'category': CATEGORIES[index % len(CATEGORIES)]})
+    for index in range(items - funds):
+        user_id = f'u{index // 10:07d}'
+        if index % 10 == 0:
+            table.put({'PK': f'USER#{user_id}', 'SK': 'PROFILE',
+                       'user_id': user_id, 'name': 'Bench',
+                       'notify_channel': 'email', 'balance': 500000})
+        else:
+            table.put({'PK': f'USER#{user_id}', 'SK': f'TX#{index:08d}',
+                       'user_id': user_id, 'fund_id': 'f00001',
+                       'amount': 75000, 'transaction_type': 'open'})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=1_000_000)
+    parser.add_argument('--funds', type=int, default=200)
+    parser.add_argument('--limit', type=int, default=50)
+    args = parser.parse_args()
+
+    dynamodb = MemoryDynamoDB()
+    table = dynamodb.create_table('AppChallenge')
+    seed(table, args.items, args.funds)
+    adapter = FundAdapter(dynamodb.resource())
+
+    print(f"{'method':>8} {'funds':>6} {'calls':>6} {'ms':>10} {'RCU':>10}")
+    for method, operation in (
+        ('scan', lambda: adapter.list_all(limit=args.limit)),
+        ('query', lambda: adapter.search('FPV', limit=args.limit)),
+        ('query<=', lambda: adapter.search(
+            'FPV', max_min_amount=250000, limit=args.limit)),
+    ):
+        dynamodb.reset_metrics()
+        started = time.perf_counter()
+        funds, _ = operation()
+        elapsed = (time.perf_counter() - started) * 1000
+        calls = sum(dynamodb.operations.values())
+        print(f"{method:>8} {len(funds):>6} {calls:>6} {elapsed:>10.1f} "
+              f"{table.read_units:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark: N sequential GetItem calls vs get_many (BatchGetItem).
+
+Every DynamoDB call pays ``--latency`` seconds. get_many reads 100 keys
+per BatchGetItem and runs the chunks concurrently.
+
+    python -m benchmarks.bench_get_many --sizes 10 100 1000 --latency 0.01
+"""
+import argparse
+import time
+
+from app.infrastructure.adapters.funds import FundAdapter
+from app.infrastructure.adapters.users import UserAdapter
+from app.infrastructure.tests.memory_dynamodb import MemoryDynamoDB
+
+
+def seed(table, size: int) -> None:
+    for index in range(size):
+        table.put({'PK': f'USER#u{index:05d}', 'SK': 'PROFILE',
+                   'user_id': f'u{index:05d}', 'name': 'Bench',
+                   'email': 'bench@example.com', 'phone': '0',
+                   'notify_channel': 'email', 'balance': 500000})
+        table.put({'PK': f'FUND#f{index:05d}', 'SK': 'PROFILE',
+                   'fund_id': f'f{index:05d}', 'name': 'Bench',
+                   'min_amount': 1000, 'category': 'FPV'})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[10, 100, 1000])
+    parser.add_argument('--latency', type=float, default=0.01)
+    args = parser.parse_args()
+
+    print(f"{'port':>6} {'ids':>6} {'loop ms':>10} {'get_many ms':>12} "
+          f"{'calls':>6}")
+    for size in args.sizes:
+        dynamodb = MemoryDynamoDB(latency=args.latency)
+        seed(dynamodb.create_table('AppChallenge'), size)
+        resource = dynamodb.resource()
+
+        for name, adapter, prefix in (
+            ('users', UserAdapter(resource), 'u'),
+            ('funds', FundAdapter(resource), 'f'),
+        ):
+            ids = [f'{prefix}{index:05d}' for index in range(size)]
+
+            started = time.perf_counter()
+            for item_id in ids:
+                adapter.get_by_id(item_id)
+            loop = time.perf_counter() - started
+
+            dynamodb.reset_metrics()
+            started = time.perf_counter()
+            found = adapter.get_many(ids)
+            batched = time.perf_counter() - started
+            assert len(found) == size
+
+            calls = dynamodb.operations['BatchGetItem']
+            print(f"{name:>6} {size:>6} {loop * 1000:>10.1f} "
+                  f"{batched * 1000:>12.1f} {calls:>6}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark: subscribe latency without a key, with a new Idempotency-Key
+and when replaying a stored response.
+
+Every DynamoDB call pays ``--latency`` seconds. A replay costs only the
+failed conditional put, which returns the stored response, whatever the
+operation did the first time.
+
+    python -m benchmarks.bench_idempotency --repeat 50 --latency 0.01
+"""
+import argparse
+import statistics
+import time
+
+from fastapi.testclient import TestClient
+
+from app.infrastructure.container import Container
+from app.infrastructure.dependencies import (
+    get_async_idempotency_use_case,
+    get_async_subscription_use_case,
+    get_async_user_profiles
+)
+from app.infrastructure.tests.memory_dynamodb import MemoryDynamoDB
+
+
+def seed(table, users: int) -> None:
+    table.put({'PK': 'FUND#f001', 'SK': 'PROFILE', 'fund_id': 'f001',
+               'name': 'Bench', 'min_amount': 1000, 'category': 'FPV'})
+    for index in range(users):
+        table.put({'PK': f'USER#u{index:05d}', 'SK': 'PROFILE',
+                   'user_id': f'u{index:05d}', 'name': 'Bench',
+                   'email': 'bench@example.com', 'phone': '0',
+                   'notify_channel': 'email', 'balance': 10 ** 9})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--latency', type=float, default=0.01)
+    args = parser.parse_args()
+
+    from app.main import app
+
+    dynamodb = MemoryDynamoDB(latency=args.latency)
+    seed(dynamodb.create_table('AppChallenge'), 2 * args.repeat)
+    container = Container(dynamodb.resource())
+    app.dependency_overrides[get_async_subscription_use_case] = (
+        lambda: container.async_subscription_use_case
+    )
+    app.dependency_overrides[get_async_idempotency_use_case] = (
+        lambda: container.async_idempotency_use_case
+    )
+    app.dependency_overrides[get_async_user_profiles] = (
+        lambda: container.async_user_profile_port
+    )
+    client = TestClient(app)
+
+    def timed(user: int, key: str | None) -> tuple[float, int]:
+        dynamodb.reset_metrics()
+        headers = {'Idempotency-Key': key} if key else {}
+        started = time.perf_counter()
+        response = client.post(f'/user/u{user:05d}/subscribe/f001',
+                               json={'amount': 1000}, headers=headers)
+        elapsed = time.perf_counter() - started
+        assert response.status_code == 200, response.text
+        return elapsed, sum(dynamodb.operations.values())
+
+    modes = {
+        'no key': [timed(i, None) for i in range(args.repeat)],
+        'new key': [timed(args.repeat + i, f'k{i}')
+                    for i in range(args.repeat)],
+        'replay': [timed(args.repeat + i, f'k{i}')
+                   for i in range(args.repeat)],
+    }
+
+    print(f"{'mode':>8} {'p50 ms':>8} {'calls':>6}")
+    for mode, samples in modes.items():
+        p50 = statistics.median(s[0] for s in samples)
+        calls = statistics.mean(s[1] for s in samples)
+        print(f"{mode:>8} {p50 * 1000:>8.1f} {calls:>6.1f}")
+
+    app.dependency_overrides.clear()
+    container.executor.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark: SubscriptionAdapter.list_by_user as the table grows.
+
+Compares the key-condition Query against the full-table Scan it replaced,
+reporting latency and read units for one user's portfolio lookup.
+
+    python -m benchmarks.bench_list_by_user --sizes 1000 10000 100000
+"""
+import argparse
+import time
+
+from boto3.dynamodb.conditions import Attr
+
+from app.infrastructure.adapters.subscription import SubscriptionAdapter
+from app.infrastructure.tests.memory_dynamodb import MemoryDynamoDB
+
+
+def seed(table, total_items: int) -> None:
+    """Fill the table with users holding a profile, subscriptions and txs."""
+    users = max(1, total_items // 6)
+    for index in range(users):
+        user_id = f"u{index:07d}"
+        table.put({'PK': f'USER#{user_id}', 'SK': 'PROFILE',
+                   'user_id': user_id, 'name': 'Bench', 'balance': 500000})
+        for fund in range(2):
+            table.put({'PK': f'USER#{user_id}', 'SK': f'SUB#f{fund:03d}',
+                       'user_id': user_id, 'fund_id': f'f{fund:03d}',
+                       'amount': 75000, 'status': 'active',
+                       'created_at': '2025-08-22T10:00:00'})
+        for tx in range(3):
+            table.put({'PK': f'USER#{user_id}',
+                       'SK': f'TX#20250822T10000{tx}#T{tx}',
+                       'user_id': user_id, 'fund_id': 'f000',
+                       'amount': 75000, 'transaction_type': 'open',
+                       'timestamp': f'2025-08-22T10:00:0{tx}',
+                       'prev_balance': 500000, 'new_balance': 425000})
+
+
+def scan_list_by_user(dynamodb_table, user_id: str) -> list:
+    """The previous implementation: filter the whole table with Scan."""
+    scan_kwargs = {
+        'FilterExpression': (
+            Attr('PK').eq(f'USER#{user_id}') & Attr('SK').begins_with('SUB#')
+        )
+    }
+    items = []
+    while True:
+        response = dynamodb_table.scan(**scan_kwargs)
+        items.extend(response.get('Items', []))
+        if 'LastEvaluatedKey' not in response:
+            return items
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def measure(table, operation, repeat: int) -> tuple[float, float]:
+    table.reset_metrics()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        operation()
+    elapsed = (time.perf_counter() - started) / repeat
+    return elapsed * 1000, table.read_units / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--sizes', type=int, nargs='+', default=[1000, 10000, 100000]
+    )
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'items':>10} {'method':>6} {'ms/op':>10} {'RCU/op':>10}")
+    for size in args.sizes:
+        dynamodb = MemoryDynamoDB()
+        table = dynamodb.create_table('AppChallenge')
+        seed(table, size)
+        resource = dynamodb.resource()
+        adapter = SubscriptionAdapter(resource)
+        user_id = 'u0000000'
+
+        query_ms, query_rcu = measure(
+            table, lambda: list(adapter.list_by_user(user_id)), args.repeat
+        )
+        scan_ms, scan_rcu = measure(
+            table,
+            lambda: scan_list_by_user(adapter.subscriptions_table, user_id),
+            max(1, args.repeat // 10)
+        )
+        print(f"{len(table):>10} {'query':>6} {query_ms:>10.2f} "
+              f"{query_rcu:>10.1f}")
+        print(f"{len(table):>10} {'scan':>6} {scan_ms:>10.2f} "
+              f"{scan_rcu:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
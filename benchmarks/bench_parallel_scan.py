@@ -0,0 +1,68 @@
+"""
+Benchmark: parallel segmented scan for the transaction history export.
+
+Each call to the in-memory table pays a simulated service latency, so
+the export is I/O bound like it is against DynamoDB and the speedup
+tracks the number of segments read concurrently, until response parsing
+(which holds the GIL) saturates one core.
+
+    python -m benchmarks.bench_parallel_scan --items 10000 --latency 0.05
+"""
+import argparse
+import time
+
+from boto3.dynamodb.conditions import Attr
+
+from app.infrastructure.adapters.parallel_scan import parallel_scan
+from app.infrastructure.tests.memory_dynamodb import MemoryDynamoDB
+
+
+def seed(table, total_items: int) -> None:
+    for index in range(total_items):
+        user_id = f"u{index // 10:06d}"
+        table.put({
+            'PK': f'USER#{user_id}',
+            'SK': f'TX#{index:08d}',
+            'user_id': user_id,
+            'fund_id': 'f001',
+            'amount': 75000,
+            'transaction_type': 'open',
+            'timestamp': f'2025-08-22T10:{index // 60 % 60:02d}:{index % 60:02d}',
+            'prev_balance': 500000,
+            'new_balance': 425000
+        })
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=10000)
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.05)
+    parser.add_argument(
+        '--segments', type=int, nargs='+', default=[1, 2, 4, 8, 16]
+    )
+    args = parser.parse_args()
+
+    dynamodb = MemoryDynamoDB(latency=args.latency)
+    seed(dynamodb.create_table('AppChallenge'), args.items)
+    client = dynamodb.resource().meta.client
+    request = {
+        'TableName': 'AppChallenge',
+        'FilterExpression': Attr('SK').begins_with('TX#')
+    }
+
+    baseline = None
+    print(f"{'segments':>8} {'seconds':>10} {'items/s':>12} {'speedup':>8}")
+    for segments in args.segments:
+        started = time.perf_counter()
+        count = sum(1 for _ in parallel_scan(
+            client, request, segments, page_size=args.page_size
+        ))
+        elapsed = time.perf_counter() - started
+        baseline = baseline or elapsed
+        print(f"{segments:>8} {elapsed:>10.3f} {count / elapsed:>12.0f} "
+              f"{baseline / elapsed:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
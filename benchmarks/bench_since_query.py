@@ -0,0 +1,85 @@
+"""
+Benchmark: date-range reads on the transaction history.
+
+Compares get_all(since=...) on the day-bucketed tx_time-index against the
+full-table Scan filtered on timestamp it replaced. The window stays the
+same (last 24 hours) while the table grows.
+
+    python -m benchmarks.bench_since_query --sizes 10000 100000
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from boto3.dynamodb.conditions import Attr
+
+from app.domain.models.clock import utc_now
+from app.domain.models.transaction import Transaction, TransactionType
+from app.infrastructure.adapters.transactions import (
+    TransactionAdapter,
+    transaction_to_item
+)
+from app.infrastructure.tests.memory_dynamodb import MemoryDynamoDB
+
+
+def seed(table, total_items: int, days: int = 365) -> None:
+    """Spread transactions evenly over the last ``days`` days."""
+    now = utc_now()
+    step = timedelta(days=days) / total_items
+    for index in range(total_items):
+        table.put(transaction_to_item(Transaction(
+            user_id=f"u{index % 5000:05d}",
+            fund_id="f001",
+            amount=75000,
+            transaction_type=TransactionType.OPEN,
+            timestamp=(now - step * index).isoformat(),
+            prev_balance=500000,
+            new_balance=425000
+        )))
+
+
+def scan_since(dynamodb_table, since: datetime) -> int:
+    """The previous implementation: Scan everything, filter on timestamp."""
+    scan_kwargs = {
+        'FilterExpression': (
+            Attr('SK').begins_with('TX#') &
+            Attr('timestamp').gte(since.isoformat())
+        )
+    }
+    count = 0
+    while True:
+        response = dynamodb_table.scan(**scan_kwargs)
+        count += len(response.get('Items', []))
+        if 'LastEvaluatedKey' not in response:
+            return count
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'items':>10} {'method':>6} {'rows':>6} {'ms':>10} {'RCU':>10}")
+    for size in args.sizes:
+        dynamodb = MemoryDynamoDB()
+        table = dynamodb.create_table('AppChallenge')
+        seed(table, size)
+        adapter = TransactionAdapter(dynamodb.resource())
+        since = utc_now() - timedelta(days=1)
+
+        for method, operation in (
+            ('index', lambda: sum(
+                1 for _ in adapter.get_all(limit=None, since=since))),
+            ('scan', lambda: scan_since(adapter.transactions_table, since)),
+        ):
+            table.reset_metrics()
+            started = time.perf_counter()
+            rows = operation()
+            elapsed = (time.perf_counter() - started) * 1000
+            print(f"{size:>10} {method:>6} {rows:>6} {elapsed:>10.1f} "
+                  f"{table.read_units:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
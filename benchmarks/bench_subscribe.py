@@ -0,0 +1,68 @@
+"""
+Benchmark: sequential subscribe writes vs one TransactWriteItems call.
+
+Every DynamoDB call pays ``--latency`` seconds, so the wall time of a
+subscription tracks the number of round trips it makes.
+
+    python -m benchmarks.bench_subscribe --repeat 50 --latency 0.01
+"""
+import argparse
+import time
+
+from app.domain.models.user import User, NotifyChannel
+from app.infrastructure.adapters.funds import FundAdapter
+from app.infrastructure.adapters.subscription import SubscriptionAdapter
+from app.infrastructure.adapters.transactions import TransactionAdapter
+from app.infrastructure.adapters.unit_of_work import UnitOfWorkAdapter
+from app.infrastructure.adapters.users import UserAdapter
+from app.infrastructure.tests.memory_dynamodb import MemoryDynamoDB
+from app.use_cases.subscriptions import SubscriptionUseCase
+
+
+def build(latency: float, atomic: bool, users: int):
+    dynamodb = MemoryDynamoDB(latency=latency)
+    table = dynamodb.create_table('AppChallenge')
+    table.put({'PK': 'FUND#f001', 'SK': 'PROFILE', 'fund_id': 'f001',
+               'name': 'Bench', 'min_amount': 1000, 'category': 'FPV'})
+    for index in range(users):
+        table.put({'PK': f'USER#u{index:05d}', 'SK': 'PROFILE',
+                   'user_id': f'u{index:05d}', 'name': 'Bench',
+                   'email': 'bench@example.com', 'phone': '0',
+                   'notify_channel': 'email', 'balance': 500000})
+    resource = dynamodb.resource()
+    use_case = SubscriptionUseCase(
+        funds_port=FundAdapter(resource),
+        subscription_port=SubscriptionAdapter(resource),
+        transaction_port=TransactionAdapter(resource),
+        user_port=UserAdapter(resource),
+        unit_of_work=UnitOfWorkAdapter(resource) if atomic else None
+    )
+    return dynamodb, use_case
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--latency', type=float, default=0.01)
+    args = parser.parse_args()
+
+    print(f"{'method':>12} {'ms/op':>10} {'calls/op':>10}")
+    for atomic in (False, True):
+        dynamodb, use_case = build(args.latency, atomic, args.repeat)
+        started = time.perf_counter()
+        for index in range(args.repeat):
+            use_case.subscribe(
+                fund_id='f001',
+                user=User(user_id=f'u{index:05d}', name='Bench',
+                          email='bench@example.com', balance=500000,
+                          notify_channel=NotifyChannel.EMAIL, phone='0'),
+                amount=10000
+            )
+        elapsed = (time.perf_counter() - started) / args.repeat
+        calls = sum(dynamodb.operations.values()) / args.repeat
+        name = 'transaction' if atomic else 'sequential'
+        print(f"{name:>12} {elapsed * 1000:>10.2f} {calls:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Micro-benchmark: transaction history as pydantic models vs slotted rows.
+
+Both paths start from the items boto3 returns (numbers as Decimal) and end
+with the JSON bytes of a page. ``model`` builds Transaction models and
+serializes them the way FastAPI does for a ``response_model``;
+``rows`` builds TransactionRow dataclasses and renders them with
+``app.routes.responses.dumps`` (orjson when installed, else ``json``).
+Peak memory is measured in a separate run with tracemalloc.
+
+    python -m benchmarks.bench_transaction_rows --rows 1000 10000 100000
+"""
+import argparse
+import time
+import tracemalloc
+from decimal import Decimal
+from typing import Any, Callable, Dict, List
+
+from pydantic import TypeAdapter
+
+from app.domain.models.transaction import TransactionPage, TransactionRowPage
+from app.infrastructure.adapters.transactions import (
+    item_to_row,
+    item_to_transaction
+)
+from app.routes import responses
+
+
+def make_items(count: int) -> List[Dict[str, Any]]:
+    return [
+        {'PK': f'USER#u{index % 100:03d}', 'SK': f'TX#{index:08d}',
+         'user_id': f'u{index % 100:03d}', 'fund_id': 'f001',
+         'amount': Decimal(75000), 'transaction_type': 'open',
+         'timestamp': '2025-08-22T10:00:00.000001',
+         'tx_bucket': 'TXB#2025-08-22',
+         'prev_balance': Decimal(500000), 'new_balance': Decimal(425000)}
+        for index in range(count)
+    ]
+
+
+_page_adapter = TypeAdapter(TransactionPage)
+
+
+def model_path(items: List[Dict[str, Any]]) -> bytes:
+    page = TransactionPage(items=[item_to_transaction(i) for i in items])
+    # What FastAPI does with the returned value of a response_model route
+    return _page_adapter.dump_json(_page_adapter.validate_python(page))
+
+
+def rows_path(items: List[Dict[str, Any]]) -> bytes:
+    return responses.dumps(
+        TransactionRowPage(items=[item_to_row(i) for i in items])
+    )
+
+
+def measure(path: Callable[[List[Dict[str, Any]]], bytes],
+            items: List[Dict[str, Any]], repeat: int) -> tuple[float, int]:
+    """Best time per row in microseconds and peak traced bytes."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        path(items)
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    path(items)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best / len(items) * 1e6, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, nargs='+',
+                        default=[1000, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    orjson = responses.orjson
+    paths = [('model', model_path), ('rows', rows_path)]
+    if orjson is not None:
+        paths.append(('rows-json', rows_path))
+
+    print(f"{'path':>10} {'rows':>8} {'us/row':>8} {'peak MiB':>9}")
+    for count in args.rows:
+        items = make_items(count)
+        assert model_path(items) == rows_path(items)
+        for name, path in paths:
+            # rows-json: the stdlib fallback used when orjson is missing
+            responses.orjson = None if name == 'rows-json' else orjson
+            per_row, peak = measure(path, items, args.repeat)
+            print(f"{name:>10} {count:>8} {per_row:>8.2f} "
+                  f"{peak / 2 ** 20:>9.1f}")
+        responses.orjson = orjson
+
+
+if __name__ == '__main__':
+    main()
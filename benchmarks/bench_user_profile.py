@@ -0,0 +1,100 @@
+"""
+Benchmark: latency the user profile read adds to the subscribe route.
+
+Every DynamoDB call pays ``--latency`` seconds, one round trip. Compares
+the route with a profile built in memory (what the route used to do, with
+a made-up balance) against reading the stored profile with the cache off
+and with it warm (the profile was read in a recent request). ``added``
+is the difference with the first row, in round trips.
+
+    python -m benchmarks.bench_user_profile --repeat 50 --latency 0.01
+"""
+import argparse
+import os
+import statistics
+import time
+
+from fastapi.testclient import TestClient
+
+from app.domain.models.user import NotifyChannel, User
+from app.infrastructure.container import Container
+from app.infrastructure.dependencies import (
+    get_async_subscription_use_case,
+    get_async_user_profiles
+)
+from app.infrastructure.tests.memory_dynamodb import MemoryDynamoDB
+
+
+class InMemoryProfiles:
+    """The profile the route used to build without reading DynamoDB."""
+
+    async def get_by_id(self, user_id: str) -> User:
+        return User(user_id=user_id, name='Bench', email='bench@example.com',
+                    phone='0', balance=10 ** 9,
+                    notify_channel=NotifyChannel.EMAIL)
+
+
+def seed(table, users: int) -> None:
+    table.put({'PK': 'FUND#f001', 'SK': 'PROFILE', 'fund_id': 'f001',
+               'name': 'Bench', 'min_amount': 1000, 'category': 'FPV'})
+    for index in range(users):
+        table.put({'PK': f'USER#u{index:05d}', 'SK': 'PROFILE',
+                   'user_id': f'u{index:05d}', 'name': 'Bench',
+                   'email': 'bench@example.com', 'phone': '0',
+                   'notify_channel': 'email', 'balance': 10 ** 9})
+
+
+def run(mode: str, repeat: int, latency: float) -> tuple[float, float]:
+    """p50 seconds and mean DynamoDB calls of ``repeat`` subscriptions."""
+    from app.main import app
+
+    os.environ['USER_CACHE_TTL_SECONDS'] = '0' if mode == 'read' else '60'
+    dynamodb = MemoryDynamoDB(latency=latency)
+    seed(dynamodb.create_table('AppChallenge'), repeat)
+    container = Container(dynamodb.resource())
+    user_ids = [f'u{index:05d}' for index in range(repeat)]
+    # The fund catalog is warm in every mode
+    container.fund_port.get_by_id('f001')
+    if mode == 'cached':
+        container.user_cache.get_many(user_ids)
+
+    profiles = (InMemoryProfiles() if mode == 'in memory'
+                else container.async_user_profile_port)
+    app.dependency_overrides[get_async_subscription_use_case] = (
+        lambda: container.async_subscription_use_case
+    )
+    app.dependency_overrides[get_async_user_profiles] = lambda: profiles
+    client = TestClient(app)
+
+    samples, calls = [], []
+    for user_id in user_ids:
+        dynamodb.reset_metrics()
+        started = time.perf_counter()
+        response = client.post(f'/user/{user_id}/subscribe/f001',
+                               json={'amount': 1000})
+        samples.append(time.perf_counter() - started)
+        assert response.status_code == 200, response.text
+        calls.append(sum(dynamodb.operations.values()))
+
+    app.dependency_overrides.clear()
+    container.executor.shutdown()
+    return statistics.median(samples), statistics.mean(calls)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--latency', type=float, default=0.01)
+    args = parser.parse_args()
+
+    print(f"{'profile':>10} {'p50 ms':>8} {'calls':>6} {'added RT':>9}")
+    baseline = None
+    for mode in ('in memory', 'read', 'cached'):
+        p50, calls = run(mode, args.repeat, args.latency)
+        baseline = p50 if baseline is None else baseline
+        added = (p50 - baseline) / args.latency
+        print(f"{mode:>10} {p50 * 1000:>8.1f} {calls:>6.1f} {added:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""
+Load test: concurrent requests against the API and the in-memory table.
+
+Every DynamoDB call pays ``--latency`` seconds. In ``blocking`` mode the
+routes call the synchronous use cases on the event loop, as they did
+before the async adapters, so each call stalls every other request. In
+``offload`` mode they use the async use cases, which run the calls on
+the container's thread pool.
+
+    python -m benchmarks.load_test --requests 400 --concurrency 100
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from app.infrastructure.adapters.offload import create_executor
+from app.infrastructure.container import Container
+from app.infrastructure.dependencies import (
+    get_async_subscription_use_case,
+    get_async_transaction_use_case,
+    get_async_user_profiles
+)
+from app.infrastructure.tests.memory_dynamodb import MemoryDynamoDB
+
+
+class BlockingSubscriptions:
+    """Sync use case called straight from the route, blocking the loop."""
+
+    def __init__(self, use_case):
+        self._use_case = use_case
+
+    async def subscribe(self, **kwargs):
+        return self._use_case.subscribe(**kwargs)
+
+    async def cancel_subscription(self, **kwargs):
+        return self._use_case.cancel_subscription(**kwargs)
+
+
+class BlockingUsers:
+    """Sync user port called straight from the route, blocking the loop."""
+
+    def __init__(self, user_port):
+        self._user_port = user_port
+
+    async def get_by_id(self, user_id):
+        return self._user_port.get_by_id(user_id)
+
+
+class BlockingTransactions:
+    """Sync use case called straight from the route, blocking the loop."""
+
+    def __init__(self, use_case):
+        self._use_case = use_case
+
+    async def get_transaction_rows_page(self, **kwargs):
+        return self._use_case.get_transaction_rows_page(**kwargs)
+
+    async def get_transaction_rows_by_user_page(self, **kwargs):
+        return self._use_case.get_transaction_rows_by_user_page(**kwargs)
+
+
+def seed(table, users: int) -> None:
+    table.put({'PK': 'FUND#f001', 'SK': 'PROFILE', 'fund_id': 'f001',
+               'name': 'Load', 'min_amount': 1000, 'category': 'FPV'})
+    for index in range(users):
+        user_id = f'u{index:05d}'
+        table.put({'PK': f'USER#{user_id}', 'SK': 'PROFILE',
+                   'user_id': user_id, 'name': 'Load',
+                   'email': 'load@example.com', 'phone': '0',
+                   'notify_channel': 'email', 'balance': 10 ** 9})
+        for tx in range(5):
+            table.put({'PK': f'USER#{user_id}',
+                       'SK': f'TX#20250822T10000{tx}#T{tx}',
+                       'user_id': user_id, 'fund_id': 'f001',
+                       'amount': 1000, 'transaction_type': 'open',
+                       'timestamp': f'2025-08-22T10:00:0{tx}',
+                       'prev_balance': 10 ** 9, 'new_balance': 10 ** 9})
+
+
+async def run_load(app, requests: int, concurrency: int) -> list[float]:
+    limit = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport,
+                                 base_url='http://load') as client:
+        async def one(index: int) -> float:
+            user_id = f'u{index:05d}'
+            async with limit:
+                started = time.perf_counter()
+                if index % 2:
+                    response = await client.post(
+                        f'/user/{user_id}/subscribe/f001',
+                        json={'amount': 1000}
+                    )
+                else:
+                    response = await client.get(
+                        f'/user/{user_id}/transactions?limit=5'
+                    )
+                response.raise_for_status()
+                return time.perf_counter() - started
+
+        return await asyncio.gather(*(one(i) for i in range(requests)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--concurrency', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.01)
+    parser.add_argument('--workers', type=int, default=50)
+    args = parser.parse_args()
+
+    from app.main import app
+
+    print(f"{'mode':>8} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8}")
+    for mode in ('blocking', 'offload'):
+        dynamodb = MemoryDynamoDB(latency=args.latency)
+        seed(dynamodb.create_table('AppChallenge'), args.requests)
+        container = Container(
+            dynamodb.resource(), executor=create_executor(args.workers)
+        )
+
+        if mode == 'blocking':
+            subscriptions = BlockingSubscriptions(
+                container.subscription_use_case
+            )
+            transactions = BlockingTransactions(
+                container.transaction_use_case
+            )
+            profiles = BlockingUsers(container.user_profile_port)
+        else:
+            subscriptions = container.async_subscription_use_case
+            transactions = container.async_transaction_use_case
+            profiles = container.async_user_profile_port
+        app.dependency_overrides[get_async_subscription_use_case] = (
+            lambda: subscriptions
+        )
+        app.dependency_overrides[get_async_transaction_use_case] = (
+            lambda: transactions
+        )
+        app.dependency_overrides[get_async_user_profiles] = (
+            lambda: profiles
+        )
+
+        started = time.perf_counter()
+        latencies = asyncio.run(
+            run_load(app, args.requests, args.concurrency)
+        )
+        elapsed = time.perf_counter() - started
+        container.executor.shutdown()
+
+        quantiles = statistics.quantiles(latencies, n=20)
+        print(f"{mode:>8} {args.requests / elapsed:>8.1f} "
+              f"{quantiles[9] * 1000:>8.1f} {quantiles[18] * 1000:>8.1f}")
+
+    app.dependency_overrides.clear()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Profile: cold-start import time of the Lambda entry point.
+
+Imports ``app.main`` in a fresh interpreter with ``-X importtime`` and
+reports the slowest modules, the cost per top-level package and the total
+init time. ``--lambda`` simulates the Lambda environment (no dotenv,
+container built during init); ``--max-ms`` exits with status 1 when the
+total goes over budget, to catch regressions.
+
+    python -m benchmarks.profile_cold_start --top 20
+    python -m benchmarks.profile_cold_start --lambda --max-ms 1500
+"""
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+MODULE = 'app.main'
+
+_PROBE = (
+    "import time\n"
+    "started = time.perf_counter()\n"
+    f"import {MODULE}\n"
+    "print(f'TOTAL {(time.perf_counter() - started) * 1e6:.0f}')\n"
+)
+
+
+def run_import(simulate_lambda: bool) -> tuple[list[tuple[str, int, int]], int]:
+    """Import the module in a new process; return (module rows, total us)."""
+    env = dict(os.environ)
+    env.pop('AWS_LAMBDA_FUNCTION_NAME', None)
+    if simulate_lambda:
+        env['AWS_LAMBDA_FUNCTION_NAME'] = 'cold-start-profile'
+        env.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _PROBE],
+        capture_output=True, text=True, env=env, check=True
+    )
+
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((name.rstrip(), int(self_us), int(cumulative_us)))
+
+    total = next(
+        int(line.split()[1]) for line in completed.stdout.splitlines()
+        if line.startswith('TOTAL ')
+    )
+    return rows, total
+
+
+def by_package(rows: list[tuple[str, int, int]]) -> dict[str, int]:
+    """Self time summed per top-level package."""
+    totals: dict[str, int] = defaultdict(int)
+    for name, self_us, _ in rows:
+        totals[name.strip().split('.')[0]] += self_us
+    return totals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--lambda', dest='simulate_lambda',
+                        action='store_true')
+    parser.add_argument('--max-ms', type=float, default=None)
+    args = parser.parse_args()
+
+    rows, total = run_import(args.simulate_lambda)
+
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for name, self_us, cumulative_us in sorted(
+        rows, key=lambda row: row[2], reverse=True
+    )[:args.top]:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  "
+              f"{name.strip()}")
+
+    print(f"\n{'self ms':>14}  package")
+    packages = sorted(by_package(rows).items(), key=lambda p: p[1],
+                      reverse=True)
+    for package, self_us in packages[:args.top]:
+        print(f"{self_us / 1000:>14.1f}  {package}")
+
+    loaded = {name.strip().split('.')[0] for name, _, _ in rows}
+    print(f"\nboto3 imported during init: {'boto3' in loaded}")
+    print(f"total {MODULE} init: {total / 1000:.1f} ms")
+
+    if args.max_ms is not None and total / 1000 > args.max_ms:
+        print(f"over budget: {total / 1000:.1f} ms > {args.max_ms} ms")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()